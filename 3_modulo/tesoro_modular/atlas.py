@@ -0,0 +1,197 @@
+"""
+MÓDULO DE ATLAS DE SPRITES - CAZADOR DE TESOROS
+===============================================
+Este módulo junta todos los sprites del juego (explorador, tesoro,
+enemigo) en una sola imagen grande, el "atlas", y guarda en una tabla el
+rectángulo que ocupa cada uno dentro de ella.
+
+Con el atlas, cada capa del dibujo (tesoros, personajes) se arma como
+una lista de (atlas, posición, rectángulo del sprite) y se dibuja con una
+sola llamada a Surface.blits, en lugar de una llamada a blit por entidad
+desde Python.
+
+Conceptos enseñados:
+- Atlas de texturas (sprite sheets)
+- Empaquetado de rectángulos por estantes
+- Dibujado por lotes (batching)
+"""
+
+import pygame
+from configuracion import *
+import enemigo
+import tesoros
+import utilidades
+
+# Sprites que se empaquetan (el fondo se dibuja una sola vez y no entra)
+SPRITES_ATLAS = ('jugador', 'tesoro', 'enemigo')
+
+# ============================================================================
+# EMPAQUETADO
+# ============================================================================
+
+def empaquetar_estantes(tamanos, ancho_maximo=1024, margen=1):
+    """
+    Ubica rectángulos en filas ("estantes") de izquierda a derecha
+
+    Los rectángulos se ordenan de más alto a más bajo; cuando uno no cabe
+    en la fila actual se abre otra debajo de la más alta.
+
+    Args:
+        tamanos (dict): Nombre -> (ancho, alto)
+        ancho_maximo (int): Ancho máximo del atlas
+        margen (int): Píxeles libres entre sprites
+
+    Returns:
+        tuple: (dict nombre -> pygame.Rect, (ancho, alto) del atlas)
+
+    Conceptos enseñados:
+    - Algoritmo de estantes (shelf packing)
+    """
+    rects = {}
+    x = y = alto_estante = ancho_usado = 0
+    for nombre in sorted(tamanos, key=lambda nombre: tamanos[nombre][1], reverse=True):
+        ancho, alto = tamanos[nombre]
+        if x > 0 and x + ancho > ancho_maximo:
+            # Nuevo estante
+            y += alto_estante + margen
+            x = alto_estante = 0
+        rects[nombre] = pygame.Rect(x, y, ancho, alto)
+        ancho_usado = max(ancho_usado, x + ancho)
+        alto_estante = max(alto_estante, alto)
+        x += ancho + margen
+    return rects, (ancho_usado, y + alto_estante)
+
+class AtlasSprites:
+    """
+    Imagen con varios sprites y la tabla de dónde está cada uno
+
+    Atributos:
+        superficie (pygame.Surface): Imagen del atlas
+        rects (dict): Nombre del sprite -> pygame.Rect dentro del atlas
+    """
+
+    def __init__(self, superficie, rects):
+        self.superficie = superficie
+        self.rects = rects
+        # (campo, versión, origen de la cámara, secuencia) de la última
+        # capa de tesoros armada
+        self._capa_tesoros = None
+
+    def capa(self, nombre, posiciones):
+        """
+        Arma la secuencia para Surface.blits de un sprite en varias
+        posiciones
+
+        Args:
+            nombre (str): Sprite del atlas
+            posiciones (iterable): Pares (x, y) o rects (se usa su esquina)
+
+        Returns:
+            list: Tuplas (atlas, posición, rectángulo del sprite)
+        """
+        superficie = self.superficie
+        area = self.rects[nombre]
+        return [(superficie, posicion, area) for posicion in posiciones]
+
+def crear_atlas(imagenes, nombres=SPRITES_ATLAS, ancho_maximo=1024, margen=1):
+    """
+    Empaqueta los sprites indicados en un atlas
+
+    Args:
+        imagenes (dict): Imágenes cargadas (utilidades.cargar_todas_las_imagenes)
+        nombres (tuple): Sprites a incluir
+        ancho_maximo (int): Ancho máximo del atlas
+        margen (int): Píxeles libres entre sprites
+
+    Returns:
+        AtlasSprites: Atlas convertido al formato de la pantalla
+    """
+    tamanos = {nombre: imagenes[nombre].get_size() for nombre in nombres}
+    rects, tamano = empaquetar_estantes(tamanos, ancho_maximo, margen)
+
+    superficie = pygame.Surface(tamano, pygame.SRCALPHA)
+    superficie.fill((0, 0, 0, 0))
+    for nombre, rect in rects.items():
+        # BLEND_RGBA_MAX sobre un fondo transparente copia los píxeles tal
+        # cual; un blit normal mezclaría la transparencia dos veces
+        superficie.blit(imagenes[nombre], rect, special_flags=pygame.BLEND_RGBA_MAX)
+    return AtlasSprites(utilidades.convertir_para_pantalla(superficie), rects)
+
+# ============================================================================
+# DIBUJADO POR CAPAS
+# ============================================================================
+
+def capa_tesoros(atlas, coleccion, camara=None):
+    """
+    Arma la capa de tesoros visibles que se ven en la pantalla
+
+    Con cámara, solo entran los tesoros que tocan su vista (la grilla del
+    TreasureField los encuentra sin recorrer el resto), así que la capa
+    tiene tantos blits como tesoros en pantalla.
+
+    Los tesoros no se mueven: con un TreasureField la secuencia se guarda
+    y solo se vuelve a armar cuando cambia su versión (al recoger o
+    reiniciar) o se mueve la cámara. Con el mundo fijo la cámara no se
+    mueve nunca; armar 10.000 tuplas en cada frame costaría casi tanto
+    como dibujarlas.
+
+    Args:
+        atlas (AtlasSprites): Atlas con el sprite 'tesoro'
+        coleccion (list | TreasureField): Tesoros del juego
+        camara (Camara, optional): Cámara para pasar del mundo a la
+            pantalla (sin ella se dibujan todos los visibles)
+
+    Returns:
+        list: Secuencia para Surface.blits
+    """
+    if not isinstance(coleccion, tesoros.TreasureField):
+        return atlas.capa('tesoro', tesoros.posiciones_en_pantalla(coleccion, camara))
+    origen = (camara.x, camara.y) if camara else None
+    guardada = atlas._capa_tesoros
+    if (guardada and guardada[0] is coleccion and guardada[1] == coleccion.version and
+            guardada[2] == origen):
+        return guardada[3]
+    secuencia = atlas.capa('tesoro', tesoros.posiciones_en_pantalla(coleccion, camara))
+    atlas._capa_tesoros = (coleccion, coleccion.version, origen, secuencia)
+    return secuencia
+
+def capa_personajes(atlas, explorador, enemigos, camara=None):
+    """
+    Arma la capa del jugador y los enemigos (en ese orden, igual que el
+    dibujado sin atlas)
+
+    Args:
+        atlas (AtlasSprites): Atlas con 'jugador' y 'enemigo'
+        explorador (Jugador): Estado del jugador
+        enemigos (Enemigo | EnemySwarm): Enemigo o enjambre
+        camara (Camara, optional): Cámara para pasar del mundo a la
+            pantalla; solo entra lo que toca su vista
+
+    Returns:
+        list: Secuencia para Surface.blits
+    """
+    secuencia = []
+    if explorador.vivo:
+        if camara is None:
+            secuencia.extend(atlas.capa('jugador', [explorador.rect]))
+        elif explorador.rect.colliderect(camara.rect):
+            secuencia.extend(atlas.capa('jugador', [camara.a_pantalla(explorador.x,
+                                                                      explorador.y)]))
+    secuencia.extend(atlas.capa('enemigo', enemigo.posiciones_en_pantalla(enemigos, camara)))
+    return secuencia
+
+def dibujar_capas(pantalla, atlas, estado):
+    """
+    Dibuja tesoros, jugador y enemigos con una llamada a blits por capa
+
+    Args:
+        pantalla (pygame.Surface): Superficie donde dibujar
+        atlas (AtlasSprites): Atlas de sprites
+        estado (dict): Estado del juego
+
+    Conceptos enseñados:
+    - Menos llamadas desde Python = menos costo fijo por sprite
+    """
+    camara = estado['camara']
+    pantalla.blits(capa_tesoros(atlas, estado['tesoros'], camara), False)
+    pantalla.blits(capa_personajes(atlas, estado['jugador'], estado['enemigo'], camara), False)
@@ -0,0 +1,273 @@
+"""
+MÓDULO DE BALANCEO - CAZADOR DE TESOROS
+======================================
+Este módulo juega miles de partidas sin pantalla con un bot para ajustar
+los parámetros de configuracion.py (velocidades, número de tesoros) con
+datos en lugar de a mano.
+
+Las partidas se reparten entre procesos con ProcessPoolExecutor (uno por
+núcleo). Cada partida recibe su propia semilla y sus cambios de
+parámetros como datos; nunca se modifican las constantes globales de
+configuracion.py, así que funciona igual con fork que con spawn. Los
+resultados llegan a medida que terminan y se acumulan en una tabla por
+combinación de parámetros. Una partida que falla (por ejemplo, una
+semilla cuyo mapa no se puede generar) se cuenta como fallida en su fila
+y el resto del balanceo sigue.
+
+Se ejecuta directamente:
+    python balanceo.py --partidas 200 --velocidad-enemigo 1,2,3 --numero-tesoros 5,8
+
+Conceptos enseñados:
+- Paralelismo con procesos (concurrent.futures)
+- Reparto de trabajo en lotes
+- Funciones puras: todo lo que necesita una partida viaja como argumento
+- Agregación de resultados
+"""
+
+import os
+import time
+import argparse
+import itertools
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from configuracion import *
+import main
+import simulacion
+
+# ============================================================================
+# UNA PARTIDA
+# ============================================================================
+
+def jugar_partida(semilla, cambios, frames_maximos=HZ_SIMULACION * 180):
+    """
+    Juega una partida completa con el bot y resume el resultado
+
+    Args:
+        semilla (int): Semilla de la partida
+        cambios (dict): Parámetros de balance a modificar
+        frames_maximos (int): Frames antes de dar la partida por empatada
+
+    Returns:
+        dict: semilla, cambios, resultado ('victoria', 'derrota' o
+            'tiempo'), frames jugados y tesoros recogidos
+    """
+    estado = main.crear_estado_inicial(semilla, cambios)
+    resumen = simulacion.simular(frames_maximos, simulacion.bot_cazador,
+                                 estado=estado, reiniciar=False)
+    return {
+        'semilla': semilla,
+        'cambios': cambios,
+        'resultado': estado['tipo_final'] or 'tiempo',
+        'frames': resumen['frames'],
+        'tesoros': estado['jugador'].tesoros_recogidos,
+    }
+
+def partida_fallida(semilla, cambios, error):
+    """
+    Resultado de una partida que no se pudo jugar
+
+    Args:
+        semilla (int): Semilla de la partida
+        cambios (dict): Parámetros de balance a modificar
+        error (Exception): Excepción que la interrumpió
+
+    Returns:
+        dict: Mismas claves que jugar_partida, con resultado 'error' y el
+            mensaje en 'error'
+    """
+    return {
+        'semilla': semilla,
+        'cambios': cambios,
+        'resultado': 'error',
+        'frames': 0,
+        'tesoros': 0,
+        'error': f"{type(error).__name__}: {error}",
+    }
+
+def jugar_lote(tareas, frames_maximos):
+    """
+    Juega varias partidas seguidas en el mismo proceso
+
+    Enviar lotes en lugar de partidas sueltas reduce el costo de
+    comunicación entre procesos. Si una partida lanza una excepción, se
+    anota como fallida y el lote sigue con las demás.
+
+    Args:
+        tareas (list): Pares (semilla, cambios)
+        frames_maximos (int): Límite de frames por partida
+
+    Returns:
+        list: Resultados de jugar_partida (o de partida_fallida)
+    """
+    resultados = []
+    for semilla, cambios in tareas:
+        try:
+            resultados.append(jugar_partida(semilla, cambios, frames_maximos))
+        except Exception as error:
+            resultados.append(partida_fallida(semilla, cambios, error))
+    return resultados
+
+# ============================================================================
+# TABLA DE RESULTADOS
+# ============================================================================
+
+class TablaBalanceo:
+    """
+    Acumula los resultados de las partidas por combinación de parámetros
+
+    Atributos:
+        filas (dict): Parámetros -> totales de sus partidas
+        errores (list): (semilla, cambios, mensaje) de las partidas fallidas
+
+    Conceptos enseñados:
+    - Agregación incremental (sin guardar cada partida)
+    """
+
+    def __init__(self):
+        self.filas = {}
+        self.errores = []
+
+    def agregar(self, resultado):
+        """
+        Suma una partida a la fila de sus parámetros
+
+        Args:
+            resultado (dict): Resultado de jugar_partida
+        """
+        clave = tuple(sorted(resultado['cambios'].items()))
+        fila = self.filas.setdefault(clave, {'partidas': 0, 'victoria': 0, 'derrota': 0,
+                                             'tiempo': 0, 'error': 0, 'frames': 0, 'tesoros': 0})
+        fila['partidas'] += 1
+        if resultado['resultado'] == 'error':
+            self.errores.append((resultado['semilla'], resultado['cambios'], resultado['error']))
+        fila[resultado['resultado']] += 1
+        fila['frames'] += resultado['frames']
+        fila['tesoros'] += resultado['tesoros']
+
+    def imprimir(self):
+        """
+        Muestra la tabla: porcentaje de victorias, derrotas y partidas sin
+        terminar, partidas fallidas, y promedios de frames y tesoros por
+        partida jugada; después, las primeras partidas fallidas
+        """
+        nombres = {clave: ', '.join(f"{parametro}={valor}" for parametro, valor in clave)
+                   or 'por defecto' for clave in self.filas}
+        ancho = max([len('parámetros')] + [len(nombre) for nombre in nombres.values()])
+        print(f"{'parámetros':<{ancho}} {'partidas':>8} {'victoria':>9} {'derrota':>8} "
+              f"{'tiempo':>7} {'fallidas':>8} {'frames':>8} {'tesoros':>8}")
+        for clave, fila in sorted(self.filas.items()):
+            partidas = fila['partidas']
+            jugadas = max(partidas - fila['error'], 1)
+            print(f"{nombres[clave]:<{ancho}} {partidas:>8} "
+                  f"{fila['victoria'] / partidas:>9.0%} {fila['derrota'] / partidas:>8.0%} "
+                  f"{fila['tiempo'] / partidas:>7.0%} {fila['error']:>8} "
+                  f"{fila['frames'] / jugadas:>8.0f} {fila['tesoros'] / jugadas:>8.1f}")
+        for semilla, cambios, mensaje in self.errores[:5]:
+            print(f"Falló la semilla {semilla} {cambios or ''}: {mensaje}")
+        if len(self.errores) > 5:
+            print(f"... y {len(self.errores) - 5} partidas fallidas más")
+
+# ============================================================================
+# EJECUCIÓN EN PARALELO
+# ============================================================================
+
+def combinaciones_parametros(valores):
+    """
+    Genera todas las combinaciones de valores de los parámetros
+
+    Args:
+        valores (dict): Parámetro -> lista de valores a probar
+
+    Returns:
+        list: Diccionarios de cambios, uno por combinación
+    """
+    nombres = sorted(valores)
+    return [dict(zip(nombres, combinacion))
+            for combinacion in itertools.product(*(valores[nombre] for nombre in nombres))]
+
+def ejecutar_balanceo(combinaciones, partidas, trabajadores=None, semilla_base=0,
+                      frames_maximos=HZ_SIMULACION * 180, tamano_lote=25, al_recibir=None,
+                      contexto=None):
+    """
+    Juega todas las partidas repartidas entre procesos y devuelve la tabla
+
+    Args:
+        combinaciones (list): Diccionarios de cambios a probar
+        partidas (int): Partidas por combinación
+        trabajadores (int, optional): Procesos (por defecto, uno por núcleo)
+        semilla_base (int): Primera semilla; cada partida usa la siguiente
+        frames_maximos (int): Límite de frames por partida
+        tamano_lote (int): Partidas que juega un proceso por envío
+        al_recibir (callable, optional): Se llama con cada resultado
+        contexto (multiprocessing.context, optional): Forma de crear los
+            procesos ('fork' o 'spawn'); por defecto la del sistema
+
+    Returns:
+        TablaBalanceo: Resultados agregados
+    """
+    tareas = [(semilla_base + numero, cambios)
+              for cambios in combinaciones
+              for numero in range(partidas)]
+    lotes = [tareas[inicio:inicio + tamano_lote] for inicio in range(0, len(tareas), tamano_lote)]
+
+    tabla = TablaBalanceo()
+    with ProcessPoolExecutor(max_workers=trabajadores or os.cpu_count(),
+                             mp_context=contexto) as ejecutor:
+        futuros = {ejecutor.submit(jugar_lote, lote, frames_maximos): lote for lote in lotes}
+        for futuro in as_completed(futuros):
+            try:
+                resultados = futuro.result()
+            except Exception as error:
+                # El proceso mismo falló (por ejemplo, se quedó sin
+                # memoria): todo su lote cuenta como fallido
+                resultados = [partida_fallida(semilla, cambios, error)
+                              for semilla, cambios in futuros[futuro]]
+            for resultado in resultados:
+                tabla.agregar(resultado)
+                if al_recibir:
+                    al_recibir(resultado)
+    return tabla
+
+# ============================================================================
+# PUNTO DE ENTRADA
+# ============================================================================
+
+def leer_valores(texto):
+    """
+    Convierte "1,2,3" en [1, 2, 3]
+    """
+    return [int(valor) for valor in texto.split(',')]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Partidas en paralelo para balancear el juego")
+    parser.add_argument('--partidas', type=int, default=100, help="partidas por combinación")
+    parser.add_argument('--trabajadores', type=int, default=None, help="procesos (uno por núcleo)")
+    parser.add_argument('--semilla', type=int, default=0, help="semilla de la primera partida")
+    parser.add_argument('--velocidad-jugador', type=leer_valores, default=[VELOCIDAD_JUGADOR])
+    parser.add_argument('--velocidad-enemigo', type=leer_valores, default=[VELOCIDAD_ENEMIGO])
+    parser.add_argument('--numero-tesoros', type=leer_valores, default=[NUMERO_TESOROS])
+    argumentos = parser.parse_args()
+
+    combinaciones = combinaciones_parametros({
+        'VELOCIDAD_JUGADOR': argumentos.velocidad_jugador,
+        'VELOCIDAD_ENEMIGO': argumentos.velocidad_enemigo,
+        'NUMERO_TESOROS': argumentos.numero_tesoros,
+    })
+    total = len(combinaciones) * argumentos.partidas
+    recibidos = [0]
+
+    def mostrar_progreso(resultado):
+        recibidos[0] += 1
+        if recibidos[0] % 100 == 0 or recibidos[0] == total:
+            print(f"\r{recibidos[0]}/{total} partidas", end='', flush=True)
+
+    inicio = time.perf_counter()
+    tabla = ejecutar_balanceo(combinaciones, argumentos.partidas, argumentos.trabajadores,
+                              argumentos.semilla, al_recibir=mostrar_progreso)
+    segundos = time.perf_counter() - inicio
+
+    print()
+    tabla.imprimir()
+    print(f"{total} partidas en {segundos:.1f} s con "
+          f"{argumentos.trabajadores or os.cpu_count()} procesos "
+          f"({total / segundos:.1f} partidas/s)")
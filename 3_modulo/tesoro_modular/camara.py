@@ -0,0 +1,159 @@
+"""
+MÓDULO DE CÁMARA - CAZADOR DE TESOROS
+====================================
+Este módulo convierte coordenadas del mundo en coordenadas de pantalla.
+
+Con el mundo fijo, el mundo y la pantalla coinciden: la cámara se queda
+en (0, 0) y dibujar no cambia nada. Con el mundo infinito
+(MUNDO_INFINITO) la cámara sigue al jugador con un poco de retraso
+(SUAVIZADO_CAMARA), y todo lo que se dibuja del mundo (fondo, tesoros,
+jugador y enemigos) se desplaza restando la esquina de la cámara. El HUD
+se dibuja siempre en coordenadas de pantalla.
+
+Solo se dibuja lo que toca la vista de la cámara (rect): los tesoros se
+buscan en la grilla del TreasureField y los enemigos se filtran con una
+máscara, así que la cantidad de blits depende de lo que hay en pantalla
+y no del tamaño del mundo.
+
+Conceptos enseñados:
+- Coordenadas del mundo y coordenadas de pantalla
+- Cámaras que siguen a un personaje con suavizado exponencial
+- Descarte de lo que no se ve (frustum culling en 2D)
+- Fondos que se repiten en mosaico
+"""
+
+import math
+import pygame
+from configuracion import *
+
+class Camara:
+    """
+    Ventana de ANCHO x ALTO píxeles sobre el mundo
+
+    Atributos:
+        x, y (int): Esquina superior izquierda de la vista, en el mundo
+        ancho, alto (int): Tamaño de la vista (el de la pantalla)
+        suavizado (float): Segundos en que la cámara recorre ~63% de la
+            distancia que la separa del objetivo (0: lo sigue sin retraso)
+
+    Conceptos enseñados:
+    - Transformación de mundo a pantalla (una resta)
+    """
+
+    __slots__ = ('x', 'y', 'ancho', 'alto', 'suavizado')
+
+    def __init__(self, ancho=ANCHO, alto=ALTO, x=0, y=0, suavizado=SUAVIZADO_CAMARA):
+        self.x = x
+        self.y = y
+        self.ancho = ancho
+        self.alto = alto
+        self.suavizado = suavizado
+
+    @property
+    def rect(self):
+        """Zona del mundo que se ve, como pygame.Rect"""
+        return pygame.Rect(self.x, self.y, self.ancho, self.alto)
+
+    def en_origen(self):
+        """
+        Returns:
+            bool: True si el mundo y la pantalla coinciden (no hace falta
+                desplazar nada al dibujar)
+        """
+        return self.x == 0 and self.y == 0
+
+    def centrar_en(self, x, y):
+        """
+        Mueve la cámara para que el punto (x, y) quede en el centro
+
+        Args:
+            x, y (int): Punto del mundo
+        """
+        self.x = x - self.ancho // 2
+        self.y = y - self.alto // 2
+
+    def seguir(self, entidad, segundos=None):
+        """
+        Acerca la cámara a una entidad (el jugador) hasta centrarla
+
+        Cada frame la cámara recorre la fracción 1 - e^(-segundos /
+        suavizado) de la distancia que le falta: la misma curva con
+        cualquier cantidad de FPS. Sin 'segundos' (al empezar o reiniciar
+        la partida) se centra de golpe.
+
+        Args:
+            entidad (EntidadConRect): Entidad con rect
+            segundos (float, optional): Tiempo real desde el frame anterior
+        """
+        objetivo_x, objetivo_y = entidad.rect.center
+        if segundos is None or self.suavizado <= 0:
+            self.centrar_en(objetivo_x, objetivo_y)
+            return
+        peso = 1.0 - math.exp(-segundos / self.suavizado)
+        self.x = acercar(self.x, objetivo_x - self.ancho // 2, peso)
+        self.y = acercar(self.y, objetivo_y - self.alto // 2, peso)
+
+    def a_pantalla(self, x, y):
+        """
+        Args:
+            x, y (int): Posición en el mundo
+
+        Returns:
+            tuple: Posición en la pantalla
+        """
+        return x - self.x, y - self.y
+
+    def a_mundo(self, x, y):
+        """
+        Args:
+            x, y (int): Posición en la pantalla (por ejemplo, del ratón)
+
+        Returns:
+            tuple: Posición en el mundo
+        """
+        return x + self.x, y + self.y
+
+    def dibujar_fondo(self, pantalla, fondo):
+        """
+        Dibuja el fondo repetido en mosaico, desplazado con la cámara
+
+        El fondo mide lo mismo que la pantalla, así que como mucho se ven
+        cuatro copias.
+
+        Args:
+            pantalla (pygame.Surface): Superficie donde dibujar
+            fondo (pygame.Surface): Imagen de fondo
+        """
+        if self.en_origen():
+            pantalla.blit(fondo, (0, 0))
+            return
+        ancho, alto = fondo.get_size()
+        inicio_x = -(self.x % ancho)
+        inicio_y = -(self.y % alto)
+        pantalla.blits([(fondo, (x, y))
+                        for y in range(inicio_y, self.alto, alto)
+                        for x in range(inicio_x, self.ancho, ancho)], False)
+
+    def __repr__(self):
+        return f"Camara(x={self.x}, y={self.y}, ancho={self.ancho}, alto={self.alto})"
+
+def acercar(actual, objetivo, peso):
+    """
+    Avanza una coordenada entera la fracción 'peso' del camino al
+    objetivo, al menos un píxel (redondear pasos pequeños a cero dejaría
+    la cámara quieta a unos píxeles del jugador)
+
+    Args:
+        actual, objetivo (int): Posición actual y buscada
+        peso (float): Fracción del camino (0 a 1)
+
+    Returns:
+        int: Nueva posición
+    """
+    diferencia = objetivo - actual
+    if diferencia == 0:
+        return actual
+    paso = round(diferencia * peso)
+    if paso == 0:
+        paso = 1 if diferencia > 0 else -1
+    return actual + paso
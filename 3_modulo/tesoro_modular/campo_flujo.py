@@ -0,0 +1,375 @@
+"""
+MÓDULO DE CAMPO DE FLUJO - CAZADOR DE TESOROS
+============================================
+Este módulo calcula un campo de flujo (flow field) para que los enemigos
+lleguen hasta el jugador esquivando obstáculos.
+
+En lugar de buscar un camino (A*) para cada enemigo, se hace UNA búsqueda
+en anchura (BFS) desde la celda del jugador sobre una grilla de celdas
+transitables. Cada celda guarda su distancia al jugador y la dirección
+hacia el vecino más cercano a él; cualquier enemigo solo tiene que mirar
+la celda en la que está (O(1)) para saber hacia dónde moverse.
+
+El campo se recalcula solo cuando el jugador entra en otra celda, y si
+cambian los obstáculos se corrigen únicamente las celdas afectadas.
+
+Conceptos enseñados:
+- Búsqueda en anchura (BFS) por frentes de onda
+- Campos de flujo para muchos agentes
+- Caché: recalcular solo cuando cambia la entrada
+- Actualización incremental de distancias
+"""
+
+import heapq
+
+import numpy as np
+from configuracion import *
+
+# Distancia de las celdas a las que no se puede llegar
+INALCANZABLE = np.iinfo(np.int32).max
+
+# ============================================================================
+# CAMPO DE FLUJO
+# ============================================================================
+
+class CampoFlujo:
+    """
+    Grilla de distancias y direcciones hacia la celda del jugador.
+
+    Los arreglos son planos y tienen un borde de celdas no transitables
+    alrededor del mapa, así que los cuatro vecinos de cualquier celda
+    interior están siempre en índice ± 1 y índice ± ancho, sin revisar
+    bordes.
+
+    Conceptos enseñados:
+    - Grillas guardadas como arreglos planos con borde
+    - BFS vectorizado con NumPy
+    - Dijkstra local para reparar distancias
+    """
+
+    def __init__(self, columnas, filas, tamano_celda, transitables=None):
+        """
+        Crea el campo con todas las celdas transitables (o las indicadas)
+
+        Args:
+            columnas (int): Celdas a lo ancho
+            filas (int): Celdas a lo alto
+            tamano_celda (int): Lado de cada celda en píxeles
+            transitables (numpy.ndarray, optional): Matriz booleana
+                (filas x columnas) con True en las celdas libres
+        """
+        self.columnas = columnas
+        self.filas = filas
+        self.tamano_celda = tamano_celda
+        self.ancho = columnas + 2
+
+        self.transitable = np.zeros((filas + 2, columnas + 2), dtype=bool)
+        self.transitable[1:-1, 1:-1] = True if transitables is None else transitables
+        self.transitable_plano = self.transitable.reshape(-1)
+
+        total = self.transitable_plano.size
+        self.distancia = np.full(total, INALCANZABLE, dtype=np.int32)
+        self.direccion_x = np.zeros(total, dtype=np.int8)
+        self.direccion_y = np.zeros(total, dtype=np.int8)
+        self.desplazamientos = np.array([-1, 1, -self.ancho, self.ancho])
+        self._marca = np.zeros(total, dtype=np.int64)
+        self.interiores = np.flatnonzero(np.pad(np.ones((filas, columnas), dtype=bool), 1))
+
+        self.celda_objetivo = None
+        self.recalculos = 0
+
+    # ------------------------------------------------------------------
+    # Conversión entre píxeles, celdas e índices
+    # ------------------------------------------------------------------
+
+    def celda_de(self, x, y):
+        """
+        Args:
+            x, y (int): Posición en píxeles
+
+        Returns:
+            tuple: (columna, fila) de la celda, recortada al mapa
+        """
+        columna = min(max(int(x) // self.tamano_celda, 0), self.columnas - 1)
+        fila = min(max(int(y) // self.tamano_celda, 0), self.filas - 1)
+        return columna, fila
+
+    def indice(self, columna, fila):
+        """
+        Returns:
+            int: Índice plano de la celda (teniendo en cuenta el borde)
+        """
+        return (fila + 1) * self.ancho + columna + 1
+
+    def indices_de(self, posiciones_x, posiciones_y):
+        """
+        Convierte muchas posiciones en píxeles a índices planos de celda
+
+        Args:
+            posiciones_x, posiciones_y (numpy.ndarray): Posiciones en píxeles
+
+        Returns:
+            numpy.ndarray: Índice plano de la celda de cada posición
+        """
+        columnas = np.clip(posiciones_x // self.tamano_celda, 0, self.columnas - 1)
+        filas = np.clip(posiciones_y // self.tamano_celda, 0, self.filas - 1)
+        return (filas + 1) * self.ancho + columnas + 1
+
+    # ------------------------------------------------------------------
+    # Cálculo completo
+    # ------------------------------------------------------------------
+
+    def actualizar_objetivo(self, x, y):
+        """
+        Apunta el campo hacia una posición, recalculando solo si la
+        posición cae en una celda distinta de la anterior
+
+        Args:
+            x, y (int): Posición del objetivo en píxeles
+
+        Returns:
+            bool: True si hubo que recalcular el campo
+        """
+        celda = self.celda_de(x, y)
+        if celda == self.celda_objetivo:
+            return False
+        self.celda_objetivo = celda
+        self.recalcular()
+        return True
+
+    def recalcular(self):
+        """
+        Calcula de cero las distancias con un BFS desde la celda objetivo
+
+        Cada vuelta del bucle procesa un frente de onda completo con
+        operaciones de NumPy: todos los vecinos de las celdas del frente
+        que aún no tienen distancia reciben la distancia del nivel.
+        """
+        distancia = self.distancia
+        distancia.fill(INALCANZABLE)
+        self.recalculos += 1
+        if self.celda_objetivo is None:
+            return
+
+        frente = np.array([self.indice(*self.celda_objetivo)])
+        distancia[frente] = 0
+        sin_visitar = self.transitable_plano.copy()
+        sin_visitar[frente] = False
+        nivel = 0
+        while frente.size:
+            nivel += 1
+            vecinos = (frente[:, None] + self.desplazamientos).reshape(-1)
+            vecinos = vecinos[sin_visitar[vecinos]]
+            sin_visitar[vecinos] = False
+            distancia[vecinos] = nivel
+            # Una celda puede ser vecina de dos celdas del frente: quitar
+            # repetidos marcando cada celda con su posición (sin ordenar)
+            posiciones = np.arange(vecinos.size)
+            self._marca[vecinos] = posiciones
+            frente = vecinos[self._marca[vecinos] == posiciones]
+
+        self._calcular_direcciones(self.interiores)
+
+    def _calcular_direcciones(self, indices):
+        """
+        Elige para cada celda el paso (-1, 0 o 1 por eje) hacia los vecinos
+        más cercanos al objetivo
+
+        Si la celda tiene un vecino más cercano en horizontal y otro en
+        vertical, se mueve en diagonal salvo que la esquina esté bloqueada.
+
+        Args:
+            indices (numpy.ndarray): Índices planos de las celdas a actualizar
+        """
+        distancia = self.distancia
+        propia = distancia[indices]
+        izquierda = distancia[indices - 1]
+        derecha = distancia[indices + 1]
+        arriba = distancia[indices - self.ancho]
+        abajo = distancia[indices + self.ancho]
+
+        paso_x = np.where((izquierda < propia) & (izquierda <= derecha), -1,
+                          np.where(derecha < propia, 1, 0))
+        paso_y = np.where((arriba < propia) & (arriba <= abajo), -1,
+                          np.where(abajo < propia, 1, 0))
+
+        # No cortar esquinas de obstáculos
+        esquina = indices + paso_x + paso_y * self.ancho
+        paso_y[(paso_x != 0) & (paso_y != 0) & ~self.transitable_plano[esquina]] = 0
+
+        self.direccion_x[indices] = paso_x
+        self.direccion_y[indices] = paso_y
+
+    # ------------------------------------------------------------------
+    # Cambios de obstáculos
+    # ------------------------------------------------------------------
+
+    def cambiar_transitables(self, celdas, transitable):
+        """
+        Marca celdas como libres u ocupadas y repara solo las distancias
+        que dependían de ellas
+
+        Al bloquear, se invalidan las celdas cuyo único camino pasaba por
+        la celda bloqueada (y las que dependían de esas). Después, un
+        Dijkstra local parte de las celdas vecinas que siguen siendo
+        correctas y vuelve a llenar la zona invalidada. Al liberar una
+        celda, el mismo Dijkstra propaga las mejoras que produce.
+
+        Args:
+            celdas (list): Pares (columna, fila) a cambiar
+            transitable (bool): True para liberar, False para bloquear
+
+        Returns:
+            int: Número de celdas cuya distancia se revisó
+        """
+        indices = [self.indice(columna, fila) for columna, fila in celdas]
+        cambiados = [i for i in indices if self.transitable_plano[i] != transitable]
+        for indice in cambiados:
+            self.transitable_plano[indice] = transitable
+        if not cambiados or self.celda_objetivo is None:
+            return 0
+
+        objetivo = self.indice(*self.celda_objetivo)
+        distancia = self.distancia
+        transitable_plano = self.transitable_plano
+        desplazamientos = self.desplazamientos.tolist()
+
+        if objetivo in cambiados:
+            self.recalcular()
+            return len(self.interiores)
+
+        # 1. Invalidar las distancias que dependían de las celdas cambiadas.
+        #    Se procesan en orden de distancia para que un vecino que
+        #    "sostiene" a otro ya esté invalidado si también dependía del
+        #    obstáculo.
+        invalidas = set(cambiados)
+        pendientes = []
+        for indice in cambiados:
+            pendientes.append((int(distancia[indice]), indice))
+            distancia[indice] = INALCANZABLE
+        heapq.heapify(pendientes)
+
+        if not transitable:
+            limite = len(self.interiores) // 4
+            while pendientes:
+                anterior, indice = heapq.heappop(pendientes)
+                if anterior == INALCANZABLE:
+                    continue
+                for desplazamiento in desplazamientos:
+                    vecino = indice + desplazamiento
+                    valor = int(distancia[vecino])
+                    if valor != anterior + 1 or not transitable_plano[vecino]:
+                        continue
+                    # Sigue siendo válido si otro vecino lo sostiene
+                    if any(distancia[vecino + otro] == valor - 1 for otro in desplazamientos):
+                        continue
+                    invalidas.add(vecino)
+                    distancia[vecino] = INALCANZABLE
+                    heapq.heappush(pendientes, (valor, vecino))
+                # Si el bloqueo afecta a gran parte del mapa, es más
+                # barato el BFS vectorizado completo
+                if len(invalidas) > limite:
+                    self.recalcular()
+                    return len(self.interiores)
+
+        # 2. Dijkstra local desde los bordes válidos de la zona invalidada
+        cola = []
+        for indice in invalidas:
+            for desplazamiento in desplazamientos:
+                vecino = indice + desplazamiento
+                if distancia[vecino] != INALCANZABLE:
+                    cola.append((int(distancia[vecino]), vecino))
+        heapq.heapify(cola)
+
+        revisadas = set(invalidas)
+        while cola:
+            valor, indice = heapq.heappop(cola)
+            if valor > distancia[indice]:
+                continue
+            for desplazamiento in desplazamientos:
+                vecino = indice + desplazamiento
+                if transitable_plano[vecino] and distancia[vecino] > valor + 1:
+                    distancia[vecino] = valor + 1
+                    revisadas.add(vecino)
+                    heapq.heappush(cola, (valor + 1, vecino))
+
+        # 3. Actualizar direcciones de las celdas revisadas y de sus ocho
+        #    vecinas (una esquina bloqueada cambia el paso en diagonal)
+        revisadas = np.fromiter(revisadas, dtype=np.int64)
+        alrededor = np.array([fila * self.ancho + columna
+                              for fila in (-1, 0, 1) for columna in (-1, 0, 1)])
+        afectadas = np.unique((revisadas[:, None] + alrededor).reshape(-1))
+        afectadas = afectadas[self._son_interiores(afectadas)]
+        self._calcular_direcciones(afectadas)
+        return len(revisadas)
+
+    def _son_interiores(self, indices):
+        """
+        Returns:
+            numpy.ndarray: Máscara de los índices que no están en el borde
+        """
+        fila, columna = np.divmod(indices, self.ancho)
+        return (fila >= 1) & (fila <= self.filas) & (columna >= 1) & (columna <= self.columnas)
+
+    def bloquear_rect(self, rect, bloquear=True):
+        """
+        Bloquea (o libera) todas las celdas que toca un rectángulo en píxeles
+
+        Args:
+            rect (pygame.Rect): Obstáculo en píxeles
+            bloquear (bool): False para liberar las celdas
+
+        Returns:
+            int: Número de celdas cuya distancia se revisó
+        """
+        columna_min, fila_min = self.celda_de(rect.left, rect.top)
+        columna_max, fila_max = self.celda_de(rect.right - 1, rect.bottom - 1)
+        celdas = [(columna, fila)
+                  for fila in range(fila_min, fila_max + 1)
+                  for columna in range(columna_min, columna_max + 1)]
+        return self.cambiar_transitables(celdas, not bloquear)
+
+    # ------------------------------------------------------------------
+    # Consultas de los enemigos
+    # ------------------------------------------------------------------
+
+    def direccion_en(self, x, y):
+        """
+        Consulta O(1) de la dirección a seguir desde una posición
+
+        Args:
+            x, y (int): Posición en píxeles (por ejemplo, el centro del enemigo)
+
+        Returns:
+            tuple: (paso_x, paso_y, distancia en celdas al objetivo)
+        """
+        indice = self.indice(*self.celda_de(x, y))
+        return (int(self.direccion_x[indice]), int(self.direccion_y[indice]),
+                int(self.distancia[indice]))
+
+    def direcciones_en(self, posiciones_x, posiciones_y):
+        """
+        Versión vectorizada de direccion_en para un enjambre
+
+        Args:
+            posiciones_x, posiciones_y (numpy.ndarray): Posiciones en píxeles
+
+        Returns:
+            tuple: (pasos_x, pasos_y, distancias) como arreglos
+        """
+        indices = self.indices_de(posiciones_x, posiciones_y)
+        return self.direccion_x[indices], self.direccion_y[indices], self.distancia[indices]
+
+def crear_campo_pantalla(tamano_celda=TAMANO_CELDA_FLUJO):
+    """
+    Crea un campo de flujo que cubre la pantalla del juego
+
+    Args:
+        tamano_celda (int): Lado de cada celda en píxeles
+
+    Returns:
+        CampoFlujo: Campo con todas las celdas transitables
+    """
+    columnas = -(-ANCHO // tamano_celda)
+    filas = -(-ALTO // tamano_celda)
+    return CampoFlujo(columnas, filas, tamano_celda)
@@ -0,0 +1,152 @@
+"""
+MÓDULO DE CARGA EN SEGUNDO PLANO - CAZADOR DE TESOROS
+====================================================
+Este módulo carga las imágenes del juego en varios hilos mientras el
+hilo principal dibuja la pantalla de inicio con una barra de progreso.
+
+Leer un PNG, decodificarlo y escalarlo es trabajo de SDL (en C), y
+pygame suelta el GIL mientras lo hace: varios hilos pueden preparar
+imágenes a la vez y el hilo principal sigue dibujando y atendiendo la
+ventana. Convertir cada imagen al formato de la pantalla
+(convert/convert_alpha) depende de la ventana, así que eso se hace en el
+hilo principal a medida que terminan los trabajos.
+
+Las fuentes se cargan antes, en el hilo principal: hacen falta para
+dibujar la pantalla de carga.
+
+Conceptos enseñados:
+- Hilos y el GIL: cuándo sirven los hilos en Python
+- concurrent.futures.ThreadPoolExecutor y wait
+- Trabajo en segundo plano con una ventana que sigue respondiendo
+"""
+
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+import pygame
+from configuracion import *
+import interfaz
+import utilidades
+
+# ============================================================================
+# CARGADOR
+# ============================================================================
+
+class CargadorImagenes:
+    """
+    Reparte la preparación de las imágenes (caché, decodificación y
+    escalado) entre hilos y las convierte en el hilo principal a medida
+    que terminan
+
+    Uso:
+        cargador = CargadorImagenes(utilidades.RECURSOS_IMAGENES)
+        while not cargador.terminado():
+            cargador.esperar(1 / FPS)   # convierte las que terminaron
+            ... dibujar con cargador.progreso() ...
+        imagenes = cargador.imagenes
+
+    Conceptos enseñados:
+    - Futuros: resultados que llegan más tarde
+    - Dividir un trabajo entre lo que puede ir en otro hilo y lo que no
+    """
+
+    def __init__(self, recursos, hilos=HILOS_CARGA, directorio_cache=RUTA_CACHE_IMAGENES):
+        """
+        Args:
+            recursos (dict): Nombre -> (archivo, tamaño), como
+                utilidades.RECURSOS_IMAGENES
+            hilos (int): Hilos que preparan imágenes
+            directorio_cache (str, optional): Carpeta de la caché de
+                imágenes escaladas (None para no usarla)
+        """
+        self.recursos = recursos
+        self.imagenes = {}
+        ejecutor = ThreadPoolExecutor(max_workers=hilos, thread_name_prefix='carga')
+
+        def area(nombre):
+            tamano = recursos[nombre][1]
+            return tamano[0] * tamano[1] if tamano else 0
+
+        # Las más grandes primero: son las que más tardan
+        orden = sorted(recursos, key=area, reverse=True)
+        self.pendientes = {
+            ejecutor.submit(utilidades.preparar_imagen, recursos[nombre][0],
+                            recursos[nombre][1], directorio_cache): nombre
+            for nombre in orden
+        }
+        # Sin trabajos nuevos: los hilos terminan solos al vaciar la cola
+        ejecutor.shutdown(wait=False)
+
+    def esperar(self, limite=None):
+        """
+        Espera a que termine alguna imagen y convierte todas las que ya
+        terminaron
+
+        Args:
+            limite (float, optional): Segundos como máximo (None: hasta
+                que termine alguna)
+
+        Returns:
+            int: Imágenes convertidas en esta llamada
+        """
+        if not self.pendientes:
+            return 0
+        terminados, _ = wait(self.pendientes, timeout=limite, return_when=FIRST_COMPLETED)
+        for futuro in terminados:
+            nombre = self.pendientes.pop(futuro)
+            tamano = self.recursos[nombre][1]
+            self.imagenes[nombre] = utilidades.terminar_imagen(nombre, futuro.result(), tamano)
+        return len(terminados)
+
+    def progreso(self):
+        """
+        Returns:
+            float: Fracción de imágenes listas (0 a 1)
+        """
+        if not self.recursos:
+            return 1.0
+        return len(self.imagenes) / len(self.recursos)
+
+    def terminado(self):
+        """
+        Returns:
+            bool: True si todas las imágenes están listas
+        """
+        return not self.pendientes
+
+# ============================================================================
+# CARGA CON PANTALLA DE PROGRESO
+# ============================================================================
+
+def cargar_con_pantalla(pantalla, fuentes, recursos=None, hilos=HILOS_CARGA,
+                        directorio_cache=RUTA_CACHE_IMAGENES):
+    """
+    Carga las imágenes en hilos mientras dibuja la pantalla de inicio con
+    el progreso, un frame cada 1/FPS segundos como máximo
+
+    Los eventos se bombean para que la ventana siga respondiendo; quedan
+    en la cola (por ejemplo, cerrar la ventana) y los atiende el bucle del
+    juego.
+
+    Args:
+        pantalla (pygame.Surface): Superficie de la ventana
+        fuentes (dict): Fuentes ya cargadas (interfaz.inicializar_fuentes)
+        recursos (dict, optional): Imágenes a cargar (por defecto
+            utilidades.RECURSOS_IMAGENES)
+        hilos (int): Hilos que preparan imágenes
+        directorio_cache (str, optional): Carpeta de la caché
+
+    Returns:
+        dict: Nombre -> imagen convertida
+
+    Conceptos enseñados:
+    - Pantalla de carga: mostrar algo mientras se trabaja
+    """
+    cargador = CargadorImagenes(recursos or utilidades.RECURSOS_IMAGENES, hilos,
+                                directorio_cache)
+    while True:
+        interfaz.mostrar_pantalla_inicio(pantalla, fuentes, cargador.progreso())
+        pygame.display.flip()
+        pygame.event.pump()
+        if cargador.terminado():
+            return cargador.imagenes
+        cargador.esperar(1 / FPS)
@@ -3,14 +3,29 @@ MÓDULO DE COLISIONES - CAZADOR DE TESOROS
 ========================================
 Este módulo centraliza toda la lógica de detección de colisiones del juego.
 
+También define el "mundo de colisiones" (MundoColisiones): cada tipo de
+entidad se registra una vez con su caja y su fase amplia, y cada par de
+tipos que interesa (jugador-tesoro, jugador-enemigo, ...) con una función
+que lo atiende. En cada frame el mundo busca todos los contactos y se los
+entrega a cada manejador en un solo lote. Sumar un tipo de entidad nuevo
+es registrar su tipo y sus pares, sin escribir otro recorrido completo.
+
 Conceptos enseñados:
 - Centralización de lógica de colisiones
 - Funciones especializadas por tipo de colisión
 - Separación de responsabilidades
+- Fase amplia (broadphase) y fase precisa (narrowphase)
+- Manejadores registrados (callbacks)
 """
 
+import math
+import numpy as np
 import pygame
 from configuracion import *
+from jugador import obtener_rect_jugador, agregar_tesoro_jugador, jugador_capturado
+from tesoros import obtener_rect_tesoro, recoger_tesoro, TreasureField
+from enemigo import obtener_rect_enemigo, EnemySwarm
+from utilidades import EntidadConRect
 
 # ============================================================================
 # FUNCIONES BÁSICAS DE DETECCIÓN DE COLISIONES
@@ -110,7 +125,7 @@ def procesar_colisiones_jugador_tesoros(jugador, tesoros):
     Procesa todas las colisiones entre el jugador y los tesoros
     
     Args:
-        jugador (dict): Estado del jugador
+        jugador (Jugador): Estado del jugador
         tesoros (list): Lista de tesoros
         
     Returns:
@@ -121,24 +136,31 @@ def procesar_colisiones_jugador_tesoros(jugador, tesoros):
     - Modificación de estado durante el procesamiento
     - Contadores de eventos
     - Importación de módulos hermanos
+    - Consultas a una grilla espacial (solo celdas cercanas)
     """
-    # Importar funciones de otros módulos (evitar importación circular)
-    from jugador import obtener_rect_jugador, agregar_tesoro_jugador
-    from tesoros import obtener_rect_tesoro, recoger_tesoro
-    
     tesoros_recogidos_ahora = 0  # Contador para este frame
     
     # Solo verificar si el jugador está vivo
-    if not jugador['vivo']:
+    if not jugador.vivo:
         return 0
     
     # Obtener rectángulo del jugador una vez
     rect_jugador = obtener_rect_jugador(jugador)
     
-    # Revisar cada tesoro
+    # Con un TreasureField, su GrillaEstatica solo revisa las celdas que
+    # toca el jugador
+    if isinstance(tesoros, TreasureField):
+        tocados = tesoros.indices_en_rect(rect_jugador)
+        if tocados.size:
+            tesoros_recogidos_ahora = tesoros.recoger(tocados)
+            for _ in range(tesoros_recogidos_ahora):
+                agregar_tesoro_jugador(jugador)
+        return tesoros_recogidos_ahora
+    
+    # Lista simple: revisar cada tesoro
     for tesoro in tesoros:
         # Solo verificar tesoros visibles
-        if tesoro['visible']:
+        if tesoro.visible:
             rect_tesoro = obtener_rect_tesoro(tesoro)
             
             # Verificar colisión
@@ -155,8 +177,8 @@ def procesar_colision_jugador_enemigo(jugador, enemigo):
     Procesa la colisión entre jugador y enemigo
     
     Args:
-        jugador (dict): Estado del jugador
-        enemigo (dict): Estado del enemigo
+        jugador (Jugador): Estado del jugador
+        enemigo (Enemigo | EnemySwarm): Estado del enemigo o del enjambre
         
     Returns:
         bool: True si hubo colisión (jugador capturado)
@@ -165,14 +187,18 @@ def procesar_colision_jugador_enemigo(jugador, enemigo):
     - Procesamiento de colisión de derrota
     - Modificación de estado crítico
     - Funciones que cambian el estado del juego
+    - Colisión de un rectángulo contra muchos a la vez
     """
-    # Solo verificar si ambos están activos
-    if not jugador['vivo'] or not enemigo['activo']:
+    # Enjambre: una sola prueba vectorizada contra todos los enemigos
+    if isinstance(enemigo, EnemySwarm):
+        if jugador.vivo and enemigo.toca_rect(obtener_rect_jugador(jugador)):
+            jugador_capturado(jugador)
+            return True
         return False
     
-    # Importar funciones necesarias
-    from jugador import obtener_rect_jugador, jugador_capturado
-    from enemigo import obtener_rect_enemigo
+    # Solo verificar si ambos están activos
+    if not jugador.vivo or not enemigo.activo:
+        return False
     
     # Obtener rectángulos
     rect_jugador = obtener_rect_jugador(jugador)
@@ -186,6 +212,557 @@ def procesar_colision_jugador_enemigo(jugador, enemigo):
     
     return False
 
+# ============================================================================
+# COLISIONES CONTINUAS (BARRIDO)
+# ============================================================================
+
+# 'discreto' prueba solo las posiciones finales de cada paso; los modos de
+# barrido prueban todo el recorrido del paso y no se saltan nada
+MODOS_COLISION = ('discreto', 'barrido_aabb', 'barrido_circulo')
+
+def franja_superposicion(inicio_a, largo_a, inicio_b, largo_b, velocidad):
+    """
+    Calcula en qué intervalo de tiempo se superponen dos segmentos de un
+    eje cuando A se mueve a cierta velocidad respecto de B
+
+    Args:
+        inicio_a, largo_a: Segmento de A al inicio del paso
+        inicio_b, largo_b: Segmento de B
+        velocidad: Desplazamiento de A respecto de B durante el paso
+
+    Returns:
+        tuple: (entrada, salida) en fracciones del paso (-inf/inf si se
+            superponen todo el tiempo; entrada > salida si nunca)
+    """
+    velocidad = np.asarray(velocidad, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        tiempo_1 = (inicio_b - (inicio_a + largo_a)) / velocidad
+        tiempo_2 = (inicio_b + largo_b - inicio_a) / velocidad
+    quieto = velocidad == 0
+    superpuestos = (inicio_a < inicio_b + largo_b) & (inicio_a + largo_a > inicio_b)
+    entrada = np.where(quieto, np.where(superpuestos, -np.inf, np.inf), np.minimum(tiempo_1, tiempo_2))
+    salida = np.where(quieto, np.where(superpuestos, np.inf, -np.inf), np.maximum(tiempo_1, tiempo_2))
+    return entrada, salida
+
+def tiempos_impacto_aabb(x_a, y_a, dx_a, dy_a, ancho_a, alto_a,
+                         x_b, y_b, dx_b, dy_b, ancho_b, alto_b):
+    """
+    Calcula cuándo empieza a superponerse una caja con otra (o con muchas)
+    si las dos avanzan en línea recta durante un paso (barrido AABB)
+
+    En cada eje se busca el intervalo de tiempo en que las cajas se
+    superponen (método de las franjas); chocan si los dos intervalos se
+    cruzan dentro del paso. Usa la misma regla que colliderect: tocarse
+    solo por el borde no cuenta.
+
+    Args:
+        x_a, y_a: Esquina de A al inicio del paso
+        dx_a, dy_a: Desplazamiento de A durante el paso
+        ancho_a, alto_a: Tamaño de A
+        x_b, y_b, dx_b, dy_b, ancho_b, alto_b: Lo mismo para B (pueden
+            ser arreglos para probar muchas cajas a la vez)
+
+    Returns:
+        numpy.ndarray: Tiempo de impacto entre 0 (inicio del paso) y 1
+            (final) para cada B; np.inf si no chocan
+
+    Conceptos enseñados:
+    - Detección continua de colisiones
+    - Movimiento relativo: B queda quieto y A se mueve por los dos
+    """
+    entrada_x, salida_x = franja_superposicion(x_a, ancho_a, x_b, ancho_b, np.subtract(dx_a, dx_b))
+    entrada_y, salida_y = franja_superposicion(y_a, alto_a, y_b, alto_b, np.subtract(dy_a, dy_b))
+    entrada = np.maximum(entrada_x, entrada_y)
+    salida = np.minimum(salida_x, salida_y)
+    chocan = (entrada < salida) & (entrada < 1) & (salida > 0)
+    return np.where(chocan, np.maximum(entrada, 0.0), np.inf)
+
+def tiempos_impacto_circulos(x_a, y_a, dx_a, dy_a, radio_a, x_b, y_b, dx_b, dy_b, radio_b):
+    """
+    Calcula cuándo se tocan dos círculos que avanzan en línea recta
+    durante un paso (barrido de círculos)
+
+    Con p = distancia entre centros y v = velocidad relativa, se tocan
+    cuando |p + v t| = suma de radios: una ecuación de segundo grado en t.
+
+    Args:
+        x_a, y_a: Centro de A al inicio del paso
+        dx_a, dy_a: Desplazamiento de A durante el paso
+        radio_a: Radio de A
+        x_b, y_b, dx_b, dy_b, radio_b: Lo mismo para B (pueden ser arreglos)
+
+    Returns:
+        numpy.ndarray: Tiempo de impacto entre 0 y 1 para cada B; np.inf
+            si no se tocan (tocarse justo cuenta, como en
+            detectar_colision_circular)
+
+    Conceptos enseñados:
+    - Ecuación cuadrática para el instante de contacto
+    """
+    distancia_x = np.subtract(x_b, x_a, dtype=np.float64)
+    distancia_y = np.subtract(y_b, y_a, dtype=np.float64)
+    velocidad_x = np.subtract(dx_b, dx_a, dtype=np.float64)
+    velocidad_y = np.subtract(dy_b, dy_a, dtype=np.float64)
+    suma_radios = np.add(radio_a, radio_b)
+
+    a = velocidad_x * velocidad_x + velocidad_y * velocidad_y
+    b = distancia_x * velocidad_x + distancia_y * velocidad_y
+    c = distancia_x * distancia_x + distancia_y * distancia_y - suma_radios * suma_radios
+    discriminante = b * b - a * c
+    with np.errstate(divide='ignore', invalid='ignore'):
+        tiempo = (-b - np.sqrt(np.maximum(discriminante, 0))) / a
+    se_acercan = (a > 0) & (discriminante >= 0) & (tiempo >= 0) & (tiempo <= 1)
+    return np.where(c <= 0, 0.0, np.where(se_acercan, tiempo, np.inf))
+
+def tiempo_impacto_rectangulos(rect_previo_a, rect_a, rect_previo_b, rect_b):
+    """
+    Versión de un solo par de tiempos_impacto_aabb con pygame.Rect
+
+    Args:
+        rect_previo_a, rect_a (pygame.Rect): A al inicio y al final del paso
+        rect_previo_b, rect_b (pygame.Rect): B al inicio y al final del paso
+
+    Returns:
+        float | None: Tiempo de impacto entre 0 y 1, o None si no chocan
+    """
+    tiempo = float(tiempos_impacto_aabb(
+        rect_previo_a.x, rect_previo_a.y, rect_a.x - rect_previo_a.x, rect_a.y - rect_previo_a.y,
+        rect_a.width, rect_a.height,
+        rect_previo_b.x, rect_previo_b.y, rect_b.x - rect_previo_b.x, rect_b.y - rect_previo_b.y,
+        rect_b.width, rect_b.height))
+    return None if math.isinf(tiempo) else tiempo
+
+# ============================================================================
+# MUNDO DE COLISIONES: TIPOS REGISTRADOS Y MANEJADORES POR PAR
+# ============================================================================
+
+# Resultados constantes de las consultas (de solo lectura, se comparten
+# en lugar de crear un arreglo nuevo en cada frame)
+SIN_INDICES = np.empty(0, dtype=np.intp)
+SOLO_PRIMERO = np.zeros(1, dtype=np.intp)
+SIN_INDICES.flags.writeable = False
+SOLO_PRIMERO.flags.writeable = False
+
+def pares_superpuestos(x, y, ancho, alto):
+    """
+    Busca todos los pares de cajas del mismo tamaño que se superponen
+    (barrido y poda sobre el eje X)
+
+    Se ordenan las cajas por X; cada una solo puede tocar a las siguientes
+    cuya X empieza antes de que ella termine. Entre esos candidatos se
+    comprueba el eje Y. Todo se hace con arreglos, sin bucles de Python.
+
+    Args:
+        x, y (numpy.ndarray): Esquinas superiores izquierdas
+        ancho, alto (int): Tamaño de todas las cajas
+
+    Returns:
+        tuple: (indices_a, indices_b) con cada par una sola vez
+
+    Conceptos enseñados:
+    - Barrido y poda (sweep and prune)
+    - Generar pares variables con np.repeat
+    """
+    orden = np.argsort(x, kind='stable')
+    x_ordenado = x[orden]
+    inicio = np.arange(1, len(orden) + 1)
+    fin = np.searchsorted(x_ordenado, x_ordenado + ancho, side='left')
+    cantidades = np.maximum(fin - inicio, 0)
+    total = int(cantidades.sum())
+    if total == 0:
+        return SIN_INDICES, SIN_INDICES
+
+    # Para cada caja, sus candidatos son inicio .. fin - 1
+    primeros = np.repeat(np.arange(len(orden)), cantidades)
+    saltos = np.arange(total) - np.repeat(np.cumsum(cantidades) - cantidades, cantidades)
+    indices_a = orden[primeros]
+    indices_b = orden[inicio[primeros] + saltos]
+    solapan = np.abs(y[indices_a].astype(np.int64) - y[indices_b]) < alto
+    return indices_a[solapan], indices_b[solapan]
+
+class TipoColision:
+    """
+    Un tipo de entidad registrado en el mundo de colisiones
+
+    La colección puede ser una entidad suelta (Jugador, Enemigo), una
+    lista de entidades, un TreasureField o un EnemySwarm; en todos los
+    casos cada entidad se identifica por su índice (0 para una suelta).
+    Las entidades sueltas y las de una lista se prueban con su propio
+    rect, que debe medir ancho x alto.
+
+    Atributos:
+        nombre (str): Nombre del tipo ('jugador', 'tesoro', ...)
+        clave (str): Clave del estado donde está la colección
+        ancho, alto (int): Caja de cada entidad
+        clave_activo (str): Atributo de cada entidad que dice si
+            participa ('vivo', 'activo', 'visible')
+        consultar (callable): Fase amplia y precisa:
+            (coleccion, rect) -> índices de las entidades que tocan rect
+    """
+
+    def __init__(self, nombre, clave, ancho, alto, clave_activo, consultar=None):
+        self.nombre = nombre
+        self.clave = clave
+        self.ancho = ancho
+        self.alto = alto
+        self.clave_activo = clave_activo
+        self.consultar = consultar or self.consultar_coleccion
+
+    def contar_activos(self, coleccion):
+        """
+        Args:
+            coleccion: Colección de este tipo
+
+        Returns:
+            int: Cuántas entidades participan (sin armar arreglos)
+        """
+        if isinstance(coleccion, TreasureField):
+            return coleccion.contar_visibles()
+        if isinstance(coleccion, EnemySwarm):
+            return coleccion.contar_activos()
+        if isinstance(coleccion, EntidadConRect):
+            return int(bool(getattr(coleccion, self.clave_activo)))
+        return sum(1 for entidad in coleccion if getattr(entidad, self.clave_activo))
+
+    def activos(self, coleccion):
+        """
+        Args:
+            coleccion: Colección de este tipo
+
+        Returns:
+            tuple: (indices, x, y) de las entidades que participan
+        """
+        if isinstance(coleccion, TreasureField):
+            indices = coleccion.indices_visibles()
+            return indices, coleccion.x[indices], coleccion.y[indices]
+        if isinstance(coleccion, EnemySwarm):
+            indices = np.flatnonzero(coleccion.activo)
+            return indices, coleccion.x[indices], coleccion.y[indices]
+        if isinstance(coleccion, EntidadConRect):
+            if not getattr(coleccion, self.clave_activo):
+                return SIN_INDICES, SIN_INDICES, SIN_INDICES
+            return np.zeros(1, dtype=np.intp), np.array([coleccion.x]), np.array([coleccion.y])
+        indices = [indice for indice, entidad in enumerate(coleccion)
+                   if getattr(entidad, self.clave_activo)]
+        return (np.array(indices, dtype=np.intp),
+                np.array([coleccion[indice].x for indice in indices]),
+                np.array([coleccion[indice].y for indice in indices]))
+
+    def posiciones(self, coleccion, indices):
+        """
+        Args:
+            coleccion: Colección de este tipo
+            indices (numpy.ndarray): Entidades pedidas
+
+        Returns:
+            tuple: Arreglos (x, y) de esas entidades
+        """
+        if isinstance(coleccion, (TreasureField, EnemySwarm)):
+            return coleccion.x[indices], coleccion.y[indices]
+        if isinstance(coleccion, EntidadConRect):
+            coleccion = [coleccion]
+        return (np.array([coleccion[indice].x for indice in indices.tolist()]),
+                np.array([coleccion[indice].y for indice in indices.tolist()]))
+
+    def posiciones_previas(self, estado, coleccion, indices):
+        """
+        Posiciones de esas entidades antes del último paso
+
+        Se leen de estado['previas'] (paso_fijo.copiar_posiciones); los
+        tipos que no aparecen ahí (los tesoros) no se mueven.
+
+        Args:
+            estado (dict): Estado del juego
+            coleccion: Colección de este tipo
+            indices (numpy.ndarray): Entidades pedidas
+
+        Returns:
+            tuple: Arreglos (x, y) al inicio del paso
+        """
+        previas = (estado.get('previas') or {}).get(self.clave)
+        if previas is None:
+            return self.posiciones(coleccion, indices)
+        previa_x, previa_y = previas
+        if isinstance(previa_x, np.ndarray):
+            return previa_x[indices], previa_y[indices]
+        return np.full(len(indices), previa_x), np.full(len(indices), previa_y)
+
+    def desplazamiento_maximo(self, estado, coleccion):
+        """
+        Returns:
+            int: Lo más que se movió una entidad de este tipo en el último
+                paso, en cualquier eje (0 si no se mueven)
+        """
+        previas = (estado.get('previas') or {}).get(self.clave)
+        if previas is None or self.contar_activos(coleccion) == 0:
+            return 0
+        indices, x, y = self.activos(coleccion)
+        previa_x, previa_y = self.posiciones_previas(estado, coleccion, indices)
+        return int(max(np.abs(x - previa_x).max(), np.abs(y - previa_y).max()))
+
+    def consultar_coleccion(self, coleccion, rect):
+        """
+        Fase amplia por defecto según el tipo de colección: la grilla del
+        TreasureField, la prueba vectorizada del EnemySwarm o un recorrido
+        de los rects de las entidades
+
+        Args:
+            coleccion: Colección de este tipo
+            rect (pygame.Rect): Rectángulo de consulta (no se guarda: el
+                mundo lo reutiliza)
+
+        Returns:
+            numpy.ndarray: Índices de las entidades activas que tocan rect
+                (SIN_INDICES o SOLO_PRIMERO cuando alcanza, sin crear
+                arreglos)
+        """
+        if isinstance(coleccion, (TreasureField, EnemySwarm)):
+            return coleccion.indices_en_rect(rect)
+        if isinstance(coleccion, EntidadConRect):
+            if getattr(coleccion, self.clave_activo) and rect.colliderect(coleccion.rect):
+                return SOLO_PRIMERO
+            return SIN_INDICES
+        tocados = [indice for indice, entidad in enumerate(coleccion)
+                   if getattr(entidad, self.clave_activo) and rect.colliderect(entidad.rect)]
+        return np.array(tocados, dtype=np.intp) if tocados else SIN_INDICES
+
+class MundoColisiones:
+    """
+    Registro de tipos de entidad y de manejadores por par de tipos
+
+    Uso:
+        mundo = MundoColisiones()
+        mundo.registrar_tipo('jugador', 'jugador', TAMANO_JUGADOR, TAMANO_JUGADOR, 'vivo')
+        mundo.registrar_tipo('tesoro', 'tesoros', TAMANO_TESORO, TAMANO_TESORO, 'visible')
+        mundo.registrar_manejador('jugador', 'tesoro', al_tocar_tesoros)
+        mundo.procesar(estado)   # una vez por frame
+
+    Cada manejador recibe (estado, indices_a, indices_b): un lote con
+    todos los contactos del par en el frame, ya filtrados por la fase
+    precisa. Primero se buscan los contactos de todos los pares y después
+    se llama a los manejadores en el orden en que se registraron.
+
+    En los modos de barrido, la fase precisa prueba todo el recorrido del
+    paso (desde estado['previas'] hasta la posición actual) en lugar de
+    solo la posición final, y el tiempo de impacto de cada contacto queda
+    en self.impactos. Los pares de un mismo tipo siempre son discretos.
+
+    Conceptos enseñados:
+    - Registro de callbacks en lugar de llamadas fijas
+    - Separar "qué choca" de "qué pasa cuando choca"
+    - Eventos por lotes
+    """
+
+    def __init__(self, modo='discreto'):
+        """
+        Args:
+            modo (str): Uno de MODOS_COLISION
+
+        Raises:
+            ValueError: Si el modo no existe
+        """
+        if modo not in MODOS_COLISION:
+            raise ValueError(f"Modo de colisión desconocido: {modo}")
+        self.modo = modo
+        self.tipos = {}
+        self.manejadores = []   # (tipo_a, tipo_b, manejador) en orden de registro
+        self.contactos = {}     # (tipo_a, tipo_b) -> (indices_a, indices_b) del último frame
+        self.impactos = {}      # (tipo_a, tipo_b) -> tiempos de impacto (modos de barrido)
+        # Rectángulo de las consultas a la fase amplia: se mueve en lugar
+        # de crear uno por entidad y por frame
+        self.consulta = pygame.Rect(0, 0, 0, 0)
+
+    def registrar_tipo(self, nombre, clave, ancho, alto, clave_activo='activo', consultar=None):
+        """
+        Registra un tipo de entidad
+
+        Args:
+            nombre (str): Nombre del tipo
+            clave (str): Clave del estado donde está su colección
+            ancho, alto (int): Caja de cada entidad
+            clave_activo (str): Campo que indica si una entidad participa
+            consultar (callable, optional): Fase amplia propia
+                (coleccion, rect) -> índices; por defecto se elige según
+                la colección
+
+        Returns:
+            TipoColision: El tipo registrado
+        """
+        tipo = TipoColision(nombre, clave, ancho, alto, clave_activo, consultar)
+        self.tipos[nombre] = tipo
+        return tipo
+
+    def registrar_manejador(self, tipo_a, tipo_b, manejador):
+        """
+        Registra la función que atiende los contactos entre dos tipos
+
+        Con tipo_a == tipo_b se buscan los pares dentro del mismo tipo
+        (cada par una sola vez).
+
+        Args:
+            tipo_a, tipo_b (str): Tipos ya registrados
+            manejador (callable): (estado, indices_a, indices_b) -> None
+
+        Raises:
+            ValueError: Si alguno de los tipos no está registrado
+        """
+        for nombre in (tipo_a, tipo_b):
+            if nombre not in self.tipos:
+                raise ValueError(f"Tipo de colisión no registrado: {nombre}")
+        self.manejadores.append((tipo_a, tipo_b, manejador))
+
+    def buscar_contactos(self, estado, tipo_a, tipo_b):
+        """
+        Busca los contactos entre dos tipos
+
+        Se recorren las entidades del lado con menos activas y cada una
+        consulta la fase amplia del otro lado (con un jugador contra miles
+        de tesoros, una sola consulta a la grilla).
+
+        Args:
+            estado (dict): Estado del juego
+            tipo_a, tipo_b (str): Tipos registrados
+
+        Returns:
+            tuple: (indices_a, indices_b) de cada contacto; en los modos de
+                barrido, también sus tiempos de impacto
+        """
+        primero, segundo = self.tipos[tipo_a], self.tipos[tipo_b]
+        coleccion_a, coleccion_b = estado[primero.clave], estado[segundo.clave]
+
+        if primero is segundo:
+            indices, x, y = primero.activos(coleccion_a)
+            pares_a, pares_b = pares_superpuestos(x, y, primero.ancho, primero.alto)
+            return indices[pares_a], indices[pares_b]
+
+        invertido = primero.contar_activos(coleccion_a) > segundo.contar_activos(coleccion_b)
+        if invertido:
+            primero, segundo = segundo, primero
+            coleccion_a, coleccion_b = coleccion_b, coleccion_a
+
+        if self.modo == 'discreto':
+            propios, ajenos = self.contactos_discretos(primero, segundo, coleccion_a, coleccion_b)
+            tiempos = []
+        else:
+            indices_a, x_a, y_a = primero.activos(coleccion_a)
+            propios, ajenos, tiempos = self.contactos_barridos(
+                estado, primero, segundo, coleccion_a, coleccion_b, indices_a, x_a, y_a)
+
+        if not propios:
+            return SIN_INDICES, SIN_INDICES
+        propios, ajenos = np.concatenate(propios), np.concatenate(ajenos)
+        contacto = (ajenos, propios) if invertido else (propios, ajenos)
+        if tiempos:
+            contacto += (np.concatenate(tiempos),)
+        return contacto
+
+    def contactos_discretos(self, primero, segundo, coleccion_a, coleccion_b):
+        """
+        Fase amplia y precisa con las posiciones finales del paso
+
+        Una entidad suelta consulta con su propio rect; las de arreglos y
+        listas, con self.consulta movido a su posición. Sin contactos no
+        se crea ningún arreglo.
+
+        Returns:
+            tuple: Listas (indices_a, indices_b) por entidad de A
+        """
+        propios, ajenos = [], []
+        if isinstance(coleccion_a, EntidadConRect):
+            if getattr(coleccion_a, primero.clave_activo):
+                tocados = segundo.consultar(coleccion_b, coleccion_a.rect)
+                if len(tocados):
+                    propios.append(np.zeros(len(tocados), dtype=np.intp))
+                    ajenos.append(tocados)
+            return propios, ajenos
+
+        consulta = self.consulta
+        indices_a, x_a, y_a = primero.activos(coleccion_a)
+        for indice, x, y in zip(indices_a.tolist(), x_a.tolist(), y_a.tolist()):
+            consulta.update(x, y, primero.ancho, primero.alto)
+            tocados = segundo.consultar(coleccion_b, consulta)
+            if len(tocados):
+                propios.append(np.full(len(tocados), indice, dtype=np.intp))
+                ajenos.append(tocados)
+        return propios, ajenos
+
+    def contactos_barridos(self, estado, primero, segundo, coleccion_a, coleccion_b,
+                           indices_a, x_a, y_a):
+        """
+        Fase amplia y precisa sobre el recorrido de todo el paso
+
+        La consulta a la fase amplia usa la caja que cubre el recorrido de
+        cada entidad de A, agrandada por lo más que se movió cualquiera de
+        B; los candidatos pasan por el barrido AABB o de círculos.
+
+        Returns:
+            tuple: Listas (indices_a, indices_b, tiempos) por entidad de A
+        """
+        previa_x_a, previa_y_a = primero.posiciones_previas(estado, coleccion_a, indices_a)
+        margen = segundo.desplazamiento_maximo(estado, coleccion_b) + 1
+        propios, ajenos, tiempos = [], [], []
+        recorrido = self.consulta
+        for indice, x, y, previa_x, previa_y in zip(indices_a.tolist(), x_a.tolist(), y_a.tolist(),
+                                                    previa_x_a.tolist(), previa_y_a.tolist()):
+            recorrido.update(min(x, previa_x) - margen, min(y, previa_y) - margen,
+                             abs(x - previa_x) + primero.ancho + 2 * margen,
+                             abs(y - previa_y) + primero.alto + 2 * margen)
+            candidatos = segundo.consultar(coleccion_b, recorrido)
+            if not len(candidatos):
+                continue
+            x_b, y_b = segundo.posiciones(coleccion_b, candidatos)
+            previa_x_b, previa_y_b = segundo.posiciones_previas(estado, coleccion_b, candidatos)
+            if self.modo == 'barrido_aabb':
+                impacto = tiempos_impacto_aabb(
+                    previa_x, previa_y, x - previa_x, y - previa_y, primero.ancho, primero.alto,
+                    previa_x_b, previa_y_b, x_b - previa_x_b, y_b - previa_y_b,
+                    segundo.ancho, segundo.alto)
+            else:
+                # Círculos inscritos en las cajas, centrados en ellas
+                radio_a, radio_b = min(primero.ancho, primero.alto) / 2, min(segundo.ancho, segundo.alto) / 2
+                impacto = tiempos_impacto_circulos(
+                    previa_x + primero.ancho / 2, previa_y + primero.alto / 2,
+                    x - previa_x, y - previa_y, radio_a,
+                    previa_x_b + segundo.ancho / 2, previa_y_b + segundo.alto / 2,
+                    x_b - previa_x_b, y_b - previa_y_b, radio_b)
+            chocan = np.isfinite(impacto)
+            if chocan.any():
+                propios.append(np.full(int(chocan.sum()), indice, dtype=np.intp))
+                ajenos.append(candidatos[chocan])
+                tiempos.append(impacto[chocan])
+        return propios, ajenos, tiempos
+
+    def procesar(self, estado):
+        """
+        Busca los contactos de todos los pares registrados y los entrega a
+        sus manejadores (una llamada por par con contactos)
+
+        Args:
+            estado (dict): Estado del juego
+
+        Returns:
+            dict: (tipo_a, tipo_b) -> (indices_a, indices_b) de los pares
+                que tuvieron contactos
+        """
+        # Los diccionarios se vacían y se vuelven a llenar: sin contactos
+        # no se crea ningún objeto nuevo
+        self.contactos.clear()
+        self.impactos.clear()
+        for tipo_a, tipo_b, _ in self.manejadores:
+            par = (tipo_a, tipo_b)
+            if par in self.contactos:
+                continue
+            indices = self.buscar_contactos(estado, tipo_a, tipo_b)
+            if len(indices[0]):
+                self.contactos[par] = indices[:2]
+                if len(indices) > 2:
+                    self.impactos[par] = indices[2]
+        for tipo_a, tipo_b, manejador in self.manejadores:
+            indices = self.contactos.get((tipo_a, tipo_b))
+            if indices is not None:
+                manejador(estado, *indices)
+        return self.contactos
+
 # ============================================================================
 # FUNCIONES DE UTILIDAD PARA COLISIONES
 # ============================================================================
@@ -211,31 +788,39 @@ def esta_dentro_de_pantalla(x, y, ancho_objeto, alto_objeto):
 
 def distancia_entre_objetos(obj1, obj2):
     """
-    Calcula la distancia entre los centros de dos objetos
+    Calcula la distancia entre las posiciones de dos objetos
+    
+    Usa la esquina superior izquierda del rect de cada uno, igual que
+    EnemySwarm.distancia_minima, así que el indicador de distancia mide
+    lo mismo con un enemigo suelto que con un enjambre.
     
     Args:
-        obj1, obj2 (dict): Objetos con propiedades 'x' e 'y'
+        obj1, obj2 (EntidadConRect): Objetos con su propio rect
         
     Returns:
-        float: Distancia entre los centros
+        float: Distancia entre las posiciones
         
     Conceptos enseñados:
     - Cálculo de distancias entre objetos
     - Función auxiliar para IA y gameplay
-    - Uso de propiedades de diccionarios
+    - Misma interfaz (el rect) en todas las funciones de dos objetos
     """
-    import math
-    
-    dx = obj2['x'] - obj1['x']
-    dy = obj2['y'] - obj1['y']
+    rect1 = obj1.rect
+    rect2 = obj2.rect
+    dx = rect2.x - rect1.x
+    dy = rect2.y - rect1.y
     return math.sqrt(dx * dx + dy * dy)
 
+# Rectángulo que objetos_se_superponen agranda con el margen: se copia y
+# se infla en el lugar en lugar de crear dos por llamada
+_RECT_CON_MARGEN = pygame.Rect(0, 0, 0, 0)
+
 def objetos_se_superponen(obj1, obj2, margen=0):
     """
     Verifica si dos objetos se superponen considerando un margen adicional
     
     Args:
-        obj1, obj2 (dict): Objetos con posición y tamaño implícito
+        obj1, obj2 (EntidadConRect): Objetos con su propio rect
         margen (int): Margen adicional para la detección
         
     Returns:
@@ -246,13 +831,14 @@ def objetos_se_superponen(obj1, obj2, margen=0):
     - Uso de márgenes para gameplay
     - Flexibilidad en detección de colisiones
     """
-    # Crear rectángulos expandidos con margen
-    rect1 = pygame.Rect(obj1['x'] - margen, obj1['y'] - margen, 
-                       TAMANO_JUGADOR + 2*margen, TAMANO_JUGADOR + 2*margen)
-    rect2 = pygame.Rect(obj2['x'] - margen, obj2['y'] - margen,
-                       TAMANO_TESORO + 2*margen, TAMANO_TESORO + 2*margen)
+    if not margen:
+        return detectar_colision_rectangulos(obj1.rect, obj2.rect)
     
-    return detectar_colision_rectangulos(rect1, rect2)
+    # Agrandar los dos rects 'margen' por lado equivale a agrandar solo
+    # uno el doble por lado (inflate reparte el aumento entre los dos lados)
+    _RECT_CON_MARGEN.update(obj1.rect)
+    _RECT_CON_MARGEN.inflate_ip(4 * margen, 4 * margen)
+    return detectar_colision_rectangulos(_RECT_CON_MARGEN, obj2.rect)
 
 # ============================================================================
 # FUNCIONES DE ANÁLISIS DE COLISIONES
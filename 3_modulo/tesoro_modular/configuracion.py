@@ -15,7 +15,10 @@ Conceptos enseñados:
 ANCHO = 800                    # Ancho de la ventana en píxeles
 ALTO = 600                     # Alto de la ventana en píxeles
 TITULO = "Cazador de Tesoros - Versión Modular"
-FPS = 60                       # Cuadros por segundo
+FPS = 60                       # Cuadros por segundo (límite del dibujo)
+HZ_SIMULACION = 60             # Pasos de lógica por segundo (30 en equipos lentos; divide a 60)
+PASOS_MAXIMOS_POR_FRAME = 5    # Pasos de recuperación por frame (evita la espiral de la muerte)
+USAR_RECTANGULOS_SUCIOS = False  # Actualizar solo las zonas que cambian (equipos lentos)
 
 # ============================================================================
 # CONFIGURACIÓN DEL GAMEPLAY
@@ -24,6 +27,33 @@ NUMERO_TESOROS = 5             # Cantidad de tesoros en el mapa
 TESOROS_PARA_GANAR = 5         # Tesoros necesarios para ganar
 VELOCIDAD_JUGADOR = 5          # Velocidad del explorador
 VELOCIDAD_ENEMIGO = 2          # Velocidad del perseguidor (más lento que jugador)
+NUMERO_ENEMIGOS = 1            # Con más de uno se usa un enjambre (EnemySwarm)
+DISTANCIA_SEGURA_ENEMIGOS = 200  # Distancia mínima al jugador al aparecer
+USAR_CAMPO_FLUJO = False       # Los enemigos rodean obstáculos con un campo de flujo
+SEPARAR_ENEMIGOS = False       # Los enemigos del enjambre se empujan para no encimarse
+MODO_COLISION = 'discreto'     # 'barrido_aabb' o 'barrido_circulo': no se saltan tesoros a alta velocidad
+TAMANO_CELDA_FLUJO = 20        # Lado de cada celda del campo de flujo (px)
+
+# ============================================================================
+# CONFIGURACIÓN DEL MUNDO INFINITO
+# ============================================================================
+MUNDO_INFINITO = False         # Mundo abierto: regiones que se generan alrededor del jugador
+TAMANO_REGION = 400            # Lado de cada región del mundo (px)
+TESOROS_POR_REGION = 4         # Tesoros que se generan en cada región
+RADIO_REGIONES = 2             # Regiones cargadas alrededor de la del jugador (en cada dirección)
+SUAVIZADO_CAMARA = 0.1         # Retraso de la cámara al seguir al jugador (s; 0 = sin retraso)
+
+# ============================================================================
+# CONFIGURACIÓN DE DESARROLLO
+# ============================================================================
+MODO_DEBUG = False             # Activa verificaciones extra (más lentas)
+GRABAR_PARTIDA = False         # Graba la entrada para repetirla con grabacion.py
+ARCHIVO_GRABACION = "partida.rec"  # Archivo donde se guarda la grabación
+USAR_PERFILADOR = False        # Mide cada fase del frame (panel con F3)
+FRAMES_PERFILADOR = 600        # Frames que guarda el perfilador (10 s a 60 FPS)
+ARCHIVO_PERFIL = "perfil.csv"  # Tiempos por fase que se guardan al salir
+USAR_REBOBINADO = False        # Mantener Retroceso para volver atrás paso a paso
+PASOS_REBOBINADO = 600         # Pasos que se pueden deshacer (10 s a 60 Hz)
 
 # ============================================================================
 # TAMAÑOS DE SPRITES
@@ -41,6 +71,7 @@ VERDE = (0, 255, 0)            # Color verde
 AMARILLO = (255, 255, 0)       # Color amarillo
 ROJO = (255, 0, 0)             # Color rojo
 AZUL = (0, 0, 255)             # Color azul
+GRIS = (128, 128, 128)         # Color gris
 
 # ============================================================================
 # RUTAS DE ARCHIVOS
@@ -50,6 +81,8 @@ ARCHIVO_FONDO = RUTA_IMAGENES + "fondo_selva.png"    # Imagen de fondo
 ARCHIVO_JUGADOR = RUTA_IMAGENES + "explorador.png"   # Sprite del jugador
 ARCHIVO_TESORO = RUTA_IMAGENES + "tesoro.png"        # Sprite del tesoro
 ARCHIVO_ENEMIGO = RUTA_IMAGENES + "enemigo.png"      # Sprite del enemigo
+RUTA_CACHE_IMAGENES = RUTA_IMAGENES + ".cache/"      # Sprites ya escalados (se regeneran solos)
+HILOS_CARGA = 4                                       # Hilos que preparan las imágenes al arrancar
 
 # ============================================================================
 # POSICIONES INICIALES
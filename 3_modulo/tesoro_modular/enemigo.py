@@ -7,11 +7,22 @@ Conceptos enseñados:
 - Inteligencia artificial básica
 - Algoritmo de persecución
 - Modularización de enemigos
+- Enjambres de enemigos en arreglos (operaciones vectorizadas)
 """
 
 import pygame
 import math
+import numpy as np
 from configuracion import *
+from campo_flujo import INALCANZABLE
+from utilidades import EntidadConRect
+
+# Zona donde pueden moverse los enemigos
+AREA_PANTALLA = pygame.Rect(0, 0, ANCHO, ALTO)
+
+# Esquina superior izquierda más lejana que puede ocupar un enemigo
+LIMITE_ENEMIGO_X = ANCHO - TAMANO_ENEMIGO
+LIMITE_ENEMIGO_Y = ALTO - TAMANO_ENEMIGO
 
 # ============================================================================
 # FUNCIONES DE INICIALIZACIÓN DEL ENEMIGO
@@ -37,23 +48,318 @@ def cargar_sprite_enemigo():
         print(f"Error: No se pudo cargar {ARCHIVO_ENEMIGO}")
         return None
 
-def crear_enemigo():
+class Enemigo(EntidadConRect):
+    """
+    Estado de un enemigo suelto: posición (en su rect), si está activo y
+    velocidad
+
+    Para muchos enemigos se usa EnemySwarm, que guarda lo mismo en arreglos.
+    """
+
+    __slots__ = ('activo', 'velocidad')
+    campos = ('x', 'y', 'activo', 'velocidad')
+
+    def __init__(self, x=ENEMIGO_X_INICIAL, y=ENEMIGO_Y_INICIAL, activo=True,
+                 velocidad=VELOCIDAD_ENEMIGO):
+        super().__init__(x, y, TAMANO_ENEMIGO, TAMANO_ENEMIGO)
+        self.activo = activo
+        self.velocidad = velocidad
+
+def crear_enemigo(velocidad=VELOCIDAD_ENEMIGO):
     """
     Crea el estado inicial del enemigo
     
+    Args:
+        velocidad (int): Píxeles que avanza por frame en cada eje
+        
     Returns:
-        dict: Diccionario con la información del enemigo
+        Enemigo: Objeto con la información del enemigo
         
     Conceptos enseñados:
     - Inicialización de estado de enemigo
     - Propiedades específicas del perseguidor
     """
-    enemigo = {
-        'x': ENEMIGO_X_INICIAL,
-        'y': ENEMIGO_Y_INICIAL,
-        'activo': True
-    }
-    return enemigo
+    return Enemigo(velocidad=velocidad)
+
+# ============================================================================
+# ENJAMBRE DE ENEMIGOS EN ARREGLOS
+# ============================================================================
+
+class EnemySwarm:
+    """
+    Grupo de enemigos perseguidores guardado en arreglos de NumPy: uno para
+    x, otro para y y otro para el estado activo de cada enemigo.
+
+    En lugar de mover cada Enemigo con if por eje, el enjambre entero
+    avanza en una sola pasada: la diferencia con el objetivo se recorta a
+    [-velocidad, velocidad] y los límites de pantalla se
+    aplican con np.clip. Con un solo enemigo el resultado es idéntico al
+    de mover_hacia_objetivo.
+
+    Conceptos enseñados:
+    - Estructura de arreglos en lugar de lista de objetos
+    - Operaciones vectorizadas (sin bucles de Python)
+    - Recorte de valores con np.clip
+    """
+
+    def __init__(self, posiciones_x, posiciones_y, velocidad=VELOCIDAD_ENEMIGO):
+        """
+        Crea el enjambre a partir de las posiciones iniciales
+
+        Args:
+            posiciones_x (sequence): Coordenadas X de cada enemigo
+            posiciones_y (sequence): Coordenadas Y de cada enemigo
+            velocidad (int): Píxeles que avanza cada enemigo por frame
+        """
+        self.velocidad = velocidad
+        self.x_inicial = np.array(posiciones_x, dtype=np.int32)
+        self.y_inicial = np.array(posiciones_y, dtype=np.int32)
+        self.x = self.x_inicial.copy()
+        self.y = self.y_inicial.copy()
+        self.activo = np.ones(len(self.x), dtype=bool)
+
+    def __len__(self):
+        return len(self.x)
+
+    def contar_activos(self):
+        """
+        Returns:
+            int: Número de enemigos activos
+        """
+        return int(np.count_nonzero(self.activo))
+
+    def perseguir(self, objetivo_x, objetivo_y, campo_flujo=None, con_bordes=True,
+                  indices=None, pasos=1):
+        """
+        Mueve todos los enemigos activos hacia el objetivo en una pasada
+
+        Con un campo de flujo, cada enemigo sigue la dirección de la celda
+        donde está su centro; en la celda del objetivo (o si no hay camino)
+        vuelve a la persecución en línea recta.
+
+        Con 'indices' solo se mueven esos enemigos, y cada uno avanza lo
+        de 'pasos' pasos de una vez (los que lleva sin moverse; ver
+        nivel_detalle).
+
+        Args:
+            objetivo_x (int): Posición X del objetivo
+            objetivo_y (int): Posición Y del objetivo
+            campo_flujo (CampoFlujo, optional): Campo ya apuntado al objetivo
+            con_bordes (bool): Mantenerlos dentro de la pantalla (False en
+                el mundo infinito)
+            indices (numpy.ndarray | slice, optional): Enemigos a mover
+                (todos si falta)
+            pasos (int | numpy.ndarray): Pasos que avanza cada enemigo
+        """
+        # Con un slice, x e y son vistas y se modifican en el lugar; con un
+        # arreglo de índices son copias que hay que guardar al final
+        if indices is None:
+            indices = slice(None)
+        x, y, activo = self.x[indices], self.y[indices], self.activo[indices]
+        velocidad = self.velocidad * pasos
+        paso_x = recortar(objetivo_x - x, velocidad)
+        paso_y = recortar(objetivo_y - y, velocidad)
+        if campo_flujo is not None:
+            mitad = TAMANO_ENEMIGO // 2
+            flujo_x, flujo_y, distancia = campo_flujo.direcciones_en(x + mitad, y + mitad)
+            con_camino = (distancia > 0) & (distancia != INALCANZABLE)
+            paso_x = np.where(con_camino, flujo_x * velocidad, paso_x)
+            paso_y = np.where(con_camino, flujo_y * velocidad, paso_y)
+        # Los inactivos no se mueven
+        x += paso_x * activo
+        y += paso_y * activo
+        if con_bordes:
+            np.clip(x, 0, ANCHO - TAMANO_ENEMIGO, out=x)
+            np.clip(y, 0, ALTO - TAMANO_ENEMIGO, out=y)
+        if not isinstance(indices, slice):
+            self.x[indices] = x
+            self.y[indices] = y
+
+    def aplicar_limites(self):
+        """
+        Mantiene a todos los enemigos dentro de la pantalla
+        """
+        np.clip(self.x, 0, ANCHO - TAMANO_ENEMIGO, out=self.x)
+        np.clip(self.y, 0, ALTO - TAMANO_ENEMIGO, out=self.y)
+
+    def separar(self, indices_a, indices_b, con_bordes=True):
+        """
+        Empuja a los pares de enemigos encimados hacia lados opuestos
+
+        Cada par se separa por el eje en que menos se superpone, la mitad
+        cada uno. Los empujones de todos los pares se suman por enemigo y
+        se limitan a su velocidad para que el enjambre no dé saltos.
+
+        Args:
+            indices_a, indices_b (numpy.ndarray): Pares que se superponen
+            con_bordes (bool): Mantenerlos dentro de la pantalla
+        """
+        dx = self.x[indices_b].astype(np.int64) - self.x[indices_a]
+        dy = self.y[indices_b].astype(np.int64) - self.y[indices_a]
+        solape_x = TAMANO_ENEMIGO - np.abs(dx)
+        solape_y = TAMANO_ENEMIGO - np.abs(dy)
+        por_x = solape_x <= solape_y
+        # b se aleja de a; si están en el mismo lugar, b va a la derecha/abajo
+        empuje_x = np.where(por_x, np.where(dx >= 0, 1, -1) * ((solape_x + 1) // 2), 0)
+        empuje_y = np.where(por_x, 0, np.where(dy >= 0, 1, -1) * ((solape_y + 1) // 2))
+
+        total_x = np.zeros(len(self.x), dtype=np.int64)
+        total_y = np.zeros(len(self.y), dtype=np.int64)
+        np.add.at(total_x, indices_b, empuje_x)
+        np.add.at(total_x, indices_a, -empuje_x)
+        np.add.at(total_y, indices_b, empuje_y)
+        np.add.at(total_y, indices_a, -empuje_y)
+        self.x += np.clip(total_x, -self.velocidad, self.velocidad).astype(np.int32)
+        self.y += np.clip(total_y, -self.velocidad, self.velocidad).astype(np.int32)
+        if con_bordes:
+            self.aplicar_limites()
+
+    def indices_en_rect(self, rect):
+        """
+        Devuelve los enemigos activos que se superponen con un rectángulo
+
+        Usa la misma regla que pygame.Rect.colliderect, pero para todo el
+        enjambre a la vez.
+
+        Args:
+            rect (pygame.Rect): Rectángulo a comprobar (por ejemplo, el jugador)
+
+        Returns:
+            numpy.ndarray: Índices de los enemigos que lo tocan
+        """
+        tocan = ((self.x < rect.right) & (self.x + TAMANO_ENEMIGO > rect.left) &
+                 (self.y < rect.bottom) & (self.y + TAMANO_ENEMIGO > rect.top) &
+                 self.activo)
+        return np.flatnonzero(tocan)
+
+    def toca_rect(self, rect):
+        """
+        Args:
+            rect (pygame.Rect): Rectángulo a comprobar
+
+        Returns:
+            bool: True si algún enemigo activo se superpone con el rectángulo
+        """
+        return bool(self.indices_en_rect(rect).size)
+
+    def distancia_minima(self, x, y):
+        """
+        Calcula la distancia del enemigo activo más cercano a un punto
+
+        Args:
+            x, y (int): Punto de referencia
+
+        Returns:
+            float: Distancia al enemigo más cercano (inf si no hay activos)
+        """
+        if not self.activo.any():
+            return math.inf
+        dx = self.x[self.activo].astype(np.int64) - x
+        dy = self.y[self.activo].astype(np.int64) - y
+        return math.sqrt(int((dx * dx + dy * dy).min()))
+
+    def distancias(self, x, y):
+        """
+        Args:
+            x, y (int): Punto de referencia
+
+        Returns:
+            numpy.ndarray: Distancia de cada enemigo (activo o no) al
+                punto, en float32 (sobra para píxeles y, con enjambres
+                grandes, tarda varias veces menos que en float64)
+        """
+        dx = (self.x - x).astype(np.float32)
+        dy = (self.y - y).astype(np.float32)
+        dx *= dx
+        dy *= dy
+        dx += dy
+        return np.sqrt(dx, out=dx)
+
+    def reiniciar(self):
+        """
+        Devuelve todos los enemigos a su posición inicial y los activa
+        """
+        self.x[:] = self.x_inicial
+        self.y[:] = self.y_inicial
+        self.activo[:] = True
+
+    def desactivar(self):
+        """
+        Desactiva a todos los enemigos
+        """
+        self.activo[:] = False
+
+def recortar(valores, limite):
+    """
+    Recorta valores a [-limite, limite], como np.clip
+
+    Con un límite distinto por elemento (un arreglo), np.clip es varias
+    veces más lento que np.maximum + np.minimum.
+
+    Args:
+        valores (numpy.ndarray): Valores a recortar
+        limite (int | numpy.ndarray): Límite (positivo) común o por elemento
+
+    Returns:
+        numpy.ndarray: Valores recortados
+    """
+    if np.ndim(limite):
+        return np.minimum(np.maximum(valores, -limite), limite)
+    return np.clip(valores, -limite, limite)
+
+def crear_enjambre(cantidad, semilla=None, velocidad=VELOCIDAD_ENEMIGO):
+    """
+    Crea un enjambre de enemigos repartidos por la pantalla
+
+    El primer enemigo aparece en la posición de siempre y el resto en
+    posiciones aleatorias alejadas al menos DISTANCIA_SEGURA_ENEMIGOS del
+    punto de inicio del jugador.
+
+    Args:
+        cantidad (int): Número de enemigos
+        semilla (int, optional): Semilla para reproducir las posiciones
+        velocidad (int): Píxeles que avanza cada enemigo por frame
+
+    Returns:
+        EnemySwarm: Enjambre con todos los enemigos activos
+
+    Conceptos enseñados:
+    - Generación vectorizada de posiciones
+    - Muestreo por rechazo
+    """
+    generador = np.random.default_rng(semilla)
+    posiciones_x = np.empty(cantidad, dtype=np.int32)
+    posiciones_y = np.empty(cantidad, dtype=np.int32)
+    posiciones_x[:1] = ENEMIGO_X_INICIAL
+    posiciones_y[:1] = ENEMIGO_Y_INICIAL
+
+    # Sortear de nuevo solo las posiciones demasiado cerca del jugador
+    pendientes = np.arange(1, cantidad)
+    while pendientes.size:
+        posiciones_x[pendientes] = generador.integers(0, ANCHO - TAMANO_ENEMIGO + 1, pendientes.size)
+        posiciones_y[pendientes] = generador.integers(0, ALTO - TAMANO_ENEMIGO + 1, pendientes.size)
+        dx = posiciones_x[pendientes] - JUGADOR_X_INICIAL
+        dy = posiciones_y[pendientes] - JUGADOR_Y_INICIAL
+        pendientes = pendientes[dx * dx + dy * dy < DISTANCIA_SEGURA_ENEMIGOS ** 2]
+
+    return EnemySwarm(posiciones_x, posiciones_y, velocidad)
+
+def crear_enemigos(cantidad=NUMERO_ENEMIGOS, semilla=None, velocidad=VELOCIDAD_ENEMIGO):
+    """
+    Crea el enemigo del juego: un Enemigo si es uno solo o un EnemySwarm
+    si son varios
+
+    Args:
+        cantidad (int): Número de enemigos
+        semilla (int, optional): Semilla para las posiciones del enjambre
+        velocidad (int): Píxeles que avanza cada enemigo por frame
+
+    Returns:
+        Enemigo | EnemySwarm: Estado de los enemigos
+    """
+    if cantidad == 1:
+        return crear_enemigo(velocidad)
+    return crear_enjambre(cantidad, semilla, velocidad)
 
 # ============================================================================
 # FUNCIONES DE INTELIGENCIA ARTIFICIAL (IA BÁSICA)
@@ -80,14 +386,16 @@ def calcular_distancia(x1, y1, x2, y2):
     distancia = math.sqrt(diferencia_x * diferencia_x + diferencia_y * diferencia_y)
     return distancia
 
-def mover_hacia_objetivo(enemigo, objetivo_x, objetivo_y):
+def mover_hacia_objetivo(enemigo, objetivo_x, objetivo_y, con_bordes=True):
     """
     Mueve al enemigo hacia el objetivo (persecución simple)
     
     Args:
-        enemigo (dict): Estado del enemigo
+        enemigo (Enemigo): Estado del enemigo
         objetivo_x (int): Posición X del objetivo
         objetivo_y (int): Posición Y del objetivo
+        con_bordes (bool): Mantenerlo dentro de la pantalla (False en el
+            mundo infinito)
         
     Conceptos enseñados:
     - Algoritmo de persecución básico
@@ -95,26 +403,75 @@ def mover_hacia_objetivo(enemigo, objetivo_x, objetivo_y):
     - Normalización de movimiento
     - Límites de pantalla para enemigos
     """
-    if not enemigo['activo']:
+    if not enemigo.activo:
         return
     
-    # Calcular la diferencia entre posiciones
-    diferencia_x = objetivo_x - enemigo['x']
-    diferencia_y = objetivo_y - enemigo['y']
+    # La posición vive en el rect del enemigo: se copia una vez a variables
+    # locales, se calcula con enteros y se escribe de vuelta con una sola
+    # asignación (leer y escribir rect.x en cada paso era más lento que
+    # los diccionarios)
+    rect = enemigo.rect
+    velocidad = enemigo.velocidad
+    x, y = rect.topleft
+    
+    # Paso en X (horizontal): como mucho 'velocidad', sin pasarse del objetivo
+    diferencia_x = objetivo_x - x
+    if diferencia_x > velocidad:  # Objetivo lejos a la derecha
+        x += velocidad
+    elif diferencia_x < -velocidad:  # Objetivo lejos a la izquierda
+        x -= velocidad
+    else:  # Llega en este paso
+        x = objetivo_x
+    
+    # Paso en Y (vertical)
+    diferencia_y = objetivo_y - y
+    if diferencia_y > velocidad:  # Objetivo lejos abajo
+        y += velocidad
+    elif diferencia_y < -velocidad:  # Objetivo lejos arriba
+        y -= velocidad
+    else:
+        y = objetivo_y
+    
+    # Aplicar límites de pantalla (lo mismo que aplicar_limites_enemigo,
+    # con comparaciones en lugar de una llamada a clamp_ip)
+    if con_bordes:
+        if x < 0:
+            x = 0
+        elif x > LIMITE_ENEMIGO_X:
+            x = LIMITE_ENEMIGO_X
+        if y < 0:
+            y = 0
+        elif y > LIMITE_ENEMIGO_Y:
+            y = LIMITE_ENEMIGO_Y
+    
+    rect.topleft = (x, y)
+
+def mover_con_campo_flujo(enemigo, campo_flujo, objetivo_x, objetivo_y):
+    """
+    Mueve al enemigo siguiendo un campo de flujo (rodea obstáculos)
+    
+    Args:
+        enemigo (Enemigo): Estado del enemigo
+        campo_flujo (CampoFlujo): Campo ya apuntado al objetivo
+        objetivo_x (int): Posición X del objetivo
+        objetivo_y (int): Posición Y del objetivo
+        
+    Conceptos enseñados:
+    - Consulta O(1) de un campo precalculado
+    - Alternativa simple cuando no hay camino
+    """
+    if not enemigo.activo:
+        return
     
-    # Mover en X (horizontal)
-    if diferencia_x > 0:  # Objetivo está a la derecha
-        enemigo['x'] += min(VELOCIDAD_ENEMIGO, diferencia_x)
-    elif diferencia_x < 0:  # Objetivo está a la izquierda
-        enemigo['x'] += max(-VELOCIDAD_ENEMIGO, diferencia_x)
+    paso_x, paso_y, distancia = campo_flujo.direccion_en(enemigo.rect.centerx,
+                                                         enemigo.rect.centery)
     
-    # Mover en Y (vertical)
-    if diferencia_y > 0:  # Objetivo está abajo
-        enemigo['y'] += min(VELOCIDAD_ENEMIGO, diferencia_y)
-    elif diferencia_y < 0:  # Objetivo está arriba
-        enemigo['y'] += max(-VELOCIDAD_ENEMIGO, diferencia_y)
+    # Ya en la celda del objetivo o sin camino: persecución directa
+    if distancia == 0 or distancia == INALCANZABLE:
+        mover_hacia_objetivo(enemigo, objetivo_x, objetivo_y)
+        return
     
-    # Aplicar límites de pantalla
+    enemigo.rect.move_ip(paso_x * enemigo.velocidad, paso_y * enemigo.velocidad)
     aplicar_limites_enemigo(enemigo)
 
 def aplicar_limites_enemigo(enemigo):
@@ -122,86 +479,133 @@ def aplicar_limites_enemigo(enemigo):
     Mantiene al enemigo dentro de los límites de la pantalla
     
     Args:
-        enemigo (dict): Estado del enemigo
+        enemigo (Enemigo): Estado del enemigo
         
     Conceptos enseñados:
     - Validación de límites
     - Funciones auxiliares
     - Prevención de errores visuales
     """
-    # Límite izquierdo
-    if enemigo['x'] < 0:
-        enemigo['x'] = 0
-    
-    # Límite derecho
-    if enemigo['x'] > ANCHO - TAMANO_ENEMIGO:
-        enemigo['x'] = ANCHO - TAMANO_ENEMIGO
-    
-    # Límite superior
-    if enemigo['y'] < 0:
-        enemigo['y'] = 0
-    
-    # Límite inferior
-    if enemigo['y'] > ALTO - TAMANO_ENEMIGO:
-        enemigo['y'] = ALTO - TAMANO_ENEMIGO
+    # clamp_ip hace las cuatro comparaciones (izquierda, derecha, arriba y
+    # abajo) y mueve el rect dentro de la pantalla en una sola llamada
+    enemigo.rect.clamp_ip(AREA_PANTALLA)
 
 # ============================================================================
 # FUNCIONES DE COMPORTAMIENTO DEL ENEMIGO
 # ============================================================================
 
-def actualizar_enemigo(enemigo, jugador):
+def actualizar_enemigo(enemigo, jugador, campo_flujo=None, con_bordes=True, planificador=None):
     """
     Actualiza el comportamiento del enemigo cada frame
     
     Args:
-        enemigo (dict): Estado del enemigo
-        jugador (dict): Estado del jugador (objetivo)
+        enemigo (Enemigo | EnemySwarm): Estado del enemigo o del enjambre
+        jugador (Jugador): Estado del jugador (objetivo)
+        campo_flujo (CampoFlujo, optional): Campo para rodear obstáculos
+            (solo dentro de la pantalla)
+        con_bordes (bool): Mantener a los enemigos dentro de la pantalla
+            (False en el mundo infinito)
+        planificador (PlanificadorDetalle, optional): Mueve a los enemigos
+            lejanos del enjambre cada varios pasos (nivel_detalle)
         
     Conceptos enseñados:
     - Función de actualización principal
     - Comportamiento condicional
     - Integración de múltiples sistemas
     """
-    # Solo perseguir si el jugador está vivo
-    if jugador['vivo'] and enemigo['activo']:
-        # Mover hacia el jugador
-        mover_hacia_objetivo(enemigo, jugador['x'], jugador['y'])
+    if not jugador.vivo:
+        return
+    
+    # El campo solo se recalcula si el jugador cambió de celda
+    if campo_flujo is not None:
+        campo_flujo.actualizar_objetivo(jugador.x + TAMANO_JUGADOR // 2,
+                                        jugador.y + TAMANO_JUGADOR // 2)
+    
+    if isinstance(enemigo, EnemySwarm):
+        if planificador is not None:
+            planificador.actualizar(enemigo, jugador, campo_flujo, con_bordes)
+        else:
+            enemigo.perseguir(jugador.x, jugador.y, campo_flujo, con_bordes)
+        return
+    
+    # Solo perseguir si el enemigo está activo
+    if enemigo.activo:
+        if campo_flujo is not None:
+            mover_con_campo_flujo(enemigo, campo_flujo, jugador.x, jugador.y)
+        else:
+            # Mover hacia el jugador
+            mover_hacia_objetivo(enemigo, jugador.x, jugador.y, con_bordes)
 
 def obtener_rect_enemigo(enemigo):
     """
-    Crea un rectángulo para el enemigo (usado para colisiones)
+    Devuelve el rectángulo del enemigo (usado para colisiones)
     
     Args:
-        enemigo (dict): Estado del enemigo
+        enemigo (Enemigo): Estado del enemigo
         
     Returns:
-        pygame.Rect: Rectángulo del enemigo
+        pygame.Rect: Rectángulo propio del enemigo (el mismo objeto en
+            cada llamada)
         
     Conceptos enseñados:
     - Rectángulos para colisiones
     - Tamaños específicos por entidad
     """
-    return pygame.Rect(enemigo['x'], enemigo['y'], TAMANO_ENEMIGO, TAMANO_ENEMIGO)
+    return enemigo.rect
 
 # ============================================================================
 # FUNCIONES DE RENDERIZADO DEL ENEMIGO
 # ============================================================================
 
-def dibujar_enemigo(pantalla, sprite_enemigo, enemigo):
+def posiciones_en_pantalla(enemigo, camara=None):
     """
-    Dibuja el enemigo en la pantalla
+    Posiciones de pantalla de los enemigos activos que se ven
+    
+    Args:
+        enemigo (Enemigo | EnemySwarm): Enemigo o enjambre
+        camara (Camara, optional): Cámara que define la vista (sin ella,
+            el mundo es la pantalla y se devuelven todos los activos)
+        
+    Returns:
+        list: Pares (x, y) en coordenadas de pantalla
+        
+    Conceptos enseñados:
+    - Descartar lo que no se ve antes de dibujar
+    """
+    if isinstance(enemigo, EnemySwarm):
+        if camara is None:
+            indices = np.flatnonzero(enemigo.activo)
+            return list(zip(enemigo.x[indices].tolist(), enemigo.y[indices].tolist()))
+        indices = enemigo.indices_en_rect(camara.rect)
+        return list(zip((enemigo.x[indices] - camara.x).tolist(),
+                        (enemigo.y[indices] - camara.y).tolist()))
+    
+    if not enemigo.activo:
+        return []
+    if camara is None:
+        return [(enemigo.x, enemigo.y)]
+    if not enemigo.rect.colliderect(camara.rect):
+        return []
+    return [camara.a_pantalla(enemigo.x, enemigo.y)]
+
+def dibujar_enemigo(pantalla, sprite_enemigo, enemigo, camara=None):
+    """
+    Dibuja el enemigo (o los del enjambre) que se ve en la pantalla
     
     Args:
         pantalla (pygame.Surface): Superficie donde dibujar
         sprite_enemigo (pygame.Surface): Imagen del enemigo
-        enemigo (dict): Estado del enemigo
+        enemigo (Enemigo | EnemySwarm): Estado del enemigo o del enjambre
+        camara (Camara, optional): Cámara para pasar del mundo a la
+            pantalla; solo se dibuja lo que toca su vista
         
     Conceptos enseñados:
     - Renderizado condicional
     - Uso de sprites específicos
     """
-    if enemigo['activo'] and sprite_enemigo:
-        pantalla.blit(sprite_enemigo, (enemigo['x'], enemigo['y']))
+    if sprite_enemigo:
+        pantalla.blits([(sprite_enemigo, posicion)
+                        for posicion in posiciones_en_pantalla(enemigo, camara)], False)
 
 # ============================================================================
 # FUNCIONES DE ESTADO DEL ENEMIGO
@@ -212,46 +616,60 @@ def reiniciar_enemigo(enemigo):
     Reinicia el estado del enemigo a los valores iniciales
     
     Args:
-        enemigo (dict): Estado del enemigo a reiniciar
+        enemigo (Enemigo): Estado del enemigo a reiniciar
         
     Conceptos enseñados:
     - Restablecimiento de estado
     - Reutilización para múltiples partidas
     """
-    enemigo['x'] = ENEMIGO_X_INICIAL
-    enemigo['y'] = ENEMIGO_Y_INICIAL
-    enemigo['activo'] = True
+    if isinstance(enemigo, EnemySwarm):
+        enemigo.reiniciar()
+        return
+    
+    enemigo.x = ENEMIGO_X_INICIAL
+    enemigo.y = ENEMIGO_Y_INICIAL
+    enemigo.activo = True
 
 def desactivar_enemigo(enemigo):
     """
     Desactiva al enemigo (para pausas o fin de juego)
     
     Args:
-        enemigo (dict): Estado del enemigo
+        enemigo (Enemigo): Estado del enemigo
         
     Conceptos enseñados:
     - Control de estado de entidades
     - Funciones de control de gameplay
     """
-    enemigo['activo'] = False
+    if isinstance(enemigo, EnemySwarm):
+        enemigo.desactivar()
+        return
+    
+    enemigo.activo = False
 
 # ============================================================================
 # FUNCIONES DE INFORMACIÓN DEL ENEMIGO
 # ============================================================================
 
-def distancia_al_jugador(enemigo, jugador):
+def distancia_al_jugador(enemigo, jugador, por_enemigo=False):
     """
     Calcula la distancia entre el enemigo y el jugador
     
     Args:
-        enemigo (dict): Estado del enemigo
-        jugador (dict): Estado del jugador
+        enemigo (Enemigo | EnemySwarm): Estado del enemigo o del enjambre
+        jugador (Jugador): Estado del jugador
+        por_enemigo (bool): Con un enjambre, devolver la distancia de cada
+            enemigo en lugar de la del más cercano
         
     Returns:
-        float: Distancia entre enemigo y jugador
+        float | numpy.ndarray: Distancia entre enemigo y jugador
         
     Conceptos enseñados:
     - Reutilización de funciones auxiliares
     - Cálculos de distancia para gameplay
     """
-    return calcular_distancia(enemigo['x'], enemigo['y'], jugador['x'], jugador['y'])
\ No newline at end of file
+    if isinstance(enemigo, EnemySwarm):
+        if por_enemigo:
+            return enemigo.distancias(jugador.x, jugador.y)
+        return enemigo.distancia_minima(jugador.x, jugador.y)
+    return calcular_distancia(enemigo.x, enemigo.y, jugador.x, jugador.y)
\ No newline at end of file
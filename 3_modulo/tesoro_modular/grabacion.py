@@ -0,0 +1,329 @@
+"""
+MÓDULO DE GRABACIÓN Y REPETICIÓN - CAZADOR DE TESOROS
+====================================================
+Este módulo graba la entrada que el juego consume en cada frame y la
+vuelve a reproducir sin pantalla y a máxima velocidad, para reproducir
+frames lentos o partidas que terminaron distinto de lo esperado.
+
+Como la lógica del juego es determinista, basta con guardar la semilla
+de la partida y las teclas de cada frame. Cada frame se empaqueta en un
+número de 16 bits (un bit por tecla), los frames iguales seguidos se
+agrupan (run-length encoding) y el resultado se comprime con zlib: una
+hora de juego ocupa unos pocos KB.
+
+Al terminar la grabación se guarda también una huella (SHA-256) del
+estado final; al reproducir se compara para comprobar que el resultado
+es idéntico bit a bit.
+
+Se ejecuta directamente:  python grabacion.py partida.rec
+
+Conceptos enseñados:
+- Determinismo: misma semilla + misma entrada = mismo resultado
+- Campos de bits
+- Compresión run-length y formatos binarios con struct
+- Verificación con funciones hash
+"""
+
+import sys
+import struct
+import hashlib
+import zlib
+
+import numpy as np
+import pygame
+from configuracion import *
+from jugador import TeclasSimuladas
+from utilidades import EntidadConSlots
+
+# ============================================================================
+# FORMATO DEL ARCHIVO
+# ============================================================================
+
+# Cabecera: firma, versión, semilla y número de frames
+FIRMA_GRABACION = b'TSRG'
+VERSION_GRABACION = 1
+FORMATO_CABECERA = '<4sBQI'
+TAMANO_HUELLA = 32
+
+# Teclas mantenidas (se leen con pygame.key.get_pressed)
+TECLAS_MANTENIDAS = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN)
+
+# Teclas de evento (KEYDOWN) que usa manejar_eventos
+TECLAS_EVENTO = (pygame.K_p, pygame.K_r, pygame.K_F1, pygame.K_SPACE, pygame.K_ESCAPE)
+
+# Bit extra para el evento de cerrar la ventana
+BIT_SALIR = 1 << (len(TECLAS_MANTENIDAS) + len(TECLAS_EVENTO))
+
+# ============================================================================
+# EMPAQUETADO DE CADA FRAME
+# ============================================================================
+
+def empaquetar_frame(eventos, teclas):
+    """
+    Convierte la entrada de un frame en un número con un bit por tecla
+
+    Args:
+        eventos (list): Eventos de pygame del frame
+        teclas (sequence): Estado de las teclas mantenidas
+
+    Returns:
+        int: Entrada del frame como campo de bits
+
+    Conceptos enseñados:
+    - Operadores de bits (|, <<)
+    """
+    bits = 0
+    for posicion, tecla in enumerate(TECLAS_MANTENIDAS):
+        if teclas[tecla]:
+            bits |= 1 << posicion
+    for evento in eventos:
+        if evento.type == pygame.QUIT:
+            bits |= BIT_SALIR
+        elif evento.type == pygame.KEYDOWN and evento.key in TECLAS_EVENTO:
+            bits |= 1 << (len(TECLAS_MANTENIDAS) + TECLAS_EVENTO.index(evento.key))
+    return bits
+
+def desempaquetar_frame(bits):
+    """
+    Reconstruye los eventos y las teclas de un frame grabado
+
+    Args:
+        bits (int): Entrada del frame como campo de bits
+
+    Returns:
+        tuple: (lista de eventos, TeclasSimuladas)
+    """
+    teclas = [tecla for posicion, tecla in enumerate(TECLAS_MANTENIDAS)
+              if bits & (1 << posicion)]
+    eventos = [pygame.event.Event(pygame.KEYDOWN, key=tecla)
+               for posicion, tecla in enumerate(TECLAS_EVENTO)
+               if bits & (1 << (len(TECLAS_MANTENIDAS) + posicion))]
+    if bits & BIT_SALIR:
+        eventos.append(pygame.event.Event(pygame.QUIT))
+    return eventos, TeclasSimuladas(teclas)
+
+# ============================================================================
+# HUELLA DEL ESTADO
+# ============================================================================
+
+def huella_estado(estado):
+    """
+    Calcula un hash SHA-256 de todo el estado de la partida
+
+    Args:
+        estado (dict): Estado del juego
+
+    Returns:
+        bytes: Huella de 32 bytes
+
+    Conceptos enseñados:
+    - Representación canónica de datos
+    - Funciones hash para comparar estados grandes
+    """
+    huella = hashlib.sha256()
+    explorador = estado['jugador']
+    huella.update(repr((explorador.x, explorador.y, explorador.vivo,
+                        explorador.tesoros_recogidos, estado['juego_terminado'],
+                        estado['tipo_final'], estado['pausa'], estado['running'])).encode())
+
+    enemigos = estado['enemigo']
+    if isinstance(enemigos, EntidadConSlots):
+        huella.update(repr((enemigos.x, enemigos.y, enemigos.activo)).encode())
+    else:
+        for arreglo in (enemigos.x, enemigos.y, enemigos.activo):
+            huella.update(np.ascontiguousarray(arreglo).tobytes())
+
+    for tesoro in estado['tesoros']:
+        huella.update(repr((tesoro.x, tesoro.y, tesoro.visible,
+                            tesoro.recogido)).encode())
+    return huella.digest()
+
+# ============================================================================
+# GRABADOR
+# ============================================================================
+
+def escribir_varint(salida, numero):
+    """
+    Escribe un entero sin signo en 7 bits por byte (LEB128)
+
+    Args:
+        salida (bytearray): Destino
+        numero (int): Entero a escribir
+    """
+    while numero >= 0x80:
+        salida.append((numero & 0x7F) | 0x80)
+        numero >>= 7
+    salida.append(numero)
+
+def leer_varint(datos, posicion):
+    """
+    Lee un entero escrito con escribir_varint
+
+    Returns:
+        tuple: (número, posición siguiente)
+    """
+    numero = 0
+    desplazamiento = 0
+    while True:
+        byte = datos[posicion]
+        posicion += 1
+        numero |= (byte & 0x7F) << desplazamiento
+        if byte < 0x80:
+            return numero, posicion
+        desplazamiento += 7
+
+class Grabador:
+    """
+    Acumula la entrada de cada frame como tramos (valor, repeticiones)
+
+    Conceptos enseñados:
+    - Run-length encoding incremental
+    """
+
+    def __init__(self, semilla):
+        """
+        Args:
+            semilla (int): Semilla con la que se creó la partida
+        """
+        self.semilla = semilla
+        self.frames = 0
+        self.tramos = []
+
+    def registrar_frame(self, eventos, teclas):
+        """
+        Agrega la entrada de un frame a la grabación
+
+        Args:
+            eventos (list): Eventos de pygame del frame
+            teclas (sequence): Estado de las teclas mantenidas
+        """
+        bits = empaquetar_frame(eventos, teclas)
+        if self.tramos and self.tramos[-1][0] == bits:
+            self.tramos[-1][1] += 1
+        else:
+            self.tramos.append([bits, 1])
+        self.frames += 1
+
+    def a_bytes(self, estado_final):
+        """
+        Serializa la grabación junto con la huella del estado final
+
+        Args:
+            estado_final (dict): Estado del juego al terminar de grabar
+
+        Returns:
+            bytes: Contenido del archivo de grabación
+        """
+        tramos = bytearray()
+        for bits, repeticiones in self.tramos:
+            escribir_varint(tramos, bits)
+            escribir_varint(tramos, repeticiones)
+        cabecera = struct.pack(FORMATO_CABECERA, FIRMA_GRABACION, VERSION_GRABACION,
+                               self.semilla, self.frames)
+        return cabecera + huella_estado(estado_final) + zlib.compress(bytes(tramos), 9)
+
+    def guardar(self, ruta, estado_final):
+        """
+        Guarda la grabación en un archivo
+
+        Args:
+            ruta (str): Archivo de destino
+            estado_final (dict): Estado del juego al terminar de grabar
+
+        Returns:
+            int: Tamaño del archivo en bytes
+        """
+        datos = self.a_bytes(estado_final)
+        with open(ruta, 'wb') as archivo:
+            archivo.write(datos)
+        return len(datos)
+
+# ============================================================================
+# REPRODUCTOR
+# ============================================================================
+
+def leer_grabacion(datos):
+    """
+    Decodifica el contenido de un archivo de grabación
+
+    Args:
+        datos (bytes): Contenido del archivo
+
+    Returns:
+        tuple: (semilla, frames, huella, lista de tramos [bits, repeticiones])
+
+    Raises:
+        ValueError: Si el archivo no es una grabación válida
+    """
+    tamano_cabecera = struct.calcsize(FORMATO_CABECERA)
+    firma, version, semilla, frames = struct.unpack_from(FORMATO_CABECERA, datos)
+    if firma != FIRMA_GRABACION:
+        raise ValueError("El archivo no es una grabación de Cazador de Tesoros")
+    if version != VERSION_GRABACION:
+        raise ValueError(f"Versión de grabación no soportada: {version}")
+
+    huella = datos[tamano_cabecera:tamano_cabecera + TAMANO_HUELLA]
+    tramos_crudos = zlib.decompress(datos[tamano_cabecera + TAMANO_HUELLA:])
+    tramos = []
+    posicion = 0
+    while posicion < len(tramos_crudos):
+        bits, posicion = leer_varint(tramos_crudos, posicion)
+        repeticiones, posicion = leer_varint(tramos_crudos, posicion)
+        tramos.append((bits, repeticiones))
+    return semilla, frames, huella, tramos
+
+def reproducir(datos):
+    """
+    Repite una partida grabada sin pantalla y sin límite de velocidad
+
+    Cada frame pasa por manejar_eventos y actualizar_juego en el mismo
+    orden que en el bucle principal del juego. Igual que allí, el frame en
+    que se cierra la ventana (QUIT) se graba pero no llega a actualizar
+    el juego.
+
+    Args:
+        datos (bytes): Contenido del archivo de grabación
+
+    Returns:
+        tuple: (estado final, True si la huella coincide con la grabada)
+
+    Conceptos enseñados:
+    - Repetición determinista
+    - Reutilización del mismo código del juego
+    """
+    # Importación local: main también importa este módulo
+    import main
+    
+    semilla, frames, huella, tramos = leer_grabacion(datos)
+    estado = main.crear_estado_inicial(semilla)
+
+    for bits, repeticiones in tramos:
+        eventos, teclas = desempaquetar_frame(bits)
+        for _ in range(repeticiones):
+            main.manejar_eventos(estado, eventos)
+            if not estado['running']:
+                return estado, huella_estado(estado) == huella
+            main.actualizar_juego(estado, teclas)
+
+    return estado, huella_estado(estado) == huella
+
+# ============================================================================
+# PUNTO DE ENTRADA
+# ============================================================================
+
+if __name__ == "__main__":
+    import time
+
+    ruta = sys.argv[1] if len(sys.argv) > 1 else ARCHIVO_GRABACION
+    with open(ruta, 'rb') as archivo:
+        contenido = archivo.read()
+
+    semilla, frames, _, tramos = leer_grabacion(contenido)
+    inicio = time.perf_counter()
+    estado, coincide = reproducir(contenido)
+    segundos = time.perf_counter() - inicio
+
+    print(f"Grabación: {ruta} ({len(contenido)} bytes, {len(tramos)} tramos)")
+    print(f"Semilla {semilla}, {frames} frames ({frames / HZ_SIMULACION / 60:.1f} min de juego)")
+    print(f"Reproducida en {segundos:.2f} s ({frames / max(segundos, 1e-9):.0f} frames/s)")
+    print("Estado final idéntico" if coincide else "Advertencia: el estado final no coincide")
@@ -0,0 +1,305 @@
+"""
+MÓDULO DE GRILLA ESPACIAL - CAZADOR DE TESOROS
+=============================================
+Este módulo implementa una grilla espacial uniforme para que las
+consultas de colisión y de vecinos solo revisen los objetos cercanos y
+no todo el mapa. Los objetos se guardan ordenados por celda en arreglos
+de NumPy (formato CSR), sin un diccionario por celda.
+
+Conceptos enseñados:
+- Estructuras de datos espaciales
+- Fase amplia (broadphase) de colisiones
+"""
+
+import math
+import numpy as np
+
+# ============================================================================
+# GRILLA ESTÁTICA EN ARREGLOS
+# ============================================================================
+
+class GrillaEstatica:
+    """
+    Índice espacial de solo lectura para objetos que no se mueven (como
+    los tesoros), guardado en arreglos de NumPy en lugar de diccionarios.
+
+    Los índices de los objetos se ordenan por celda, fila por fila, y un
+    arreglo 'inicios' indica dónde empieza cada celda. Las celdas de una
+    misma fila quedan contiguas, así que una consulta toma una rebanada por
+    cada fila de celdas que toca. Quitar objetos no cambia la grilla: quien
+    la usa filtra los candidatos con su propio estado y la reconstruye
+    cuando le conviene.
+
+    Conceptos enseñados:
+    - Ordenamiento por clave de celda (formato CSR)
+    - Rebanadas contiguas en lugar de recorridos
+    - Búsqueda de vecinos más cercanos por zonas crecientes
+    - Memoria compacta para millones de objetos
+    """
+
+    def __init__(self, posiciones_x, posiciones_y, tamano_celda, tamano_objeto=None, indices=None):
+        """
+        Args:
+            posiciones_x, posiciones_y (numpy.ndarray): Esquinas superiores
+                izquierdas de todos los objetos
+            tamano_celda (int): Lado de cada celda en píxeles
+            tamano_objeto (int, optional): Lado de los objetos guardados
+            indices (numpy.ndarray, optional): Subconjunto de objetos a
+                indexar (por defecto todos)
+        """
+        self.tamano_celda = tamano_celda
+        self.tamano_objeto = tamano_objeto if tamano_objeto else tamano_celda
+        self.x = posiciones_x
+        self.y = posiciones_y
+
+        if indices is None:
+            indices = np.arange(len(posiciones_x), dtype=np.int32)
+        indices = np.asarray(indices, dtype=np.int32)
+        self.cantidad = len(indices)
+
+        if self.cantidad:
+            x = posiciones_x[indices]
+            y = posiciones_y[indices]
+            self.origen_x = int(x.min())
+            self.origen_y = int(y.min())
+            columnas = (x - self.origen_x) // tamano_celda
+            filas = (y - self.origen_y) // tamano_celda
+            self.columnas = int(columnas.max()) + 1
+            self.filas = int(filas.max()) + 1
+        else:
+            self.origen_x = self.origen_y = 0
+            self.columnas = self.filas = 1
+            columnas = filas = np.zeros(0, dtype=np.int64)
+
+        claves = filas.astype(np.int64) * self.columnas + columnas
+        orden = np.argsort(claves, kind='stable')
+        self.orden = indices[orden]
+        self.inicios = np.searchsorted(
+            claves[orden], np.arange(self.filas * self.columnas + 1)).astype(np.int32)
+        # Resultado vacío compartido por las consultas sin candidatos
+        self.vacia = self.orden[:0]
+        self.vacia.flags.writeable = False
+
+    def rebanada_fila(self, fila, columna_min, columna_max):
+        """
+        Devuelve los índices guardados en un tramo de celdas de una fila
+
+        Args:
+            fila (int): Fila de celdas (relativa al origen)
+            columna_min, columna_max (int): Tramo de columnas (inclusive)
+
+        Returns:
+            numpy.ndarray: Índices de los objetos de ese tramo
+        """
+        if fila < 0 or fila >= self.filas:
+            return self.vacia
+        columna_min = max(columna_min, 0)
+        columna_max = min(columna_max, self.columnas - 1)
+        if columna_min > columna_max:
+            return self.vacia
+        base = fila * self.columnas
+        return self.orden[self.inicios[base + columna_min]:self.inicios[base + columna_max + 1]]
+
+    def consultar_rect(self, x, y, ancho, alto):
+        """
+        Devuelve los índices de los objetos que podrían tocar un rectángulo
+
+        Args:
+            x, y (int): Esquina superior izquierda del rectángulo buscado
+            ancho, alto (int): Dimensiones del rectángulo buscado
+
+        Returns:
+            numpy.ndarray: Índices candidatos (fase amplia)
+        """
+        tamano = self.tamano_celda
+        # Mismo criterio que GrillaEspacial, recortado a las celdas existentes
+        columna_min = (int(x) - self.tamano_objeto + 1 - self.origen_x) // tamano
+        columna_max = (int(x) + ancho - 1 - self.origen_x) // tamano
+        fila_min = max((int(y) - self.tamano_objeto + 1 - self.origen_y) // tamano, 0)
+        fila_max = min((int(y) + alto - 1 - self.origen_y) // tamano, self.filas - 1)
+
+        rebanadas = []
+        for fila in range(fila_min, fila_max + 1):
+            rebanada = self.rebanada_fila(fila, columna_min, columna_max)
+            if rebanada.size:
+                rebanadas.append(rebanada)
+
+        if not rebanadas:
+            return self.vacia
+        if len(rebanadas) == 1:
+            return rebanadas[0]
+        return np.concatenate(rebanadas)
+
+    def consultar_cuadrado(self, columna_centro, fila_centro, radio):
+        """
+        Devuelve los índices guardados en un cuadrado de celdas
+
+        Args:
+            columna_centro, fila_centro (int): Celda central (relativa al origen)
+            radio (int): Celdas hacia cada lado (0 = solo la celda central)
+
+        Returns:
+            numpy.ndarray: Índices de los objetos del cuadrado
+        """
+        fila_min = max(fila_centro - radio, 0)
+        fila_max = min(fila_centro + radio, self.filas - 1)
+        rebanadas = [self.rebanada_fila(fila, columna_centro - radio, columna_centro + radio)
+                     for fila in range(fila_min, fila_max + 1)]
+        if not rebanadas:
+            return self.vacia
+        return np.concatenate(rebanadas)
+
+    def k_mas_cercanos(self, x, y, k=1, estados=None, bit=1):
+        """
+        Busca los k objetos más cercanos a un punto con cuadrados de celdas
+        cada vez más grandes alrededor de la celda del punto
+
+        Todo lo que queda fuera de un cuadrado de radio r está al menos a
+        r * tamano_celda de distancia. Si el k-ésimo candidato está más cerca
+        que eso la respuesta es definitiva; si no, se hace una última pasada
+        con el cuadrado justo para cubrir esa distancia.
+
+        Args:
+            x, y (int): Punto de consulta
+            k (int): Cantidad de vecinos buscados
+            estados (numpy.ndarray, optional): Byte de estado de todos los
+                objetos; solo cuentan los que tengan 'bit' encendido
+            bit (int): Bit de estado que deben tener los objetos
+
+        Returns:
+            numpy.ndarray: Índices ordenados del más cercano al más lejano
+        """
+        if self.cantidad == 0 or k <= 0:
+            return self.vacia
+
+        tamano = self.tamano_celda
+        columna = (int(x) - self.origen_x) // tamano
+        fila = (int(y) - self.origen_y) // tamano
+        # Radio con el que el cuadrado ya cubre toda la grilla
+        radio_maximo = max(columna, self.columnas - 1 - columna, fila, self.filas - 1 - fila)
+        # Primer radio que llega a tocar la grilla (consultas desde fuera)
+        radio = max(1, -columna, columna - (self.columnas - 1), -fila, fila - (self.filas - 1))
+
+        definitivo = False
+        while True:
+            candidatos = self.consultar_cuadrado(columna, fila, radio)
+            if estados is not None and candidatos.size:
+                candidatos = candidatos[(estados[candidatos] & bit) != 0]
+            dx = self.x[candidatos].astype(np.int64) - int(x)
+            dy = self.y[candidatos].astype(np.int64) - int(y)
+            distancias = dx * dx + dy * dy
+
+            if definitivo or radio >= radio_maximo:
+                break
+            if candidatos.size >= k:
+                limite = radio * tamano
+                distancia_k = np.partition(distancias, k - 1)[k - 1]
+                if distancia_k <= limite * limite:
+                    break
+                # Cuadrado que cubre todo lo que está a distancia_k o menos
+                radio = int(math.sqrt(distancia_k)) // tamano + 1
+                definitivo = True
+            else:
+                radio *= 2
+
+        orden = np.argsort(distancias, kind='stable')[:k]
+        return candidatos[orden]
+
+    def mas_cercanos_lote(self, puntos_x, puntos_y, estados=None, bit=1):
+        """
+        Busca el objeto más cercano a muchos puntos a la vez (por ejemplo,
+        uno por bot o por flecha de pista)
+
+        Todas las consultas avanzan juntas: por cada fila de celdas del
+        cuadrado de búsqueda se toma la rebanada de cada consulta y se
+        recorre posición por posición con operaciones vectorizadas. Las
+        consultas que aún no pueden asegurar su respuesta repiten con un
+        cuadrado del doble de radio.
+
+        Args:
+            puntos_x, puntos_y (sequence): Puntos de consulta
+            estados (numpy.ndarray, optional): Byte de estado de los objetos
+            bit (int): Bit de estado que deben tener los objetos
+
+        Returns:
+            numpy.ndarray: Índice del objeto más cercano a cada punto
+                (-1 si no hay ninguno)
+        """
+        puntos_x = np.asarray(puntos_x, dtype=np.int64)
+        puntos_y = np.asarray(puntos_y, dtype=np.int64)
+        resultado = np.full(len(puntos_x), -1, dtype=np.int64)
+        if self.cantidad == 0 or len(puntos_x) == 0:
+            return resultado
+
+        tamano = self.tamano_celda
+        columnas_centro = (puntos_x - self.origen_x) // tamano
+        filas_centro = (puntos_y - self.origen_y) // tamano
+        radio_maximo = np.maximum.reduce([columnas_centro, self.columnas - 1 - columnas_centro,
+                                          filas_centro, self.filas - 1 - filas_centro])
+        mejor = np.full(len(puntos_x), np.iinfo(np.int64).max, dtype=np.int64)
+        pendientes = np.arange(len(puntos_x))
+        radio = 2
+
+        while pendientes.size:
+            x = puntos_x[pendientes]
+            y = puntos_y[pendientes]
+            columna = columnas_centro[pendientes]
+            fila = filas_centro[pendientes]
+            columna_min = np.clip(columna - radio, 0, self.columnas - 1)
+            columna_max = np.clip(columna + radio, 0, self.columnas - 1)
+            tramo_valido = (columna + radio >= 0) & (columna - radio < self.columnas)
+            mejor_actual = mejor[pendientes]
+            resultado_actual = resultado[pendientes]
+
+            for desplazamiento in range(-radio, radio + 1):
+                fila_actual = fila + desplazamiento
+                valida = tramo_valido & (fila_actual >= 0) & (fila_actual < self.filas)
+                base = np.clip(fila_actual, 0, self.filas - 1) * self.columnas
+                inicio = np.where(valida, self.inicios[base + columna_min], 0)
+                fin = np.where(valida, self.inicios[base + columna_max + 1], 0)
+                largo = fin - inicio
+                largo_maximo = int(largo.max()) if largo.size else 0
+                for paso in range(largo_maximo):
+                    activa = paso < largo
+                    indice = self.orden[np.where(activa, inicio + paso, 0)]
+                    if estados is not None:
+                        activa &= (estados[indice] & bit) != 0
+                    dx = self.x[indice] - x
+                    dy = self.y[indice] - y
+                    distancia = dx * dx + dy * dy
+                    mejora = activa & (distancia < mejor_actual)
+                    mejor_actual = np.where(mejora, distancia, mejor_actual)
+                    resultado_actual = np.where(mejora, indice, resultado_actual)
+
+            mejor[pendientes] = mejor_actual
+            resultado[pendientes] = resultado_actual
+            # Terminadas: respuesta asegurada o cuadrado que cubre la grilla
+            limite = radio * tamano
+            terminada = (mejor_actual <= limite * limite) | (radio >= radio_maximo[pendientes])
+            pendientes = pendientes[~terminada]
+            radio *= 2
+
+        return resultado
+
+    def en_radio(self, x, y, radio, estados=None, bit=1):
+        """
+        Busca todos los objetos a una distancia menor o igual que 'radio'
+
+        Args:
+            x, y (int): Punto de consulta
+            radio (float): Distancia máxima
+            estados (numpy.ndarray, optional): Byte de estado de los objetos
+            bit (int): Bit de estado que deben tener los objetos
+
+        Returns:
+            numpy.ndarray: Índices de los objetos dentro del círculo
+        """
+        alcance = int(math.ceil(radio))
+        # consultar_rect añade el margen del objeto; se filtra por distancia
+        candidatos = self.consultar_rect(int(x) - alcance, int(y) - alcance,
+                                         2 * alcance + 1, 2 * alcance + 1)
+        if estados is not None and candidatos.size:
+            candidatos = candidatos[(estados[candidatos] & bit) != 0]
+        dx = self.x[candidatos].astype(np.int64) - int(x)
+        dy = self.y[candidatos].astype(np.int64) - int(y)
+        return candidatos[dx * dx + dy * dy <= radio * radio]
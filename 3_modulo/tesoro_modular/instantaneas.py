@@ -0,0 +1,518 @@
+"""
+MÓDULO DE INSTANTÁNEAS - CAZADOR DE TESOROS
+==========================================
+Este módulo guarda el estado completo de una partida (jugador, enemigos,
+tesoros y banderas del juego) en un bloque de bytes con formato fijo y
+lo vuelve a cargar. Sirve para guardar partidas de prueba y para
+rebobinar el juego paso a paso.
+
+Una instantánea empieza con una cabecera (firma, versión, banderas y
+cuántos enemigos y tesoros hay) seguida de bloques escritos con struct.
+Las posiciones van como enteros de 32 bits y el estado de cada tesoro y
+de cada enemigo como bits empaquetados con np.packbits. Los arreglos se
+escriben directamente dentro del bloque, sin copias intermedias.
+
+Las posiciones de los tesoros y los puntos de partida de los enemigos no
+cambian durante la partida. Las instantáneas "completas" los incluyen
+(unos 8,25 bytes por tesoro) y se pueden cargar en un estado nuevo; las
+del búfer de rebobinado no (un cuarto de byte por tesoro) y se cargan
+sobre el estado de la misma partida. Como todas las de una partida miden
+lo mismo, el búfer es un solo bloque de memoria que se recorre en
+círculo.
+
+Conceptos enseñados:
+- Formatos binarios con cabecera y número de versión
+- Serialización con struct y vistas de NumPy sobre un bytearray
+- Campos de bits
+- Búfer circular de estados (rebobinado)
+"""
+
+import struct
+
+import numpy as np
+import pygame
+from configuracion import *
+import enemigo
+import tesoros
+
+# ============================================================================
+# FORMATO DE LA INSTANTÁNEA
+# ============================================================================
+
+FIRMA_INSTANTANEA = b'TSRI'
+VERSION_INSTANTANEA = 1
+
+# Banderas de la cabecera
+CON_POSICIONES = 1   # Incluye posiciones de tesoros y puntos de partida
+CON_ENJAMBRE = 2     # Los enemigos son un EnemySwarm (si no, un Enemigo)
+
+# Bloques de tamaño fijo (little-endian, sin relleno)
+CABECERA = struct.Struct('<4sBBII')   # firma, versión, banderas, enemigos, tesoros
+PARAMETROS = struct.Struct('<4i')     # NOMBRES_PARAMETROS en orden
+JUGADOR = struct.Struct('<iiIi?')     # x, y, tesoros recogidos, velocidad, vivo
+PARTIDA = struct.Struct('<?B??')      # terminado, tipo de final, pausa, running
+ENEMIGOS = struct.Struct('<i')        # velocidad (seguida de los arreglos)
+
+NOMBRES_PARAMETROS = ('VELOCIDAD_JUGADOR', 'VELOCIDAD_ENEMIGO',
+                      'NUMERO_TESOROS', 'TESOROS_PARA_GANAR')
+TIPOS_FINAL = (None, 'victoria', 'derrota')
+
+# Coordenadas: enteros de 32 bits little-endian
+ENTERO = np.dtype('<i4')
+
+# Tecla que se mantiene para rebobinar
+TECLA_REBOBINAR = pygame.K_BACKSPACE
+
+# ============================================================================
+# TAMAÑOS Y ARREGLOS
+# ============================================================================
+
+def bytes_de_bits(cantidad):
+    """
+    Returns:
+        int: Bytes que ocupan 'cantidad' bits empaquetados
+    """
+    return (cantidad + 7) // 8
+
+def calcular_tamano(enemigos, tesoros_totales, con_posiciones):
+    """
+    Calcula cuántos bytes ocupa una instantánea
+
+    Args:
+        enemigos (int): Número de enemigos
+        tesoros_totales (int): Número de tesoros
+        con_posiciones (bool): Si incluye las posiciones fijas
+
+    Returns:
+        int: Tamaño en bytes
+    """
+    tamano = (CABECERA.size + PARAMETROS.size + JUGADOR.size + PARTIDA.size +
+              ENEMIGOS.size + 2 * ENTERO.itemsize * enemigos + bytes_de_bits(enemigos) +
+              2 * bytes_de_bits(tesoros_totales))
+    if con_posiciones:
+        tamano += 2 * ENTERO.itemsize * (enemigos + tesoros_totales)
+    return tamano
+
+def tamano_instantanea(estado, con_posiciones=True):
+    """
+    Args:
+        estado (dict): Estado del juego
+        con_posiciones (bool): Si incluye las posiciones fijas
+
+    Returns:
+        int: Bytes que ocupa la instantánea de ese estado
+    """
+    enemigos = estado['enemigo']
+    cantidad = len(enemigos) if isinstance(enemigos, enemigo.EnemySwarm) else 1
+    return calcular_tamano(cantidad, len(estado['tesoros']), con_posiciones)
+
+def arreglos_enemigos(enemigos):
+    """
+    Reúne los datos de los enemigos como arreglos, haya uno o un enjambre
+
+    Returns:
+        tuple: (x, y, activo, x inicial, y inicial)
+    """
+    if isinstance(enemigos, enemigo.EnemySwarm):
+        return enemigos.x, enemigos.y, enemigos.activo, enemigos.x_inicial, enemigos.y_inicial
+    return ((enemigos.x,), (enemigos.y,), (enemigos.activo,),
+            (ENEMIGO_X_INICIAL,), (ENEMIGO_Y_INICIAL,))
+
+def arreglos_tesoros(coleccion):
+    """
+    Reúne posiciones y estado de los tesoros como arreglos
+
+    Con un TreasureField son sus propios arreglos (no se copia nada); con
+    una lista de Tesoro se arman recorriéndola.
+
+    Returns:
+        tuple: (x, y, estado) con un byte ESTADO_* por tesoro
+    """
+    if isinstance(coleccion, tesoros.TreasureField):
+        return coleccion.x, coleccion.y, coleccion.estado
+    estado = np.array([(tesoros.ESTADO_VISIBLE if tesoro.visible else 0) |
+                       (tesoros.ESTADO_RECOGIDO if tesoro.recogido else 0)
+                       for tesoro in coleccion], dtype=np.uint8)
+    return ([tesoro.x for tesoro in coleccion], [tesoro.y for tesoro in coleccion], estado)
+
+def escribir_arreglo(destino, posicion, valores, tipo=ENTERO):
+    """
+    Copia valores dentro del bloque a través de una vista de NumPy
+
+    Returns:
+        int: Posición siguiente
+    """
+    cantidad = len(valores)
+    np.frombuffer(destino, tipo, cantidad, posicion)[:] = valores
+    return posicion + cantidad * np.dtype(tipo).itemsize
+
+def escribir_bits(destino, posicion, valores):
+    """
+    Empaqueta valores (cero o distinto de cero) a un bit cada uno
+
+    Returns:
+        int: Posición siguiente
+    """
+    return escribir_arreglo(destino, posicion, np.packbits(valores), np.uint8)
+
+def leer_arreglo(datos, posicion, cantidad, tipo=ENTERO):
+    """
+    Returns:
+        tuple: (vista de solo lectura sobre los datos, posición siguiente)
+    """
+    return (np.frombuffer(datos, tipo, cantidad, posicion),
+            posicion + cantidad * np.dtype(tipo).itemsize)
+
+def leer_bits(datos, posicion, cantidad):
+    """
+    Returns:
+        tuple: (arreglo de 0 y 1 de largo 'cantidad', posición siguiente)
+    """
+    empaquetados, siguiente = leer_arreglo(datos, posicion, bytes_de_bits(cantidad), np.uint8)
+    return np.unpackbits(empaquetados, count=cantidad), siguiente
+
+# ============================================================================
+# ESCRITURA
+# ============================================================================
+
+def escribir_instantanea(estado, destino, con_posiciones=True):
+    """
+    Escribe la instantánea de un estado dentro de un bloque ya reservado
+
+    Args:
+        estado (dict): Estado del juego
+        destino (bytearray | memoryview): Bloque escribible de al menos
+            tamano_instantanea(estado, con_posiciones) bytes
+        con_posiciones (bool): Si incluye las posiciones fijas
+
+    Returns:
+        int: Bytes escritos
+
+    Conceptos enseñados:
+    - struct.pack_into: escribir sin crear objetos bytes intermedios
+    """
+    explorador, enemigos, coleccion = estado['jugador'], estado['enemigo'], estado['tesoros']
+    enemigos_x, enemigos_y, activos, inicio_x, inicio_y = arreglos_enemigos(enemigos)
+    tesoros_x, tesoros_y, estado_tesoros = arreglos_tesoros(coleccion)
+
+    banderas = CON_POSICIONES if con_posiciones else 0
+    if isinstance(enemigos, enemigo.EnemySwarm):
+        banderas |= CON_ENJAMBRE
+    CABECERA.pack_into(destino, 0, FIRMA_INSTANTANEA, VERSION_INSTANTANEA, banderas,
+                       len(enemigos_x), len(estado_tesoros))
+    posicion = CABECERA.size
+    PARAMETROS.pack_into(destino, posicion,
+                         *(estado['parametros'][nombre] for nombre in NOMBRES_PARAMETROS))
+    posicion += PARAMETROS.size
+    JUGADOR.pack_into(destino, posicion, explorador.x, explorador.y,
+                      explorador.tesoros_recogidos, explorador.velocidad, explorador.vivo)
+    posicion += JUGADOR.size
+    PARTIDA.pack_into(destino, posicion, estado['juego_terminado'],
+                      TIPOS_FINAL.index(estado['tipo_final']), estado['pausa'], estado['running'])
+    posicion += PARTIDA.size
+    ENEMIGOS.pack_into(destino, posicion, enemigos.velocidad)
+    posicion += ENEMIGOS.size
+
+    posicion = escribir_arreglo(destino, posicion, enemigos_x)
+    posicion = escribir_arreglo(destino, posicion, enemigos_y)
+    posicion = escribir_bits(destino, posicion, activos)
+    posicion = escribir_bits(destino, posicion, estado_tesoros & tesoros.ESTADO_VISIBLE)
+    posicion = escribir_bits(destino, posicion, estado_tesoros & tesoros.ESTADO_RECOGIDO)
+    if con_posiciones:
+        posicion = escribir_arreglo(destino, posicion, inicio_x)
+        posicion = escribir_arreglo(destino, posicion, inicio_y)
+        posicion = escribir_arreglo(destino, posicion, tesoros_x)
+        posicion = escribir_arreglo(destino, posicion, tesoros_y)
+    return posicion
+
+def snapshot(estado, con_posiciones=True):
+    """
+    Guarda el estado de la partida en un bloque de bytes
+
+    Args:
+        estado (dict): Estado del juego
+        con_posiciones (bool): Incluir las posiciones de los tesoros y los
+            puntos de partida de los enemigos (hace falta para cargarla en
+            un estado nuevo)
+
+    Returns:
+        bytes: Instantánea
+
+    Raises:
+        ValueError: Si la partida es de mundo infinito (sus tesoros
+            cambian de cantidad al cargar regiones)
+
+    Conceptos enseñados:
+    - Reservar una vez el tamaño exacto y escribir en su lugar
+    """
+    if estado.get('regiones'):
+        raise ValueError("Las instantáneas no admiten partidas de mundo infinito")
+    destino = bytearray(tamano_instantanea(estado, con_posiciones))
+    escribir_instantanea(estado, destino, con_posiciones)
+    return bytes(destino)
+
+# ============================================================================
+# LECTURA
+# ============================================================================
+
+def leer_cabecera(datos):
+    """
+    Lee y valida la cabecera de una instantánea
+
+    Args:
+        datos (bytes-like): Instantánea
+
+    Returns:
+        tuple: (banderas, número de enemigos, número de tesoros)
+
+    Raises:
+        ValueError: Si no es una instantánea válida o está incompleta
+    """
+    if len(datos) < CABECERA.size:
+        raise ValueError("Instantánea incompleta")
+    firma, version, banderas, enemigos, tesoros_totales = CABECERA.unpack_from(datos)
+    if firma != FIRMA_INSTANTANEA:
+        raise ValueError("Los datos no son una instantánea de Cazador de Tesoros")
+    if version != VERSION_INSTANTANEA:
+        raise ValueError(f"Versión de instantánea no soportada: {version}")
+    if len(datos) != calcular_tamano(enemigos, tesoros_totales, banderas & CON_POSICIONES):
+        raise ValueError("Instantánea incompleta")
+    return banderas, enemigos, tesoros_totales
+
+def crear_estado_para(parametros, banderas, enemigos, velocidad, inicio, posiciones_tesoros):
+    """
+    Arma un estado nuevo con los parámetros, enemigos y tesoros de una
+    instantánea (el resto de restore lo completa)
+
+    Returns:
+        dict: Estado del juego
+    """
+    # Importación local: main importa este módulo
+    import main
+
+    estado = main.crear_estado_inicial(cambios=parametros, posiciones_tesoros=posiciones_tesoros,
+                                       mundo_infinito=False)
+    if banderas & CON_ENJAMBRE:
+        estado['enemigo'] = enemigo.EnemySwarm(inicio[0], inicio[1], velocidad)
+    elif enemigos == 1:
+        estado['enemigo'] = enemigo.Enemigo(velocidad=velocidad)
+    else:
+        raise ValueError("Instantánea con varios enemigos que no son un enjambre")
+    return estado
+
+def restore(datos, estado=None):
+    """
+    Carga una instantánea
+
+    Sin estado, crea uno nuevo (la instantánea debe incluir posiciones).
+    Con estado, lo modifica en su lugar reutilizando sus objetos: así se
+    rebobina sin crear nada. 'previas' queda en None, de modo que el
+    siguiente dibujo no interpola desde antes de la carga.
+
+    Args:
+        datos (bytes-like): Instantánea de snapshot o escribir_instantanea
+        estado (dict, optional): Estado de la misma partida donde cargarla
+
+    Returns:
+        dict: Estado restaurado
+
+    Raises:
+        ValueError: Si los datos no son válidos o no corresponden al estado
+
+    Conceptos enseñados:
+    - Validar antes de modificar: un error no deja el estado a medias
+    """
+    banderas, cantidad_enemigos, cantidad_tesoros = leer_cabecera(datos)
+    posicion = CABECERA.size
+    parametros = dict(zip(NOMBRES_PARAMETROS, PARAMETROS.unpack_from(datos, posicion)))
+    posicion += PARAMETROS.size
+    jugador_x, jugador_y, recogidos, velocidad_jugador, vivo = JUGADOR.unpack_from(datos, posicion)
+    posicion += JUGADOR.size
+    terminado, final, pausa, running = PARTIDA.unpack_from(datos, posicion)
+    posicion += PARTIDA.size
+    velocidad_enemigos, = ENEMIGOS.unpack_from(datos, posicion)
+    posicion += ENEMIGOS.size
+
+    enemigos_x, posicion = leer_arreglo(datos, posicion, cantidad_enemigos)
+    enemigos_y, posicion = leer_arreglo(datos, posicion, cantidad_enemigos)
+    activos, posicion = leer_bits(datos, posicion, cantidad_enemigos)
+    visibles, posicion = leer_bits(datos, posicion, cantidad_tesoros)
+    recogidos_bits, posicion = leer_bits(datos, posicion, cantidad_tesoros)
+    estado_tesoros = visibles * tesoros.ESTADO_VISIBLE | recogidos_bits * tesoros.ESTADO_RECOGIDO
+
+    inicio = posiciones_tesoros = None
+    if banderas & CON_POSICIONES:
+        inicio_x, posicion = leer_arreglo(datos, posicion, cantidad_enemigos)
+        inicio_y, posicion = leer_arreglo(datos, posicion, cantidad_enemigos)
+        tesoros_x, posicion = leer_arreglo(datos, posicion, cantidad_tesoros)
+        tesoros_y, posicion = leer_arreglo(datos, posicion, cantidad_tesoros)
+        inicio, posiciones_tesoros = (inicio_x, inicio_y), (tesoros_x, tesoros_y)
+
+    if estado is None:
+        if posiciones_tesoros is None:
+            raise ValueError("La instantánea no incluye posiciones: "
+                             "hace falta el estado de su partida para cargarla")
+        estado = crear_estado_para(parametros, banderas, cantidad_enemigos,
+                                   velocidad_enemigos, inicio, posiciones_tesoros)
+    else:
+        es_enjambre = isinstance(estado['enemigo'], enemigo.EnemySwarm)
+        if (bool(banderas & CON_ENJAMBRE) != es_enjambre or
+                (es_enjambre and len(estado['enemigo']) != cantidad_enemigos) or
+                len(estado['tesoros']) != cantidad_tesoros):
+            raise ValueError("La instantánea es de una partida con otros enemigos o tesoros")
+        estado['parametros'].update(parametros)
+
+    explorador = estado['jugador']
+    explorador.x, explorador.y = jugador_x, jugador_y
+    explorador.tesoros_recogidos = recogidos
+    explorador.velocidad = velocidad_jugador
+    explorador.vivo = vivo
+
+    enemigos = estado['enemigo']
+    enemigos.velocidad = velocidad_enemigos
+    if isinstance(enemigos, enemigo.EnemySwarm):
+        enemigos.x[:] = enemigos_x
+        enemigos.y[:] = enemigos_y
+        enemigos.activo[:] = activos
+        if inicio is not None:
+            enemigos.x_inicial[:], enemigos.y_inicial[:] = inicio
+    else:
+        enemigos.x, enemigos.y = int(enemigos_x[0]), int(enemigos_y[0])
+        enemigos.activo = bool(activos[0])
+
+    coleccion = estado['tesoros']
+    if isinstance(coleccion, tesoros.TreasureField):
+        if posiciones_tesoros is None:
+            coleccion.restaurar(estado_tesoros)
+        else:
+            coleccion.restaurar(estado_tesoros, *posiciones_tesoros)
+    else:
+        if posiciones_tesoros is None:
+            posiciones_tesoros = ([tesoro.x for tesoro in coleccion],
+                                  [tesoro.y for tesoro in coleccion])
+        posiciones_x, posiciones_y = (np.asarray(arreglo).tolist() for arreglo in posiciones_tesoros)
+        for tesoro, x, y, bits in zip(coleccion, posiciones_x, posiciones_y,
+                                      estado_tesoros.tolist()):
+            tesoro.x, tesoro.y = x, y
+            tesoro.visible = bool(bits & tesoros.ESTADO_VISIBLE)
+            tesoro.recogido = bool(bits & tesoros.ESTADO_RECOGIDO)
+
+    estado['juego_terminado'] = terminado
+    estado['tipo_final'] = TIPOS_FINAL[final]
+    estado['pausa'] = pausa
+    estado['running'] = running
+    estado['previas'] = None
+    return estado
+
+# ============================================================================
+# ARCHIVOS
+# ============================================================================
+
+def guardar_instantanea(ruta, estado):
+    """
+    Guarda una instantánea completa en un archivo
+
+    Args:
+        ruta (str): Archivo de destino
+        estado (dict): Estado del juego
+
+    Returns:
+        int: Tamaño del archivo en bytes
+    """
+    datos = snapshot(estado)
+    with open(ruta, 'wb') as archivo:
+        archivo.write(datos)
+    return len(datos)
+
+def cargar_instantanea(ruta, estado=None):
+    """
+    Carga una instantánea desde un archivo (ver restore)
+
+    Args:
+        ruta (str): Archivo guardado con guardar_instantanea
+        estado (dict, optional): Estado donde cargarla
+
+    Returns:
+        dict: Estado restaurado
+    """
+    with open(ruta, 'rb') as archivo:
+        return restore(archivo.read(), estado)
+
+# ============================================================================
+# BÚFER DE REBOBINADO
+# ============================================================================
+
+class BuferRebobinado:
+    """
+    Guarda una instantánea sin posiciones por cada paso de lógica en un
+    búfer circular, para volver atrás paso a paso
+
+    Todas las instantáneas de una partida miden lo mismo, así que se
+    escriben una tras otra en un único bytearray reservado la primera vez:
+    guardar un paso no crea objetos bytes y rebobinar es calcular un
+    índice. Si la partida cambia de tamaño (otro número de tesoros), el
+    búfer empieza de cero.
+
+    Uso en el bucle del juego:
+        rebobinado.guardar(estado)     # antes de cada paso
+        rebobinado.rebobinar(estado)   # en lugar del paso, para volver
+
+    Conceptos enseñados:
+    - Índice que da la vuelta (módulo) en lugar de listas que crecen
+    - Registros de tamaño fijo en un bloque contiguo
+    """
+
+    def __init__(self, capacidad=PASOS_REBOBINADO):
+        """
+        Args:
+            capacidad (int): Pasos que se pueden deshacer
+        """
+        self.capacidad = capacidad
+        self.tamano = 0        # Bytes de cada instantánea
+        self.datos = None
+        self.vista = None
+        self.posicion = 0      # Lugar de la próxima instantánea
+        self.llenos = 0        # Instantáneas guardadas (hasta la capacidad)
+
+    def guardar(self, estado):
+        """
+        Guarda el estado actual como el paso más reciente
+
+        Args:
+            estado (dict): Estado del juego
+        """
+        tamano = tamano_instantanea(estado, con_posiciones=False)
+        if tamano != self.tamano:
+            self.tamano = tamano
+            self.datos = bytearray(tamano * self.capacidad)
+            self.vista = memoryview(self.datos)
+            self.posicion = self.llenos = 0
+        inicio = self.posicion * tamano
+        escribir_instantanea(estado, self.vista[inicio:inicio + tamano], con_posiciones=False)
+        self.posicion = (self.posicion + 1) % self.capacidad
+        self.llenos = min(self.llenos + 1, self.capacidad)
+
+    def rebobinar(self, estado, pasos=1):
+        """
+        Vuelve el estado a como estaba 'pasos' pasos atrás y descarta los
+        pasos más nuevos
+
+        Args:
+            estado (dict): Estado de la partida guardada
+            pasos (int): Pasos a retroceder
+
+        Returns:
+            int: Pasos retrocedidos (0 si no queda historia)
+        """
+        pasos = min(pasos, self.llenos)
+        if pasos <= 0:
+            return 0
+        self.posicion = (self.posicion - pasos) % self.capacidad
+        self.llenos -= pasos
+        inicio = self.posicion * self.tamano
+        restore(self.vista[inicio:inicio + self.tamano], estado)
+        return pasos
+
+    def vaciar(self):
+        """Olvida todos los pasos guardados (por ejemplo, al reiniciar)"""
+        self.posicion = self.llenos = 0
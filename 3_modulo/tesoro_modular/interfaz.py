@@ -9,8 +9,13 @@ Conceptos enseñados:
 - Modularización de elementos visuales
 """
 
+import numpy as np
 import pygame
 from configuracion import *
+from utilidades import convertir_para_pantalla
+from enemigo import EnemySwarm
+from colisiones import distancia_entre_objetos
+import perfilador
 
 # ============================================================================
 # INICIALIZACIÓN DE FUENTES
@@ -34,8 +39,161 @@ def inicializar_fuentes():
         'normal': pygame.font.Font(None, 36),      # Para texto regular
         'pequeña': pygame.font.Font(None, 28)      # Para instrucciones
     }
+    # Textos del HUD dibujados una sola vez (ver AtlasGlifos)
+    fuentes['glifos'] = {
+        (nombre, color): AtlasGlifos(fuentes[nombre], color, textos)
+        for (nombre, color), textos in TEXTOS_HUD.items()
+    }
     return fuentes
 
+# ============================================================================
+# ATLAS DE GLIFOS PARA EL HUD
+# ============================================================================
+
+# Caracteres sueltos con los que se arman los números del HUD
+CARACTERES_GLIFOS = "0123456789/(),.- "
+
+# Instrucciones que se muestran durante el juego
+INSTRUCCIONES_JUEGO = (
+    "Usa las flechas para mover al explorador",
+    "Recoge todos los tesoros",
+    "¡Evita al enemigo!"
+)
+
+# Textos fijos del HUD para cada (fuente, color)
+TEXTOS_HUD = {
+    ('mediana', AMARILLO): ("Tesoros: ",),
+    ('mediana', ROJO): ("¡CAPTURADO!",),
+    ('pequeña', VERDE): ("Enemigo: ", "px"),
+    ('pequeña', AMARILLO): ("Enemigo: ", "px"),
+    ('pequeña', ROJO): ("Enemigo: ", "px"),
+    ('pequeña', BLANCO): INSTRUCCIONES_JUEGO + ("FPS: ", "Jugador: ", "Enemigo: ",
+                                                "Enemigos activos: ", "Estado: ",
+                                                "Vivo", "Muerto", "fase", "prom", "p99")
+                         + perfilador.NOMBRES_FASES,
+}
+
+class AtlasGlifos:
+    """
+    Superficie con los textos fijos y los caracteres de los números del
+    HUD ya dibujados con una fuente y un color
+
+    font.render crea una superficie nueva en cada llamada. Con el atlas,
+    un texto como "Tesoros: 3/5" se arma copiando trozos ya dibujados
+    ("Tesoros: ", "3", "/", "5"), sin crear superficies en cada frame.
+
+    Conceptos enseñados:
+    - Atlas de glifos (como las fuentes de mapa de bits)
+    - Evitar crear objetos dentro del bucle del juego
+    """
+
+    def __init__(self, fuente, color, textos=()):
+        """
+        Args:
+            fuente (pygame.font.Font): Fuente a usar
+            color (tuple): Color RGB del texto
+            textos (tuple): Textos fijos a dibujar completos
+        """
+        # Primera fila: los caracteres sueltos; después, un texto por fila
+        filas = [list(CARACTERES_GLIFOS)] + [[texto] for texto in textos]
+        dibujos = [[(pieza, fuente.render(pieza, True, color)) for pieza in fila]
+                   for fila in filas]
+        ancho = max(sum(dibujo.get_width() for _, dibujo in fila) for fila in dibujos)
+        alto = sum(max(dibujo.get_height() for _, dibujo in fila) for fila in dibujos)
+
+        superficie = pygame.Surface((ancho, alto), pygame.SRCALPHA)
+        superficie.fill((0, 0, 0, 0))
+        self.rects = {}
+        y = 0
+        for fila in dibujos:
+            x = 0
+            for pieza, dibujo in fila:
+                # BLEND_RGBA_MAX sobre transparente copia los píxeles tal cual
+                self.rects[pieza] = superficie.blit(dibujo, (x, y),
+                                                    special_flags=pygame.BLEND_RGBA_MAX)
+                x += dibujo.get_width()
+            y += max(dibujo.get_height() for _, dibujo in fila)
+        self.superficie = convertir_para_pantalla(superficie)
+
+    def medir(self, piezas):
+        """
+        Calcula el tamaño que ocupará un texto armado con dibujar()
+
+        Args:
+            piezas (tuple): Textos fijos o números como texto
+
+        Returns:
+            tuple: (ancho, alto) en píxeles
+        """
+        ancho = alto = 0
+        for pieza in piezas:
+            rect = self.rects.get(pieza)
+            if rect:
+                ancho += rect.width
+                alto = max(alto, rect.height)
+            else:
+                for caracter in pieza:
+                    rect = self.rects[caracter]
+                    ancho += rect.width
+                    alto = max(alto, rect.height)
+        return ancho, alto
+
+    def dibujar(self, pantalla, piezas, posicion):
+        """
+        Dibuja un texto copiando sus trozos desde el atlas
+
+        Cada pieza es un texto fijo del atlas o, si no lo es, se dibuja
+        carácter por carácter (para los números).
+
+        Args:
+            pantalla (pygame.Surface): Superficie donde dibujar
+            piezas (tuple): Por ejemplo ("Tesoros: ", "3", "/", "5")
+            posicion (tuple): Esquina superior izquierda (x, y)
+
+        Returns:
+            pygame.Rect: Área ocupada por el texto
+        """
+        x, y = posicion
+        inicio = x
+        alto = 0
+        superficie = self.superficie
+        for pieza in piezas:
+            rect = self.rects.get(pieza)
+            if rect:
+                pantalla.blit(superficie, (x, y), rect)
+                x += rect.width
+                alto = max(alto, rect.height)
+            else:
+                for caracter in pieza:
+                    rect = self.rects[caracter]
+                    pantalla.blit(superficie, (x, y), rect)
+                    x += rect.width
+                    alto = max(alto, rect.height)
+        return pygame.Rect(inicio, y, x - inicio, alto)
+
+def obtener_glifos(fuentes, nombre_fuente, color):
+    """
+    Devuelve el atlas de glifos de una fuente y un color, creándolo la
+    primera vez que se pide
+
+    Args:
+        fuentes (dict): Diccionario de fuentes (inicializar_fuentes)
+        nombre_fuente (str): 'grande', 'mediana', 'normal' o 'pequeña'
+        color (tuple): Color RGB del texto
+
+    Returns:
+        AtlasGlifos: Atlas listo para dibujar
+    """
+    glifos = fuentes.get('glifos')
+    if glifos is None:
+        glifos = fuentes['glifos'] = {}
+    clave = (nombre_fuente, color)
+    atlas = glifos.get(clave)
+    if atlas is None:
+        atlas = glifos[clave] = AtlasGlifos(fuentes[nombre_fuente], color,
+                                            TEXTOS_HUD.get(clave, ()))
+    return atlas
+
 # ============================================================================
 # FUNCIONES DE HUD (Heads-Up Display)
 # ============================================================================
@@ -47,28 +205,32 @@ def dibujar_contador_tesoros(pantalla, fuentes, jugador, total_tesoros):
     Args:
         pantalla (pygame.Surface): Superficie donde dibujar
         fuentes (dict): Diccionario de fuentes
-        jugador (dict): Estado del jugador
+        jugador (Jugador): Estado del jugador
         total_tesoros (int): Número total de tesoros en el juego
         
+    Returns:
+        pygame.Rect: Área de pantalla dibujada
+        
     Conceptos enseñados:
     - Renderizado de HUD
     - Formateo de strings dinámico
     - Posicionamiento en esquinas
     - Fondos para legibilidad
+    - Texto armado desde un atlas de glifos
     """
-    fuente = fuentes['mediana']
+    glifos = obtener_glifos(fuentes, 'mediana', AMARILLO)
     
-    # Crear el texto del contador
-    texto_contador = f"Tesoros: {jugador['tesoros_recogidos']}/{total_tesoros}"
-    superficie_texto = fuente.render(texto_contador, True, AMARILLO)
+    # Piezas del texto "Tesoros: 3/5"
+    piezas = ("Tesoros: ", str(jugador.tesoros_recogidos), "/", str(total_tesoros))
+    ancho_texto, alto_texto = glifos.medir(piezas)
     
     # Calcular posición (esquina superior derecha)
-    x = ANCHO - superficie_texto.get_width() - 20
+    x = ANCHO - ancho_texto - 20
     y = 20
     
     # Dibujar fondo semi-transparente
-    ancho_fondo = superficie_texto.get_width() + 20
-    alto_fondo = superficie_texto.get_height() + 10
+    ancho_fondo = ancho_texto + 20
+    alto_fondo = alto_texto + 10
     rect_fondo = pygame.Rect(x - 10, y - 5, ancho_fondo, alto_fondo)
     
     # Fondo oscuro
@@ -77,7 +239,8 @@ def dibujar_contador_tesoros(pantalla, fuentes, jugador, total_tesoros):
     pygame.draw.rect(pantalla, AMARILLO, rect_fondo, 2)
     
     # Dibujar el texto
-    pantalla.blit(superficie_texto, (x, y))
+    glifos.dibujar(pantalla, piezas, (x, y))
+    return rect_fondo
 
 def dibujar_estado_jugador(pantalla, fuentes, jugador):
     """
@@ -86,30 +249,35 @@ def dibujar_estado_jugador(pantalla, fuentes, jugador):
     Args:
         pantalla (pygame.Surface): Superficie donde dibujar
         fuentes (dict): Diccionario de fuentes
-        jugador (dict): Estado del jugador
+        jugador (Jugador): Estado del jugador
+        
+    Returns:
+        pygame.Rect: Área dibujada (None si no se dibujó nada)
         
     Conceptos enseñados:
     - Indicadores de estado visual
     - Renderizado condicional por estado
     - Colores para transmitir información
     """
-    if not jugador['vivo']:
-        fuente = fuentes['mediana']
-        texto_estado = "¡CAPTURADO!"
-        superficie_texto = fuente.render(texto_estado, True, ROJO)
+    if not jugador.vivo:
+        glifos = obtener_glifos(fuentes, 'mediana', ROJO)
+        piezas = ("¡CAPTURADO!",)
+        ancho_texto, alto_texto = glifos.medir(piezas)
         
         # Centrar en la parte superior
-        x = (ANCHO - superficie_texto.get_width()) // 2
+        x = (ANCHO - ancho_texto) // 2
         y = 80
         
         # Fondo para destacar
         rect_fondo = pygame.Rect(x - 10, y - 5, 
-                               superficie_texto.get_width() + 20, 
-                               superficie_texto.get_height() + 10)
+                               ancho_texto + 20, 
+                               alto_texto + 10)
         pygame.draw.rect(pantalla, NEGRO, rect_fondo)
         pygame.draw.rect(pantalla, ROJO, rect_fondo, 3)
         
-        pantalla.blit(superficie_texto, (x, y))
+        glifos.dibujar(pantalla, piezas, (x, y))
+        return rect_fondo
+    return None
 
 def dibujar_instrucciones(pantalla, fuentes, jugador):
     """
@@ -118,27 +286,26 @@ def dibujar_instrucciones(pantalla, fuentes, jugador):
     Args:
         pantalla (pygame.Surface): Superficie donde dibujar
         fuentes (dict): Diccionario de fuentes
-        jugador (dict): Estado del jugador
+        jugador (Jugador): Estado del jugador
+        
+    Returns:
+        pygame.Rect: Área dibujada (None si no se dibujó nada)
         
     Conceptos enseñados:
     - Texto de ayuda en pantalla
     - Instrucciones contextuales
     - Renderizado múltiple de líneas
     """
-    if jugador['vivo']:  # Solo mostrar si el jugador está vivo
-        fuente = fuentes['pequeña']
-        
-        # Instrucciones de movimiento
-        instrucciones = [
-            "Usa las flechas para mover al explorador",
-            "Recoge todos los tesoros",
-            "¡Evita al enemigo!"
-        ]
+    if jugador.vivo:  # Solo mostrar si el jugador está vivo
+        glifos = obtener_glifos(fuentes, 'pequeña', BLANCO)
         
+        # Instrucciones de movimiento (ya dibujadas en el atlas)
         y_inicial = 10
-        for i, instruccion in enumerate(instrucciones):
-            superficie_texto = fuente.render(instruccion, True, BLANCO)
-            pantalla.blit(superficie_texto, (10, y_inicial + i * 25))
+        areas = []
+        for i, instruccion in enumerate(INSTRUCCIONES_JUEGO):
+            areas.append(glifos.dibujar(pantalla, (instruccion,), (10, y_inicial + i * 25)))
+        return areas[0].unionall(areas[1:])
+    return None
 
 # ============================================================================
 # FUNCIONES DE MENSAJES DE ESTADO
@@ -151,7 +318,7 @@ def mostrar_mensaje_victoria(pantalla, fuentes, jugador):
     Args:
         pantalla (pygame.Surface): Superficie donde dibujar
         fuentes (dict): Diccionario de fuentes
-        jugador (dict): Estado del jugador
+        jugador (Jugador): Estado del jugador
         
     Conceptos enseñados:
     - Pantallas de estado completas
@@ -174,7 +341,7 @@ def mostrar_mensaje_victoria(pantalla, fuentes, jugador):
     
     # Mensaje de puntuación
     fuente_puntos = fuentes['mediana']
-    mensaje_puntos = f"Recogiste {jugador['tesoros_recogidos']} tesoros"
+    mensaje_puntos = f"Recogiste {jugador.tesoros_recogidos} tesoros"
     superficie_puntos = fuente_puntos.render(mensaje_puntos, True, AMARILLO)
     rect_puntos = superficie_puntos.get_rect(center=(ANCHO//2, ALTO//2 - 20))
     pantalla.blit(superficie_puntos, rect_puntos)
@@ -198,7 +365,7 @@ def mostrar_mensaje_derrota(pantalla, fuentes, jugador):
     Args:
         pantalla (pygame.Surface): Superficie donde dibujar
         fuentes (dict): Diccionario de fuentes
-        jugador (dict): Estado del jugador
+        jugador (Jugador): Estado del jugador
         
     Conceptos enseñados:
     - Pantallas de derrota
@@ -220,7 +387,7 @@ def mostrar_mensaje_derrota(pantalla, fuentes, jugador):
     
     # Mensaje con progreso
     fuente_progreso = fuentes['mediana']
-    mensaje_progreso = f"Recogiste {jugador['tesoros_recogidos']} de {TESOROS_PARA_GANAR} tesoros"
+    mensaje_progreso = f"Recogiste {jugador.tesoros_recogidos} de {TESOROS_PARA_GANAR} tesoros"
     superficie_progreso = fuente_progreso.render(mensaje_progreso, True, AMARILLO)
     rect_progreso = superficie_progreso.get_rect(center=(ANCHO//2, ALTO//2 - 20))
     pantalla.blit(superficie_progreso, rect_progreso)
@@ -282,19 +449,27 @@ def mostrar_distancia_enemigo(pantalla, fuentes, jugador, enemigo):
     Args:
         pantalla (pygame.Surface): Superficie donde dibujar
         fuentes (dict): Diccionario de fuentes
-        jugador (dict): Estado del jugador
-        enemigo (dict): Estado del enemigo
+        jugador (Jugador): Estado del jugador
+        enemigo (Enemigo | EnemySwarm): Estado del enemigo
+        
+    Returns:
+        pygame.Rect: Área dibujada (None si no se dibujó nada)
         
     Conceptos enseñados:
     - Indicadores de peligro
     - Cálculo de distancias para UI
     - Colores dinámicos basados en valores
     """
-    if not jugador['vivo'] or not enemigo['activo']:
-        return
-    
-    from colisiones import distancia_entre_objetos
-    distancia = int(distancia_entre_objetos(jugador, enemigo))
+    if isinstance(enemigo, EnemySwarm):
+        # Con un enjambre se muestra el enemigo más cercano
+        if not jugador.vivo or not enemigo.contar_activos():
+            return None
+        distancia = int(enemigo.distancia_minima(jugador.x, jugador.y))
+    else:
+        if not jugador.vivo or not enemigo.activo:
+            return None
+        
+        distancia = int(distancia_entre_objetos(jugador, enemigo))
     
     # Determinar color basado en distancia (rojo = cerca, amarillo = lejos)
     if distancia < 100:
@@ -304,25 +479,25 @@ def mostrar_distancia_enemigo(pantalla, fuentes, jugador, enemigo):
     else:
         color = VERDE
     
-    # Mostrar distancia
-    fuente = fuentes['pequeña']
-    texto_distancia = f"Enemigo: {distancia}px"
-    superficie_texto = fuente.render(texto_distancia, True, color)
-    
-    # Posición en esquina inferior izquierda
-    pantalla.blit(superficie_texto, (10, ALTO - 30))
+    # Mostrar distancia ("Enemigo: 123px") en la esquina inferior izquierda
+    glifos = obtener_glifos(fuentes, 'pequeña', color)
+    return glifos.dibujar(pantalla, ("Enemigo: ", str(distancia), "px"), (10, ALTO - 30))
 
 # ============================================================================
 # FUNCIONES DE MENÚ Y PANTALLA DE INICIO
 # ============================================================================
 
-def mostrar_pantalla_inicio(pantalla, fuentes):
+def mostrar_pantalla_inicio(pantalla, fuentes, progreso=None):
     """
     Muestra una pantalla de inicio antes de comenzar el juego
     
+    Mientras se cargan los recursos (cargador.py), en lugar de la línea
+    "Presiona ESPACIO" se dibuja una barra con el progreso de la carga.
+    
     Args:
         pantalla (pygame.Surface): Superficie donde dibujar
         fuentes (dict): Diccionario de fuentes
+        progreso (float, optional): Fracción ya cargada (0 a 1)
         
     Returns:
         bool: True si se debe iniciar el juego
@@ -355,12 +530,24 @@ def mostrar_pantalla_inicio(pantalla, fuentes):
         "Presiona ESPACIO para empezar"
     ]
     
+    if progreso is not None:
+        instrucciones_juego[-1] = f"Cargando... {progreso:.0%}"
+    
     y_inicial = 280
     for i, instruccion in enumerate(instrucciones_juego):
-        color = VERDE if instruccion.startswith("Presiona") else BLANCO
+        color = VERDE if instruccion.startswith(("Presiona", "Cargando")) else BLANCO
         superficie_instruccion = fuentes['normal'].render(instruccion, True, color)
         rect_instruccion = superficie_instruccion.get_rect(center=(ANCHO//2, y_inicial + i * 35))
         pantalla.blit(superficie_instruccion, rect_instruccion)
+    
+    # Barra de progreso debajo del texto de carga
+    if progreso is not None:
+        barra = pygame.Rect(0, 0, 400, 20)
+        barra.midtop = (ANCHO//2, y_inicial + len(instrucciones_juego) * 35)
+        relleno = barra.inflate(-4, -4)
+        relleno.width = round(relleno.width * min(max(progreso, 0.0), 1.0))
+        pygame.draw.rect(pantalla, VERDE, relleno)
+        pygame.draw.rect(pantalla, BLANCO, barra, 2)
 
 def mostrar_pausa(pantalla, fuentes):
     """
@@ -484,29 +671,46 @@ def dibujar_boton(pantalla, boton):
 # FUNCIONES DE DEBUG (OPCIONAL PARA DESARROLLO)
 # ============================================================================
 
-def mostrar_info_debug(pantalla, fuentes, jugador, enemigo, fps_actual):
+def mostrar_info_debug(pantalla, fuentes, jugador, enemigo, fps_actual=None, perfil=None):
     """
     Muestra información de debug en la esquina (opcional para desarrollo)
     
     Args:
         pantalla (pygame.Surface): Superficie donde dibujar
         fuentes (dict): Diccionario de fuentes
-        jugador (dict): Estado del jugador
-        enemigo (dict): Estado del enemigo
-        fps_actual (int): FPS actuales del juego
+        jugador (Jugador): Estado del jugador
+        enemigo (Enemigo | EnemySwarm): Estado del enemigo
+        fps_actual (int, optional): FPS actuales del juego; si no se da,
+            se calculan con los tiempos de frame del perfilador
+        perfil (perfilador.Perfilador, optional): Agrega el panel con el
+            tiempo de cada fase del frame
+        
+    Returns:
+        pygame.Rect: Área dibujada
         
     Conceptos enseñados:
     - Información de debug para desarrolladores
     - Monitoreo de rendimiento
     - Herramientas de desarrollo
     """
-    fuente = fuentes['pequeña']
+    glifos = obtener_glifos(fuentes, 'pequeña', BLANCO)
+    
+    estadisticas = perfil.estadisticas() if perfil else None
+    if fps_actual is None:
+        fps_actual = 0
+        if estadisticas:
+            fps_actual = round(1000 / max(estadisticas[0][perfilador.FASE_FRAME], 1e-6))
+    
+    if isinstance(enemigo, EnemySwarm):
+        info_enemigo = ("Enemigos activos: ", str(enemigo.contar_activos()))
+    else:
+        info_enemigo = ("Enemigo: ", "(", str(enemigo.x), ", ", str(enemigo.y), ")")
     
     info_debug = [
-        f"FPS: {fps_actual}",
-        f"Jugador: ({jugador['x']}, {jugador['y']})",
-        f"Enemigo: ({enemigo['x']}, {enemigo['y']})",
-        f"Estado: {'Vivo' if jugador['vivo'] else 'Muerto'}"
+        ("FPS: ", str(fps_actual)),
+        ("Jugador: ", "(", str(jugador.x), ", ", str(jugador.y), ")"),
+        info_enemigo,
+        ("Estado: ", "Vivo" if jugador.vivo else "Muerto")
     ]
     
     # Fondo para legibilidad
@@ -515,6 +719,61 @@ def mostrar_info_debug(pantalla, fuentes, jugador, enemigo, fps_actual):
     pygame.draw.rect(pantalla, BLANCO, rect_debug, 1)
     
     # Mostrar cada línea
-    for i, info in enumerate(info_debug):
-        superficie_info = fuente.render(info, True, BLANCO)
-        pantalla.blit(superficie_info, (ANCHO - 190, ALTO - 110 + i * 20))
\ No newline at end of file
+    for i, piezas in enumerate(info_debug):
+        glifos.dibujar(pantalla, piezas, (ANCHO - 190, ALTO - 110 + i * 20))
+    
+    if perfil:
+        return rect_debug.union(dibujar_panel_perfilador(pantalla, glifos, perfil,
+                                                         estadisticas, rect_debug.top - 10))
+    return rect_debug
+
+def dibujar_panel_perfilador(pantalla, glifos, perfil, estadisticas, y_inferior):
+    """
+    Dibuja una tabla con el promedio y el percentil 99 (en ms) de cada
+    fase del frame y un gráfico con el tiempo de los últimos frames
+    
+    Args:
+        pantalla (pygame.Surface): Superficie donde dibujar
+        glifos (AtlasGlifos): Atlas de la fuente pequeña en blanco
+        perfil (perfilador.Perfilador): Perfilador con los tiempos
+        estadisticas (tuple): Resultado de perfil.estadisticas()
+        y_inferior (int): Borde inferior del panel
+        
+    Returns:
+        pygame.Rect: Área dibujada
+        
+    Conceptos enseñados:
+    - Tablas de texto alineadas en columnas
+    - Gráficos de línea (sparklines) con pygame.draw.lines
+    """
+    alto_grafico = 50
+    columnas = (10, 120, 185)     # fase, promedio, p99
+    alto_tabla = (len(perfilador.NOMBRES_FASES) + 1) * 20
+    rect_panel = pygame.Rect(ANCHO - 260, y_inferior - alto_tabla - alto_grafico - 25,
+                             250, alto_tabla + alto_grafico + 25)
+    pygame.draw.rect(pantalla, NEGRO, rect_panel)
+    pygame.draw.rect(pantalla, BLANCO, rect_panel, 1)
+    
+    # Tabla por fase
+    y = rect_panel.top + 5
+    for x, titulo in zip(columnas, ("fase", "prom", "p99")):
+        glifos.dibujar(pantalla, (titulo,), (rect_panel.left + x, y))
+    for fase, nombre in enumerate(perfilador.NOMBRES_FASES):
+        y += 20
+        glifos.dibujar(pantalla, (nombre,), (rect_panel.left + columnas[0], y))
+        if estadisticas:
+            for x, valores in zip(columnas[1:], estadisticas):
+                glifos.dibujar(pantalla, (f"{valores[fase]:.2f}",), (rect_panel.left + x, y))
+    
+    # Gráfico del tiempo de frame: la línea gris es el objetivo (1000 / FPS ms)
+    grafico = pygame.Rect(rect_panel.left + 10, rect_panel.bottom - alto_grafico - 10,
+                          rect_panel.width - 20, alto_grafico)
+    escala = 2000 / FPS
+    y_objetivo = grafico.bottom - grafico.height // 2
+    pygame.draw.line(pantalla, GRIS, (grafico.left, y_objetivo), (grafico.right, y_objetivo))
+    frames = perfil.historial()[perfilador.FASE_FRAME, -grafico.width:]
+    if len(frames) >= 2:
+        xs = grafico.right - len(frames) + np.arange(len(frames))
+        ys = grafico.bottom - np.minimum(frames / escala, 1.0) * grafico.height
+        pygame.draw.lines(pantalla, VERDE, False, np.column_stack((xs, ys)).tolist())
+    return rect_panel
@@ -9,8 +9,10 @@ Conceptos enseñados:
 - Separación de lógica del jugador
 """
 
+import math
 import pygame
 from configuracion import *
+from utilidades import EntidadConRect
 
 # ============================================================================
 # FUNCIONES DE INICIALIZACIÓN DEL JUGADOR
@@ -36,99 +38,157 @@ def cargar_sprite_jugador():
         print(f"Error: No se pudo cargar {ARCHIVO_JUGADOR}")
         return None
 
-def crear_jugador():
+class Jugador(EntidadConRect):
+    """
+    Estado del explorador: posición (en su rect), si sigue vivo, tesoros
+    recogidos y velocidad
+
+    Se usa con atributos (jugador.x) en el código del juego; jugador['x']
+    también funciona (ver EntidadConSlots).
+    """
+
+    __slots__ = ('vivo', 'tesoros_recogidos', 'velocidad')
+    campos = ('x', 'y', 'vivo', 'tesoros_recogidos', 'velocidad')
+
+    def __init__(self, x=JUGADOR_X_INICIAL, y=JUGADOR_Y_INICIAL, vivo=True,
+                 tesoros_recogidos=0, velocidad=VELOCIDAD_JUGADOR):
+        super().__init__(x, y, TAMANO_JUGADOR, TAMANO_JUGADOR)
+        self.vivo = vivo
+        self.tesoros_recogidos = tesoros_recogidos
+        self.velocidad = velocidad
+
+def crear_jugador(velocidad=VELOCIDAD_JUGADOR):
     """
     Crea el estado inicial del jugador
     
+    Args:
+        velocidad (int): Píxeles que avanza por frame
+        
     Returns:
-        dict: Diccionario con la información del jugador
+        Jugador: Objeto con la información del jugador
         
     Conceptos enseñados:
     - Inicialización de estado
-    - Uso de diccionarios para datos estructurados
+    - Objetos con __slots__ para datos estructurados
     - Valores por defecto
     """
-    jugador = {
-        'x': JUGADOR_X_INICIAL,
-        'y': JUGADOR_Y_INICIAL,
-        'vivo': True,
-        'tesoros_recogidos': 0
-    }
-    return jugador
+    return Jugador(velocidad=velocidad)
 
 # ============================================================================
 # FUNCIONES DE MOVIMIENTO DEL JUGADOR
 # ============================================================================
 
-def mover_jugador(jugador, teclas_presionadas):
+class TeclasSimuladas:
+    """
+    Reemplazo de pygame.key.get_pressed(): se consulta igual,
+    teclas[pygame.K_LEFT], pero las teclas presionadas las decide el
+    programa.
+
+    Conceptos enseñados:
+    - Interfaces compatibles (duck typing)
+    - Método especial __getitem__
+    """
+
+    __slots__ = ('presionadas',)
+
+    def __init__(self, presionadas=()):
+        self.presionadas = frozenset(presionadas)
+
+    def __getitem__(self, tecla):
+        return tecla in self.presionadas
+
+    def __repr__(self):
+        return f"TeclasSimuladas({sorted(self.presionadas)})"
+
+def mover_jugador(jugador, teclas_presionadas, con_bordes=True):
     """
     Actualiza la posición del jugador según las teclas presionadas
     
     Args:
-        jugador (dict): Estado actual del jugador
-        teclas_presionadas (pygame.key): Estado de las teclas
+        jugador (Jugador): Estado actual del jugador
+        teclas_presionadas (pygame.key): Estado de las teclas (el del
+            teclado o un TeclasSimuladas)
+        con_bordes (bool): Detenerse en los bordes de la pantalla (False
+            en el mundo infinito)
         
     Conceptos enseñados:
-    - Modificación de diccionarios
+    - Modificación de atributos
     - Condicionales múltiples
     - Límites de pantalla
     - Validación de movimiento
     """
     # Solo mover si el jugador está vivo
-    if not jugador['vivo']:
+    if not jugador.vivo:
         return
     
+    # La posición vive en el rect del jugador (ver EntidadConRect)
+    rect = jugador.rect
+    velocidad = jugador.velocidad
+    
+    # Sin bordes cada dirección avanza siempre (comparar con un límite
+    # infinito es lo mismo que no comparar)
+    izquierda, arriba = (0, 0) if con_bordes else (-math.inf, -math.inf)
+    derecha, abajo = ((ANCHO - TAMANO_JUGADOR, ALTO - TAMANO_JUGADOR) if con_bordes
+                      else (math.inf, math.inf))
+    
     # Mover hacia la izquierda
-    if teclas_presionadas[pygame.K_LEFT] and jugador['x'] > 0:
-        jugador['x'] -= VELOCIDAD_JUGADOR
+    if teclas_presionadas[pygame.K_LEFT] and rect.x > izquierda:
+        rect.x -= velocidad
     
     # Mover hacia la derecha
-    if teclas_presionadas[pygame.K_RIGHT] and jugador['x'] < ANCHO - TAMANO_JUGADOR:
-        jugador['x'] += VELOCIDAD_JUGADOR
+    if teclas_presionadas[pygame.K_RIGHT] and rect.x < derecha:
+        rect.x += velocidad
     
     # Mover hacia arriba
-    if teclas_presionadas[pygame.K_UP] and jugador['y'] > 0:
-        jugador['y'] -= VELOCIDAD_JUGADOR
+    if teclas_presionadas[pygame.K_UP] and rect.y > arriba:
+        rect.y -= velocidad
     
     # Mover hacia abajo
-    if teclas_presionadas[pygame.K_DOWN] and jugador['y'] < ALTO - TAMANO_JUGADOR:
-        jugador['y'] += VELOCIDAD_JUGADOR
+    if teclas_presionadas[pygame.K_DOWN] and rect.y < abajo:
+        rect.y += velocidad
 
 def obtener_rect_jugador(jugador):
     """
-    Crea un rectángulo para el jugador (usado para colisiones)
+    Devuelve el rectángulo del jugador (usado para colisiones)
     
     Args:
-        jugador (dict): Estado del jugador
+        jugador (Jugador): Estado del jugador
         
     Returns:
-        pygame.Rect: Rectángulo del jugador
+        pygame.Rect: Rectángulo propio del jugador (el mismo objeto en
+            cada llamada; copiarlo si se quiere guardar la posición)
         
     Conceptos enseñados:
-    - Creación de rectángulos para colisiones
-    - Acceso a datos del diccionario
+    - Rectángulos para colisiones
+    - Reutilizar el rectángulo en lugar de crear uno por frame
     """
-    return pygame.Rect(jugador['x'], jugador['y'], TAMANO_JUGADOR, TAMANO_JUGADOR)
+    return jugador.rect
 
 # ============================================================================
 # FUNCIONES DE RENDERIZADO DEL JUGADOR
 # ============================================================================
 
-def dibujar_jugador(pantalla, sprite_jugador, jugador):
+def dibujar_jugador(pantalla, sprite_jugador, jugador, camara=None):
     """
     Dibuja el jugador en la pantalla
     
     Args:
         pantalla (pygame.Surface): Superficie donde dibujar
         sprite_jugador (pygame.Surface): Imagen del jugador
-        jugador (dict): Estado del jugador
+        jugador (Jugador): Estado del jugador
+        camara (Camara, optional): Cámara para pasar del mundo a la
+            pantalla (no se dibuja si queda fuera de su vista)
         
     Conceptos enseñados:
     - Renderizado condicional
-    - Uso de coordenadas del diccionario
-    """
-    if jugador['vivo'] and sprite_jugador:
-        pantalla.blit(sprite_jugador, (jugador['x'], jugador['y']))
+    - Uso de coordenadas del objeto
+    """
+    if jugador.vivo and sprite_jugador:
+        if camara:
+            if jugador.rect.colliderect(camara.rect):
+                pantalla.blit(sprite_jugador, camara.a_pantalla(jugador.x, jugador.y))
+        else:
+            pantalla.blit(sprite_jugador, jugador.rect)
 
 # ============================================================================
 # FUNCIONES DE ESTADO DEL JUGADOR
@@ -139,49 +199,50 @@ def jugador_capturado(jugador):
     Marca al jugador como capturado (pierde el juego)
     
     Args:
-        jugador (dict): Estado del jugador
+        jugador (Jugador): Estado del jugador
         
     Conceptos enseñados:
     - Modificación de estado
     - Lógica de derrota
     """
-    jugador['vivo'] = False
+    jugador.vivo = False
 
 def reiniciar_jugador(jugador):
     """
     Reinicia el estado del jugador a los valores iniciales
     
     Args:
-        jugador (dict): Estado del jugador a reiniciar
+        jugador (Jugador): Estado del jugador a reiniciar
         
     Conceptos enseñados:
     - Restablecimiento de estado
     - Reutilización de valores de configuración
     """
-    jugador['x'] = JUGADOR_X_INICIAL
-    jugador['y'] = JUGADOR_Y_INICIAL
-    jugador['vivo'] = True
-    jugador['tesoros_recogidos'] = 0
+    jugador.x = JUGADOR_X_INICIAL
+    jugador.y = JUGADOR_Y_INICIAL
+    jugador.vivo = True
+    jugador.tesoros_recogidos = 0
 
 def agregar_tesoro_jugador(jugador):
     """
     Incrementa el contador de tesoros del jugador
     
     Args:
-        jugador (dict): Estado del jugador
+        jugador (Jugador): Estado del jugador
         
     Conceptos enseñados:
     - Incremento de contadores
     - Modificación de estado del jugador
     """
-    jugador['tesoros_recogidos'] += 1
+    jugador.tesoros_recogidos += 1
 
-def jugador_ha_ganado(jugador):
+def jugador_ha_ganado(jugador, tesoros_para_ganar=TESOROS_PARA_GANAR):
     """
     Verifica si el jugador ha recogido suficientes tesoros para ganar
     
     Args:
-        jugador (dict): Estado del jugador
+        jugador (Jugador): Estado del jugador
+        tesoros_para_ganar (int): Tesoros necesarios para la victoria
         
     Returns:
         bool: True si ha ganado, False si no
@@ -190,4 +251,4 @@ def jugador_ha_ganado(jugador):
     - Funciones que retornan booleanos
     - Condiciones de victoria
     """
-    return jugador['tesoros_recogidos'] >= TESOROS_PARA_GANAR
\ No newline at end of file
+    return jugador.tesoros_recogidos >= tesoros_para_ganar
\ No newline at end of file
@@ -12,15 +12,27 @@ Conceptos enseñados:
 
 import pygame
 import sys
+import time
+import random
 
 # Importar todos los módulos del juego
 from configuracion import *
 import jugador
 import enemigo  
+import campo_flujo
 import tesoros
 import colisiones
 import interfaz
 import utilidades
+import grabacion
+import renderizado
+import atlas
+import perfilador
+import paso_fijo
+import instantaneas
+import cargador
+import camara
+import regiones
 
 # ============================================================================
 # INICIALIZACIÓN DEL JUEGO
@@ -45,10 +57,18 @@ def inicializar_pygame():
     
     return pantalla, reloj
 
-def cargar_recursos():
+def cargar_recursos(pantalla=None):
     """
     Carga todos los recursos del juego usando el módulo de utilidades
     
+    Con la ventana, las imágenes se preparan en varios hilos mientras se
+    dibuja la pantalla de inicio con el progreso (cargador.py); sin ella
+    (pruebas y mediciones), se cargan una detrás de otra.
+    
+    Args:
+        pantalla (pygame.Surface, optional): Ventana donde mostrar la
+            pantalla de carga
+    
     Returns:
         tuple: (imagenes, fuentes) cargadas
         
@@ -62,18 +82,77 @@ def cargar_recursos():
         print("Advertencia: Algunos recursos no están disponibles")
         print("El juego usará placeholders para imágenes faltantes")
     
-    # Cargar imágenes
-    imagenes = utilidades.cargar_todas_las_imagenes()
-    
-    # Cargar fuentes
+    # Cargar fuentes (primero: la pantalla de carga las usa)
     fuentes = interfaz.inicializar_fuentes()
     
+    # Cargar imágenes y juntar los sprites en un atlas
+    if pantalla is None:
+        imagenes = utilidades.cargar_todas_las_imagenes()
+    else:
+        imagenes = cargador.cargar_con_pantalla(pantalla, fuentes)
+    imagenes['atlas'] = atlas.crear_atlas(imagenes)
+    
     return imagenes, fuentes
 
-def crear_estado_inicial():
+def crear_parametros(cambios=None):
+    """
+    Reúne los parámetros de balance de una partida: los valores de
+    configuracion.py con los cambios indicados
+    
+    Los cambios viajan dentro del estado de cada partida en lugar de
+    modificar las constantes globales, así que varias partidas con
+    parámetros distintos pueden correr en el mismo proceso (o en procesos
+    creados con fork) sin pisarse.
+    
+    Args:
+        cambios (dict, optional): Nombre del parámetro -> valor. Si se
+            cambia NUMERO_TESOROS sin TESOROS_PARA_GANAR, hay que recoger
+            todos los tesoros para ganar.
+        
+    Returns:
+        dict: Parámetros de la partida
+        
+    Raises:
+        ValueError: Si se pide un parámetro que no existe
+        
+    Conceptos enseñados:
+    - Configuración explícita en lugar de estado global
+    """
+    parametros = {
+        'VELOCIDAD_JUGADOR': VELOCIDAD_JUGADOR,
+        'VELOCIDAD_ENEMIGO': VELOCIDAD_ENEMIGO,
+        'NUMERO_TESOROS': NUMERO_TESOROS,
+        'TESOROS_PARA_GANAR': TESOROS_PARA_GANAR,
+    }
+    cambios = cambios or {}
+    for nombre in cambios:
+        if nombre not in parametros:
+            raise ValueError(f"Parámetro desconocido: {nombre}")
+    parametros.update(cambios)
+    if 'NUMERO_TESOROS' in cambios and 'TESOROS_PARA_GANAR' not in cambios:
+        parametros['TESOROS_PARA_GANAR'] = parametros['NUMERO_TESOROS']
+    return parametros
+
+def crear_estado_inicial(semilla=None, cambios=None, posiciones_tesoros=None,
+                         mundo_infinito=MUNDO_INFINITO):
     """
     Crea el estado inicial de todos los elementos del juego
     
+    Las velocidades de los parámetros están pensadas para 60 pasos por
+    segundo; se ajustan a HZ_SIMULACION para que el juego vaya igual de
+    rápido con cualquier frecuencia de lógica.
+    
+    Args:
+        semilla (int, optional): Semilla para repetir la misma partida
+        cambios (dict, optional): Parámetros de balance a modificar
+            (ver crear_parametros)
+        posiciones_tesoros (tuple, optional): Arreglos (x, y) de tesoros
+            ya conocidos (por ejemplo, de una instantánea); si no se dan,
+            se generan NUMERO_TESOROS posiciones nuevas
+        mundo_infinito (bool): Generar los tesoros por regiones alrededor
+            del jugador (regiones.GestorRegiones) en lugar de en la
+            pantalla
+    
     Returns:
         dict: Diccionario con todo el estado del juego
         
@@ -82,35 +161,62 @@ def crear_estado_inicial():
     - Organización de datos del juego
     - Uso coordinado de módulos
     """
+    parametros = crear_parametros(cambios)
+    gestor_regiones = regiones.GestorRegiones(semilla) if mundo_infinito else None
+    if gestor_regiones:
+        # Vacío hasta la primera carga de regiones (abajo)
+        coleccion = tesoros.TreasureField([], [])
+    elif posiciones_tesoros is None:
+        coleccion = tesoros.crear_lista_tesoros(parametros['NUMERO_TESOROS'], semilla=semilla)
+    else:
+        coleccion = tesoros.TreasureField(*posiciones_tesoros)
     estado = {
-        'jugador': jugador.crear_jugador(),
-        'enemigo': enemigo.crear_enemigo(),
-        'tesoros': tesoros.crear_lista_tesoros(NUMERO_TESOROS),
+        'jugador': jugador.crear_jugador(
+            paso_fijo.velocidad_por_paso(parametros['VELOCIDAD_JUGADOR'])),
+        'enemigo': enemigo.crear_enemigos(
+            NUMERO_ENEMIGOS, semilla, paso_fijo.velocidad_por_paso(parametros['VELOCIDAD_ENEMIGO'])),
+        'tesoros': coleccion,
+        'parametros': parametros,
+        'campo_flujo': campo_flujo.crear_campo_pantalla() if USAR_CAMPO_FLUJO else None,
+        'mundo_colisiones': crear_mundo_colisiones(),
+        'regiones': gestor_regiones,  # None con el mundo fijo a la pantalla
+        'camara': camara.Camara(),  # Se queda en (0, 0) con el mundo fijo
+        'previas': None,  # Posiciones antes del último paso (paso_fijo.copiar_posiciones)
+        'rebobinado': None,  # BuferRebobinado (lo crea main si USAR_REBOBINADO)
         'juego_terminado': False,
         'tipo_final': None,  # 'victoria' o 'derrota'
         'running': True,
         'pausa': False
     }
     
+    if gestor_regiones:
+        gestor_regiones.actualizar(estado)
+        estado['camara'].seguir(estado['jugador'])
+    
     return estado
 
 # ============================================================================
 # FUNCIONES DE MANEJO DE EVENTOS
 # ============================================================================
 
-def manejar_eventos(estado):
+def manejar_eventos(estado, eventos=None):
     """
     Procesa todos los eventos de entrada del usuario
     
     Args:
         estado (dict): Estado actual del juego
+        eventos (list, optional): Eventos a procesar; por defecto se leen
+            de la cola de pygame (una repetición pasa los grabados)
         
     Conceptos enseñados:
     - Manejo centralizado de eventos
     - Estados diferentes de la aplicación
     - Control de flujo por eventos
     """
-    for evento in pygame.event.get():
+    if eventos is None:
+        eventos = pygame.event.get()
+    
+    for evento in eventos:
         if evento.type == pygame.QUIT:
             estado['running'] = False
             
@@ -172,48 +278,72 @@ def manejar_eventos_juego_activo(evento, estado):
 # FUNCIONES DE ACTUALIZACIÓN DE LÓGICA
 # ============================================================================
 
-def actualizar_juego(estado):
+def actualizar_juego(estado, teclas=None, perfil=None):
     """
     Actualiza toda la lógica del juego
     
     Args:
         estado (dict): Estado actual del juego
+        teclas (sequence, optional): Estado de las teclas; por defecto se
+            lee el teclado con pygame.key.get_pressed()
+        perfil (perfilador.Perfilador, optional): Mide el tiempo de cada
+            fase
         
     Conceptos enseñados:
     - Actualización coordinada de sistemas
     - Lógica de juego modular
     - Orden de actualización importante
     """
+    # Posiciones antes de moverse: para dibujar interpolado y para las
+    # colisiones por barrido (también en pausa, para que nada se mueva)
+    estado['previas'] = paso_fijo.copiar_posiciones(estado)
+    
     # No actualizar si está en pausa o terminado
     if estado['pausa'] or estado['juego_terminado']:
         return
     
-    # 1. Actualizar movimiento del jugador
-    actualizar_movimiento_jugador(estado)
+    # 1. Actualizar movimiento del jugador (y, en el mundo infinito,
+    # cargar las regiones a las que se acerca)
+    actualizar_movimiento_jugador(estado, teclas)
+    if estado['regiones']:
+        estado['regiones'].actualizar(estado)
+    if perfil:
+        perfil.marcar(perfilador.FASE_JUGADOR)
     
     # 2. Actualizar enemigo (IA)
     actualizar_enemigo_completo(estado)
+    if perfil:
+        perfil.marcar(perfilador.FASE_ENEMIGO)
     
     # 3. Procesar colisiones
     procesar_todas_las_colisiones(estado)
     
     # 4. Verificar condiciones de final de juego
     verificar_final_juego(estado)
+    if perfil:
+        perfil.marcar(perfilador.FASE_COLISIONES)
+    
+    # 5. En modo debug, comprobar la coherencia del estado cada frame
+    if MODO_DEBUG:
+        validar_estado_juego(estado)
 
-def actualizar_movimiento_jugador(estado):
+def actualizar_movimiento_jugador(estado, teclas=None):
     """
     Actualiza el movimiento del jugador basado en input
     
     Args:
         estado (dict): Estado del juego
+        teclas (sequence, optional): Estado de las teclas (teclado real,
+            guion o bot); si falta se lee el teclado
         
     Conceptos enseñados:
     - Separación de input y lógica
     - Movimiento basado en estado continuo de teclas
     """
-    if estado['jugador']['vivo']:
-        teclas = pygame.key.get_pressed()
-        jugador.mover_jugador(estado['jugador'], teclas)
+    if estado['jugador'].vivo:
+        if teclas is None:
+            teclas = pygame.key.get_pressed()
+        jugador.mover_jugador(estado['jugador'], teclas, estado['regiones'] is None)
 
 def actualizar_enemigo_completo(estado):
     """
@@ -226,12 +356,88 @@ def actualizar_enemigo_completo(estado):
     - Actualización de IA
     - Integración de sistemas de enemigos
     """
-    enemigo.actualizar_enemigo(estado['enemigo'], estado['jugador'])
+    enemigo.actualizar_enemigo(estado['enemigo'], estado['jugador'], estado['campo_flujo'],
+                               estado['regiones'] is None)
+
+def crear_mundo_colisiones(separar_enemigos=SEPARAR_ENEMIGOS, modo=MODO_COLISION):
+    """
+    Registra los tipos de entidad del juego y qué pasa con cada par que
+    choca
+    
+    Args:
+        separar_enemigos (bool): Registrar también el par enemigo-enemigo
+            (solo tiene efecto con un enjambre)
+        modo (str): 'discreto' (posiciones finales) o un modo de barrido
+            (todo el recorrido del paso; ver colisiones.MODOS_COLISION)
+        
+    Returns:
+        colisiones.MundoColisiones: Mundo listo para procesar cada frame
+        
+    Conceptos enseñados:
+    - Registro único de tipos y manejadores
+    - Agregar interacciones sin tocar el bucle de colisiones
+    """
+    mundo = colisiones.MundoColisiones(modo)
+    mundo.registrar_tipo('jugador', 'jugador', TAMANO_JUGADOR, TAMANO_JUGADOR, 'vivo')
+    mundo.registrar_tipo('tesoro', 'tesoros', TAMANO_TESORO, TAMANO_TESORO, 'visible')
+    mundo.registrar_tipo('enemigo', 'enemigo', TAMANO_ENEMIGO, TAMANO_ENEMIGO, 'activo')
+    
+    mundo.registrar_manejador('jugador', 'tesoro', al_tocar_tesoros)
+    mundo.registrar_manejador('jugador', 'enemigo', al_tocar_enemigo)
+    if separar_enemigos:
+        mundo.registrar_manejador('enemigo', 'enemigo', al_chocar_enemigos)
+    return mundo
+
+def al_tocar_tesoros(estado, indices_jugador, indices_tesoros):
+    """
+    Recoge los tesoros que tocó el jugador en este frame
+    
+    Args:
+        estado (dict): Estado del juego
+        indices_jugador (numpy.ndarray): Siempre 0 (un solo jugador)
+        indices_tesoros (numpy.ndarray): Tesoros tocados
+    """
+    coleccion = estado['tesoros']
+    if isinstance(coleccion, tesoros.TreasureField):
+        recogidos = coleccion.recoger(indices_tesoros)
+    else:
+        for indice in indices_tesoros.tolist():
+            tesoros.recoger_tesoro(coleccion[indice])
+        recogidos = len(indices_tesoros)
+    for _ in range(recogidos):
+        jugador.agregar_tesoro_jugador(estado['jugador'])
+
+def al_tocar_enemigo(estado, indices_jugador, indices_enemigos):
+    """
+    Termina la partida: algún enemigo atrapó al jugador
+    
+    Args:
+        estado (dict): Estado del juego
+        indices_jugador (numpy.ndarray): Siempre 0 (un solo jugador)
+        indices_enemigos (numpy.ndarray): Enemigos que lo tocan
+    """
+    jugador.jugador_capturado(estado['jugador'])
+    estado['juego_terminado'] = True
+    estado['tipo_final'] = 'derrota'
+
+def al_chocar_enemigos(estado, indices_a, indices_b):
+    """
+    Separa a los enemigos del enjambre que quedaron encimados
+    
+    Args:
+        estado (dict): Estado del juego
+        indices_a, indices_b (numpy.ndarray): Pares que se superponen
+    """
+    estado['enemigo'].separar(indices_a, indices_b, estado['regiones'] is None)
 
 def procesar_todas_las_colisiones(estado):
     """
     Procesa todas las colisiones del juego
     
+    El mundo de colisiones busca los contactos de todos los pares
+    registrados en una pasada y llama a al_tocar_tesoros, al_tocar_enemigo
+    (y al_chocar_enemigos, si está activo) con los contactos de cada uno.
+    
     Args:
         estado (dict): Estado del juego
         
@@ -240,20 +446,7 @@ def procesar_todas_las_colisiones(estado):
     - Integración de sistemas de colisión
     - Modificación de estado por colisiones
     """
-    # Colisiones jugador-tesoros
-    colisiones.procesar_colisiones_jugador_tesoros(
-        estado['jugador'], 
-        estado['tesoros']
-    )
-    
-    # Colisión jugador-enemigo
-    if colisiones.procesar_colision_jugador_enemigo(
-        estado['jugador'], 
-        estado['enemigo']
-    ):
-        # El jugador fue capturado
-        estado['juego_terminado'] = True
-        estado['tipo_final'] = 'derrota'
+    estado['mundo_colisiones'].procesar(estado)
 
 def verificar_final_juego(estado):
     """
@@ -267,7 +460,7 @@ def verificar_final_juego(estado):
     - Cambio de estado del juego
     - Lógica de finalización
     """
-    if jugador.jugador_ha_ganado(estado['jugador']):
+    if jugador.jugador_ha_ganado(estado['jugador'], estado['parametros']['TESOROS_PARA_GANAR']):
         estado['juego_terminado'] = True
         estado['tipo_final'] = 'victoria'
 
@@ -285,28 +478,40 @@ def renderizar_juego(pantalla, imagenes, fuentes, estado):
         fuentes (dict): Diccionario con fuentes
         estado (dict): Estado actual del juego
         
+    Returns:
+        list: Áreas dibujadas por el HUD (las usa el renderizador por
+            rectángulos sucios para borrarlas en el frame siguiente)
+        
     Conceptos enseñados:
     - Renderizado por capas
     - Orden de dibujado importante
     - Renderizado condicional por estado
     """
-    # 1. Dibujar fondo
-    pantalla.blit(imagenes['fondo'], (0, 0))
-    
-    # 2. Dibujar tesoros
-    tesoros.dibujar_tesoros(pantalla, imagenes['tesoro'], estado['tesoros'])
-    
-    # 3. Dibujar jugador
-    jugador.dibujar_jugador(pantalla, imagenes['jugador'], estado['jugador'])
-    
-    # 4. Dibujar enemigo
-    enemigo.dibujar_enemigo(pantalla, imagenes['enemigo'], estado['enemigo'])
+    # 1. Dibujar fondo (en el mundo infinito se repite en mosaico)
+    camara_actual = estado['camara']
+    camara_actual.dibujar_fondo(pantalla, imagenes['fondo'])
+    
+    # 2-4. Solo lo que toca la vista de la cámara
+    if 'atlas' in imagenes:
+        # Tesoros y personajes desde el atlas, un blits por capa
+        atlas.dibujar_capas(pantalla, imagenes['atlas'], estado)
+    else:
+        # 2. Dibujar tesoros
+        tesoros.dibujar_tesoros(pantalla, imagenes['tesoro'], estado['tesoros'], camara_actual)
+        
+        # 3. Dibujar jugador
+        jugador.dibujar_jugador(pantalla, imagenes['jugador'], estado['jugador'], camara_actual)
+        
+        # 4. Dibujar enemigo
+        enemigo.dibujar_enemigo(pantalla, imagenes['enemigo'], estado['enemigo'], camara_actual)
     
-    # 5. Dibujar interfaz de usuario
-    renderizar_interfaz(pantalla, fuentes, estado)
+    # 5. Dibujar interfaz de usuario (en coordenadas de pantalla)
+    areas_interfaz = renderizar_interfaz(pantalla, fuentes, estado)
     
     # 6. Dibujar overlays si es necesario
     renderizar_overlays(pantalla, fuentes, estado)
+    
+    return areas_interfaz
 
 def renderizar_interfaz(pantalla, fuentes, estado):
     """
@@ -317,24 +522,31 @@ def renderizar_interfaz(pantalla, fuentes, estado):
         fuentes (dict): Fuentes cargadas
         estado (dict): Estado del juego
         
+    Returns:
+        list: Rectángulos de pantalla que ocupó el HUD
+        
     Conceptos enseñados:
     - Renderizado de UI modular
     - Elementos de información para el jugador
     """
+    areas = []
     if not estado['juego_terminado'] and not estado['pausa']:
-        # HUD normal del juego
-        interfaz.dibujar_contador_tesoros(
-            pantalla, fuentes, estado['jugador'], NUMERO_TESOROS
-        )
+        # HUD normal del juego (en el mundo infinito los tesoros no se
+        # acaban: se cuenta hacia la meta)
+        total = estado['parametros']['TESOROS_PARA_GANAR' if estado['regiones'] else 'NUMERO_TESOROS']
+        areas.append(interfaz.dibujar_contador_tesoros(
+            pantalla, fuentes, estado['jugador'], total
+        ))
         
-        interfaz.dibujar_instrucciones(pantalla, fuentes, estado['jugador'])
+        areas.append(interfaz.dibujar_instrucciones(pantalla, fuentes, estado['jugador']))
         
-        interfaz.dibujar_estado_jugador(pantalla, fuentes, estado['jugador'])
+        areas.append(interfaz.dibujar_estado_jugador(pantalla, fuentes, estado['jugador']))
         
         # Opcional: mostrar distancia al enemigo
-        interfaz.mostrar_distancia_enemigo(
+        areas.append(interfaz.mostrar_distancia_enemigo(
             pantalla, fuentes, estado['jugador'], estado['enemigo']
-        )
+        ))
+    return [area for area in areas if area is not None]
 
 def renderizar_overlays(pantalla, fuentes, estado):
     """
@@ -381,8 +593,18 @@ def reiniciar_juego_completo(estado):
     # Reiniciar enemigo
     enemigo.reiniciar_enemigo(estado['enemigo'])
     
-    # Reiniciar tesoros (mantener posiciones, pero hacerlos visibles)
-    tesoros.reiniciar_tesoros(estado['tesoros'])
+    # Reiniciar tesoros (mantener posiciones, pero hacerlos visibles); en
+    # el mundo infinito, olvidar lo recogido y cargar las regiones del inicio
+    if estado['regiones']:
+        estado['regiones'].reiniciar(estado)
+        estado['camara'].seguir(estado['jugador'])
+    else:
+        tesoros.reiniciar_tesoros(estado['tesoros'])
+    
+    # Olvidar los pasos de la partida anterior: rebobinar después de
+    # reiniciar no debe devolver al jugador a ella
+    if estado['rebobinado']:
+        estado['rebobinado'].vaciar()
     
     # Reiniciar estado de juego
     estado['juego_terminado'] = False
@@ -405,19 +627,25 @@ def validar_estado_juego(estado):
     - Debugging de estado de juego
     """
     # Verificar que existan todas las claves requeridas
-    claves_requeridas = ['jugador', 'enemigo', 'tesoros', 'juego_terminado', 'running']
+    claves_requeridas = ['jugador', 'enemigo', 'tesoros', 'parametros', 'juego_terminado', 'running']
     for clave in claves_requeridas:
         if clave not in estado:
             print(f"Error: Falta clave {clave} en estado del juego")
             return False
     
     # Verificar coherencia de tesoros
-    tesoros_recogidos = estado['jugador']['tesoros_recogidos']
+    tesoros_recogidos = estado['jugador'].tesoros_recogidos
     tesoros_visibles = tesoros.contar_tesoros_visibles(estado['tesoros'])
     
-    if tesoros_recogidos + tesoros_visibles != NUMERO_TESOROS:
+    # (en el mundo infinito solo existen los tesoros de las regiones cargadas)
+    if (estado['regiones'] is None and
+            tesoros_recogidos + tesoros_visibles != estado['parametros']['NUMERO_TESOROS']):
         print("Advertencia: Incoherencia en conteo de tesoros")
     
+    # Los contadores incrementales deben coincidir con un recorrido completo
+    if isinstance(estado['tesoros'], tesoros.TreasureField):
+        estado['tesoros'].verificar_contadores()
+    
     return True
 
 # ============================================================================
@@ -447,11 +675,16 @@ def main():
         # Inicializar Pygame
         pantalla, reloj = inicializar_pygame()
         
-        # Cargar recursos
-        imagenes, fuentes = cargar_recursos()
+        # Cargar recursos (en hilos, con pantalla de carga)
+        imagenes, fuentes = cargar_recursos(pantalla)
         
-        # Crear estado inicial
-        estado = crear_estado_inicial()
+        # Crear estado inicial (con semilla conocida si se graba la partida)
+        grabador = None
+        if GRABAR_PARTIDA:
+            grabador = grabacion.Grabador(random.randrange(2 ** 32))
+            estado = crear_estado_inicial(grabador.semilla)
+        else:
+            estado = crear_estado_inicial()
         
         # Validar estado inicial
         if not validar_estado_juego(estado):
@@ -464,26 +697,107 @@ def main():
         print("- P: Pausar/Reanudar")
         print("- R: Reiniciar juego")
         print("- F1: Mostrar estado en consola")
+        if USAR_PERFILADOR:
+            print("- F3: Mostrar tiempos por fase (perfilador)")
+        if USAR_REBOBINADO:
+            print("- Retroceso (mantener): Rebobinar")
         print("- ESC: Salir (solo en pantalla de fin)")
         print("¡Recoge todos los tesoros y evita al enemigo!")
         print("=" * 45)
         
+        # Renderizador por rectángulos sucios (opcional)
+        renderizador = None
+        if USAR_RECTANGULOS_SUCIOS:
+            renderizador = renderizado.RenderizadorSucio(renderizar_juego, renderizar_interfaz)
+        
+        # Perfilador por fases (opcional; sin él el bucle no mide nada)
+        perfil = perfilador.Perfilador() if USAR_PERFILADOR else None
+        
+        # Paso fijo: la lógica avanza en pasos de 1/HZ_SIMULACION segundos
+        # sin importar cuántos frames se dibujen
+        acumulador = paso_fijo.AcumuladorPasos()
+        pendientes = []
+        
+        # Búfer de rebobinado (opcional): una instantánea por paso de lógica
+        rebobinado = instantaneas.BuferRebobinado() if USAR_REBOBINADO else None
+        estado['rebobinado'] = rebobinado  # Para vaciarlo en reiniciar_juego_completo
+        ultimo = time.perf_counter()
+        
         # BUCLE PRINCIPAL DEL JUEGO
         while estado['running']:
-            # 1. Manejar eventos
-            manejar_eventos(estado)
+            if perfil:
+                perfil.iniciar_frame()
+            ahora = time.perf_counter()
+            duracion_frame = ahora - ultimo
+            pasos = acumulador.avanzar(duracion_frame)
+            ultimo = ahora
             
-            # 2. Actualizar lógica del juego
-            actualizar_juego(estado)
+            # 1. Leer eventos: esperan hasta el próximo paso de lógica
+            nuevos = pygame.event.get()
+            pendientes.extend(nuevos)
+            teclas = pygame.key.get_pressed()
+            if perfil:
+                perfil.procesar_eventos(nuevos)
+                perfil.marcar(perfilador.FASE_EVENTOS)
             
-            # 3. Renderizar todo
-            renderizar_juego(pantalla, imagenes, fuentes, estado)
+            # 2. Pasos de lógica (cero, uno o varios por frame)
+            for _ in range(pasos):
+                eventos, pendientes = pendientes, []
+                if grabador:
+                    grabador.registrar_frame(eventos, teclas)
+                manejar_eventos(estado, eventos)
+                if perfil:
+                    perfil.marcar(perfilador.FASE_EVENTOS)
+                if not estado['running']:
+                    break
+                if rebobinado:
+                    # Mantener la tecla deshace un paso en lugar de avanzar
+                    if teclas[instantaneas.TECLA_REBOBINAR]:
+                        rebobinado.rebobinar(estado)
+                        continue
+                    if not (estado['pausa'] or estado['juego_terminado']):
+                        rebobinado.guardar(estado)
+                actualizar_juego(estado, teclas, perfil)
             
-            # 4. Actualizar pantalla
-            pygame.display.flip()
+            # 3. Renderizar entre el paso anterior y el actual, y
+            # 4. actualizar pantalla
+            vista = paso_fijo.estado_interpolado(estado, estado['previas'], acumulador.alfa())
+            if estado['regiones']:
+                # La cámara sigue al jugador interpolado, con suavizado
+                estado['camara'].seguir(vista['jugador'], duracion_frame)
+            if renderizador:
+                # El renderizador envía sus zonas a la pantalla: todo cuenta como render
+                renderizador.dibujar(pantalla, imagenes, fuentes, vista)
+                if perfil and perfil.visible:
+                    areas = [interfaz.mostrar_info_debug(pantalla, fuentes, vista['jugador'],
+                                                         vista['enemigo'], perfil=perfil)]
+                    pygame.display.update(areas)
+                    renderizador.agregar_areas(areas)
+                if perfil:
+                    perfil.marcar(perfilador.FASE_RENDER)
+            else:
+                renderizar_juego(pantalla, imagenes, fuentes, vista)
+                if perfil:
+                    if perfil.visible:
+                        interfaz.mostrar_info_debug(pantalla, fuentes, vista['jugador'],
+                                                    vista['enemigo'], perfil=perfil)
+                    perfil.marcar(perfilador.FASE_RENDER)
+                pygame.display.flip()
+                if perfil:
+                    perfil.marcar(perfilador.FASE_FLIP)
             
-            # 5. Controlar FPS
+            # 5. Limitar los FPS del dibujo (la lógica no depende de esto)
             reloj.tick(FPS)
+            if perfil:
+                perfil.terminar_frame()
+        
+        if grabador:
+            tamano = grabador.guardar(ARCHIVO_GRABACION, estado)
+            print(f"Partida grabada en {ARCHIVO_GRABACION} ({tamano} bytes)")
+        
+        if perfil:
+            frames = perfil.guardar_csv(ARCHIVO_PERFIL)
+            print(f"Tiempos de {frames} frames guardados en {ARCHIVO_PERFIL}")
         
         print("¡Gracias por jugar Cazador de Tesoros!")
         
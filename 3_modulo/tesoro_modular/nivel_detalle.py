@@ -0,0 +1,218 @@
+"""
+MÓDULO DE NIVEL DE DETALLE - CAZADOR DE TESOROS
+==============================================
+Con un enjambre grande, casi todos los enemigos están lejos del jugador y
+moverlos en cada paso no cambia nada que se note. El planificador reparte
+el enjambre en niveles según la distancia de cada enemigo al jugador
+(DISTANCIAS): los cercanos se mueven en cada paso y los demás cada 2, 4
+u 8 pasos (PERIODOS).
+
+Un enemigo que se saltó pasos avanza de una vez lo que habría avanzado
+en ellos (su velocidad por los pasos transcurridos), así que llega al
+mismo lugar que si se hubiera movido en cada paso. El trabajo se reparte
+por turnos (round-robin): de los que se mueven cada 4 pasos, en cada
+paso se mueve un cuarto. El último nivel no necesita lista: en cada
+paso se mueve un bloque contiguo de 1/8 del enjambre, y quien ya se
+movió en ese paso (por estar cerca) tiene 0 pasos pendientes.
+
+Los niveles se recalculan cada PERIODOS[-1] pasos (una ventana). El
+primer límite deja margen para que, en ese tiempo, ningún enemigo lejano
+llegue a tocar al jugador sin pasar antes al nivel cercano
+(crear_planificador lo comprueba): los enemigos que atrapan al jugador
+se mueven paso a paso, igual que sin niveles.
+
+Ojo: es un experimento que no salió bien, y el juego no lo usa. Con
+10.000 enemigos, mover a todo el enjambre con NumPy tarda unos 50 µs, y
+casi todo es el costo fijo de cada operación, no el de cada enemigo:
+mover solo una parte cuesta casi lo mismo, y llevar la cuenta de los
+niveles lo hace más lento en todos los escenarios medidos. Solo ahorra
+algo con cientos de miles de enemigos casi todos lejos (ver
+rendimiento.benchmark_nivel_detalle, que lo pasa a
+enemigo.actualizar_enemigo).
+
+Conceptos enseñados:
+- Nivel de detalle (LOD) en la simulación, no solo en el dibujo
+- Repartir el trabajo entre pasos por turnos (round-robin)
+- Avanzar según el tiempo transcurrido
+"""
+
+import math
+import numpy as np
+from configuracion import *
+import enemigo
+import paso_fijo
+
+# Cada cuántos pasos se mueve cada nivel de distancia (el primero 1;
+# todos dividen al último)
+PERIODOS = (1, 2, 4, 8)
+
+# Dónde termina cada nivel menos el último (px)
+DISTANCIAS = (200, 400, 800)
+
+# ============================================================================
+# PLANIFICADOR DE NIVEL DE DETALLE
+# ============================================================================
+
+class PlanificadorDetalle:
+    """
+    Decide qué enemigos del enjambre se mueven en cada paso
+
+    Uso:
+        planificador = PlanificadorDetalle(len(enjambre))
+        planificador.actualizar(enjambre, jugador)   # en lugar de perseguir
+
+    Atributos:
+        paso (int): Pasos simulados desde el último reinicio
+        ultimo (numpy.ndarray): Paso en que se movió cada enemigo por
+            última vez
+        niveles (list): Índices de los enemigos de cada nivel menos el
+            último, del más cercano al más lejano (según la última
+            clasificación)
+        todos_al_dia (bool): En el último paso se movieron todos (y
+            'ultimo' no se anotó)
+
+    Conceptos enseñados:
+    - Actualizar con distinta frecuencia según la importancia
+    """
+
+    def __init__(self, cantidad, distancias=DISTANCIAS, periodos=PERIODOS):
+        """
+        Args:
+            cantidad (int): Enemigos del enjambre
+            distancias (tuple): Límite de cada nivel menos el último (px)
+            periodos (tuple): Cada cuántos pasos se mueve cada nivel (el
+                primero 1; todos dividen al último)
+        """
+        self.distancias = distancias
+        self.periodos = periodos
+        self.ventana = periodos[-1]
+        self.paso = 0
+        self.ultimo = np.zeros(cantidad, dtype=np.int32)
+        self.niveles = []
+        self.todos_al_dia = False
+
+    def clasificar(self, enjambre, jugador):
+        """
+        Busca a los enemigos de los niveles que se mueven más seguido que
+        una vez por ventana (los del último nivel no necesitan lista)
+
+        Args:
+            enjambre (EnemySwarm): Enemigos
+            jugador (Jugador): Jugador perseguido
+        """
+        distancias = enemigo.distancia_al_jugador(enjambre, jugador, por_enemigo=True)
+        cercanos = np.flatnonzero(distancias < self.distancias[-1])
+        distancias = distancias[cercanos]
+        # Nivel = cuántos límites quedan por debajo de la distancia
+        nivel = np.zeros(len(cercanos), dtype=np.int8)
+        for limite in self.distancias[:-1]:
+            nivel += distancias >= limite
+        self.niveles = [cercanos[nivel == numero] for numero in range(len(self.distancias))]
+
+    def mover(self, enjambre, jugador, campo_flujo, con_bordes, indices):
+        """
+        Mueve a unos enemigos lo de todos los pasos que llevan sin moverse
+
+        Args:
+            enjambre (EnemySwarm): Enemigos
+            jugador (Jugador): Objetivo
+            campo_flujo (CampoFlujo): Campo ya apuntado al jugador (o None)
+            con_bordes (bool): Mantenerlos dentro de la pantalla
+            indices (numpy.ndarray | slice): Enemigos a mover
+        """
+        transcurridos = self.paso - self.ultimo[indices]
+        enjambre.perseguir(jugador.x, jugador.y, campo_flujo, con_bordes, indices, transcurridos)
+        self.ultimo[indices] = self.paso
+
+    def actualizar(self, enjambre, jugador, campo_flujo=None, con_bordes=True):
+        """
+        Mueve a los enemigos a los que les toca en este paso
+
+        Primero los de los niveles cercanos (de cada nivel con período p,
+        uno de cada p, por turnos) y después el bloque de este turno
+        (enemigos del turno/8 al (turno + 1)/8 del enjambre): un slice,
+        que NumPy recorre sin copiar. Si hay muchos cerca, se mueve el
+        enjambre entero.
+
+        Args:
+            enjambre (EnemySwarm): Enemigos
+            jugador (Jugador): Objetivo
+            campo_flujo (CampoFlujo, optional): Campo ya apuntado al jugador
+            con_bordes (bool): Mantenerlos dentro de la pantalla
+        """
+        if len(enjambre) != len(self.ultimo):
+            # Otro enjambre: de cero
+            self.ultimo = np.zeros(len(enjambre), dtype=np.int32)
+            self.reiniciar()
+        if self.paso % self.ventana == 0:
+            self.clasificar(enjambre, jugador)
+        turno = self.paso % self.ventana
+        self.paso += 1
+        cantidad = len(self.ultimo)
+        turnos = [turno % periodo for periodo in self.periodos]
+        a_mover = sum(len(range(inicio, len(nivel), periodo))
+                      for nivel, inicio, periodo in zip(self.niveles, turnos, self.periodos))
+        if a_mover > cantidad // 4:
+            # Muchos cerca: copiar por índices cuesta unas cuatro veces más
+            # por enemigo que recorrer el arreglo entero. Si en el paso
+            # anterior también se movieron todos, es un paso normal
+            if self.todos_al_dia:
+                enjambre.perseguir(jugador.x, jugador.y, campo_flujo, con_bordes)
+            else:
+                self.mover(enjambre, jugador, campo_flujo, con_bordes, slice(None))
+                self.todos_al_dia = True
+            return
+        if self.todos_al_dia:
+            # Los pasos normales no anotan 'ultimo': todos se movieron en
+            # el paso anterior
+            self.ultimo[:] = self.paso - 1
+            self.todos_al_dia = False
+        if a_mover:
+            indices = np.concatenate([nivel[inicio::periodo] for nivel, inicio, periodo
+                                      in zip(self.niveles, turnos, self.periodos)])
+            self.mover(enjambre, jugador, campo_flujo, con_bordes, indices)
+        bloque = slice(cantidad * turno // self.ventana, cantidad * (turno + 1) // self.ventana)
+        self.mover(enjambre, jugador, campo_flujo, con_bordes, bloque)
+
+    def reiniciar(self):
+        """
+        Empieza de cero (nueva partida o enemigos movidos por fuera): en
+        el próximo paso se vuelve a clasificar
+        """
+        self.paso = 0
+        self.ultimo[:] = 0
+        self.niveles = []
+        self.todos_al_dia = False
+
+def crear_planificador(enemigos, usar=True, distancias=DISTANCIAS, periodos=PERIODOS):
+    """
+    Args:
+        enemigos (Enemigo | EnemySwarm): Enemigos de la partida
+        usar (bool): Activar el nivel de detalle
+        distancias (tuple): Límite de cada nivel menos el último (px)
+        periodos (tuple): Cada cuántos pasos se mueve cada nivel
+
+    Returns:
+        PlanificadorDetalle | None: Planificador para un enjambre (None
+            con un solo Enemigo o si no se usa)
+
+    Raises:
+        ValueError: Si los niveles están mal armados o el primero es tan
+            chico que un enemigo lejano podría atrapar al jugador
+    """
+    if not (usar and isinstance(enemigos, enemigo.EnemySwarm)):
+        return None
+    if (periodos[0] != 1 or any(periodos[-1] % periodo for periodo in periodos) or
+            len(distancias) != len(periodos) - 1 or list(distancias) != sorted(set(distancias))):
+        raise ValueError("Los períodos deben empezar en 1 y dividir al último, con una "
+                         "distancia creciente menos")
+    # En una ventana el jugador avanza hasta P pasos y el enemigo hasta 2P
+    # (puede traer pasos pendientes de la ventana anterior)
+    lado = max(TAMANO_JUGADOR, TAMANO_ENEMIGO)
+    contacto = math.hypot(lado, lado)
+    acercamiento = periodos[-1] * (paso_fijo.velocidad_por_paso(VELOCIDAD_JUGADOR) +
+                                   2 * enemigos.velocidad)
+    if distancias[0] <= contacto + acercamiento:
+        raise ValueError(f"El primer nivel ({distancias[0]} px) es muy chico: un enemigo lejano "
+                         f"podría atrapar al jugador sin pasar por el nivel cercano")
+    return PlanificadorDetalle(len(enemigos), distancias, periodos)
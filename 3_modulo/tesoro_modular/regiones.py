@@ -0,0 +1,255 @@
+"""
+MÓDULO DE REGIONES DEL MUNDO - CAZADOR DE TESOROS
+================================================
+Con MUNDO_INFINITO el mapa no termina en los bordes de la pantalla: el
+mundo se divide en regiones cuadradas de TAMANO_REGION píxeles y solo
+existen las que rodean al jugador (RADIO_REGIONES en cada dirección).
+
+Los tesoros de cada región (creados con crear_tesoro) se generan con
+una semilla hecha de (semilla de la partida, columna, fila), así que la
+misma región sale siempre igual y al alejarse no hace falta guardarla.
+Solo se recuerda qué tesoros ya se recogieron: un entero usado como
+conjunto de bits (un bit por tesoro), y solo para las regiones donde se
+recogió alguno. La memoria depende de cuántas regiones se cargan y de
+cuántos tesoros se recogieron, no de cuánto se viajó.
+
+Los tesoros de las regiones cargadas se juntan en un único
+TreasureField (estado['tesoros']), así que las colisiones, el dibujo y
+las consultas no cambian: solo trabajan con coordenadas del mundo. Cada
+vez que el jugador cambia de región, el campo se vuelve a armar.
+
+Conceptos enseñados:
+- Mundos por regiones (chunks) que se cargan y descargan
+- Generación procedural determinista con semillas derivadas
+- Conjuntos de bits como memoria compacta
+"""
+
+import random
+import numpy as np
+from configuracion import *
+import tesoros
+from tesoros import TreasureField, ESTADO_VISIBLE, ESTADO_RECOGIDO
+
+# Separación mínima entre tesoros (la misma que crear_lista_tesoros)
+DISTANCIA_TESOROS = 80
+
+# Intentos al azar por tesoro antes de dar la región por llena
+INTENTOS_POR_TESORO = 30
+
+# ============================================================================
+# GESTOR DE REGIONES
+# ============================================================================
+
+class GestorRegiones:
+    """
+    Carga y descarga las regiones alrededor del jugador y recuerda qué
+    tesoros se recogieron en las que ya no están cargadas
+
+    Uso:
+        regiones = GestorRegiones(semilla)
+        regiones.actualizar(estado)   # tras mover al jugador
+
+    Atributos:
+        semilla (int): Semilla del mundo
+        centro (tuple): Región (columna, fila) del jugador en la última
+            carga (None antes de la primera)
+        cargadas (dict): Región -> (inicio, cantidad) de sus tesoros
+            dentro del campo actual
+        recordadas (dict): Región descargada -> bits de los tesoros
+            recogidos (solo regiones con al menos uno)
+        cargas (int): Veces que se rearmó el campo
+
+    Conceptos enseñados:
+    - Ventana de regiones que se desliza con el jugador
+    - Guardar solo lo que no se puede volver a generar
+    """
+
+    def __init__(self, semilla=None, tamano=TAMANO_REGION, por_region=TESOROS_POR_REGION,
+                 radio=RADIO_REGIONES):
+        """
+        Args:
+            semilla (int, optional): Semilla del mundo (al azar si falta)
+            tamano (int): Lado de cada región en píxeles
+            por_region (int): Tesoros por región
+            radio (int): Regiones cargadas en cada dirección alrededor
+                de la del jugador
+        """
+        self.semilla = random.randrange(2 ** 32) if semilla is None else semilla
+        self.tamano = tamano
+        self.por_region = por_region
+        self.radio = radio
+        self.centro = None
+        self.cargadas = {}
+        self.recordadas = {}
+        self.cargas = 0
+
+    def region_de(self, x, y):
+        """
+        Args:
+            x, y (int): Posición en el mundo
+
+        Returns:
+            tuple: Región (columna, fila) que contiene ese punto
+        """
+        return x // self.tamano, y // self.tamano
+
+    def generar_region(self, columna, fila):
+        """
+        Genera los tesoros de una región, siempre los mismos para la misma
+        semilla
+
+        Con tan pocos tesoros por región alcanza con probar posiciones al
+        azar y descartar las que quedan cerca de otro tesoro
+        (verificar_distancia_minima): el muestreo de Poisson de
+        crear_lista_tesoros paga un costo fijo de NumPy en cada ronda y
+        tarda unas cien veces más. Se dejan DISTANCIA_TESOROS / 2 píxeles
+        libres en cada borde, así que los tesoros de regiones vecinas
+        también quedan separados.
+
+        Args:
+            columna, fila (int): Región
+
+        Returns:
+            tuple: Arreglos (x, y) con las esquinas de los tesoros (puede
+                haber menos de por_region si no caben)
+        """
+        # Una semilla de texto da la misma secuencia en cualquier equipo
+        # (no depende de PYTHONHASHSEED)
+        generador = random.Random(f"{self.semilla}:{columna}:{fila}")
+        margen = DISTANCIA_TESOROS // 2
+        x_min = columna * self.tamano + margen
+        y_min = fila * self.tamano + margen
+        x_max = x_min + self.tamano - 2 * margen - 1
+        y_max = y_min + self.tamano - 2 * margen - 1
+
+        colocados = []
+        for _ in range(self.por_region * INTENTOS_POR_TESORO):
+            if len(colocados) == self.por_region:
+                break
+            x = generador.randint(x_min, x_max)
+            y = generador.randint(y_min, y_max)
+            if tesoros.verificar_distancia_minima(x, y, colocados, DISTANCIA_TESOROS):
+                colocados.append(tesoros.crear_tesoro(x, y))
+        posiciones_x = np.array([tesoro.x for tesoro in colocados], dtype=np.int32)
+        posiciones_y = np.array([tesoro.y for tesoro in colocados], dtype=np.int32)
+        return posiciones_x, posiciones_y
+
+    def regiones_alrededor(self, centro):
+        """
+        Args:
+            centro (tuple): Región (columna, fila) del jugador
+
+        Returns:
+            list: Regiones que deben estar cargadas, fila por fila
+        """
+        columna, fila = centro
+        radio = self.radio
+        return [(columna + dc, fila + df)
+                for df in range(-radio, radio + 1)
+                for dc in range(-radio, radio + 1)]
+
+    def actualizar(self, estado):
+        """
+        Carga las regiones nuevas alrededor del jugador y descarga las que
+        quedaron lejos, si el jugador cambió de región
+
+        Args:
+            estado (dict): Estado del juego (usa 'jugador' y reemplaza
+                'tesoros')
+
+        Returns:
+            bool: True si se rearmó el campo de tesoros
+        """
+        centro = self.region_de(*estado['jugador'].rect.center)
+        if centro == self.centro:
+            return False
+
+        anterior = estado['tesoros']
+        nuevas = self.regiones_alrededor(centro)
+        conservadas = set(nuevas)
+
+        # 1. Las regiones que se descargan guardan sus bits de recogidos
+        for region, (inicio, cantidad) in self.cargadas.items():
+            if region not in conservadas:
+                bits = bits_recogidos(anterior.estado[inicio:inicio + cantidad])
+                if bits:
+                    self.recordadas[region] = bits
+
+        # 2. Armar el campo: las regiones que siguen copian sus tesoros
+        #    del campo anterior; las nuevas se generan y recuperan sus bits
+        partes_x, partes_y, partes_estado = [], [], []
+        cargadas = {}
+        total = 0
+        for region in nuevas:
+            if region in self.cargadas:
+                inicio, cantidad = self.cargadas[region]
+                final = inicio + cantidad
+                partes_x.append(anterior.x[inicio:final])
+                partes_y.append(anterior.y[inicio:final])
+                partes_estado.append(anterior.estado[inicio:final])
+            else:
+                posiciones_x, posiciones_y = self.generar_region(*region)
+                cantidad = len(posiciones_x)
+                partes_x.append(posiciones_x)
+                partes_y.append(posiciones_y)
+                partes_estado.append(estado_desde_bits(self.recordadas.pop(region, 0), cantidad))
+            cargadas[region] = (total, cantidad)
+            total += cantidad
+
+        campo = TreasureField(np.concatenate(partes_x), np.concatenate(partes_y))
+        campo.restaurar(np.concatenate(partes_estado))
+        estado['tesoros'] = campo
+        self.cargadas = cargadas
+        self.centro = centro
+        self.cargas += 1
+        return True
+
+    def reiniciar(self, estado):
+        """
+        Olvida los tesoros recogidos y vuelve a cargar las regiones
+        alrededor del jugador (nueva partida en el mismo mundo)
+
+        Args:
+            estado (dict): Estado del juego, con el jugador ya reiniciado
+        """
+        self.recordadas.clear()
+        self.cargadas = {}
+        self.centro = None
+        self.actualizar(estado)
+
+# ============================================================================
+# CONJUNTOS DE BITS
+# ============================================================================
+
+def bits_recogidos(estado):
+    """
+    Convierte el byte de estado de los tesoros de una región en un
+    entero con un bit por tesoro recogido
+
+    Args:
+        estado (numpy.ndarray): Un byte ESTADO_* por tesoro
+
+    Returns:
+        int: Bit i encendido si el tesoro i está recogido (0 si ninguno)
+    """
+    bits = 0
+    for indice in np.flatnonzero(estado & ESTADO_RECOGIDO).tolist():
+        bits |= 1 << indice
+    return bits
+
+def estado_desde_bits(bits, cantidad):
+    """
+    Operación inversa de bits_recogidos
+
+    Args:
+        bits (int): Bits de los tesoros recogidos
+        cantidad (int): Tesoros de la región
+
+    Returns:
+        numpy.ndarray: Un byte ESTADO_* por tesoro
+    """
+    estado = np.full(cantidad, ESTADO_VISIBLE, dtype=np.uint8)
+    if bits:
+        recogidos = [indice for indice in range(cantidad) if bits >> indice & 1]
+        estado[recogidos] = ESTADO_RECOGIDO
+    return estado
@@ -0,0 +1,246 @@
+"""
+MÓDULO DE RENDERIZADO POR RECTÁNGULOS SUCIOS - CAZADOR DE TESOROS
+================================================================
+Este módulo dibuja cada frame tocando solo las zonas de la pantalla que
+cambiaron ("rectángulos sucios") en lugar de copiar el fondo completo de
+800x600 y llamar a pygame.display.flip().
+
+Cada frame:
+1. Se restaura el fondo solo donde había algo que se movió o desapareció
+   (jugador, enemigos, HUD, tesoros recogidos) en el frame anterior.
+2. Se vuelven a dibujar los tesoros que tocan esas zonas, las entidades y
+   el HUD, guardando el rectángulo de cada cosa dibujada.
+3. Se envían a la pantalla solo esas zonas con pygame.display.update(rects).
+
+Cuando aparece un overlay (pausa, victoria, derrota), reaparecen tesoros
+o hay demasiadas zonas, se vuelve al dibujado completo con flip().
+
+Conceptos enseñados:
+- Rectángulos sucios (dirty rects)
+- Tasa de relleno (fill rate): píxeles copiados por frame
+- Casos de respaldo (fallback) cuando la optimización no conviene
+"""
+
+import numpy as np
+import pygame
+from configuracion import *
+import jugador
+import enemigo
+import tesoros
+
+# Con más zonas que esto, un flip completo sale más barato
+LIMITE_RECTANGULOS = 64
+
+# ============================================================================
+# FUNCIONES AUXILIARES
+# ============================================================================
+
+def fusionar_rectangulos(rectangulos):
+    """
+    Une los rectángulos que se superponen para no copiar dos veces la
+    misma zona
+
+    Args:
+        rectangulos (list): Lista de pygame.Rect
+
+    Returns:
+        list: Rectángulos sin superposiciones entre sí
+
+    Conceptos enseñados:
+    - Unión de rectángulos
+    """
+    pendientes = [pygame.Rect(rect) for rect in rectangulos]
+    fusionados = []
+    while pendientes:
+        actual = pendientes.pop()
+        indice = actual.collidelist(pendientes)
+        while indice != -1:
+            actual.union_ip(pendientes.pop(indice))
+            indice = actual.collidelist(pendientes)
+        # La unión pudo crecer hasta tocar uno ya fusionado
+        indice = actual.collidelist(fusionados)
+        if indice != -1:
+            pendientes.append(actual.union(fusionados.pop(indice)))
+        else:
+            fusionados.append(actual)
+    return fusionados
+
+def visibilidad_tesoros(coleccion):
+    """
+    Devuelve qué tesoros están visibles como arreglo de booleanos
+
+    Args:
+        coleccion (list | TreasureField): Tesoros del juego
+
+    Returns:
+        numpy.ndarray: True para cada tesoro visible
+    """
+    if isinstance(coleccion, tesoros.TreasureField):
+        return coleccion.mascara_visibles()
+    return np.array([tesoro.visible for tesoro in coleccion], dtype=bool)
+
+def rect_tesoro(coleccion, indice):
+    """
+    Returns:
+        pygame.Rect: Rectángulo del tesoro con ese índice
+    """
+    if isinstance(coleccion, tesoros.TreasureField):
+        return pygame.Rect(int(coleccion.x[indice]), int(coleccion.y[indice]),
+                           TAMANO_TESORO, TAMANO_TESORO)
+    return tesoros.obtener_rect_tesoro(coleccion[indice])
+
+def rects_entidades(estado):
+    """
+    Calcula los rectángulos que ocupan el jugador y los enemigos
+
+    Son copias: el rect propio de cada entidad se mueve con ella, y estos
+    se guardan hasta el frame siguiente para borrar lo dibujado.
+
+    Args:
+        estado (dict): Estado del juego
+
+    Returns:
+        list: pygame.Rect de cada entidad que se dibuja
+    """
+    rects = []
+    if estado['jugador'].vivo:
+        rects.append(jugador.obtener_rect_jugador(estado['jugador']).copy())
+
+    enemigos = estado['enemigo']
+    if isinstance(enemigos, enemigo.EnemySwarm):
+        activos = enemigos.activo
+        rects.extend(pygame.Rect(x, y, TAMANO_ENEMIGO, TAMANO_ENEMIGO)
+                     for x, y in zip(enemigos.x[activos].tolist(), enemigos.y[activos].tolist()))
+    elif enemigos.activo:
+        rects.append(enemigo.obtener_rect_enemigo(enemigos).copy())
+    return rects
+
+# ============================================================================
+# RENDERIZADOR
+# ============================================================================
+
+class RenderizadorSucio:
+    """
+    Dibuja el juego actualizando solo los rectángulos que cambiaron
+
+    Recuerda las zonas dibujadas en el frame anterior y la visibilidad de
+    los tesoros para saber qué hay que borrar en el frame actual.
+
+    Conceptos enseñados:
+    - Estado entre frames
+    - Separar "qué cambió" de "cómo se dibuja"
+    """
+
+    def __init__(self, renderizar_completo, renderizar_interfaz):
+        """
+        Args:
+            renderizar_completo (callable): Dibuja todo el frame y devuelve
+                las áreas del HUD (main.renderizar_juego)
+            renderizar_interfaz (callable): Dibuja solo el HUD y devuelve
+                sus áreas (main.renderizar_interfaz)
+        """
+        self.renderizar_completo = renderizar_completo
+        self.renderizar_interfaz = renderizar_interfaz
+        self.areas_previas = []
+        self.visibles_previos = None
+        self.necesita_completo = True
+        self.frames = 0
+        self.frames_completos = 0
+        self.pixeles_actualizados = 0
+
+    def forzar_completo(self):
+        """
+        Pide un dibujado completo en el próximo frame (por ejemplo, si
+        otra parte del programa dibujó sobre la pantalla)
+        """
+        self.necesita_completo = True
+
+    def agregar_areas(self, areas):
+        """
+        Registra zonas que otra parte del programa dibujó sobre este frame
+        (por ejemplo, el panel del perfilador) para borrarlas en el siguiente
+
+        Args:
+            areas (list): pygame.Rect dibujados
+        """
+        self.areas_previas.extend(areas)
+
+    def dibujar(self, pantalla, imagenes, fuentes, estado):
+        """
+        Dibuja un frame y lo envía a la pantalla
+
+        Args:
+            pantalla (pygame.Surface): Superficie de la ventana
+            imagenes (dict): Imágenes cargadas
+            fuentes (dict): Fuentes cargadas
+            estado (dict): Estado del juego
+
+        Returns:
+            list: Rectángulos enviados a la pantalla (None si fue un flip)
+        """
+        self.frames += 1
+        visibles = visibilidad_tesoros(estado['tesoros'])
+        entidades = rects_entidades(estado)
+
+        # Casos en que conviene (o es necesario) redibujar todo
+        overlay = estado['pausa'] or estado['juego_terminado']
+        reaparecieron = (self.visibles_previos is None or
+                         len(visibles) != len(self.visibles_previos) or
+                         bool((visibles & ~self.visibles_previos).any()))
+        if (overlay or self.necesita_completo or reaparecieron or
+                len(entidades) + len(self.areas_previas) > LIMITE_RECTANGULOS):
+            return self._dibujar_completo(pantalla, imagenes, fuentes, estado,
+                                          visibles, entidades, overlay)
+
+        # 1. Borrar lo del frame anterior y los tesoros recogidos
+        coleccion = estado['tesoros']
+        recogidos = np.flatnonzero(self.visibles_previos & ~visibles)
+        borrar = fusionar_rectangulos(
+            self.areas_previas + [rect_tesoro(coleccion, indice) for indice in recogidos])
+        for rect in borrar:
+            pantalla.blit(imagenes['fondo'], rect, rect)
+
+        # 2. Redibujar tesoros que tocan las zonas borradas, entidades y HUD
+        tesoros.dibujar_tesoros_en_areas(pantalla, imagenes['tesoro'], coleccion, borrar)
+        jugador.dibujar_jugador(pantalla, imagenes['jugador'], estado['jugador'])
+        enemigo.dibujar_enemigo(pantalla, imagenes['enemigo'], estado['enemigo'])
+        areas_interfaz = self.renderizar_interfaz(pantalla, fuentes, estado)
+
+        # 3. Enviar a la pantalla lo borrado y lo dibujado
+        self.areas_previas = entidades + areas_interfaz
+        self.visibles_previos = visibles
+        actualizar = fusionar_rectangulos(borrar + self.areas_previas)
+        actualizar = [rect.clip(pantalla.get_rect()) for rect in actualizar]
+        pygame.display.update(actualizar)
+        self.pixeles_actualizados += sum(rect.width * rect.height for rect in actualizar)
+        return actualizar
+
+    def _dibujar_completo(self, pantalla, imagenes, fuentes, estado, visibles, entidades, overlay):
+        """
+        Dibuja todo el frame con flip() y deja preparado el siguiente
+
+        Después de un overlay se pide otro completo para borrarlo.
+        """
+        areas_interfaz = self.renderizar_completo(pantalla, imagenes, fuentes, estado)
+        pygame.display.flip()
+        self.areas_previas = entidades + areas_interfaz
+        self.visibles_previos = visibles
+        self.necesita_completo = overlay
+        self.frames_completos += 1
+        self.pixeles_actualizados += pantalla.get_width() * pantalla.get_height()
+        return None
+
+    def fraccion_actualizada(self, pantalla):
+        """
+        Calcula qué parte de la pantalla se envió en promedio por frame
+
+        Args:
+            pantalla (pygame.Surface): Superficie de la ventana
+
+        Returns:
+            float: Entre 0 y 1 (1 = flip completo en cada frame)
+        """
+        if self.frames == 0:
+            return 0.0
+        total = pantalla.get_width() * pantalla.get_height() * self.frames
+        return self.pixeles_actualizados / total
@@ -0,0 +1,1611 @@
+"""
+MÓDULO DE RENDIMIENTO - CAZADOR DE TESOROS
+=========================================
+Este módulo reúne pequeñas mediciones de rendimiento (benchmarks) para
+comprobar que los sistemas del juego escalan con mapas grandes.
+
+Se ejecuta directamente:  python rendimiento.py
+
+Conceptos enseñados:
+- Medición de tiempos con time.perf_counter
+- Comparación de algoritmos (lineal vs espacial)
+- Escalabilidad de estructuras de datos
+"""
+
+import math
+import random
+import time
+import tracemalloc
+
+import numpy as np
+import pygame
+
+from configuracion import *
+import jugador
+import enemigo
+import campo_flujo
+import tesoros
+import colisiones
+
+# ============================================================================
+# FUNCIONES AUXILIARES DE MEDICIÓN
+# ============================================================================
+
+def medir(funcion, repeticiones):
+    """
+    Ejecuta una función varias veces y mide el tiempo promedio
+
+    Args:
+        funcion (callable): Función sin argumentos a medir
+        repeticiones (int): Número de ejecuciones
+
+    Returns:
+        float: Tiempo promedio por ejecución en microsegundos
+    """
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        funcion()
+    return (time.perf_counter() - inicio) / repeticiones * 1_000_000
+
+def lado_mundo(cantidad, espacio_por_tesoro=80):
+    """
+    Calcula el lado de un mapa cuadrado con densidad constante de tesoros
+
+    Args:
+        cantidad (int): Número de tesoros
+        espacio_por_tesoro (int): Lado del área reservada por tesoro
+
+    Returns:
+        int: Lado del mapa en píxeles
+    """
+    return max(ANCHO, int(math.sqrt(cantidad) * espacio_por_tesoro))
+
+def crear_tesoros_dispersos(cantidad, lado, semilla=0):
+    """
+    Crea tesoros en posiciones aleatorias de un mapa cuadrado
+
+    Args:
+        cantidad (int): Número de tesoros
+        lado (int): Lado del mapa en píxeles
+        semilla (int): Semilla para reproducibilidad
+
+    Returns:
+        list: Lista de Tesoro
+    """
+    generador = random.Random(semilla)
+    return [tesoros.crear_tesoro(generador.randrange(lado - TAMANO_TESORO),
+                                 generador.randrange(lado - TAMANO_TESORO))
+            for _ in range(cantidad)]
+
+def campo_desde_lista(lista):
+    """
+    Convierte una lista de Tesoro en un TreasureField
+
+    Args:
+        lista (list): Tesoros sueltos
+
+    Returns:
+        tesoros.TreasureField: Campo con las mismas posiciones
+    """
+    return tesoros.TreasureField([tesoro.x for tesoro in lista],
+                                 [tesoro.y for tesoro in lista])
+
+def medir_memoria(constructor):
+    """
+    Mide la memoria que queda reservada al construir un objeto
+
+    Args:
+        constructor (callable): Función sin argumentos que crea el objeto
+
+    Returns:
+        tuple: (objeto creado, bytes reservados)
+    """
+    tracemalloc.start()
+    objeto = constructor()
+    memoria, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return objeto, memoria
+
+# ============================================================================
+# BENCHMARKS
+# ============================================================================
+
+def benchmark_colisiones_tesoros(cantidades=(5, 1000, 10000, 100000), frames=2000):
+    """
+    Compara el costo por frame de las colisiones jugador-tesoros usando la
+    lista simple (recorrido lineal) y la colección con grilla espacial.
+
+    Args:
+        cantidades (tuple): Números de tesoros a probar
+        frames (int): Frames simulados por medición
+    """
+    print("=== Colisiones jugador-tesoros (µs por frame) ===")
+    print(f"{'tesoros':>10} {'lineal':>12} {'grilla':>12}")
+
+    for cantidad in cantidades:
+        lado = lado_mundo(cantidad)
+        generador = random.Random(1)
+        posiciones = [(generador.randrange(lado - TAMANO_JUGADOR),
+                       generador.randrange(lado - TAMANO_JUGADOR))
+                      for _ in range(frames)]
+
+        resultados = []
+        for usar_grilla in (False, True):
+            lista = crear_tesoros_dispersos(cantidad, lado)
+            if usar_grilla:
+                lista = campo_desde_lista(lista)
+            explorador = jugador.crear_jugador()
+            # El recorrido lineal es muy lento con mapas grandes: menos frames
+            frames_medidos = frames if usar_grilla else max(5, frames * 100 // max(cantidad, 100))
+            paso = iter(posiciones * 2)
+
+            def un_frame():
+                explorador.x, explorador.y = next(paso)
+                colisiones.procesar_colisiones_jugador_tesoros(explorador, lista)
+
+            resultados.append(medir(un_frame, frames_medidos))
+
+        print(f"{cantidad:>10} {resultados[0]:>12.1f} {resultados[1]:>12.1f}")
+
+def benchmark_generacion_tesoros(cantidades=(5, 1000, 10000, 100000), distancia_minima=80):
+    """
+    Mide el tiempo de generar posiciones con disco de Poisson en un mapa
+    con espacio suficiente para cada cantidad
+
+    Args:
+        cantidades (tuple): Números de tesoros a generar
+        distancia_minima (int): Separación mínima entre tesoros
+    """
+    print("=== Generación de tesoros con disco de Poisson (ms) ===")
+    print(f"{'tesoros':>10} {'generados':>10} {'tiempo':>10}")
+
+    for cantidad in cantidades:
+        lado = lado_mundo(cantidad, espacio_por_tesoro=distancia_minima + 20)
+        inicio = time.perf_counter()
+        posiciones = tesoros.generar_posiciones_poisson(
+            cantidad, distancia_minima, semilla=1,
+            x_min=0, y_min=0, x_max=lado - TAMANO_TESORO, y_max=lado - TAMANO_TESORO)
+        milisegundos = (time.perf_counter() - inicio) * 1000
+        print(f"{cantidad:>10} {len(posiciones):>10} {milisegundos:>10.1f}")
+
+def comprobar_semillas_tesoros(cantidad=NUMERO_TESOROS, semillas=2000, distancia_minima=80):
+    """
+    Comprueba que crear_lista_tesoros coloca todos los tesoros de la
+    configuración con cualquier semilla. Con la semilla 216 la única
+    semilla inicial del muestreo cae junto a una esquina y, antes de
+    volver a sembrar, el juego no arrancaba (solo cabía 1 de 5 tesoros).
+
+    Args:
+        cantidad (int): Tesoros por mapa
+        semillas (int): Semillas probadas (0 a semillas - 1, más la 216)
+        distancia_minima (int): Separación mínima entre tesoros
+
+    Raises:
+        AssertionError: Si alguna semilla no coloca todos los tesoros
+    """
+    cortas = []
+    for semilla in sorted(set(range(semillas)) | {216}):
+        posiciones = tesoros.generar_posiciones_poisson(cantidad, distancia_minima, semilla)
+        if len(posiciones) < cantidad:
+            cortas.append(semilla)
+    print(f"=== {cantidad} tesoros con {semillas} semillas: {len(cortas)} mapas incompletos ===")
+    if cortas:
+        raise AssertionError(f"Semillas con menos de {cantidad} tesoros: {cortas[:10]}")
+    # La partida entera también arranca con esa semilla
+    import main
+    main.crear_estado_inicial(216)
+
+def comprobar_balanceo_con_errores(partidas=3):
+    """
+    Comprueba que una partida que falla no detiene el balanceo: una
+    combinación con más tesoros de los que caben falla en todas sus
+    partidas y la otra se juega igual
+
+    Args:
+        partidas (int): Partidas por combinación
+
+    Raises:
+        AssertionError: Si se pierden resultados o no se anotan las fallidas
+    """
+    import balanceo
+
+    imposible = {'NUMERO_TESOROS': 1000, 'TESOROS_PARA_GANAR': 1}
+    tabla = balanceo.ejecutar_balanceo([{}, imposible], partidas, trabajadores=1,
+                                       frames_maximos=100)
+    print("=== Balanceo con partidas fallidas ===")
+    tabla.imprimir()
+    normal = tabla.filas[()]
+    fallida = tabla.filas[tuple(sorted(imposible.items()))]
+    if normal['partidas'] != partidas or normal['error']:
+        raise AssertionError(f"La combinación normal perdió partidas: {normal}")
+    if fallida['error'] != partidas or len(tabla.errores) != partidas:
+        raise AssertionError(f"No se anotaron las partidas fallidas: {fallida}")
+
+def comprobar_rebobinado_al_reiniciar(pasos=30, semilla=1):
+    """
+    Comprueba que reiniciar la partida vacía el búfer de rebobinado: tras
+    jugar unos pasos hacia la derecha y reiniciar, rebobinar no tiene
+    nada que deshacer y el jugador sigue en la posición inicial
+
+    Args:
+        pasos (int): Pasos jugados antes de reiniciar
+        semilla (int): Semilla de la partida
+
+    Raises:
+        AssertionError: Si después del reinicio se puede volver a la
+            partida anterior
+    """
+    import main
+    import instantaneas
+
+    estado = main.crear_estado_inicial(semilla)
+    estado['rebobinado'] = instantaneas.BuferRebobinado()
+    inicio = (estado['jugador'].x, estado['jugador'].y)
+    teclas = jugador.TeclasSimuladas({pygame.K_RIGHT})
+    for _ in range(pasos):
+        estado['rebobinado'].guardar(estado)
+        main.actualizar_juego(estado, teclas)
+    movido = estado['jugador'].x - inicio[0]
+
+    main.reiniciar_juego_completo(estado)
+    deshechos = estado['rebobinado'].rebobinar(estado)
+    posicion = (estado['jugador'].x, estado['jugador'].y)
+    print(f"=== Rebobinar tras reiniciar: {deshechos} pasos deshechos "
+          f"(el jugador se había movido {movido} px) ===")
+    if deshechos or posicion != inicio:
+        raise AssertionError(f"El rebobinado volvió a la partida anterior: "
+                             f"{deshechos} pasos, jugador en {posicion} en lugar de {inicio}")
+
+def benchmark_campo_tesoros(cantidades=(1000, 50000, 100000), frames=20):
+    """
+    Compara memoria por tesoro y costo por frame de las consultas del HUD
+    y la IA (contar, posiciones, más cercano) entre la lista de Tesoro y
+    el TreasureField
+
+    Args:
+        cantidades (tuple): Números de tesoros a probar
+        frames (int): Frames simulados por medición
+    """
+    print("=== Lista de Tesoro vs TreasureField ===")
+    print(f"{'tesoros':>10} {'bytes/lista':>11} {'bytes/campo':>12} "
+          f"{'µs/frame lista':>14} {'µs/frame campo':>15}")
+
+    for cantidad in cantidades:
+        lado = lado_mundo(cantidad)
+        lista, memoria_lista = medir_memoria(lambda: crear_tesoros_dispersos(cantidad, lado))
+        campo, memoria_campo = medir_memoria(lambda: campo_desde_lista(lista))
+
+        def frame_lista():
+            tesoros.contar_tesoros_visibles(lista)
+            tesoros.obtener_posiciones_tesoros(lista)
+            tesoros.tesoro_mas_cercano(lista, lado // 2, lado // 2)
+
+        def frame_campo():
+            campo.contar_visibles()
+            campo.posiciones_visibles()
+            campo.mas_cercano(lado // 2, lado // 2)
+
+        tiempos = [medir(frame_lista, frames), medir(frame_campo, frames)]
+
+        print(f"{cantidad:>10} {memoria_lista / cantidad:>11.1f} {memoria_campo / cantidad:>12.1f} "
+              f"{tiempos[0]:>14.0f} {tiempos[1]:>15.0f}")
+
+def benchmark_tesoro_mas_cercano(cantidades=(1000, 10000, 100000), consultas=1000):
+    """
+    Compara la búsqueda del tesoro más cercano para muchos agentes (bots,
+    flechas de pista): recorrido de la lista, recorrido lineal con
+    NumPy, búsqueda en la grilla del TreasureField punto por punto y la
+    misma búsqueda en lote para todos los puntos a la vez
+
+    Args:
+        cantidades (tuple): Números de tesoros a probar
+        consultas (int): Puntos de consulta por frame
+    """
+    print(f"=== Tesoro más cercano, {consultas} consultas (ms por frame) ===")
+    print(f"{'tesoros':>10} {'lista':>10} {'lineal':>10} {'grilla':>10} {'lote':>10}")
+
+    for cantidad in cantidades:
+        lado = lado_mundo(cantidad)
+        lista = crear_tesoros_dispersos(cantidad, lado)
+        campo = campo_desde_lista(lista)
+        generador = random.Random(2)
+        puntos = [(generador.randrange(lado), generador.randrange(lado))
+                  for _ in range(consultas)]
+
+        def lineal(x, y):
+            indices = campo.indices_visibles()
+            dx = campo.x[indices].astype(np.int64) - x
+            dy = campo.y[indices].astype(np.int64) - y
+            return indices[np.argmin(dx * dx + dy * dy)]
+
+        # El recorrido de la lista se mide con menos puntos y se escala
+        muestra = puntos[:max(1, consultas * 1000 // cantidad)]
+        inicio = time.perf_counter()
+        for x, y in muestra:
+            tesoros.tesoro_mas_cercano(lista, x, y)
+        tiempo_lista = (time.perf_counter() - inicio) * 1000 * consultas / len(muestra)
+
+        inicio = time.perf_counter()
+        for x, y in puntos:
+            lineal(x, y)
+        tiempo_lineal = (time.perf_counter() - inicio) * 1000
+
+        inicio = time.perf_counter()
+        for x, y in puntos:
+            campo.mas_cercano(x, y)
+        tiempo_grilla = (time.perf_counter() - inicio) * 1000
+
+        puntos_x, puntos_y = zip(*puntos)
+        inicio = time.perf_counter()
+        campo.mas_cercanos_lote(puntos_x, puntos_y)
+        tiempo_lote = (time.perf_counter() - inicio) * 1000
+
+        print(f"{cantidad:>10} {tiempo_lista:>10.1f} {tiempo_lineal:>10.1f} "
+              f"{tiempo_grilla:>10.1f} {tiempo_lote:>10.1f}")
+
+def benchmark_enjambre(cantidades=(1, 100, 1000, 10000), frames=500):
+    """
+    Mide el costo por frame de mover un enjambre hacia el jugador y
+    comprobar si alguno lo atrapa, comparado con una lista de Enemigo
+
+    Args:
+        cantidades (tuple): Números de enemigos a probar
+        frames (int): Frames simulados por medición
+    """
+    print("=== Enjambre de enemigos: persecución + colisión (ms por frame) ===")
+    print(f"{'enemigos':>10} {'lista':>10} {'enjambre':>10}")
+
+    for cantidad in cantidades:
+        enjambre = enemigo.crear_enjambre(cantidad, semilla=1)
+        lista = [enemigo.Enemigo(int(x), int(y)) for x, y in zip(enjambre.x, enjambre.y)]
+        explorador = jugador.crear_jugador()
+        generador = random.Random(3)
+        objetivos = [(generador.randrange(ANCHO - TAMANO_JUGADOR),
+                      generador.randrange(ALTO - TAMANO_JUGADOR)) for _ in range(frames)]
+
+        def frame_lista():
+            explorador.x, explorador.y = next(paso)
+            for uno in lista:
+                enemigo.actualizar_enemigo(uno, explorador)
+                colisiones.procesar_colision_jugador_enemigo(explorador, uno)
+            explorador.vivo = True
+
+        def frame_enjambre():
+            explorador.x, explorador.y = next(paso)
+            enemigo.actualizar_enemigo(enjambre, explorador)
+            colisiones.procesar_colision_jugador_enemigo(explorador, enjambre)
+            explorador.vivo = True
+
+        frames_lista = max(5, frames * 100 // max(cantidad, 100))
+        paso = iter(objetivos)
+        tiempo_lista = medir(frame_lista, frames_lista) / 1000
+        paso = iter(objetivos)
+        tiempo_enjambre = medir(frame_enjambre, frames) / 1000
+
+        print(f"{cantidad:>10} {tiempo_lista:>10.3f} {tiempo_enjambre:>10.3f}")
+
+def benchmark_campo_flujo(tamanos=((200, 150), (800, 600)), cambios=50, enemigos=10000):
+    """
+    Mide el costo de recalcular el campo de flujo completo, de reparar
+    un obstáculo que aparece o desaparece y de consultar la dirección de
+    un enjambre completo
+
+    Args:
+        tamanos (tuple): Pares (columnas, filas) de las grillas a probar
+        cambios (int): Obstáculos que se agregan y quitan por medición
+        enemigos (int): Enemigos que consultan el campo
+    """
+    print("=== Campo de flujo (ms) ===")
+    print(f"{'grilla':>10} {'completo':>10} {'bloquear':>10} {'liberar':>10} "
+          f"{f'{enemigos} consultas':>17}")
+
+    for columnas, filas in tamanos:
+        generador = np.random.default_rng(4)
+        # Un 20% de celdas bloqueadas al azar, como un mapa con rocas
+        transitables = generador.random((filas, columnas)) > 0.2
+        campo = campo_flujo.CampoFlujo(columnas, filas, 1, transitables)
+        campo.celda_objetivo = (columnas // 2, filas // 2)
+
+        repeticiones = 5
+        inicio = time.perf_counter()
+        for _ in range(repeticiones):
+            campo.recalcular()
+        completo = (time.perf_counter() - inicio) * 1000 / repeticiones
+
+        celdas = [(int(generador.integers(columnas)), int(generador.integers(filas)))
+                  for _ in range(cambios)]
+        tiempos = []
+        for transitable in (False, True):
+            inicio = time.perf_counter()
+            for celda in celdas:
+                campo.cambiar_transitables([celda], transitable)
+            tiempos.append((time.perf_counter() - inicio) * 1000 / cambios)
+
+        posiciones_x = generador.integers(0, columnas, enemigos)
+        posiciones_y = generador.integers(0, filas, enemigos)
+        consulta = medir(lambda: campo.direcciones_en(posiciones_x, posiciones_y), 100) / 1000
+
+        print(f"{f'{columnas}x{filas}':>10} {completo:>10.2f} {tiempos[0]:>10.3f} "
+              f"{tiempos[1]:>10.3f} {consulta:>17.3f}")
+
+def benchmark_rectangulos_sucios(frames=1000, semilla=1):
+    """
+    Compara el dibujado completo con flip() contra el renderizador por
+    rectángulos sucios en una partida jugada por el bot
+
+    Args:
+        frames (int): Frames a dibujar con cada modo
+        semilla (int): Semilla de la partida
+    """
+    # Importación local: simulacion elige el driver de video dummy
+    import main
+    import simulacion
+    import renderizado
+
+    pantalla, _ = main.inicializar_pygame()
+    imagenes, fuentes = main.cargar_recursos()
+
+    def completo(pantalla, imagenes, fuentes, estado):
+        main.renderizar_juego(pantalla, imagenes, fuentes, estado)
+        pygame.display.flip()
+
+    sucio = renderizado.RenderizadorSucio(main.renderizar_juego, main.renderizar_interfaz)
+    print("=== Rectángulos sucios ===")
+    print(f"{'modo':>10} {'ms/frame':>10} {'% pantalla':>11} {'completos':>10}")
+    for nombre, dibujar in (('completo', completo), ('sucio', sucio.dibujar)):
+        estado = main.crear_estado_inicial(semilla)
+        tiempo_dibujo = 0.0
+        for frame in range(frames):
+            eventos = []
+            if estado['juego_terminado']:
+                eventos = [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)]
+            main.manejar_eventos(estado, eventos)
+            main.actualizar_juego(estado, simulacion.bot_cazador(estado, frame))
+            inicio = time.perf_counter()
+            dibujar(pantalla, imagenes, fuentes, estado)
+            tiempo_dibujo += time.perf_counter() - inicio
+
+        if nombre == 'completo':
+            fraccion, completos = 1.0, frames
+        else:
+            fraccion, completos = sucio.fraccion_actualizada(pantalla), sucio.frames_completos
+        print(f"{nombre:>10} {tiempo_dibujo * 1000 / frames:>10.3f} {fraccion:>11.1%} "
+              f"{completos:>10}")
+    pygame.quit()
+
+def benchmark_carga_imagenes(repeticiones=5, blits=2000):
+    """
+    Compara la carga original de imágenes (PNG completo + escalado, sin
+    convertir) con la caché de sprites escalados, en frío y en caliente,
+    y mide cuánto cuesta dibujar cada imagen antes y después de convertirla
+    al formato de la pantalla
+
+    Args:
+        repeticiones (int): Cargas completas por medición
+        blits (int): Dibujos de cada imagen para medir su costo
+    """
+    # Importación local: simulacion elige el driver de video dummy
+    import shutil
+    import tempfile
+    import pygame
+    import main
+    import simulacion
+    import utilidades
+
+    pantalla, _ = main.inicializar_pygame()
+    recursos = {
+        'fondo': (ARCHIVO_FONDO, (ANCHO, ALTO)),
+        'jugador': (ARCHIVO_JUGADOR, (TAMANO_JUGADOR, TAMANO_JUGADOR)),
+        'tesoro': (ARCHIVO_TESORO, (TAMANO_TESORO, TAMANO_TESORO)),
+        'enemigo': (ARCHIVO_ENEMIGO, (TAMANO_ENEMIGO, TAMANO_ENEMIGO)),
+    }
+
+    def carga_original():
+        return {nombre: pygame.transform.scale(pygame.image.load(archivo), tamano)
+                for nombre, (archivo, tamano) in recursos.items()}
+
+    directorio = tempfile.mkdtemp()
+    try:
+        def carga_fria():
+            shutil.rmtree(directorio, ignore_errors=True)
+            return utilidades.cargar_todas_las_imagenes(directorio)
+
+        original = medir(carga_original, repeticiones) / 1000
+        fria = medir(carga_fria, repeticiones) / 1000
+        caliente = medir(lambda: utilidades.cargar_todas_las_imagenes(directorio),
+                         repeticiones) / 1000
+        convertidas = utilidades.cargar_todas_las_imagenes(directorio)
+    finally:
+        shutil.rmtree(directorio, ignore_errors=True)
+
+    print("=== Carga de imágenes (ms) ===")
+    print(f"{'original':>10} {'caché fría':>11} {'caché caliente':>15}")
+    print(f"{original:>10.1f} {fria:>11.1f} {caliente:>15.1f}")
+
+    print("=== Costo de dibujar cada imagen (µs por blit) ===")
+    print(f"{'imagen':>10} {'original':>10} {'convertida':>11}")
+    sin_convertir = carga_original()
+    for nombre in recursos:
+        antes = medir(lambda: pantalla.blit(sin_convertir[nombre], (0, 0)), blits)
+        despues = medir(lambda: pantalla.blit(convertidas[nombre], (0, 0)), blits)
+        print(f"{nombre:>10} {antes:>10.1f} {despues:>11.1f}")
+    pygame.quit()
+
+def benchmark_carga_en_hilos(imagenes=8, lado=1200, hilos=(1, 2, 4)):
+    """
+    Compara cargar un conjunto grande de imágenes una detrás de otra
+    (como utilidades.cargar_todas_las_imagenes) con cargador.CargadorImagenes,
+    sin caché: tiempo hasta tener todas listas y mayor intervalo en que el
+    hilo principal no puede dibujar un frame (en serie no dibuja hasta el
+    final)
+
+    Con un solo núcleo los hilos no acortan la carga, pero la ventana
+    sigue respondiendo; con varios núcleos las imágenes se decodifican a
+    la vez.
+
+    Args:
+        imagenes (int): Imágenes PNG generadas
+        lado (int): Lado de cada PNG en píxeles (se escalan a ANCHO x ALTO)
+        hilos (tuple): Números de hilos a probar
+    """
+    # Importación local: simulacion elige el driver de video dummy
+    import os
+    import shutil
+    import tempfile
+    import main
+    import simulacion
+    import utilidades
+    import cargador
+
+    main.inicializar_pygame()
+    directorio = tempfile.mkdtemp()
+    try:
+        generador = np.random.default_rng(1)
+        recursos = {}
+        for numero in range(imagenes):
+            ruta = os.path.join(directorio, f"imagen_{numero}.png")
+            pixeles = generador.integers(0, 256, (lado, lado, 3), dtype=np.uint8)
+            pygame.image.save(pygame.surfarray.make_surface(pixeles), ruta)
+            recursos[f"imagen_{numero}"] = (ruta, (ANCHO, ALTO))
+
+        def en_serie():
+            inicio = time.perf_counter()
+            for nombre, (archivo, tamano) in recursos.items():
+                imagen = utilidades.preparar_imagen(archivo, tamano, None)
+                utilidades.terminar_imagen(nombre, imagen, tamano)
+            total = time.perf_counter() - inicio
+            return total, total
+
+        def con_hilos(cantidad):
+            inicio = ultimo = time.perf_counter()
+            hueco = 0.0
+            carga = cargador.CargadorImagenes(recursos, cantidad, None)
+            while not carga.terminado():
+                carga.esperar(1 / FPS)
+                ahora = time.perf_counter()
+                hueco = max(hueco, ahora - ultimo)
+                ultimo = ahora
+            return time.perf_counter() - inicio, hueco
+
+        print(f"=== Carga de {imagenes} PNG de {lado}x{lado} sin caché "
+              f"({os.cpu_count()} núcleos) ===")
+        print(f"{'modo':>10} {'total ms':>9} {'máx. sin frame ms':>18}")
+        for nombre, cargar in [('serie', en_serie)] + [
+                (f"{cantidad} hilos", lambda cantidad=cantidad: con_hilos(cantidad))
+                for cantidad in hilos]:
+            total, hueco = cargar()
+            print(f"{nombre:>10} {total * 1000:>9.0f} {hueco * 1000:>18.0f}")
+    finally:
+        shutil.rmtree(directorio, ignore_errors=True)
+    pygame.quit()
+
+def benchmark_atlas(cantidad=10000, frames=20):
+    """
+    Compara dibujar tesoros con un blit por tesoro contra una sola llamada
+    a blits por capa (con el sprite suelto y desde el atlas)
+
+    Con el sprite de 1 píxel casi no hay píxeles que copiar, así que la
+    columna mide sobre todo el costo fijo de cada llamada.
+
+    Args:
+        cantidad (int): Tesoros visibles en pantalla
+        frames (int): Frames medidos por método
+    """
+    # Importación local: simulacion elige el driver de video dummy
+    import main
+    import simulacion
+    import atlas
+
+    pantalla, _ = main.inicializar_pygame()
+    imagenes, _ = main.cargar_recursos()
+    generador = random.Random(5)
+    lista = [tesoros.crear_tesoro(generador.randrange(ANCHO - TAMANO_TESORO),
+                                  generador.randrange(ALTO - TAMANO_TESORO))
+             for _ in range(cantidad)]
+    campo = campo_desde_lista(lista)
+
+    def bucle_lista(sprite, _):
+        for tesoro in lista:
+            if tesoro.visible:
+                pantalla.blit(sprite, (tesoro.x, tesoro.y))
+
+    def bucle_campo(sprite, _):
+        posiciones_x, posiciones_y = campo.posiciones_visibles()
+        for posicion in zip(posiciones_x.tolist(), posiciones_y.tolist()):
+            pantalla.blit(sprite, posicion)
+
+    def blits_sprite(sprite, _):
+        tesoros.dibujar_tesoros(pantalla, sprite, campo)
+
+    def blits_atlas(_, atlas_tesoros):
+        pantalla.blits(atlas.capa_tesoros(atlas_tesoros, campo), False)
+
+    sprites = {
+        f'{TAMANO_TESORO}px': (imagenes['tesoro'], imagenes['atlas']),
+        '1px': (pygame.Surface((1, 1)).convert_alpha(), None),
+    }
+    sprites['1px'] = (sprites['1px'][0],
+                      atlas.crear_atlas({'tesoro': sprites['1px'][0]}, ('tesoro',)))
+
+    print(f"=== Dibujar {cantidad} tesoros (ms por frame) ===")
+    print(f"{'método':>22} " + " ".join(f"{f'sprite {nombre}':>12}" for nombre in sprites))
+    for nombre, metodo in (('blit por tesoro (lista)', bucle_lista),
+                           ('blit por tesoro (campo)', bucle_campo),
+                           ('blits con sprite', blits_sprite),
+                           ('blits con atlas', blits_atlas)):
+        tiempos = [medir(lambda: metodo(*sprite), frames) / 1000 for sprite in sprites.values()]
+        print(f"{nombre:>22} " + " ".join(f"{tiempo:>12.2f}" for tiempo in tiempos))
+    pygame.quit()
+
+def benchmark_camara(cantidades=(1000, 10000, 100000, 1000000), frames=20):
+    """
+    Compara dibujar todo el mundo (la pantalla recorta lo que queda
+    fuera) con dibujar solo lo que toca la vista de la cámara, con
+    tesoros y con enjambres repartidos en mundos cada vez más grandes
+    (densidad constante: unos 75 tesoros por pantalla)
+
+    La cámara se mueve en cada frame, así que la capa nunca se reutiliza.
+    Las columnas 'blits' son los sprites enviados por frame.
+
+    Args:
+        cantidades (tuple): Tesoros (y enemigos, hasta 100.000) en el mundo
+        frames (int): Frames medidos por método
+    """
+    # Importación local: simulacion elige el driver de video dummy
+    import main
+    import simulacion
+    import camara
+
+    pantalla, _ = main.inicializar_pygame()
+    imagenes, _ = main.cargar_recursos()
+    vista = camara.Camara()
+
+    def medir_dibujo(lado, dibujar_todo, dibujar_vista, contar_vista):
+        # La cámara recorre el mundo en diagonal, otra posición cada frame
+        posiciones = [((paso * 97) % (lado - ANCHO), (paso * 61) % (lado - ALTO))
+                      for paso in range(frames)]
+        resultados = []
+        for dibujar in (dibujar_todo, dibujar_vista):
+            recorrido = iter(posiciones)
+
+            def frame():
+                vista.x, vista.y = next(recorrido)
+                dibujar()
+
+            resultados.append(medir(frame, frames) / 1000)
+        blits = 0
+        for vista.x, vista.y in posiciones:
+            blits += contar_vista()
+        return resultados, blits / frames
+
+    print("=== Dibujar con cámara: todo el mundo frente a solo la vista (ms por frame) ===")
+    print(f"{'entidades':>10} {'lado px':>8} {'blits todo':>11} {'ms todo':>8} "
+          f"{'blits vista':>12} {'ms vista':>9}")
+    for cantidad in cantidades:
+        lado = max(lado_mundo(cantidad), 2 * ANCHO)
+        generador = np.random.default_rng(cantidad)
+        campo = tesoros.TreasureField(generador.integers(0, lado - TAMANO_TESORO, cantidad),
+                                      generador.integers(0, lado - TAMANO_TESORO, cantidad))
+        sprite = imagenes['tesoro']
+
+        def todo():
+            posiciones_x, posiciones_y = campo.posiciones_visibles()
+            pantalla.blits([(sprite, posicion) for posicion in
+                            zip((posiciones_x - vista.x).tolist(),
+                                (posiciones_y - vista.y).tolist())], False)
+
+        (tiempo_todo, tiempo_vista), blits = medir_dibujo(
+            lado, todo, lambda: tesoros.dibujar_tesoros(pantalla, sprite, campo, vista),
+            lambda: len(tesoros.posiciones_en_pantalla(campo, vista)))
+        print(f"{f'{cantidad} tes.':>10} {lado:>8} {cantidad:>11} {tiempo_todo:>8.2f} "
+              f"{blits:>12.0f} {tiempo_vista:>9.2f}")
+
+    for cantidad in [cantidad for cantidad in cantidades if cantidad <= 100000]:
+        lado = max(lado_mundo(cantidad), 2 * ANCHO)
+        generador = np.random.default_rng(cantidad)
+        enjambre = enemigo.EnemySwarm(generador.integers(0, lado - TAMANO_ENEMIGO, cantidad),
+                                      generador.integers(0, lado - TAMANO_ENEMIGO, cantidad))
+        sprite = imagenes['enemigo']
+
+        def todo():
+            pantalla.blits([(sprite, posicion) for posicion in
+                            zip((enjambre.x - vista.x).tolist(),
+                                (enjambre.y - vista.y).tolist())], False)
+
+        (tiempo_todo, tiempo_vista), blits = medir_dibujo(
+            lado, todo, lambda: enemigo.dibujar_enemigo(pantalla, sprite, enjambre, vista),
+            lambda: len(enemigo.posiciones_en_pantalla(enjambre, vista)))
+        print(f"{f'{cantidad} en.':>10} {lado:>8} {cantidad:>11} {tiempo_todo:>8.2f} "
+              f"{blits:>12.0f} {tiempo_vista:>9.2f}")
+    pygame.quit()
+
+class FuenteContadora:
+    """
+    Envuelve una fuente y cuenta cuántas superficies crea con render()
+    """
+
+    def __init__(self, fuente):
+        self.fuente = fuente
+        self.superficies = 0
+
+    def render(self, *argumentos):
+        self.superficies += 1
+        return self.fuente.render(*argumentos)
+
+    def __getattr__(self, nombre):
+        return getattr(self.fuente, nombre)
+
+def benchmark_hud(frames=1000, semilla=1):
+    """
+    Comprueba que el HUD armado con el atlas de glifos no crea superficies
+    en cada frame y mide con tracemalloc la memoria que reserva, frente a
+    dibujar los mismos textos con font.render
+
+    Pasado el primer décimo de los frames (cuando las cachés ya se
+    llenaron), el HUD con glifos no puede dejar memoria reservada de un
+    frame al siguiente.
+
+    Args:
+        frames (int): Frames medidos por método
+        semilla (int): Semilla de la partida (el bot la juega mientras tanto)
+
+    Raises:
+        AssertionError: Si el HUD con glifos llama a font.render o su
+            memoria crece frame a frame
+    """
+    # Importación local: simulacion elige el driver de video dummy
+    import main
+    import simulacion
+    import interfaz
+
+    pantalla, _ = main.inicializar_pygame()
+    _, fuentes = main.cargar_recursos()
+    # Los atlas de glifos ya están creados: desde aquí se cuenta cada render
+    for nombre in ('grande', 'mediana', 'normal', 'pequeña'):
+        fuentes[nombre] = FuenteContadora(fuentes[nombre])
+
+    def hud_con_render(estado):
+        explorador = estado['jugador']
+        distancia = int(enemigo.distancia_al_jugador(estado['enemigo'], explorador))
+        textos = [(fuentes['mediana'], f"Tesoros: {explorador.tesoros_recogidos}/"
+                                       f"{estado['parametros']['NUMERO_TESOROS']}", AMARILLO),
+                  (fuentes['pequeña'], f"Enemigo: {distancia}px", VERDE)]
+        textos += [(fuentes['pequeña'], instruccion, BLANCO)
+                   for instruccion in interfaz.INSTRUCCIONES_JUEGO]
+        for fuente, texto, color in textos:
+            pantalla.blit(fuente.render(texto, True, color), (10, 10))
+
+    def hud_con_glifos(estado):
+        main.renderizar_interfaz(pantalla, fuentes, estado)
+
+    print("=== HUD por frame ===")
+    print(f"{'método':>12} {'ms':>8} {'superficies':>12} {'pico KB':>9} {'crecimiento KB':>15}")
+    for nombre, hud in (('font.render', hud_con_render), ('glifos', hud_con_glifos)):
+        estado = main.crear_estado_inicial(semilla)
+        for fuente in fuentes.values():
+            if isinstance(fuente, FuenteContadora):
+                fuente.superficies = 0
+        hud(estado)   # Calentamiento
+
+        tracemalloc.start()
+        pico = tiempo = crecimiento = 0.0
+        crecimiento_estable = 0
+        renders_antes = sum(fuente.superficies for fuente in fuentes.values()
+                            if isinstance(fuente, FuenteContadora))
+        for frame in range(frames):
+            main.manejar_eventos(estado, [])
+            main.actualizar_juego(estado, simulacion.bot_cazador(estado, frame))
+            tracemalloc.reset_peak()
+            antes = tracemalloc.get_traced_memory()[0]
+            inicio = time.perf_counter()
+            hud(estado)
+            tiempo += time.perf_counter() - inicio
+            actual, maximo = tracemalloc.get_traced_memory()
+            pico = max(pico, maximo - antes)
+            crecimiento += actual - antes
+            if frame >= frames // 10:
+                crecimiento_estable += actual - antes
+        tracemalloc.stop()
+        renders = sum(fuente.superficies for fuente in fuentes.values()
+                      if isinstance(fuente, FuenteContadora)) - renders_antes
+
+        print(f"{nombre:>12} {tiempo * 1000 / frames:>8.3f} {renders / frames:>12.1f} "
+              f"{pico / 1024:>9.1f} {crecimiento / 1024:>15.1f}")
+        if nombre == 'glifos':
+            if renders:
+                raise AssertionError(f"el HUD creó {renders} superficies con font.render")
+            if crecimiento_estable > 0:
+                raise AssertionError(f"la memoria del HUD creció {crecimiento_estable} bytes "
+                                     f"después del calentamiento")
+    pygame.quit()
+
+def benchmark_perfilador(frames=1000, repeticiones=20000, semilla=1, rondas=7, limite=0.02):
+    """
+    Mide cuánto agrega el perfilador a cada frame: lo que cuestan sus
+    marcas por frame y la diferencia en un bucle real (lógica + dibujo
+    completo + flip, sin esperar al reloj) con y sin perfilador
+
+    La diferencia entre los dos bucles es de unos pocos microsegundos en
+    un frame de medio milisegundo, menos que el ruido de la máquina entre
+    una ronda y otra: por eso se alternan varias rondas y se toma la
+    mejor de cada uno. El límite se comprueba con el costo de las marcas
+    (lo único que agrega el perfilador con el panel oculto) frente al
+    frame sin perfilador.
+
+    Args:
+        frames (int): Frames del bucle real por medición
+        repeticiones (int): Frames vacíos para medir solo las marcas
+        semilla (int): Semilla de la partida
+        rondas (int): Mediciones alternadas de cada bucle
+        limite (float): Fracción máxima del frame que pueden costar las marcas
+
+    Raises:
+        AssertionError: Si las marcas cuestan más que 'limite' del frame
+    """
+    # Importación local: simulacion elige el driver de video dummy
+    import main
+    import simulacion
+    import perfilador
+
+    pantalla, _ = main.inicializar_pygame()
+    imagenes, fuentes = main.cargar_recursos()
+
+    def solo_marcas(perfil):
+        perfil.iniciar_frame()
+        perfil.procesar_eventos([])
+        for fase in range(perfilador.FASE_FRAME):
+            perfil.marcar(fase)
+        perfil.terminar_frame()
+
+    def bucle(perfil):
+        estado = main.crear_estado_inicial(semilla)
+        inicio = time.perf_counter()
+        for frame in range(frames):
+            if perfil:
+                perfil.iniciar_frame()
+            eventos = []
+            if estado['juego_terminado']:
+                eventos = [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)]
+            main.manejar_eventos(estado, eventos)
+            if perfil:
+                perfil.procesar_eventos(eventos)
+                perfil.marcar(perfilador.FASE_EVENTOS)
+            main.actualizar_juego(estado, simulacion.bot_cazador(estado, frame), perfil)
+            main.renderizar_juego(pantalla, imagenes, fuentes, estado)
+            if perfil:
+                perfil.marcar(perfilador.FASE_RENDER)
+            pygame.display.flip()
+            if perfil:
+                perfil.marcar(perfilador.FASE_FLIP)
+                perfil.terminar_frame()
+        return (time.perf_counter() - inicio) * 1000 / frames
+
+    marcas = medir(lambda: solo_marcas(perfilador.Perfilador()), 1)   # Calentamiento
+    perfil = perfilador.Perfilador()
+    marcas = medir(lambda: solo_marcas(perfil), repeticiones)
+
+    # Se alterna para que el ruido de la máquina afecte a los dos por igual
+    sin, con = [], []
+    for _ in range(rondas):
+        sin.append(bucle(None))
+        con.append(bucle(perfilador.Perfilador()))
+    sin, con = min(sin), min(con)
+
+    print("=== Perfilador ===")
+    print(f"Marcas por frame: {marcas:.1f} µs "
+          f"({marcas / 1000 / (1000 / FPS):.3%} de un frame a {FPS} FPS)")
+    print(f"Bucle sin esperar al reloj: {sin:.3f} ms sin perfilador, {con:.3f} ms con "
+          f"({(con - sin) / sin:+.2%}; mejor de {rondas})")
+    print(f"Marcas frente al frame sin perfilador: {marcas / 1000 / sin:.2%}")
+    pygame.quit()
+    if marcas / 1000 > limite * sin:
+        raise AssertionError(f"Las marcas cuestan {marcas:.1f} µs, más del {limite:.0%} "
+                             f"de un frame de {sin:.3f} ms")
+
+def benchmark_mundo_colisiones(cantidades=(10, 100, 1000, 10000), frames=200, numero_tesoros=10000):
+    """
+    Compara las colisiones del frame con llamadas sueltas (jugador-tesoros
+    y jugador-enemigo) y con el mundo de colisiones, y mide aparte el par
+    enemigo-enemigo: barrido y poda contra comparar todos con todos
+
+    Args:
+        cantidades (tuple): Números de enemigos del enjambre
+        frames (int): Frames medidos
+        numero_tesoros (int): Tesoros del mapa (TreasureField)
+    """
+    import main
+
+    print("=== Mundo de colisiones (µs por frame; pares enemigo-enemigo en ms) ===")
+    print(f"{'enemigos':>10} {'sueltas':>10} {'mundo':>10} {'pares':>8} "
+          f"{'barrido':>10} {'todos':>10}")
+
+    lado = lado_mundo(numero_tesoros)
+    generador = random.Random(4)
+    posiciones = [(generador.randrange(lado - TAMANO_JUGADOR),
+                   generador.randrange(lado - TAMANO_JUGADOR)) for _ in range(frames)]
+
+    for cantidad in cantidades:
+        estado = main.crear_estado_inicial(1)
+        estado['enemigo'] = enemigo.crear_enjambre(cantidad, semilla=1)
+        lista = crear_tesoros_dispersos(numero_tesoros, lado)
+        explorador = estado['jugador']
+        mundo = estado['mundo_colisiones']
+
+        def preparar():
+            explorador.x, explorador.y = next(paso)
+            explorador.vivo = True
+
+        def sueltas():
+            preparar()
+            colisiones.procesar_colisiones_jugador_tesoros(explorador, estado['tesoros'])
+            colisiones.procesar_colision_jugador_enemigo(explorador, estado['enemigo'])
+
+        def con_mundo():
+            preparar()
+            mundo.procesar(estado)
+
+        # Cada forma empieza con todos los tesoros visibles
+        paso = iter(posiciones)
+        estado['tesoros'] = campo_desde_lista(lista)
+        tiempo_sueltas = medir(sueltas, frames)
+        paso = iter(posiciones)
+        estado['tesoros'] = campo_desde_lista(lista)
+        tiempo_mundo = medir(con_mundo, frames)
+
+        # Par enemigo-enemigo dentro de la pantalla
+        enjambre = estado['enemigo']
+        repeticiones = max(3, 3000 // cantidad)
+        inicio = time.perf_counter()
+        for _ in range(repeticiones):
+            pares_a, _ = colisiones.pares_superpuestos(enjambre.x, enjambre.y,
+                                                       TAMANO_ENEMIGO, TAMANO_ENEMIGO)
+        barrido = (time.perf_counter() - inicio) * 1000 / repeticiones
+
+        # Todos contra todos solo con pocos enemigos (matriz n x n)
+        todos = "-"
+        if cantidad <= 1000:
+            inicio = time.perf_counter()
+            for _ in range(repeticiones):
+                x = enjambre.x.astype(np.int64)
+                y = enjambre.y.astype(np.int64)
+                matriz = ((np.abs(x[:, None] - x[None, :]) < TAMANO_ENEMIGO) &
+                          (np.abs(y[:, None] - y[None, :]) < TAMANO_ENEMIGO))
+                np.nonzero(np.triu(matriz, 1))
+            todos = f"{(time.perf_counter() - inicio) * 1000 / repeticiones:.3f}"
+
+        print(f"{cantidad:>10} {tiempo_sueltas:>10.1f} {tiempo_mundo:>10.1f} {len(pares_a):>8} "
+              f"{barrido:>10.3f} {todos:>10}")
+
+def benchmark_paso_fijo(segundos=2, tasas=(60, 40, 25, 10), enemigos=10000, repeticiones=200):
+    """
+    Comprueba que la velocidad del juego no depende de los FPS del dibujo:
+    simula unos segundos de tiempo real con frames de 1/fps s y el jugador
+    manteniendo la flecha derecha, con un paso de lógica por frame (el
+    bucle anterior) y con el acumulador de paso fijo a 60 y a 30 Hz.
+    Mide además lo que cuesta armar la vista interpolada de un enjambre.
+
+    Args:
+        segundos (float): Tiempo real simulado
+        tasas (tuple): FPS del dibujo a probar
+        enemigos (int): Tamaño del enjambre para medir la interpolación
+        repeticiones (int): Vistas interpoladas medidas
+    """
+    import pygame
+    import main
+    import paso_fijo
+    from jugador import TeclasSimuladas
+
+    derecha = TeclasSimuladas({pygame.K_RIGHT})
+
+    def partida(hz=HZ_SIMULACION):
+        estado = main.crear_estado_inicial(1)
+        estado['jugador'].velocidad = paso_fijo.velocidad_por_paso(VELOCIDAD_JUGADOR, hz)
+        enemigo.desactivar_enemigo(estado['enemigo'])
+        return estado
+
+    print(f"=== Paso fijo: píxeles que avanza el jugador en {segundos} s ===")
+    print(f"{'FPS dibujo':>10} {'paso/frame':>11} {'60 Hz':>8} {'30 Hz':>8}")
+    for fps in tasas:
+        frames = int(segundos * fps)
+        estado = partida()
+        for _ in range(frames):
+            main.actualizar_juego(estado, derecha)
+        avances = [estado['jugador'].x - JUGADOR_X_INICIAL]
+
+        for hz in (60, 30):
+            estado = partida(hz)
+            acumulador = paso_fijo.AcumuladorPasos(hz)
+            for _ in range(frames):
+                for _ in range(acumulador.avanzar(1 / fps)):
+                    main.actualizar_juego(estado, derecha)
+            avances.append(estado['jugador'].x - JUGADOR_X_INICIAL)
+        print(f"{fps:>10} {avances[0]:>11} {avances[1]:>8} {avances[2]:>8}")
+    print(f"(a {tasas[-1]} FPS y 60 Hz harían falta más de {PASOS_MAXIMOS_POR_FRAME} "
+          f"pasos por frame: el límite ralentiza el juego en vez de congelarlo)")
+
+    estado = main.crear_estado_inicial(1)
+    estado['enemigo'] = enemigo.crear_enjambre(enemigos, semilla=1)
+    main.actualizar_juego(estado, derecha)
+    tiempo = medir(lambda: paso_fijo.estado_interpolado(estado, estado['previas'], 0.5),
+                   repeticiones)
+    print(f"Vista interpolada con {enemigos} enemigos: {tiempo:.0f} µs por frame")
+
+def tesoros_tocados_en_recorrido(campo, candidatos, previa, actual, circulos, muestras=4000):
+    """
+    Referencia por fuerza bruta: qué tesoros toca el jugador en algún
+    punto de su recorrido, probando muchas posiciones intermedias
+
+    Args:
+        campo (tesoros.TreasureField): Tesoros
+        candidatos (numpy.ndarray): Índices a revisar
+        previa, actual (tuple): Posición del jugador al inicio y al final
+        circulos (bool): Usar círculos inscritos en lugar de cajas
+        muestras (int): Posiciones intermedias probadas
+
+    Returns:
+        set: Índices de los tesoros tocados
+    """
+    fracciones = np.linspace(0.0, 1.0, muestras + 1)[:, None]
+    x = previa[0] + (actual[0] - previa[0]) * fracciones
+    y = previa[1] + (actual[1] - previa[1]) * fracciones
+    tesoro_x = campo.x[candidatos][None, :]
+    tesoro_y = campo.y[candidatos][None, :]
+    if circulos:
+        distancia_x = (x + TAMANO_JUGADOR / 2) - (tesoro_x + TAMANO_TESORO / 2)
+        distancia_y = (y + TAMANO_JUGADOR / 2) - (tesoro_y + TAMANO_TESORO / 2)
+        suma_radios = (TAMANO_JUGADOR + TAMANO_TESORO) / 2
+        tocan = distancia_x * distancia_x + distancia_y * distancia_y <= suma_radios * suma_radios
+    else:
+        tocan = ((x < tesoro_x + TAMANO_TESORO) & (x + TAMANO_JUGADOR > tesoro_x) &
+                 (y < tesoro_y + TAMANO_TESORO) & (y + TAMANO_JUGADOR > tesoro_y))
+    return set(candidatos[tocan.any(axis=0)].tolist())
+
+def benchmark_colision_continua(hz=15, multiplicador=4, pasos=3000, semilla=5):
+    """
+    Comprueba que las colisiones por barrido no se saltan tesoros: el
+    jugador se mueve a multiplicador veces su velocidad con la lógica a hz
+    pasos por segundo (80 px por paso con los valores por defecto) y en
+    cada paso se comparan los tesoros recogidos con los que su recorrido
+    toca de verdad (referencia por fuerza bruta)
+
+    Raises:
+        AssertionError: Si un modo por barrido pierde un tesoro o recoge
+            uno que su recorrido no toca
+
+    Args:
+        hz (int): Pasos de lógica por segundo
+        multiplicador (int): Veces la velocidad normal del jugador
+        pasos (int): Pasos simulados por modo
+        semilla (int): Semilla de los tesoros y del recorrido
+    """
+    import pygame
+    import main
+    import paso_fijo
+    from jugador import TeclasSimuladas
+
+    velocidad = paso_fijo.velocidad_por_paso(VELOCIDAD_JUGADOR * multiplicador, hz)
+    direcciones = [set(teclas) for teclas in
+                   ((pygame.K_RIGHT,), (pygame.K_LEFT,), (pygame.K_UP,), (pygame.K_DOWN,),
+                    (pygame.K_RIGHT, pygame.K_DOWN), (pygame.K_RIGHT, pygame.K_UP),
+                    (pygame.K_LEFT, pygame.K_DOWN), (pygame.K_LEFT, pygame.K_UP))]
+    generador = random.Random(semilla)
+    recorrido = [TeclasSimuladas(generador.choice(direcciones))
+                 for _ in range(pasos // 4) for _ in range(4)]
+
+    print(f"=== Colisiones continuas: {velocidad} px por paso "
+          f"({multiplicador}x a {hz} Hz), {pasos} pasos ===")
+    print(f"{'modo':>16} {'recogidos':>10} {'referencia':>11} {'perdidos':>9} "
+          f"{'de más':>7} {'µs/paso':>8}")
+
+    for modo in colisiones.MODOS_COLISION:
+        estado = main.crear_estado_inicial(semilla, {'NUMERO_TESOROS': 20,
+                                                     'TESOROS_PARA_GANAR': 10 ** 9})
+        estado['mundo_colisiones'] = main.crear_mundo_colisiones(modo=modo)
+        estado['jugador'].velocidad = velocidad
+        enemigo.desactivar_enemigo(estado['enemigo'])
+        campo = estado['tesoros']
+
+        recogidos = referencia = perdidos = de_mas = 0
+        tiempo = 0.0
+        for teclas in recorrido:
+            if campo.contar_visibles() == 0:
+                campo.reiniciar()
+            visibles_antes = campo.mascara_visibles().copy()
+            inicio = time.perf_counter()
+            main.actualizar_juego(estado, teclas)
+            tiempo += time.perf_counter() - inicio
+
+            previa = estado['previas']['jugador']
+            actual = (estado['jugador'].x, estado['jugador'].y)
+            recogidos_paso = set(np.flatnonzero(visibles_antes & ~campo.mascara_visibles()).tolist())
+            tocados = tesoros_tocados_en_recorrido(campo, np.flatnonzero(visibles_antes),
+                                                   previa, actual, modo == 'barrido_circulo')
+            recogidos += len(recogidos_paso)
+            referencia += len(tocados)
+            perdidos += len(tocados - recogidos_paso)
+            de_mas += len(recogidos_paso - tocados)
+
+        print(f"{modo:>16} {recogidos:>10} {referencia:>11} {perdidos:>9} {de_mas:>7} "
+              f"{tiempo / pasos * 1_000_000:>8.1f}")
+        # 'discreto' sí se salta tesoros a esta velocidad: es la comparación
+        if modo != 'discreto' and (perdidos or de_mas):
+            raise AssertionError(f"{modo}: {perdidos} tesoros perdidos y {de_mas} de más "
+                                 f"a {velocidad} px por paso")
+    print("(la referencia de 'barrido_circulo' usa círculos; la de los otros, cajas)")
+
+def mover_diccionario(uno, objetivo_x, objetivo_y):
+    """
+    enemigo.mover_hacia_objetivo como estaba cuando los enemigos eran
+    diccionarios (referencia para benchmark_entidades)
+    """
+    if not uno['activo']:
+        return
+    diferencia_x = objetivo_x - uno['x']
+    diferencia_y = objetivo_y - uno['y']
+    if diferencia_x > 0:
+        uno['x'] += min(uno['velocidad'], diferencia_x)
+    elif diferencia_x < 0:
+        uno['x'] += max(-uno['velocidad'], diferencia_x)
+    if diferencia_y > 0:
+        uno['y'] += min(uno['velocidad'], diferencia_y)
+    elif diferencia_y < 0:
+        uno['y'] += max(-uno['velocidad'], diferencia_y)
+
+def limitar_diccionario(uno):
+    """
+    enemigo.aplicar_limites_enemigo como estaba con diccionarios
+    """
+    if uno['x'] < 0:
+        uno['x'] = 0
+    if uno['x'] > ANCHO - TAMANO_ENEMIGO:
+        uno['x'] = ANCHO - TAMANO_ENEMIGO
+    if uno['y'] < 0:
+        uno['y'] = 0
+    if uno['y'] > ALTO - TAMANO_ENEMIGO:
+        uno['y'] = ALTO - TAMANO_ENEMIGO
+
+def benchmark_entidades(cantidad=100000, frames=5, semilla=1):
+    """
+    Compara las entidades como diccionarios (antes) y como clases con
+    __slots__ y rect propio (ahora): bytes por entidad medidos con
+    tracemalloc (el rect incluido) y costo de un frame que recorre todas
+
+    El frame de enemigos persigue al jugador y aplica los límites
+    (mover_hacia_objetivo); el de tesoros cuenta los visibles y recoge los
+    que tocan un rectángulo, como la lista de
+    colisiones.procesar_colisiones_jugador_tesoros: antes con un
+    pygame.Rect nuevo por tesoro, ahora con el de cada uno.
+
+    Args:
+        cantidad (int): Entidades de cada tipo
+        frames (int): Frames simulados por medición
+        semilla (int): Semilla de las posiciones
+
+    Raises:
+        AssertionError: Si mover los enemigos con __slots__ cuesta más que
+            con diccionarios
+    """
+    print(f"=== Entidades: diccionarios vs __slots__ ({cantidad} de cada tipo) ===")
+    print(f"{'tipo':>10} {'bytes/dict':>11} {'bytes/slots':>12} "
+          f"{'ms/frame dict':>14} {'ms/frame slots':>15}")
+
+    generador = random.Random(semilla)
+    posiciones = [(generador.randrange(ANCHO), generador.randrange(ALTO))
+                  for _ in range(cantidad)]
+    objetivos = [(generador.randrange(ANCHO), generador.randrange(ALTO))
+                 for _ in range(frames)]
+    zona = pygame.Rect(ANCHO // 4, ALTO // 4, ANCHO // 2, ALTO // 2)
+
+    # --- Jugador: solo memoria (hay uno) ---
+    _, memoria_dict = medir_memoria(lambda: [
+        {'x': x, 'y': y, 'vivo': True, 'tesoros_recogidos': 0, 'velocidad': VELOCIDAD_JUGADOR}
+        for x, y in posiciones])
+    _, memoria_slots = medir_memoria(lambda: [jugador.Jugador(x, y) for x, y in posiciones])
+    print(f"{'jugador':>10} {memoria_dict / cantidad:>11.1f} {memoria_slots / cantidad:>12.1f} "
+          f"{'-':>14} {'-':>15}")
+
+    # --- Enemigos: persecución y límites ---
+    lista_dict, memoria_dict = medir_memoria(lambda: [
+        {'x': x, 'y': y, 'activo': True, 'velocidad': VELOCIDAD_ENEMIGO}
+        for x, y in posiciones])
+    lista_slots, memoria_slots = medir_memoria(lambda: [enemigo.Enemigo(x, y)
+                                                        for x, y in posiciones])
+
+    def frame_enemigos_dict():
+        objetivo_x, objetivo_y = next(paso)
+        for uno in lista_dict:
+            mover_diccionario(uno, objetivo_x, objetivo_y)
+            limitar_diccionario(uno)
+
+    def frame_enemigos_slots():
+        objetivo_x, objetivo_y = next(paso)
+        for uno in lista_slots:
+            enemigo.mover_hacia_objetivo(uno, objetivo_x, objetivo_y)
+
+    paso = iter(objetivos)
+    tiempo_dict = medir(frame_enemigos_dict, frames) / 1000
+    paso = iter(objetivos)
+    tiempo_slots = medir(frame_enemigos_slots, frames) / 1000
+    coinciden = all(uno['x'] == otro.x and uno['y'] == otro.y
+                    for uno, otro in zip(lista_dict, lista_slots))
+    print(f"{'enemigo':>10} {memoria_dict / cantidad:>11.1f} {memoria_slots / cantidad:>12.1f} "
+          f"{tiempo_dict:>14.1f} {tiempo_slots:>15.1f}")
+    if tiempo_slots > tiempo_dict:
+        raise AssertionError(f"Enemigos con __slots__ más lentos que con diccionarios: "
+                             f"{tiempo_slots:.1f} frente a {tiempo_dict:.1f} ms/frame")
+
+    # --- Tesoros: contar visibles y recoger los de una zona ---
+    lista_dict, memoria_dict = medir_memoria(lambda: [
+        {'x': x, 'y': y, 'visible': True, 'recogido': False} for x, y in posiciones])
+    lista_slots, memoria_slots = medir_memoria(lambda: [tesoros.crear_tesoro(x, y)
+                                                        for x, y in posiciones])
+
+    def frame_tesoros_dict():
+        visibles = 0
+        for tesoro in lista_dict:
+            if tesoro['visible']:
+                visibles += 1
+                if zona.colliderect(pygame.Rect(tesoro['x'], tesoro['y'],
+                                                TAMANO_TESORO, TAMANO_TESORO)):
+                    tesoro['visible'] = False
+                    tesoro['recogido'] = True
+        return visibles
+
+    def frame_tesoros_slots():
+        visibles = 0
+        for tesoro in lista_slots:
+            if tesoro.visible:
+                visibles += 1
+                if zona.colliderect(tesoro.rect):
+                    tesoro.visible = False
+                    tesoro.recogido = True
+        return visibles
+
+    tiempo_dict = medir(frame_tesoros_dict, frames) / 1000
+    tiempo_slots = medir(frame_tesoros_slots, frames) / 1000
+    coinciden = coinciden and all(uno['visible'] == otro.visible
+                                  for uno, otro in zip(lista_dict, lista_slots))
+    print(f"{'tesoro':>10} {memoria_dict / cantidad:>11.1f} {memoria_slots / cantidad:>12.1f} "
+          f"{tiempo_dict:>14.1f} {tiempo_slots:>15.1f}")
+    print(f"Mismo resultado con ambas formas: {'sí' if coinciden else 'NO'}")
+
+def benchmark_asignaciones(frames=2000, calentamiento=200, semilla=1):
+    """
+    Mide con tracemalloc cuánta memoria reserva cada fase de la
+    actualización en un frame normal de partida (el bot juega y se
+    reinicia al terminar; el reinicio no se mide)
+
+    Por fase se muestra el pico medio de memoria temporal por frame y lo
+    que queda reservado al terminar (crecimiento). A las dos se les resta
+    lo que marca tracemalloc al medir una función vacía.
+
+    Args:
+        frames (int): Frames medidos
+        calentamiento (int): Frames previos sin medir (cachés, importaciones)
+        semilla (int): Semilla de la partida
+    """
+    # Importación local: simulacion elige el driver de video dummy
+    import main
+    import paso_fijo
+    import simulacion
+
+    fases = (
+        ('posiciones previas', lambda estado, teclas: estado.__setitem__(
+            'previas', paso_fijo.copiar_posiciones(estado))),
+        ('jugador', main.actualizar_movimiento_jugador),
+        ('enemigo', lambda estado, teclas: main.actualizar_enemigo_completo(estado)),
+        ('colisiones', lambda estado, teclas: main.procesar_todas_las_colisiones(estado)),
+        ('final', lambda estado, teclas: main.verificar_final_juego(estado)),
+    )
+    picos = {nombre: 0 for nombre, _ in fases}
+    crecimientos = {nombre: 0 for nombre, _ in fases}
+    espacio = [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)]
+    estado = main.crear_estado_inicial(semilla)
+
+    def medir_fase(funcion, *argumentos):
+        tracemalloc.reset_peak()
+        antes = tracemalloc.get_traced_memory()[0]
+        funcion(*argumentos)
+        actual, maximo = tracemalloc.get_traced_memory()
+        return maximo - antes, actual - antes
+
+    tracemalloc.start()
+    base_pico, base_crecimiento = min(medir_fase(lambda: None) for _ in range(100))
+    medidos = frame = 0
+    while medidos < frames:
+        frame += 1
+        teclas = simulacion.bot_cazador(estado, frame)
+        main.manejar_eventos(estado, espacio if estado['juego_terminado'] else [])
+        if estado['juego_terminado'] or estado['pausa']:
+            continue
+        if frame <= calentamiento:
+            main.actualizar_juego(estado, teclas)
+            continue
+        for nombre, funcion in fases:
+            pico, crecimiento = medir_fase(funcion, estado, teclas)
+            picos[nombre] += pico - base_pico
+            crecimientos[nombre] += crecimiento - base_crecimiento
+        medidos += 1
+    tracemalloc.stop()
+
+    print(f"=== Memoria reservada por fase de la actualización ({frames} frames) ===")
+    print(f"{'fase':>20} {'pico B/frame':>13} {'crece B/frame':>14}")
+    for nombre, _ in fases:
+        print(f"{nombre:>20} {picos[nombre] / frames:>13.0f} {crecimientos[nombre] / frames:>14.1f}")
+    print(f"{'total':>20} {sum(picos.values()) / frames:>13.0f} "
+          f"{sum(crecimientos.values()) / frames:>14.1f}")
+
+def benchmark_instantaneas(cantidades=(5, 1000, 100000), repeticiones=200):
+    """
+    Mide cuánto ocupan y cuánto tardan las instantáneas del estado con
+    distintos números de tesoros (un tercio ya recogidos)
+
+    Columnas: bytes por tesoro de una instantánea completa; tiempo de
+    snapshot completo; de guardar un paso en el búfer de rebobinado; de
+    rebobinar un paso sin cambios en los tesoros y con un tesoro que
+    reaparece (hay que reconstruir la grilla); y de cargar la instantánea
+    en un estado nuevo. Al final se comprueba con grabacion.huella_estado
+    que el estado cargado es idéntico al guardado.
+
+    Args:
+        cantidades (tuple): Números de tesoros a probar
+        repeticiones (int): Repeticiones de cada medición
+    """
+    import main
+    import grabacion
+    import instantaneas
+
+    print("=== Instantáneas del estado ===")
+    print(f"{'tesoros':>8} {'B/tesoro':>9} {'snapshot µs':>12} {'guardar µs':>11} "
+          f"{'rebobinar µs':>13} {'+grilla µs':>11} {'nuevo µs':>9} {'iguales':>8}")
+    for cantidad in cantidades:
+        lado = lado_mundo(cantidad)
+        generador = np.random.default_rng(cantidad)
+        posiciones = (generador.integers(0, lado - TAMANO_TESORO, cantidad),
+                      generador.integers(0, lado - TAMANO_TESORO, cantidad))
+        estado = main.crear_estado_inicial(1, posiciones_tesoros=posiciones)
+        estado['tesoros'].recoger(np.arange(0, cantidad, 3))
+        estado['jugador'].tesoros_recogidos = estado['tesoros'].contar_recogidos()
+
+        completa = instantaneas.snapshot(estado)
+        tiempo_snapshot = medir(lambda: instantaneas.snapshot(estado), repeticiones)
+        bufer = instantaneas.BuferRebobinado(repeticiones)
+        tiempo_guardar = medir(lambda: bufer.guardar(estado), repeticiones)
+
+        # Dos pasos que difieren en un tesoro recogido
+        antes = instantaneas.snapshot(estado, con_posiciones=False)
+        estado['tesoros'].recoger(1)
+        despues = instantaneas.snapshot(estado, con_posiciones=False)
+        tiempo_rebobinar = medir(lambda: instantaneas.restore(despues, estado), repeticiones)
+        alternadas = iter([antes, despues] * repeticiones)
+        tiempo_grilla = medir(lambda: instantaneas.restore(next(alternadas), estado),
+                              repeticiones)
+        tiempo_nuevo = medir(lambda: instantaneas.restore(completa), max(1, repeticiones // 10))
+
+        instantaneas.restore(completa, estado)
+        iguales = (grabacion.huella_estado(instantaneas.restore(completa)) ==
+                   grabacion.huella_estado(estado))
+        print(f"{cantidad:>8} {len(completa) / cantidad:>9.2f} {tiempo_snapshot:>12.0f} "
+              f"{tiempo_guardar:>11.0f} {tiempo_rebobinar:>13.0f} {tiempo_grilla:>11.0f} "
+              f"{tiempo_nuevo:>9.0f} {'sí' if iguales else 'NO':>8}")
+
+def benchmark_regiones(distancias=(100, 1000, 10000), semilla=1):
+    """
+    Mide el mundo infinito: el jugador salta una región por paso en línea
+    recta y, tras cada distancia, se anota cuántos tesoros hay cargados,
+    cuántas regiones se recuerdan y cuánta memoria sigue en uso
+    (tracemalloc) desde que se creó el estado. El tiempo de cada recarga
+    de regiones se mide aparte, en otro recorrido sin tracemalloc (que
+    lo hace varias veces más lento).
+
+    Se hace dos veces: sin recoger nada (la memoria no debe crecer) y
+    recogiendo un tesoro en cada paso (crece un entero por región con
+    tesoros recogidos, no por región visitada). Al final vuelve al
+    inicio y comprueba que están recogidos exactamente los tesoros de
+    esas regiones que se recogieron antes.
+
+    Args:
+        distancias (tuple): Regiones recorridas en cada medición
+        semilla (int): Semilla del mundo
+    """
+    import main
+
+    def recorrer(estado, pasos, recoger, recogidas, iniciales=()):
+        # Solo se anotan los tesoros recogidos en las regiones del inicio
+        # (la comprobación final solo mira esas)
+        rect, gestor = estado['jugador'].rect, estado['regiones']
+        for _ in range(pasos):
+            rect.x += gestor.tamano
+            gestor.actualizar(estado)
+            if recoger:
+                campo = estado['tesoros']
+                indice = int(campo.indices_visibles()[0])
+                posicion = (int(campo.x[indice]), int(campo.y[indice]))
+                if gestor.region_de(*posicion) in iniciales:
+                    recogidas.add(posicion)
+                campo.recoger(indice)
+
+    print(f"=== Mundo infinito: regiones de {TAMANO_REGION} px, radio {RADIO_REGIONES}, "
+          f"{TESOROS_POR_REGION} tesoros por región ===")
+    print(f"{'recoger':>8} {'regiones':>9} {'cargados':>9} {'recordadas':>11} {'KiB en uso':>11}")
+    for recoger in (False, True):
+        estado = main.crear_estado_inicial(semilla, mundo_infinito=True)
+        tiempo = medir(lambda: recorrer(estado, 1, recoger, set()), distancias[-1])
+
+        estado = main.crear_estado_inicial(semilla, mundo_infinito=True)
+        gestor = estado['regiones']
+        inicio = estado['jugador'].rect.topleft
+        iniciales = set(gestor.cargadas)
+        recogidas = set()
+        tracemalloc.start()
+        base, _ = tracemalloc.get_traced_memory()
+        recorridas = 0
+        for distancia in distancias:
+            recorrer(estado, distancia - recorridas, recoger, recogidas, iniciales)
+            recorridas = distancia
+            memoria, _ = tracemalloc.get_traced_memory()
+            print(f"{'sí' if recoger else 'no':>8} {distancia:>9} {len(estado['tesoros']):>9} "
+                  f"{len(gestor.recordadas):>11} {(memoria - base) / 1024:>11.1f}")
+        tracemalloc.stop()
+
+        estado['jugador'].rect.topleft = inicio
+        gestor.actualizar(estado)
+        campo = estado['tesoros']
+        indices = np.flatnonzero(campo.estado & tesoros.ESTADO_RECOGIDO)
+        en_campo = set(zip(campo.x[indices].tolist(), campo.y[indices].tolist()))
+        esperadas = recogidas
+        print(f"{'':>8} {'recarga y recogida' if recoger else 'recarga'} media {tiempo:.0f} µs; "
+              f"de vuelta al inicio, "
+              f"{len(en_campo)} tesoros recogidos (esperados {len(esperadas)}): "
+              f"{'coinciden' if en_campo == esperadas else 'NO coinciden'}")
+
+def benchmark_nivel_detalle(cantidad=10000, pasos=480, repeticiones=3, semillas=(1, 2, 3, 4, 5)):
+    """
+    Mide cuánto cuesta por paso mover un enjambre con y sin el
+    planificador de nivel de detalle, y comprueba que los enemigos
+    cercanos atrapan al jugador en el mismo paso
+
+    Escenarios: el enjambre en la pantalla (se junta alrededor del
+    jugador), con campo de flujo (cada enemigo cuesta más) y repartido en
+    un mundo abierto de 8000 px de lado (casi todos lejos).
+
+    Args:
+        cantidad (int): Enemigos del enjambre
+        pasos (int): Pasos medidos por escenario (480 = 8 s a 60 Hz)
+        repeticiones (int): Mediciones por método (se toma la mejor)
+        semillas (tuple): Partidas jugadas por el bot con cada método
+    """
+    # Importación local: simulacion elige el driver de video dummy
+    import main
+    import simulacion
+    import paso_fijo
+    import nivel_detalle
+
+    lado_abierto = 8000
+
+    def crear_escenario(nombre):
+        enjambre = enemigo.crear_enjambre(cantidad, semilla=1)
+        explorador = jugador.crear_jugador()
+        campo = None
+        if nombre == 'mundo abierto':
+            generador = np.random.default_rng(1)
+            enjambre.x[:] = generador.integers(0, lado_abierto, cantidad)
+            enjambre.y[:] = generador.integers(0, lado_abierto, cantidad)
+            explorador.x = explorador.y = lado_abierto // 2
+        elif nombre == 'campo de flujo':
+            campo = campo_flujo.crear_campo_pantalla()
+        return enjambre, explorador, campo
+
+    def recorrido(nombre, paso):
+        # Un círculo alrededor del centro de la pantalla, o una recta
+        # por el mundo abierto (a la velocidad del jugador)
+        if nombre == 'mundo abierto':
+            return lado_abierto // 2 + VELOCIDAD_JUGADOR * paso, lado_abierto // 2
+        angulo = paso * VELOCIDAD_JUGADOR / 150
+        return (int(ANCHO // 2 + 150 * math.cos(angulo)) - TAMANO_JUGADOR // 2,
+                int(ALTO // 2 + 150 * math.sin(angulo)) - TAMANO_JUGADOR // 2)
+
+    def correr(nombre, usar, contar=False):
+        enjambre, explorador, campo = crear_escenario(nombre)
+        planificador = nivel_detalle.crear_planificador(enjambre, usar)
+        con_bordes = nombre != 'mundo abierto'
+        movidos = 0
+        inicio = time.perf_counter()
+        for paso in range(pasos):
+            explorador.x, explorador.y = recorrido(nombre, paso)
+            enemigo.actualizar_enemigo(enjambre, explorador, campo, con_bordes, planificador)
+            if contar:
+                movidos += (cantidad if planificador.todos_al_dia else
+                            int(np.count_nonzero(planificador.ultimo == planificador.paso)))
+        return (time.perf_counter() - inicio) / pasos * 1000, movidos / pasos
+
+    print(f"=== Nivel de detalle: mover {cantidad} enemigos (ms por paso, mejor de {repeticiones}) ===")
+    print(f"{'escenario':>16} {'todos':>8} {'por nivel':>10} {'ahorro':>7} {'movidos/paso':>13}")
+    for nombre in ('pantalla', 'campo de flujo', 'mundo abierto'):
+        # Se alternan los métodos para que el ruido de la máquina afecte a los dos
+        todos = por_nivel = math.inf
+        for _ in range(repeticiones):
+            todos = min(todos, correr(nombre, False)[0])
+            por_nivel = min(por_nivel, correr(nombre, True)[0])
+        _, movidos = correr(nombre, True, contar=True)
+        print(f"{nombre:>16} {todos:>8.3f} {por_nivel:>10.3f} {1 - por_nivel / todos:>7.0%} "
+              f"{movidos:>13.0f}")
+
+    def paso_de_juego(estado, teclas, planificador):
+        # main.actualizar_juego, con el planificador para los enemigos
+        # (el juego no lo usa)
+        estado['previas'] = paso_fijo.copiar_posiciones(estado)
+        main.actualizar_movimiento_jugador(estado, teclas)
+        enemigo.actualizar_enemigo(estado['enemigo'], estado['jugador'], planificador=planificador)
+        main.procesar_todas_las_colisiones(estado)
+        main.verificar_final_juego(estado)
+
+    print("--- Paso en que un enemigo atrapa al bot (mismo paso = tiempo de captura igual) ---")
+    for numero in (10, 100, cantidad):
+        capturas = []
+        for semilla in semillas:
+            resultado = []
+            for usar in (False, True):
+                estado = main.crear_estado_inicial(semilla)
+                velocidad = estado['enemigo'].velocidad
+                estado['enemigo'] = enemigo.crear_enjambre(numero, semilla, velocidad)
+                planificador = nivel_detalle.crear_planificador(estado['enemigo'], usar)
+                paso = 0
+                while not estado['juego_terminado'] and paso < 20000:
+                    paso_de_juego(estado, simulacion.bot_cazador(estado, paso), planificador)
+                    paso += 1
+                resultado.append(paso if estado['tipo_final'] == 'derrota' else None)
+            capturas.append(resultado)
+        iguales = sum(sin == con for sin, con in capturas)
+        print(f"{numero:>8} enemigos: {iguales}/{len(capturas)} partidas con el mismo paso de captura "
+              f"{[sin for sin, _ in capturas]} / {[con for _, con in capturas]}")
+
+# ============================================================================
+# PUNTO DE ENTRADA
+# ============================================================================
+
+if __name__ == "__main__":
+    benchmark_colisiones_tesoros()
+    benchmark_generacion_tesoros()
+    comprobar_semillas_tesoros()
+    comprobar_balanceo_con_errores()
+    comprobar_rebobinado_al_reiniciar()
+    benchmark_campo_tesoros()
+    benchmark_tesoro_mas_cercano()
+    benchmark_enjambre()
+    benchmark_campo_flujo()
+    benchmark_rectangulos_sucios()
+    benchmark_carga_imagenes()
+    benchmark_carga_en_hilos()
+    benchmark_atlas()
+    benchmark_camara()
+    benchmark_hud()
+    benchmark_perfilador()
+    benchmark_mundo_colisiones()
+    benchmark_paso_fijo()
+    benchmark_colision_continua()
+    benchmark_entidades()
+    benchmark_asignaciones()
+    benchmark_instantaneas()
+    benchmark_regiones()
+    benchmark_nivel_detalle()
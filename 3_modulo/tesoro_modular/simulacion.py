@@ -0,0 +1,197 @@
+"""
+MÓDULO DE SIMULACIÓN SIN PANTALLA - CAZADOR DE TESOROS
+=====================================================
+Este módulo ejecuta la lógica del juego sin ventana, sin dibujar y sin
+esperar al reloj: cada vuelta del bucle es un paso fijo de
+actualizar_juego con teclas simuladas (un guion o un bot) en lugar del
+teclado.
+
+Sirve para medir cuántos frames por segundo puede simular el juego (la
+referencia para cualquier cambio de rendimiento) y para ejecutarlo en
+servidores sin pantalla.
+
+Se ejecuta directamente:  python simulacion.py --frames 10000 --semilla 1
+
+Conceptos enseñados:
+- Separar la lógica del juego de la entrada y el dibujo
+- Driver de video "dummy" de SDL
+- Paso de tiempo fijo
+- Medición de rendimiento (frames simulados por segundo)
+"""
+
+import os
+import time
+import argparse
+
+# El driver dummy debe elegirse antes de inicializar pygame
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+from configuracion import *
+import main
+import tesoros
+from jugador import TeclasSimuladas
+
+# ============================================================================
+# ENTRADA SIMULADA
+# ============================================================================
+
+def entrada_guionada(guion, repetir=True):
+    """
+    Crea una entrada que sigue un guion de teclas fijo
+
+    Args:
+        guion (list): Pares (frames, teclas) donde teclas es un conjunto de
+            constantes de pygame, por ejemplo [(30, {pygame.K_RIGHT})]
+        repetir (bool): Volver a empezar el guion al terminarlo
+
+    Returns:
+        callable: Función (estado, frame) -> TeclasSimuladas
+
+    Conceptos enseñados:
+    - Funciones que devuelven funciones (closures)
+    """
+    pasos = []
+    for frames, teclas in guion:
+        pasos.extend([TeclasSimuladas(teclas)] * frames)
+    sin_teclas = TeclasSimuladas()
+
+    def entrada(estado, frame):
+        if repetir:
+            return pasos[frame % len(pasos)]
+        return pasos[frame] if frame < len(pasos) else sin_teclas
+
+    return entrada
+
+def bot_cazador(estado, frame):
+    """
+    Bot sencillo que camina hacia el tesoro visible más cercano
+
+    Args:
+        estado (dict): Estado del juego
+        frame (int): Número de frame (no se usa)
+
+    Returns:
+        TeclasSimuladas: Teclas que presionaría el bot
+
+    Conceptos enseñados:
+    - IA para pruebas automáticas
+    """
+    explorador = estado['jugador']
+    objetivo = tesoros.tesoro_mas_cercano(estado['tesoros'], explorador.x, explorador.y)
+    if objetivo is None:
+        return TeclasSimuladas()
+
+    teclas = set()
+    margen = explorador.velocidad // 2
+    diferencia_x = objetivo.x - explorador.x
+    diferencia_y = objetivo.y - explorador.y
+    if diferencia_x < -margen:
+        teclas.add(pygame.K_LEFT)
+    elif diferencia_x > margen:
+        teclas.add(pygame.K_RIGHT)
+    if diferencia_y < -margen:
+        teclas.add(pygame.K_UP)
+    elif diferencia_y > margen:
+        teclas.add(pygame.K_DOWN)
+    return TeclasSimuladas(teclas)
+
+ENTRADAS = {
+    'cazador': bot_cazador,
+    'quieto': entrada_guionada([(1, set())]),
+    'zigzag': entrada_guionada([(60, {pygame.K_RIGHT, pygame.K_DOWN}),
+                                (60, {pygame.K_LEFT, pygame.K_DOWN}),
+                                (60, {pygame.K_RIGHT, pygame.K_UP}),
+                                (60, {pygame.K_LEFT, pygame.K_UP})]),
+}
+
+# ============================================================================
+# BUCLE DE SIMULACIÓN
+# ============================================================================
+
+def simular(frames, entrada=bot_cazador, semilla=None, estado=None, reiniciar=True,
+            grabador=None):
+    """
+    Ejecuta la lógica del juego lo más rápido posible, sin dibujar
+
+    Args:
+        frames (int): Pasos de simulación a ejecutar
+        entrada (callable): Función (estado, frame) -> teclas
+        semilla (int, optional): Semilla para crear la partida
+        estado (dict, optional): Estado ya creado (si no, se crea uno)
+        reiniciar (bool): Empezar otra partida al terminar cada una
+        grabador (grabacion.Grabador, optional): Graba la entrada de cada
+            frame (su semilla debe ser la de la partida)
+
+    Returns:
+        dict: Resumen con el estado final, frames, segundos, frames por
+            segundo, victorias y derrotas
+
+    Conceptos enseñados:
+    - Bucle de juego sin render ni reloj
+    - Acumulación de estadísticas
+    """
+    if estado is None:
+        estado = main.crear_estado_inicial(semilla)
+
+    resultados = {'victoria': 0, 'derrota': 0}
+    inicio = time.perf_counter()
+    for frame in range(frames):
+        eventos = []
+        if estado['juego_terminado']:
+            resultados[estado['tipo_final']] += 1
+            if not reiniciar:
+                frames = frame
+                break
+            # Empezar otra partida igual que un jugador: con ESPACIO
+            eventos = [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)]
+        teclas = entrada(estado, frame)
+        if grabador:
+            grabador.registrar_frame(eventos, teclas)
+        main.manejar_eventos(estado, eventos)
+        main.actualizar_juego(estado, teclas)
+    else:
+        # Partida terminada justo en el último frame
+        if estado['juego_terminado']:
+            resultados[estado['tipo_final']] += 1
+    segundos = time.perf_counter() - inicio
+
+    return {
+        'estado': estado,
+        'frames': frames,
+        'segundos': segundos,
+        'fps': frames / segundos if segundos > 0 else float('inf'),
+        'victorias': resultados['victoria'],
+        'derrotas': resultados['derrota'],
+    }
+
+def imprimir_reporte(resumen):
+    """
+    Muestra en consola el resultado de una simulación
+
+    Args:
+        resumen (dict): Resultado de simular()
+    """
+    print("=== SIMULACIÓN SIN PANTALLA ===")
+    print(f"Frames simulados: {resumen['frames']}")
+    print(f"Tiempo: {resumen['segundos']:.3f} s")
+    print(f"Frames por segundo simulados: {resumen['fps']:.0f} "
+          f"({resumen['fps'] / HZ_SIMULACION:.0f}x tiempo real)")
+    print(f"Partidas: {resumen['victorias']} victorias, {resumen['derrotas']} derrotas")
+
+# ============================================================================
+# PUNTO DE ENTRADA
+# ============================================================================
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simula el juego sin pantalla")
+    parser.add_argument('--frames', type=int, default=10000, help="pasos a simular")
+    parser.add_argument('--entrada', choices=sorted(ENTRADAS), default='cazador',
+                        help="bot o guion que controla al jugador")
+    parser.add_argument('--semilla', type=int, default=None, help="semilla de la partida")
+    argumentos = parser.parse_args()
+
+    pygame.init()
+    imprimir_reporte(simular(argumentos.frames, ENTRADAS[argumentos.entrada], argumentos.semilla))
+    pygame.quit()
@@ -10,8 +10,12 @@ Conceptos enseñados:
 """
 
 import pygame
+import math
 import random
+import numpy as np
 from configuracion import *
+from grilla_espacial import GrillaEstatica
+from utilidades import EntidadConRect
 
 # ============================================================================
 # FUNCIONES DE INICIALIZACIÓN DE TESOROS
@@ -37,6 +41,23 @@ def cargar_sprite_tesoro():
         print(f"Error: No se pudo cargar {ARCHIVO_TESORO}")
         return None
 
+class Tesoro(EntidadConRect):
+    """
+    Estado de un tesoro suelto: posición (en su rect), si se ve y si ya
+    se recogió
+
+    Para miles de tesoros se usa TreasureField, que guarda lo mismo en
+    arreglos.
+    """
+
+    __slots__ = ('visible', 'recogido')
+    campos = ('x', 'y', 'visible', 'recogido')
+
+    def __init__(self, x, y, visible=True, recogido=False):
+        super().__init__(x, y, TAMANO_TESORO, TAMANO_TESORO)
+        self.visible = visible
+        self.recogido = recogido
+
 def crear_tesoro(x, y):
     """
     Crea un tesoro individual en una posición específica
@@ -46,20 +67,403 @@ def crear_tesoro(x, y):
         y (int): Posición Y del tesoro
         
     Returns:
-        dict: Diccionario con la información del tesoro
+        Tesoro: Objeto con la información del tesoro
         
     Conceptos enseñados:
     - Creación de objetos individuales
     - Parámetros de posición
     - Estructura de datos para objetos
     """
-    tesoro = {
-        'x': x,
-        'y': y,
-        'visible': True,
-        'recogido': False
-    }
-    return tesoro
+    return Tesoro(x, y)
+
+# ============================================================================
+# CAMPO DE TESOROS EN ARREGLOS
+# ============================================================================
+
+# Bits del arreglo de estado de cada tesoro
+ESTADO_VISIBLE = 1
+ESTADO_RECOGIDO = 2
+
+# Hasta cuántos candidatos de la grilla se prueban en Python en lugar de
+# con operaciones sobre arreglos
+CANDIDATOS_SIN_ARREGLOS = 8
+
+def _propiedad_vista(clave):
+    """Atributo de VistaTesoro que lee y escribe esa clave en el campo"""
+    return property(lambda vista: vista[clave],
+                    lambda vista, valor: vista.__setitem__(clave, valor))
+
+class VistaTesoro:
+    """
+    Vista de un tesoro dentro de un TreasureField que se usa como un
+    Tesoro: tesoro.x, tesoro.visible = False, etc. (y también con claves,
+    tesoro['x']).
+
+    No copia datos: lee y escribe directamente en los arreglos del campo.
+
+    Conceptos enseñados:
+    - Compatibilidad hacia atrás
+    - Métodos especiales __getitem__ y __setitem__
+    """
+
+    __slots__ = ('campo', 'indice')
+
+    def __init__(self, campo, indice):
+        self.campo = campo
+        self.indice = indice
+
+    def __getitem__(self, clave):
+        campo = self.campo
+        if clave == 'x':
+            return int(campo.x[self.indice])
+        if clave == 'y':
+            return int(campo.y[self.indice])
+        if clave == 'visible':
+            return bool(campo.estado[self.indice] & ESTADO_VISIBLE)
+        if clave == 'recogido':
+            return bool(campo.estado[self.indice] & ESTADO_RECOGIDO)
+        raise KeyError(clave)
+
+    def __setitem__(self, clave, valor):
+        campo = self.campo
+        if clave in ('x', 'y'):
+            getattr(campo, clave)[self.indice] = valor
+            campo.reconstruir_grilla()
+        elif clave in ('visible', 'recogido'):
+            bit = ESTADO_VISIBLE if clave == 'visible' else ESTADO_RECOGIDO
+            campo.cambiar_estado(self.indice, bit, valor)
+        else:
+            raise KeyError(clave)
+
+    x = _propiedad_vista('x')
+    y = _propiedad_vista('y')
+    visible = _propiedad_vista('visible')
+    recogido = _propiedad_vista('recogido')
+
+    @property
+    def rect(self):
+        """Rectángulo del tesoro (el campo no guarda uno por tesoro)"""
+        return pygame.Rect(self.x, self.y, TAMANO_TESORO, TAMANO_TESORO)
+
+    def __eq__(self, otro):
+        return (isinstance(otro, VistaTesoro) and
+                otro.campo is self.campo and otro.indice == self.indice)
+
+    def __hash__(self):
+        return hash((id(self.campo), self.indice))
+
+    def __repr__(self):
+        return (f"VistaTesoro(x={self.x}, y={self.y}, "
+                f"visible={self.visible}, recogido={self.recogido})")
+
+class TreasureField:
+    """
+    Contenedor de tesoros que guarda x, y y un byte de estado en arreglos
+    contiguos de NumPy en lugar de una lista de objetos Tesoro.
+
+    Las consultas (contar, filtrar, buscar el más cercano, recoger) se
+    hacen sobre todo el arreglo a la vez, y una GrillaEstatica permite
+    revisar solo los tesoros cercanos al jugador. Para el código que
+    todavía recorre la lista con un for, iterar el campo devuelve objetos
+    VistaTesoro que se usan igual que un Tesoro.
+
+    Los contadores 'visibles' y 'recogidos' se actualizan en cada cambio de
+    estado, así que consultarlos no recorre el arreglo. 'version' también
+    sube con cada cambio, para saber si algo calculado a partir del campo
+    (como la capa de dibujo del atlas) quedó desactualizado. Con MODO_DEBUG
+    activo se comparan contra un recorrido completo tras cada cambio.
+
+    La grilla solo indexa tesoros visibles. Recoger uno apenas cambia su
+    byte de estado (las consultas lo saltan); cuando la mitad de la grilla
+    ya está recogida se reconstruye solo con los visibles, y
+    reiniciar() la reconstruye completa.
+
+    Conceptos enseñados:
+    - Estructura de arreglos (SoA) frente a lista de objetos
+    - Operaciones vectorizadas con máscaras
+    - Compatibilidad con la interfaz anterior
+    """
+
+    def __init__(self, posiciones_x, posiciones_y):
+        """
+        Args:
+            posiciones_x, posiciones_y (sequence): Posiciones de los tesoros
+        """
+        self.x = np.asarray(posiciones_x, dtype=np.int32).copy()
+        self.y = np.asarray(posiciones_y, dtype=np.int32).copy()
+        self.estado = np.full(len(self.x), ESTADO_VISIBLE, dtype=np.uint8)
+        self.visibles = len(self.x)   # Contadores incrementales
+        self.recogidos = 0
+        self.version = 0              # Sube con cada cambio de estado
+        self.reconstruir_grilla()
+
+    @classmethod
+    def desde_posiciones(cls, posiciones):
+        """
+        Crea un campo a partir de una lista de tuplas (x, y)
+
+        Args:
+            posiciones (list): Posiciones de los tesoros
+
+        Returns:
+            TreasureField: Campo con todos los tesoros visibles
+        """
+        if not posiciones:
+            return cls([], [])
+        posiciones_x, posiciones_y = zip(*posiciones)
+        return cls(posiciones_x, posiciones_y)
+
+    def reconstruir_grilla(self):
+        """Vuelve a construir el índice espacial con los tesoros visibles"""
+        # Qué tesoros quedan en la grilla (los recogidos siguen ahí hasta
+        # la próxima reconstrucción)
+        self.indexados = self.mascara_visibles()
+        self.grilla = GrillaEstatica(self.x, self.y, TAMANO_TESORO,
+                                     indices=np.flatnonzero(self.indexados))
+
+    # --- Compatibilidad con la lista de tesoros ---
+
+    def __len__(self):
+        return len(self.x)
+
+    def __getitem__(self, indice):
+        if indice < 0:
+            indice += len(self.x)
+        if not 0 <= indice < len(self.x):
+            raise IndexError(indice)
+        return VistaTesoro(self, indice)
+
+    def __iter__(self):
+        for indice in range(len(self.x)):
+            yield VistaTesoro(self, indice)
+
+    # --- Consultas vectorizadas ---
+
+    def mascara_visibles(self):
+        """Devuelve un arreglo booleano con True en los tesoros visibles"""
+        return (self.estado & ESTADO_VISIBLE).astype(bool)
+
+    def contar_visibles(self):
+        """Cuenta los tesoros visibles (O(1), usa el contador)"""
+        return self.visibles
+
+    def contar_recogidos(self):
+        """Cuenta los tesoros recogidos (O(1), usa el contador)"""
+        return self.recogidos
+
+    def verificar_contadores(self):
+        """
+        Compara los contadores con un recorrido completo del arreglo
+
+        Returns:
+            bool: True si coinciden
+        """
+        visibles = int(np.count_nonzero(self.estado & ESTADO_VISIBLE))
+        recogidos = int(np.count_nonzero(self.estado & ESTADO_RECOGIDO))
+        if visibles != self.visibles or recogidos != self.recogidos:
+            print(f"Advertencia: contadores de tesoros incoherentes "
+                  f"(visibles {self.visibles} vs {visibles}, "
+                  f"recogidos {self.recogidos} vs {recogidos})")
+            return False
+        return True
+
+    def indices_visibles(self):
+        """Devuelve los índices de los tesoros visibles"""
+        return np.flatnonzero(self.estado & ESTADO_VISIBLE)
+
+    def posiciones_visibles(self):
+        """Devuelve dos arreglos (x, y) con las posiciones visibles"""
+        mascara = self.mascara_visibles()
+        return self.x[mascara], self.y[mascara]
+
+    def mas_cercano(self, x, y):
+        """
+        Busca el tesoro visible más cercano a un punto
+
+        Args:
+            x, y (int): Posición de referencia
+
+        Returns:
+            int: Índice del tesoro o -1 si no queda ninguno visible
+        """
+        if self.visibles == 0:
+            return -1
+        indices = self.k_mas_cercanos(x, y, 1)
+        return int(indices[0]) if indices.size else -1
+
+    def k_mas_cercanos(self, x, y, k):
+        """
+        Busca los k tesoros visibles más cercanos a un punto
+
+        Args:
+            x, y (int): Posición de referencia
+            k (int): Cantidad de tesoros buscados
+
+        Returns:
+            numpy.ndarray: Índices ordenados por distancia
+        """
+        return self.grilla.k_mas_cercanos(x, y, k, self.estado, ESTADO_VISIBLE)
+
+    def mas_cercanos_lote(self, puntos_x, puntos_y):
+        """
+        Busca el tesoro visible más cercano a cada uno de muchos puntos
+
+        Args:
+            puntos_x, puntos_y (sequence): Posiciones de referencia
+
+        Returns:
+            numpy.ndarray: Índice del tesoro más cercano a cada punto
+                (-1 si no queda ninguno visible)
+        """
+        return self.grilla.mas_cercanos_lote(puntos_x, puntos_y, self.estado, ESTADO_VISIBLE)
+
+    def en_radio(self, x, y, radio):
+        """
+        Busca los tesoros visibles a una distancia menor o igual que 'radio'
+
+        Args:
+            x, y (int): Posición de referencia
+            radio (float): Distancia máxima en píxeles
+
+        Returns:
+            numpy.ndarray: Índices de los tesoros dentro del círculo
+        """
+        return self.grilla.en_radio(x, y, radio, self.estado, ESTADO_VISIBLE)
+
+    def indices_en_rect(self, rect):
+        """
+        Busca los tesoros visibles que tocan un rectángulo
+
+        Args:
+            rect (pygame.Rect): Rectángulo de consulta
+
+        Returns:
+            numpy.ndarray: Índices de los tesoros que colisionan con rect
+        """
+        candidatos = self.grilla.consultar_rect(rect.x, rect.y, rect.width, rect.height)
+        if candidatos.size == 0:
+            return candidatos
+        if candidatos.size <= CANDIDATOS_SIN_ARREGLOS:
+            # Pocos candidatos (lo normal para un jugador): probarlos uno
+            # por uno evita crear media docena de arreglos temporales
+            estado, posiciones_x, posiciones_y = self.estado, self.x, self.y
+            tocados = [indice for indice in candidatos.tolist()
+                       if estado[indice] & ESTADO_VISIBLE and
+                       rect.colliderect(int(posiciones_x[indice]), int(posiciones_y[indice]),
+                                        TAMANO_TESORO, TAMANO_TESORO)]
+            return np.array(tocados, dtype=candidatos.dtype) if tocados else candidatos[:0]
+        x = self.x[candidatos]
+        y = self.y[candidatos]
+        toca = ((self.estado[candidatos] & ESTADO_VISIBLE).astype(bool) &
+                (x < rect.right) & (x + TAMANO_TESORO > rect.left) &
+                (y < rect.bottom) & (y + TAMANO_TESORO > rect.top))
+        return candidatos[toca]
+
+    # --- Cambios de estado vectorizados ---
+
+    def recoger(self, indices):
+        """
+        Recoge uno o varios tesoros
+
+        Args:
+            indices (int or array): Índices de los tesoros a recoger
+
+        Returns:
+            int: Cuántos de ellos seguían visibles
+        """
+        # Sin repetidos, para no contar dos veces el mismo tesoro
+        indices = np.unique(np.asarray(indices, dtype=np.intp))
+        anteriores = self.estado[indices]
+        estaban_visibles = int(np.count_nonzero(anteriores & ESTADO_VISIBLE))
+        self.visibles -= estaban_visibles
+        self.recogidos += int(np.count_nonzero((anteriores & ESTADO_RECOGIDO) == 0))
+        self.estado[indices] = ESTADO_RECOGIDO
+        self.version += 1
+        # Compactar la grilla cuando la mitad de lo indexado ya no sirve
+        if self.visibles < self.grilla.cantidad // 2:
+            self.reconstruir_grilla()
+        if MODO_DEBUG:
+            self.verificar_contadores()
+        return estaban_visibles
+
+    def reiniciar(self):
+        """Vuelve a hacer visibles todos los tesoros"""
+        self.estado[:] = ESTADO_VISIBLE
+        self.visibles = len(self.estado)
+        self.recogidos = 0
+        self.version += 1
+        self.reconstruir_grilla()
+        if MODO_DEBUG:
+            self.verificar_contadores()
+
+    def restaurar(self, estado, posiciones_x=None, posiciones_y=None):
+        """
+        Reemplaza el byte de estado de todos los tesoros (y, si se dan,
+        sus posiciones), por ejemplo al cargar una instantánea
+
+        Los contadores se recalculan. La grilla se reconstruye solo si
+        cambian las posiciones, si vuelve a ser visible un tesoro que ya no
+        está indexado o si la mitad de lo indexado quedó recogido: al
+        rebobinar unos pasos, los tesoros que reaparecen casi siempre
+        siguen en la grilla.
+
+        Args:
+            estado (numpy.ndarray): Un byte ESTADO_* por tesoro
+            posiciones_x, posiciones_y (numpy.ndarray, optional): Nuevas
+                posiciones de los tesoros
+
+        Returns:
+            bool: True si algo cambió
+        """
+        mueve = (posiciones_x is not None and
+                 not (np.array_equal(self.x, posiciones_x) and
+                      np.array_equal(self.y, posiciones_y)))
+        if not mueve and np.array_equal(self.estado, estado):
+            return False
+        if mueve:
+            self.x[:] = posiciones_x
+            self.y[:] = posiciones_y
+        self.estado[:] = estado
+        visibles = self.mascara_visibles()
+        self.visibles = int(np.count_nonzero(visibles))
+        self.recogidos = int(np.count_nonzero(self.estado & ESTADO_RECOGIDO))
+        self.version += 1
+        if (mueve or self.visibles < self.grilla.cantidad // 2 or
+                bool((visibles & ~self.indexados).any())):
+            self.reconstruir_grilla()
+        if MODO_DEBUG:
+            self.verificar_contadores()
+        return True
+
+    def cambiar_estado(self, indice, bit, activo):
+        """
+        Enciende o apaga un bit de estado de un tesoro manteniendo los
+        contadores al día
+
+        Args:
+            indice (int): Tesoro a modificar
+            bit (int): ESTADO_VISIBLE o ESTADO_RECOGIDO
+            activo (bool): Nuevo valor del bit
+        """
+        antes = bool(self.estado[indice] & bit)
+        activo = bool(activo)
+        if antes == activo:
+            return
+        if activo:
+            self.estado[indice] |= bit
+        else:
+            self.estado[indice] &= 0xFF ^ bit
+        self.version += 1
+        cambio = 1 if activo else -1
+        if bit == ESTADO_VISIBLE:
+            self.visibles += cambio
+            # Un tesoro que reaparece puede no estar en la grilla compacta
+            if activo and not self.indexados[indice]:
+                self.reconstruir_grilla()
+        else:
+            self.recogidos += cambio
+        if MODO_DEBUG:
+            self.verificar_contadores()
 
 # ============================================================================
 # FUNCIONES DE GENERACIÓN DE TESOROS
@@ -101,8 +505,8 @@ def verificar_distancia_minima(nuevo_x, nuevo_y, tesoros_existentes, distancia_m
     """
     for tesoro in tesoros_existentes:
         # Calcular distancia con teorema de Pitágoras simplificado
-        diferencia_x = nuevo_x - tesoro['x']
-        diferencia_y = nuevo_y - tesoro['y']
+        diferencia_x = nuevo_x - tesoro.x
+        diferencia_y = nuevo_y - tesoro.y
         distancia_cuadrada = diferencia_x * diferencia_x + diferencia_y * diferencia_y
         
         # Comparar con distancia mínima al cuadrado (evita usar sqrt)
@@ -111,48 +515,221 @@ def verificar_distancia_minima(nuevo_x, nuevo_y, tesoros_existentes, distancia_m
     
     return True
 
-def crear_lista_tesoros(cantidad):
+# Desplazamientos de celda que pueden contener un vecino a menos de la
+# distancia mínima (grilla 5x5 sin las esquinas, que ya están lejos),
+# ordenados de más cercano a más lejano para descartar candidatos pronto
+VECINOS_POISSON = sorted(((fila, columna)
+                          for fila in range(-2, 3) for columna in range(-2, 3)
+                          if abs(fila) + abs(columna) < 4),
+                         key=lambda celda: celda[0] * celda[0] + celda[1] * celda[1])
+
+# Direcciones precalculadas para los candidatos (evita cos/sin por punto)
+DIRECCIONES_POISSON = 256
+COSENOS_POISSON = np.cos(np.arange(DIRECCIONES_POISSON) * (2 * math.pi / DIRECCIONES_POISSON))
+SENOS_POISSON = np.sin(np.arange(DIRECCIONES_POISSON) * (2 * math.pi / DIRECCIONES_POISSON))
+
+# Puntos al azar que se prueban cuando los activos se acaban antes de
+# llegar a la cantidad pedida
+RESIEMBRA_POISSON = 32
+
+def generar_posiciones_poisson(cantidad, distancia_minima=80, semilla=None,
+                               x_min=MARGEN_BORDE, y_min=MARGEN_BORDE,
+                               x_max=ANCHO - MARGEN_TESORO, y_max=ALTO - MARGEN_TESORO,
+                               intentos_por_punto=10):
+    """
+    Genera posiciones separadas al menos distancia_minima con el muestreo
+    de disco de Poisson de Bridson
+    
+    Cada punto nuevo se busca en un anillo estrecho justo por fuera de la
+    distancia mínima alrededor de un punto activo (variante de Roberts, que
+    llena el área con menos intentos que el anillo [d, 2d] original) y solo
+    se compara con los vecinos de una grilla de fondo con celdas de lado
+    d/√2, donde cabe como mucho un punto por celda.
+    
+    Se arranca desde varias semillas repartidas por el área y en cada ronda
+    todos los puntos activos prueban un candidato a la vez con NumPy; si
+    dos candidatos de la misma ronda quedan demasiado cerca se descartan
+    ambos. Un punto deja de estar activo tras 'intentos_por_punto' fallos.
+    
+    Si los activos se acaban antes de llegar a 'cantidad' (por ejemplo, una
+    única semilla en una esquina, con casi todo su anillo fuera del área),
+    se vuelve a sembrar con RESIEMBRA_POISSON puntos al azar; el área se da
+    por llena cuando ninguno de ellos entra.
+    
+    Args:
+        cantidad (int): Número máximo de posiciones a generar
+        distancia_minima (int): Separación mínima entre posiciones
+        semilla (int, optional): Semilla para resultados reproducibles
+        x_min, y_min, x_max, y_max (int): Rango permitido (inclusive)
+        intentos_por_punto (int): Fallos permitidos antes de descartar
+            un punto activo
+        
+    Returns:
+        list: Tuplas (x, y) enteras; puede tener menos de 'cantidad'
+            elementos si el área se llenó
+        
+    Conceptos enseñados:
+    - Muestreo de disco de Poisson
+    - Grillas de fondo para búsquedas locales
+    - Operaciones vectorizadas con NumPy
+    - Generadores aleatorios con semilla
+    """
+    if cantidad <= 0 or x_max < x_min or y_max < y_min:
+        return []
+    
+    generador = np.random.default_rng(semilla)
+    tamano_celda = distancia_minima / math.sqrt(2)
+    columnas = int((x_max - x_min) / tamano_celda) + 1
+    filas = int((y_max - y_min) / tamano_celda) + 1
+    distancia_cuadrada = distancia_minima * distancia_minima
+    
+    # Grilla plana con un borde de 2 celdas para no revisar límites;
+    # cada celda guarda el índice de su punto o -1 si está vacía
+    ancho_grilla = columnas + 4
+    grilla = np.full((filas + 4) * ancho_grilla, -1, dtype=np.int32)
+    desplazamientos = [fila * ancho_grilla + columna for fila, columna in VECINOS_POISSON]
+    
+    # Coordenadas enteras relativas a (x_min, y_min), guardadas en float32
+    # (exacto para enteros y sin desbordes al elevar al cuadrado). La
+    # última posición es un centinela: el índice -1 de las celdas vacías
+    # apunta ahí y sus coordenadas nunca quedan cerca de un candidato
+    lejos = -3 * distancia_minima
+    capacidad = cantidad + 1
+    puntos_x = np.full(capacidad, lejos, dtype=np.float32)
+    puntos_y = np.full(capacidad, lejos, dtype=np.float32)
+    fallos = np.zeros(cantidad, dtype=np.int32)
+    ancho_area = x_max - x_min
+    alto_area = y_max - y_min
+    total = 0
+    
+    def celdas_de(x, y):
+        fila = (y / tamano_celda).astype(np.int32) + 2
+        columna = (x / tamano_celda).astype(np.int32) + 2
+        return fila * ancho_grilla + columna
+    
+    def insertar_lote(candidatos_x, candidatos_y):
+        """Inserta los candidatos válidos y devuelve (índices elegidos, nuevos)"""
+        nonlocal puntos_x, puntos_y, capacidad, total
+        
+        # Solo siguen los candidatos dentro del área
+        seleccion = np.flatnonzero((candidatos_x >= 0) & (candidatos_x <= ancho_area) &
+                                   (candidatos_y >= 0) & (candidatos_y <= alto_area))
+        candidatos_x = candidatos_x[seleccion]
+        candidatos_y = candidatos_y[seleccion]
+        celda = celdas_de(candidatos_x, candidatos_y)
+        
+        # 1. Comparar contra los puntos ya colocados (la celda propia debe
+        #    estar libre: cada celda guarda un solo índice). Cada pocas
+        #    celdas vecinas se descartan los candidatos ya rechazados
+        valido = grilla[celda] < 0
+        for numero, desplazamiento in enumerate(desplazamientos):
+            vecino = grilla[celda + desplazamiento]
+            dx = puntos_x[vecino] - candidatos_x
+            dy = puntos_y[vecino] - candidatos_y
+            valido &= dx * dx + dy * dy >= distancia_cuadrada
+            if numero % 5 == 4 or numero == len(desplazamientos) - 1:
+                seleccion = seleccion[valido]
+                candidatos_x = candidatos_x[valido]
+                candidatos_y = candidatos_y[valido]
+                celda = celda[valido]
+                valido = valido[valido]
+        
+        # 2. Comparar los candidatos del lote entre sí: se escriben en la
+        #    grilla con índices provisionales y se descartan los que pierden
+        #    su celda o quedan cerca de otro candidato
+        if total + seleccion.size >= capacidad:
+            capacidad = total + seleccion.size + 1
+            puntos_x = np.concatenate((puntos_x[:total], np.full(capacidad - total, lejos, dtype=np.float32)))
+            puntos_y = np.concatenate((puntos_y[:total], np.full(capacidad - total, lejos, dtype=np.float32)))
+        provisional = np.arange(total, total + seleccion.size, dtype=np.int32)
+        puntos_x[provisional] = candidatos_x
+        puntos_y[provisional] = candidatos_y
+        grilla[celda] = provisional
+        aceptado = grilla[celda] == provisional
+        for desplazamiento in desplazamientos[1:]:
+            vecino = grilla[celda + desplazamiento]
+            dx = puntos_x[vecino] - candidatos_x
+            dy = puntos_y[vecino] - candidatos_y
+            aceptado &= (vecino < total) | (dx * dx + dy * dy >= distancia_cuadrada)
+        
+        # Respetar la cantidad pedida
+        aceptado &= np.cumsum(aceptado) <= cantidad - total
+        
+        # Limpiar las celdas provisionales y escribir los índices finales
+        grilla[celda] = -1
+        puntos_x[provisional] = lejos
+        puntos_y[provisional] = lejos
+        nuevos = np.arange(total, total + np.count_nonzero(aceptado), dtype=np.int32)
+        puntos_x[nuevos] = candidatos_x[aceptado]
+        puntos_y[nuevos] = candidatos_y[aceptado]
+        grilla[celda[aceptado]] = nuevos
+        total += nuevos.size
+        return seleccion[aceptado], nuevos
+    
+    def sembrar(puntos):
+        """Prueba puntos al azar en toda el área y devuelve los insertados"""
+        return insertar_lote(
+            generador.integers(0, ancho_area + 1, puntos).astype(np.float32),
+            generador.integers(0, alto_area + 1, puntos).astype(np.float32))[1]
+    
+    # Semillas iniciales: varios focos a la vez hacen falta muchas menos
+    # rondas que crecer desde un único punto
+    activos = sembrar(max(1, cantidad // 200))
+    
+    while total < cantidad:
+        if not activos.size:
+            # Los activos se agotaron sin llenar el área: sembrar otra vez
+            activos = sembrar(RESIEMBRA_POISSON)
+            if not activos.size:
+                break
+            continue
+        # Un candidato por punto activo, en el anillo [d + 1, 1.1 d + 1]
+        # (el píxel extra compensa el redondeo a enteros)
+        direccion = generador.integers(0, DIRECCIONES_POISSON, activos.size)
+        radio = distancia_minima * (1 + 0.1 * generador.random(activos.size, dtype=np.float32)) + 1
+        candidatos_x = puntos_x[activos] + np.rint(radio * COSENOS_POISSON[direccion]).astype(np.float32)
+        candidatos_y = puntos_y[activos] + np.rint(radio * SENOS_POISSON[direccion]).astype(np.float32)
+        elegidos, nuevos = insertar_lote(candidatos_x, candidatos_y)
+        
+        # Los puntos que fallaron acumulan intentos; se retiran al agotarlos
+        exito = np.zeros(activos.size, dtype=bool)
+        exito[elegidos] = True
+        fallos[activos[~exito]] += 1
+        activos = np.concatenate((activos[fallos[activos] < intentos_por_punto], nuevos))
+    
+    posiciones_x = puntos_x[:total].astype(np.int64) + x_min
+    posiciones_y = puntos_y[:total].astype(np.int64) + y_min
+    return list(zip(posiciones_x.tolist(), posiciones_y.tolist()))
+
+def crear_lista_tesoros(cantidad, distancia_minima=80, semilla=None):
     """
     Crea una lista completa de tesoros en posiciones aleatorias válidas
     
     Args:
         cantidad (int): Número de tesoros a crear
+        distancia_minima (int): Separación mínima entre tesoros
+        semilla (int, optional): Semilla para un mapa reproducible
         
     Returns:
-        list: Lista de diccionarios con información de cada tesoro
+        TreasureField: Campo con la información de cada tesoro
+        
+    Raises:
+        ValueError: Si no caben tantos tesoros con esa distancia mínima
         
     Conceptos enseñados:
-    - Bucles con intentos limitados
     - Generación procedural con validación
-    - Prevención de bucles infinitos
+    - Reporte de errores en lugar de resultados incorrectos
     - Construcción de listas
     """
-    tesoros = []  # Lista vacía para almacenar tesoros
-    intentos_maximos = 100  # Prevenir bucles infinitos
+    posiciones = generar_posiciones_poisson(cantidad, distancia_minima, semilla)
     
-    for i in range(cantidad):
-        tesoro_colocado = False
-        intentos = 0
-        
-        # Intentar colocar tesoro hasta encontrar posición válida
-        while not tesoro_colocado and intentos < intentos_maximos:
-            x, y = generar_posicion_aleatoria()
-            
-            # Verificar que no esté muy cerca de otros tesoros
-            if verificar_distancia_minima(x, y, tesoros):
-                nuevo_tesoro = crear_tesoro(x, y)
-                tesoros.append(nuevo_tesoro)
-                tesoro_colocado = True
-            
-            intentos += 1
-        
-        # Si no se pudo colocar después de muchos intentos, usar posición aleatoria simple
-        if not tesoro_colocado:
-            x, y = generar_posicion_aleatoria()
-            nuevo_tesoro = crear_tesoro(x, y)
-            tesoros.append(nuevo_tesoro)
+    # Antes se colocaban tesoros encimados en silencio: ahora se avisa
+    if len(posiciones) < cantidad:
+        raise ValueError(f"Solo caben {len(posiciones)} de {cantidad} tesoros "
+                         f"con distancia mínima {distancia_minima}")
     
-    return tesoros
+    # Todas las posiciones van a arreglos contiguos de una sola vez
+    return TreasureField.desde_posiciones(posiciones)
 
 # ============================================================================
 # FUNCIONES DE GESTIÓN DE TESOROS
@@ -160,33 +737,34 @@ def crear_lista_tesoros(cantidad):
 
 def obtener_rect_tesoro(tesoro):
     """
-    Crea un rectángulo para un tesoro (usado para colisiones)
+    Devuelve el rectángulo de un tesoro (usado para colisiones)
     
     Args:
-        tesoro (dict): Estado del tesoro
+        tesoro (Tesoro | VistaTesoro): Estado del tesoro
         
     Returns:
-        pygame.Rect: Rectángulo del tesoro
+        pygame.Rect: Rectángulo propio del tesoro (para una VistaTesoro,
+            uno nuevo armado desde el campo)
         
     Conceptos enseñados:
-    - Creación de rectángulos para colisiones
+    - Rectángulos para colisiones
     - Uso de tamaños específicos
     """
-    return pygame.Rect(tesoro['x'], tesoro['y'], TAMANO_TESORO, TAMANO_TESORO)
+    return tesoro.rect
 
 def recoger_tesoro(tesoro):
     """
     Marca un tesoro como recogido
     
     Args:
-        tesoro (dict): Tesoro a recoger
+        tesoro (Tesoro): Tesoro a recoger
         
     Conceptos enseñados:
     - Modificación de estado de objetos
     - Cambio de múltiples propiedades
     """
-    tesoro['visible'] = False
-    tesoro['recogido'] = True
+    tesoro.visible = False
+    tesoro.recogido = True
 
 def contar_tesoros_visibles(tesoros):
     """
@@ -203,9 +781,12 @@ def contar_tesoros_visibles(tesoros):
     - Filtrado por condiciones
     - Función de consulta
     """
+    if isinstance(tesoros, TreasureField):
+        return tesoros.contar_visibles()
+    
     contador = 0
     for tesoro in tesoros:
-        if tesoro['visible']:
+        if tesoro.visible:
             contador += 1
     return contador
 
@@ -223,9 +804,12 @@ def contar_tesoros_recogidos(tesoros):
     - Contadores con condiciones
     - Reutilización de lógica de conteo
     """
+    if isinstance(tesoros, TreasureField):
+        return tesoros.contar_recogidos()
+    
     contador = 0
     for tesoro in tesoros:
-        if tesoro['recogido']:
+        if tesoro.recogido:
             contador += 1
     return contador
 
@@ -233,14 +817,50 @@ def contar_tesoros_recogidos(tesoros):
 # FUNCIONES DE RENDERIZADO DE TESOROS
 # ============================================================================
 
-def dibujar_tesoros(pantalla, sprite_tesoro, tesoros):
+def posiciones_en_pantalla(tesoros, camara=None):
+    """
+    Posiciones de pantalla de los tesoros visibles que se ven
+    
+    Con un TreasureField, la grilla devuelve solo los tesoros que tocan
+    la vista de la cámara: el costo depende de los tesoros en pantalla y
+    no de cuántos hay en el mundo. Sin cámara, el mundo es la pantalla y
+    se devuelven todos los visibles.
+    
+    Args:
+        tesoros (list | TreasureField): Tesoros del juego
+        camara (Camara, optional): Cámara que define la vista
+        
+    Returns:
+        list: Pares (x, y) en coordenadas de pantalla
+        
+    Conceptos enseñados:
+    - Descartar lo que no se ve con una consulta espacial
+    """
+    if camara is None:
+        if isinstance(tesoros, TreasureField):
+            posiciones_x, posiciones_y = tesoros.posiciones_visibles()
+            return list(zip(posiciones_x.tolist(), posiciones_y.tolist()))
+        return [(tesoro.x, tesoro.y) for tesoro in tesoros if tesoro.visible]
+    
+    vista = camara.rect
+    if isinstance(tesoros, TreasureField):
+        indices = tesoros.indices_en_rect(vista)
+        return list(zip((tesoros.x[indices] - camara.x).tolist(),
+                        (tesoros.y[indices] - camara.y).tolist()))
+    return [camara.a_pantalla(tesoro.x, tesoro.y) for tesoro in tesoros
+            if tesoro.visible and tesoro.rect.colliderect(vista)]
+
+def dibujar_tesoros(pantalla, sprite_tesoro, tesoros, camara=None):
     """
-    Dibuja todos los tesoros visibles en la pantalla
+    Dibuja los tesoros visibles que se ven en la pantalla
     
     Args:
         pantalla (pygame.Surface): Superficie donde dibujar
         sprite_tesoro (pygame.Surface): Imagen del tesoro
         tesoros (list): Lista de tesoros
+        camara (Camara, optional): Cámara para pasar del mundo a la
+            pantalla; solo se dibujan los tesoros que tocan su vista (sin
+            ella, el mundo es la pantalla y se dibujan todos)
         
     Conceptos enseñados:
     - Bucle de renderizado
@@ -250,9 +870,41 @@ def dibujar_tesoros(pantalla, sprite_tesoro, tesoros):
     if not sprite_tesoro:
         return
     
-    for tesoro in tesoros:
-        if tesoro['visible']:  # Solo dibujar tesoros visibles
-            pantalla.blit(sprite_tesoro, (tesoro['x'], tesoro['y']))
+    # Una sola llamada a blits en lugar de un blit por tesoro
+    pantalla.blits([(sprite_tesoro, posicion)
+                    for posicion in posiciones_en_pantalla(tesoros, camara)], False)
+
+def dibujar_tesoros_en_areas(pantalla, sprite_tesoro, tesoros, areas):
+    """
+    Dibuja solo los tesoros visibles que tocan alguna de las áreas dadas
+    (las zonas que el renderizador por rectángulos sucios acaba de borrar)
+    
+    Args:
+        pantalla (pygame.Surface): Superficie donde dibujar
+        sprite_tesoro (pygame.Surface): Imagen del tesoro
+        tesoros (list | TreasureField): Tesoros del juego
+        areas (list): Rectángulos (pygame.Rect) a repintar
+        
+    Conceptos enseñados:
+    - Redibujado parcial
+    - Consultas espaciales por rectángulo
+    """
+    if not sprite_tesoro or not areas:
+        return
+    
+    # Se recorta cada tesoro a su área: fuera de ella el tesoro ya está
+    # dibujado y volver a mezclar su transparencia lo oscurecería
+    clip_previo = pantalla.get_clip()
+    for area in areas:
+        pantalla.set_clip(area)
+        if isinstance(tesoros, TreasureField):
+            for indice in tesoros.indices_en_rect(area).tolist():
+                pantalla.blit(sprite_tesoro, (int(tesoros.x[indice]), int(tesoros.y[indice])))
+        else:
+            for tesoro in tesoros:
+                if tesoro.visible and obtener_rect_tesoro(tesoro).colliderect(area):
+                    pantalla.blit(sprite_tesoro, tesoro.rect)
+    pantalla.set_clip(clip_previo)
 
 # ============================================================================
 # FUNCIONES DE UTILIDAD PARA TESOROS
@@ -270,9 +922,13 @@ def reiniciar_tesoros(tesoros):
     - Restablecimiento de estado masivo
     - Reutilización de objetos existentes
     """
+    if isinstance(tesoros, TreasureField):
+        tesoros.reiniciar()
+        return
+    
     for tesoro in tesoros:
-        tesoro['visible'] = True
-        tesoro['recogido'] = False
+        tesoro.visible = True
+        tesoro.recogido = False
 
 def obtener_tesoros_visibles(tesoros):
     """
@@ -289,9 +945,12 @@ def obtener_tesoros_visibles(tesoros):
     - Creación de sublistas
     - Comprensión de listas básica
     """
+    if isinstance(tesoros, TreasureField):
+        return [VistaTesoro(tesoros, indice) for indice in tesoros.indices_visibles().tolist()]
+    
     tesoros_visibles = []
     for tesoro in tesoros:
-        if tesoro['visible']:
+        if tesoro.visible:
             tesoros_visibles.append(tesoro)
     return tesoros_visibles
 
@@ -310,10 +969,14 @@ def obtener_posiciones_tesoros(tesoros):
     - Transformación de estructuras de datos
     - Creación de tuplas
     """
+    if isinstance(tesoros, TreasureField):
+        posiciones_x, posiciones_y = tesoros.posiciones_visibles()
+        return list(zip(posiciones_x.tolist(), posiciones_y.tolist()))
+    
     posiciones = []
     for tesoro in tesoros:
-        if tesoro['visible']:
-            posicion = (tesoro['x'], tesoro['y'])
+        if tesoro.visible:
+            posicion = (tesoro.x, tesoro.y)
             posiciones.append(posicion)
     return posiciones
 
@@ -330,21 +993,25 @@ def tesoro_mas_cercano(tesoros, x, y):
         x, y (int): Posición de referencia
         
     Returns:
-        dict or None: Tesoro más cercano o None si no hay tesoros visibles
+        Tesoro or None: Tesoro más cercano o None si no hay tesoros visibles
         
     Conceptos enseñados:
     - Algoritmo de búsqueda del mínimo
     - Cálculo de distancias
     - Manejo de casos especiales (lista vacía)
     """
+    if isinstance(tesoros, TreasureField):
+        indice = tesoros.mas_cercano(x, y)
+        return VistaTesoro(tesoros, indice) if indice >= 0 else None
+    
     tesoro_cercano = None
     distancia_minima = float('inf')  # Infinito como valor inicial
     
     for tesoro in tesoros:
-        if tesoro['visible']:
+        if tesoro.visible:
             # Calcular distancia (sin raíz cuadrada para eficiencia)
-            dx = tesoro['x'] - x
-            dy = tesoro['y'] - y
+            dx = tesoro.x - x
+            dy = tesoro.y - y
             distancia = dx * dx + dy * dy
             
             if distancia < distancia_minima:
@@ -368,7 +1035,10 @@ def todos_tesoros_recogidos(tesoros):
     - Funciones que retornan booleanos
     - Lógica de finalización de objetivos
     """
+    if isinstance(tesoros, TreasureField):
+        return tesoros.contar_visibles() == 0
+    
     for tesoro in tesoros:
-        if tesoro['visible']:  # Si hay alguno visible, no están todos recogidos
+        if tesoro.visible:  # Si hay alguno visible, no están todos recogidos
             return False
     return True  # Si llegamos aquí, todos están recogidos
\ No newline at end of file
@@ -7,23 +7,137 @@ Conceptos enseñados:
 - Funciones auxiliares reutilizables
 - Carga de recursos centralizada
 - Manejo de errores común
+- Clases base de las entidades con __slots__ y rectángulo propio
 """
 
 import pygame
 import os
+import threading
+from operator import attrgetter
 from configuracion import *
 
+# ============================================================================
+# ENTIDADES CON __slots__
+# ============================================================================
+
+class EntidadConSlots:
+    """
+    Base de las entidades del juego (Jugador, Enemigo, Tesoro)
+
+    Cada subclase declara sus campos en __slots__: los objetos no tienen
+    un diccionario propio, ocupan menos memoria y leer jugador.x es más
+    rápido que buscar la clave 'x' en un diccionario. Para el material del
+    curso que usa la forma anterior, jugador['x'] sigue funcionando (lee y
+    escribe el atributo), y dict(jugador) arma un diccionario con los campos.
+
+    'campos' lista los nombres que se ven como claves, en orden; el
+    constructor de cada subclase los acepta como argumentos.
+
+    Conceptos enseñados:
+    - __slots__ frente a diccionarios
+    - Compatibilidad hacia atrás con __getitem__ y __setitem__
+    """
+
+    __slots__ = ()
+    campos = ()
+
+    def __getitem__(self, clave):
+        if clave not in self.campos:
+            raise KeyError(clave)
+        return getattr(self, clave)
+
+    def __setitem__(self, clave, valor):
+        if clave not in self.campos:
+            raise KeyError(clave)
+        setattr(self, clave, valor)
+
+    def __contains__(self, clave):
+        return clave in self.campos
+
+    def keys(self):
+        """Devuelve los nombres de los campos, como dict.keys()"""
+        return self.campos
+
+    def get(self, clave, defecto=None):
+        """Como dict.get: el campo o el valor por defecto"""
+        return getattr(self, clave) if clave in self.campos else defecto
+
+    def copiar(self, **cambios):
+        """
+        Crea otra entidad del mismo tipo con algunos campos cambiados
+
+        Args:
+            **cambios: Campos a reemplazar en la copia
+
+        Returns:
+            EntidadConSlots: La copia
+        """
+        return type(self)(**{campo: cambios[campo] if campo in cambios else getattr(self, campo)
+                             for campo in self.campos})
+
+    def __eq__(self, otro):
+        return (type(otro) is type(self) and
+                all(getattr(self, campo) == getattr(otro, campo) for campo in self.campos))
+
+    __hash__ = None   # Como los diccionarios: mutables, sin hash
+
+    def __repr__(self):
+        valores = ", ".join(f"{campo}={getattr(self, campo)!r}" for campo in self.campos)
+        return f"{type(self).__name__}({valores})"
+
+def _mover_x(entidad, valor):
+    entidad.rect.x = valor
+
+def _mover_y(entidad, valor):
+    entidad.rect.y = valor
+
+class EntidadConRect(EntidadConSlots):
+    """
+    Entidad con posición que guarda su propio pygame.Rect
+
+    x e y no se guardan aparte: leen y escriben rect.x y rect.y, así que
+    el rectángulo siempre está en la posición de la entidad y las
+    colisiones lo usan directamente, sin crear uno nuevo en cada frame.
+    Las coordenadas son enteras (un Rect redondea lo que recibe).
+
+    Conceptos enseñados:
+    - Reutilizar objetos en lugar de crearlos en cada frame
+    - Propiedades (property) que delegan en otro objeto
+    """
+
+    __slots__ = ('rect',)
+
+    # La lectura usa attrgetter (escrito en C): casi tan rápida como un slot
+    x = property(attrgetter('rect.x'), _mover_x)
+    y = property(attrgetter('rect.y'), _mover_y)
+
+    def __init__(self, x, y, ancho, alto):
+        self.rect = pygame.Rect(x, y, ancho, alto)
+
 # ============================================================================
 # FUNCIONES DE CARGA DE RECURSOS
 # ============================================================================
 
-def cargar_imagen(ruta_archivo, tamano=None):
+# Imágenes del juego: nombre -> (archivo, tamaño al que se escala)
+RECURSOS_IMAGENES = {
+    'fondo': (ARCHIVO_FONDO, (ANCHO, ALTO)),
+    'jugador': (ARCHIVO_JUGADOR, (TAMANO_JUGADOR, TAMANO_JUGADOR)),
+    'tesoro': (ARCHIVO_TESORO, (TAMANO_TESORO, TAMANO_TESORO)),
+    'enemigo': (ARCHIVO_ENEMIGO, (TAMANO_ENEMIGO, TAMANO_ENEMIGO))
+}
+
+def cargar_imagen(ruta_archivo, tamano=None, directorio_cache=RUTA_CACHE_IMAGENES):
     """
     Carga una imagen desde archivo con manejo de errores
     
+    Prepara la imagen (preparar_imagen) y la convierte al formato de la
+    pantalla para que cada blit no tenga que convertirla.
+    
     Args:
         ruta_archivo (str): Ruta del archivo de imagen
         tamano (tuple, optional): Tupla (ancho, alto) para redimensionar
+        directorio_cache (str, optional): Carpeta de la caché de imágenes
+            escaladas (None para no usarla)
         
     Returns:
         pygame.Surface or None: Imagen cargada o None si hubo error
@@ -33,6 +147,31 @@ def cargar_imagen(ruta_archivo, tamano=None):
     - Manejo de errores robusto
     - Parámetros opcionales
     - Escalado condicional
+    - Caché en disco y formato de píxeles de la pantalla
+    """
+    imagen = preparar_imagen(ruta_archivo, tamano, directorio_cache)
+    return convertir_para_pantalla(imagen) if imagen else None
+
+def preparar_imagen(ruta_archivo, tamano=None, directorio_cache=RUTA_CACHE_IMAGENES):
+    """
+    Lee, decodifica y escala una imagen, sin convertirla al formato de la
+    pantalla
+    
+    Si se pide un tamaño, primero se busca la imagen ya escalada en la
+    caché de disco; así no hay que decodificar el PNG original (que puede
+    ser mucho más grande) en cada arranque.
+    
+    No toca la ventana, así que se puede llamar desde otro hilo (ver
+    cargador.py): pygame suelta el GIL mientras decodifica y escala.
+    
+    Args:
+        ruta_archivo (str): Ruta del archivo de imagen
+        tamano (tuple, optional): Tupla (ancho, alto) para redimensionar
+        directorio_cache (str, optional): Carpeta de la caché de imágenes
+            escaladas (None para no usarla)
+        
+    Returns:
+        pygame.Surface or None: Imagen sin convertir o None si hubo error
     """
     try:
         # Verificar si el archivo existe
@@ -40,6 +179,14 @@ def cargar_imagen(ruta_archivo, tamano=None):
             print(f"Advertencia: No se encontró el archivo {ruta_archivo}")
             return None
         
+        # Buscar la imagen ya escalada en la caché
+        ruta_cache = None
+        if tamano and directorio_cache:
+            ruta_cache = ruta_cache_imagen(ruta_archivo, tamano, directorio_cache)
+            imagen = leer_imagen_cache(ruta_cache, tamano)
+            if imagen:
+                return imagen
+        
         # Cargar la imagen
         imagen = pygame.image.load(ruta_archivo)
         
@@ -47,16 +194,141 @@ def cargar_imagen(ruta_archivo, tamano=None):
         if tamano:
             imagen = pygame.transform.scale(imagen, tamano)
         
+        if ruta_cache:
+            guardar_imagen_cache(ruta_cache, imagen)
+        
         return imagen
         
     except pygame.error as e:
         print(f"Error al cargar imagen {ruta_archivo}: {e}")
         return None
 
-def cargar_todas_las_imagenes():
+def es_opaca(imagen):
+    """
+    Indica si una imagen no tiene ningún píxel transparente
+    
+    Muchos PNG (como el fondo) guardan canal alfa aunque sean opacos;
+    dibujarlos sin alfa es bastante más rápido.
+    
+    Args:
+        imagen (pygame.Surface): Imagen a revisar
+        
+    Returns:
+        bool: True si todos los píxeles son opacos
+    """
+    if not imagen.get_flags() & pygame.SRCALPHA:
+        return True
+    return pygame.surfarray.array_alpha(imagen).min() == 255
+
+def convertir_para_pantalla(imagen):
+    """
+    Convierte una imagen al formato de píxeles de la pantalla
+    
+    Sin esta conversión pygame convierte los píxeles en cada blit. Necesita
+    que la ventana ya exista; si no, la imagen se devuelve sin cambios.
+    
+    Args:
+        imagen (pygame.Surface): Imagen cargada
+        
+    Returns:
+        pygame.Surface: Imagen lista para dibujar rápido
+        
+    Conceptos enseñados:
+    - convert() y convert_alpha()
+    """
+    if pygame.display.get_surface() is None:
+        return imagen
+    if es_opaca(imagen):
+        return imagen.convert()
+    return imagen.convert_alpha()
+
+# ============================================================================
+# CACHÉ DE IMÁGENES ESCALADAS
+# ============================================================================
+
+def ruta_cache_imagen(ruta_archivo, tamano, directorio_cache=RUTA_CACHE_IMAGENES):
+    """
+    Calcula el nombre del archivo de caché de una imagen escalada
+    
+    El nombre incluye el tamaño pedido y la fecha de modificación y el
+    tamaño en bytes del original: si la imagen cambia, cambia el nombre y
+    la caché vieja deja de usarse sola.
+    
+    Args:
+        ruta_archivo (str): Ruta de la imagen original
+        tamano (tuple): Tupla (ancho, alto) de la imagen escalada
+        directorio_cache (str): Carpeta de la caché
+        
+    Returns:
+        str: Ruta del archivo de caché, sin extensión
+    """
+    informacion = os.stat(ruta_archivo)
+    nombre = os.path.splitext(os.path.basename(ruta_archivo))[0]
+    return os.path.join(directorio_cache, f"{nombre}_{tamano[0]}x{tamano[1]}_"
+                                          f"{informacion.st_mtime_ns}_{informacion.st_size}")
+
+def leer_imagen_cache(ruta_cache, tamano):
+    """
+    Lee una imagen escalada guardada como bytes de píxeles crudos
+    
+    La extensión indica el formato: .rgba (con transparencia) o .rgb.
+    
+    Args:
+        ruta_cache (str): Ruta de caché sin extensión (ruta_cache_imagen)
+        tamano (tuple): Tupla (ancho, alto) de la imagen
+        
+    Returns:
+        pygame.Surface or None: Imagen o None si no está en la caché
+        
+    Conceptos enseñados:
+    - pygame.image.frombuffer: crear una imagen sin decodificar un PNG
+    """
+    for formato in ('RGBA', 'RGB'):
+        try:
+            with open(f"{ruta_cache}.{formato.lower()}", 'rb') as archivo:
+                pixeles = archivo.read()
+        except OSError:
+            continue
+        if len(pixeles) != tamano[0] * tamano[1] * len(formato):
+            print(f"Advertencia: Caché de imagen dañada, se regenera: {ruta_cache}")
+            return None
+        return pygame.image.frombuffer(pixeles, tamano, formato)
+    return None
+
+def guardar_imagen_cache(ruta_cache, imagen):
+    """
+    Guarda una imagen escalada como bytes de píxeles crudos y borra las
+    versiones viejas de la misma imagen y tamaño
+    
+    Args:
+        ruta_cache (str): Ruta de caché sin extensión (ruta_cache_imagen)
+        imagen (pygame.Surface): Imagen ya escalada
+    """
+    formato = 'RGB' if es_opaca(imagen) else 'RGBA'
+    ruta = f"{ruta_cache}.{formato.lower()}"
+    directorio, nombre = os.path.split(ruta_cache)
+    prefijo = nombre.rsplit('_', 2)[0] + '_'
+    try:
+        os.makedirs(directorio, exist_ok=True)
+        for viejo in os.listdir(directorio):
+            if viejo.startswith(prefijo) and not ruta.endswith(viejo):
+                os.remove(os.path.join(directorio, viejo))
+        # Escribir aparte y renombrar: nunca queda un archivo a medias
+        temporal = f"{ruta}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporal, 'wb') as archivo:
+            archivo.write(pygame.image.tobytes(imagen, formato))
+        os.replace(temporal, ruta)
+    except OSError as e:
+        print(f"Advertencia: No se pudo guardar la caché de imagen {ruta}: {e}")
+
+def cargar_todas_las_imagenes(directorio_cache=RUTA_CACHE_IMAGENES):
     """
     Carga todas las imágenes del juego de una vez
     
+    Args:
+        directorio_cache (str, optional): Carpeta de la caché de imágenes
+            escaladas (None para no usarla)
+        
     Returns:
         dict: Diccionario con todas las imágenes cargadas
         
@@ -68,26 +340,34 @@ def cargar_todas_las_imagenes():
     """
     imagenes = {}
     
-    # Definir imágenes y sus tamaños
-    recursos_imagenes = {
-        'fondo': (ARCHIVO_FONDO, (ANCHO, ALTO)),
-        'jugador': (ARCHIVO_JUGADOR, (TAMANO_JUGADOR, TAMANO_JUGADOR)),
-        'tesoro': (ARCHIVO_TESORO, (TAMANO_TESORO, TAMANO_TESORO)),
-        'enemigo': (ARCHIVO_ENEMIGO, (TAMANO_ENEMIGO, TAMANO_ENEMIGO))
-    }
-    
-    # Cargar cada imagen
-    for nombre, (archivo, tamano) in recursos_imagenes.items():
-        imagen = cargar_imagen(archivo, tamano)
-        if imagen:
-            imagenes[nombre] = imagen
-        else:
-            print(f"Error crítico: No se pudo cargar {nombre}")
-            # En caso de error, crear una imagen de placeholder
-            imagenes[nombre] = crear_imagen_placeholder(tamano)
+    # Cargar cada imagen, una detrás de otra (cargador.py lo hace en hilos)
+    for nombre, (archivo, tamano) in RECURSOS_IMAGENES.items():
+        imagen = preparar_imagen(archivo, tamano, directorio_cache)
+        imagenes[nombre] = terminar_imagen(nombre, imagen, tamano)
     
     return imagenes
 
+def terminar_imagen(nombre, imagen, tamano):
+    """
+    Convierte al formato de la pantalla una imagen ya preparada o, si no
+    se pudo cargar, un placeholder del mismo tamaño
+    
+    Usa la ventana: se llama desde el hilo principal.
+    
+    Args:
+        nombre (str): Nombre de la imagen (para el mensaje de error)
+        imagen (pygame.Surface or None): Resultado de preparar_imagen
+        tamano (tuple): Tupla (ancho, alto) esperada
+        
+    Returns:
+        pygame.Surface: Imagen lista para dibujar
+    """
+    if imagen is None:
+        print(f"Error crítico: No se pudo cargar {nombre}")
+        # En caso de error, crear una imagen de placeholder
+        imagen = crear_imagen_placeholder(tamano)
+    return convertir_para_pantalla(imagen)
+
 def crear_imagen_placeholder(tamano, color=(255, 0, 255)):
     """
     Crea una imagen de placeholder cuando no se puede cargar la original
@@ -260,6 +540,41 @@ def validar_configuracion():
     if FPS <= 0:
         errores.append("Los FPS deben ser positivos")
     
+    # Validar el paso fijo de la lógica
+    if HZ_SIMULACION <= 0:
+        errores.append("HZ_SIMULACION debe ser positivo")
+    else:
+        # Las posiciones son enteras: la velocidad por paso tiene que
+        # salir exacta o el juego iría más rápido o más lento
+        # Importación local: paso_fijo importa enemigo, que importa este módulo
+        from paso_fijo import HZ_REFERENCIA
+        if HZ_REFERENCIA % HZ_SIMULACION:
+            errores.append(f"HZ_SIMULACION debe dividir a {HZ_REFERENCIA} (60, 30, 20, 15...)")
+    
+    if PASOS_MAXIMOS_POR_FRAME < 1:
+        errores.append("PASOS_MAXIMOS_POR_FRAME debe ser al menos 1")
+    
+    if HILOS_CARGA < 1:
+        errores.append("HILOS_CARGA debe ser al menos 1")
+    
+    # Rebobinar cambia la partida sin pasar por la entrada grabada
+    if USAR_REBOBINADO and GRABAR_PARTIDA:
+        errores.append("USAR_REBOBINADO y GRABAR_PARTIDA no se pueden usar juntos")
+    
+    if PASOS_REBOBINADO < 1:
+        errores.append("PASOS_REBOBINADO debe ser al menos 1")
+
+    # El mundo infinito: las regiones cargadas deben cubrir la pantalla, y
+    # lo que solo funciona dentro de la pantalla no se puede usar
+    if MUNDO_INFINITO:
+        if TAMANO_REGION <= 80 or TESOROS_POR_REGION < 1:
+            errores.append("TAMANO_REGION debe ser mayor que 80 y TESOROS_POR_REGION al menos 1")
+        if RADIO_REGIONES * TAMANO_REGION < max(ANCHO, ALTO) // 2 + TAMANO_TESORO:
+            errores.append("RADIO_REGIONES * TAMANO_REGION debe cubrir media pantalla más un tesoro")
+        if USAR_CAMPO_FLUJO or USAR_REBOBINADO or USAR_RECTANGULOS_SUCIOS:
+            errores.append("MUNDO_INFINITO no se puede usar con USAR_CAMPO_FLUJO, "
+                           "USAR_REBOBINADO ni USAR_RECTANGULOS_SUCIOS")
+
     return errores
 
 # ============================================================================
@@ -334,25 +649,48 @@ def reiniciar_temporizador(temporizador):
 # FUNCIONES DE DEBUG Y DESARROLLO
 # ============================================================================
 
+# Posiciones de enemigos que imprime imprimir_estado_juego con un enjambre
+POSICIONES_ENJAMBRE_DEBUG = 3
+
 def imprimir_estado_juego(jugador, enemigo, tesoros):
     """
     Imprime el estado actual del juego en la consola (para debug)
     
+    Con un enjambre no se imprimen los arreglos enteros (con miles de
+    enemigos llenarían la consola): solo cuántos hay, la caja que los
+    contiene y las primeras posiciones de los activos.
+    
     Args:
-        jugador (dict): Estado del jugador
-        enemigo (dict): Estado del enemigo
+        jugador (Jugador): Estado del jugador
+        enemigo (Enemigo | EnemySwarm): Estado del enemigo
         tesoros (list): Lista de tesoros
         
     Conceptos enseñados:
     - Funciones de debug
     - Formateo de información de estado
+    - Resumir datos grandes en lugar de volcarlos
     - Herramientas de desarrollo
     """
     from tesoros import contar_tesoros_recogidos, contar_tesoros_visibles
+    from enemigo import EnemySwarm
     
     print("=== ESTADO DEL JUEGO ===")
-    print(f"Jugador: ({jugador['x']}, {jugador['y']}) - Vivo: {jugador['vivo']}")
-    print(f"Enemigo: ({enemigo['x']}, {enemigo['y']}) - Activo: {enemigo['activo']}")
+    print(f"Jugador: ({jugador.x}, {jugador.y}) - Vivo: {jugador.vivo}")
+    if isinstance(enemigo, EnemySwarm):
+        activos = enemigo.activo.nonzero()[0]
+        print(f"Enemigos: {len(activos)} activos de {len(enemigo.activo)}")
+        if len(activos):
+            xs = enemigo.x[activos]
+            ys = enemigo.y[activos]
+            print(f"  Caja: ({int(xs.min())}, {int(ys.min())}) - "
+                  f"({int(xs.max())}, {int(ys.max())})")
+            primeros = activos[:POSICIONES_ENJAMBRE_DEBUG]
+            posiciones = ", ".join(f"({int(enemigo.x[i])}, {int(enemigo.y[i])})"
+                                   for i in primeros)
+            resto = " ..." if len(activos) > len(primeros) else ""
+            print(f"  Primeros: {posiciones}{resto}")
+    else:
+        print(f"Enemigo: ({enemigo.x}, {enemigo.y}) - Activo: {enemigo.activo}")
     print(f"Tesoros recogidos: {contar_tesoros_recogidos(tesoros)}")
     print(f"Tesoros restantes: {contar_tesoros_visibles(tesoros)}")
     print("========================")